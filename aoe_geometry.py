@@ -0,0 +1,290 @@
+"""AoE shape containment shared by the LAN server, map effects and the DM battle map.
+
+Shapes are the AoE dicts the tracker already stores: ``kind`` plus ``cx``/``cy`` in grid
+squares and ``radius_sq``/``length_sq``/``width_sq``/``side_sq``/``angle_deg``/
+``spread_deg``/``orient``. Positions are grid squares as well. Batches are evaluated with
+NumPy when it is installed; the pure-Python path gives identical answers without it.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+HAVE_NUMPY = np is not None
+
+# Lines and cones reach half a square further for tokens, whose centre sits mid-square.
+TOKEN_HALF = 0.5
+
+# Below this many points the per-call NumPy overhead outweighs the vector maths.
+NUMPY_MIN_POINTS = 32
+
+_CIRCLE_KINDS = ("circle", "sphere", "cylinder")
+_LINE_KINDS = ("line", "wall")
+
+
+def _default_backend() -> str:
+    requested = str(os.getenv("INITTRACKER_AOE_GEOMETRY") or "").strip().lower()
+    if requested == "python" or not HAVE_NUMPY:
+        return "python"
+    return "numpy"
+
+
+def compile_shape(effect: Any, *, pad: float = 0.0) -> Optional[Tuple[Any, ...]]:
+    """Reduce an AoE dict to the constants its containment test needs (None if not a shape).
+
+    ``pad`` widens the long axis of lines and the reach of cones, as token inclusion does.
+    """
+    if not isinstance(effect, dict):
+        return None
+    kind = str(effect.get("kind") or "").strip().lower()
+    if not kind:
+        return None
+    cx = float(effect.get("cx") or 0.0)
+    cy = float(effect.get("cy") or 0.0)
+    if kind in _CIRCLE_KINDS:
+        return ("circle", cx, cy, float(effect.get("radius_sq") or 0.0) ** 2)
+    if kind in _LINE_KINDS:
+        length_sq = float(effect.get("length_sq") or 0.0)
+        width_sq = float(effect.get("width_sq") or 0.0)
+        angle_deg = effect.get("angle_deg")
+        if angle_deg is None:
+            orient = str(effect.get("orient") or "vertical").strip().lower()
+            angle_deg = 0.0 if orient == "horizontal" else 90.0
+        angle_rad = math.radians(float(angle_deg))
+        return (
+            "rect",
+            cx,
+            cy,
+            math.cos(-angle_rad),
+            math.sin(-angle_rad),
+            (length_sq / 2.0) + pad,
+            width_sq / 2.0,
+        )
+    if kind == "cone":
+        length_sq = float(effect.get("length_sq") or 0.0)
+        spread_deg = effect.get("spread_deg")
+        has_spread = spread_deg is not None
+        if spread_deg is None:
+            spread_deg = effect.get("angle_deg")
+        if spread_deg is None:
+            spread_deg = 90.0
+        orient = str(effect.get("orient") or "vertical").strip().lower()
+        heading_deg = 0.0 if orient == "horizontal" else -90.0
+        if has_spread and effect.get("angle_deg") is not None:
+            heading_deg = float(effect.get("angle_deg"))
+        return (
+            "cone",
+            cx,
+            cy,
+            length_sq + pad,
+            math.radians(float(heading_deg)),
+            math.radians(float(spread_deg) / 2.0),
+        )
+    half = float(effect.get("side_sq") or 0.0) / 2.0
+    angle = effect.get("angle_deg") if kind in ("square", "cube") else None
+    if angle is None:
+        return ("box", cx, cy, half)
+    angle_rad = math.radians(float(angle))
+    return ("rect", cx, cy, math.cos(-angle_rad), math.sin(-angle_rad), half, half)
+
+
+def _python_predicate(shape: Tuple[Any, ...]) -> Callable[[float, float], bool]:
+    """Containment test for one compiled shape, with its constants bound as locals."""
+    kind = shape[0]
+    cx = shape[1]
+    cy = shape[2]
+    if kind == "circle":
+        r2 = shape[3]
+
+        def inside(px: float, py: float) -> bool:
+            return ((px - cx) ** 2 + (py - cy) ** 2) <= r2
+
+        return inside
+    if kind == "box":
+        min_x, max_x = cx - shape[3], cx + shape[3]
+        min_y, max_y = cy - shape[3], cy + shape[3]
+
+        def inside(px: float, py: float) -> bool:
+            return min_x <= px <= max_x and min_y <= py <= max_y
+
+        return inside
+    if kind == "rect":
+        cos_a, sin_a, half_long, half_wide = shape[3], shape[4], shape[5], shape[6]
+
+        def inside(px: float, py: float) -> bool:
+            dx = px - cx
+            dy = py - cy
+            return abs(dx * cos_a - dy * sin_a) <= half_long and abs(dx * sin_a + dy * cos_a) <= half_wide
+
+        return inside
+    reach, heading_rad, half_spread = shape[3], shape[4], shape[5]
+    hypot = math.hypot
+    atan2 = math.atan2
+    pi = math.pi
+
+    def inside(px: float, py: float) -> bool:
+        dx = px - cx
+        dy = py - cy
+        if hypot(dx, dy) > reach:
+            return False
+        angle = atan2(dy, dx) - heading_rad
+        while angle <= -pi:
+            angle += pi * 2
+        while angle > pi:
+            angle -= pi * 2
+        return abs(angle) <= half_spread
+
+    return inside
+
+
+def _contains_numpy(shape: Tuple[Any, ...], xs: Any, ys: Any) -> Any:
+    kind = shape[0]
+    cx = shape[1]
+    cy = shape[2]
+    if kind == "circle":
+        return ((xs - cx) ** 2 + (ys - cy) ** 2) <= shape[3]
+    if kind == "box":
+        half = shape[3]
+        return ((cx - half) <= xs) & (xs <= (cx + half)) & ((cy - half) <= ys) & (ys <= (cy + half))
+    dx = xs - cx
+    dy = ys - cy
+    if kind == "rect":
+        cos_a, sin_a, half_long, half_wide = shape[3], shape[4], shape[5], shape[6]
+        rx = dx * cos_a - dy * sin_a
+        ry = dx * sin_a + dy * cos_a
+        return (np.abs(rx) <= half_long) & (np.abs(ry) <= half_wide)
+    reach, heading_rad, half_spread = shape[3], shape[4], shape[5]
+    within = np.hypot(dx, dy) <= reach
+    angle = np.arctan2(dy, dx) - heading_rad
+    # Wrap the same way the scalar loop does so boundary squares agree exactly.
+    while True:
+        low = angle <= -math.pi
+        if not low.any():
+            break
+        angle = np.where(low, angle + math.pi * 2, angle)
+    while True:
+        high = angle > math.pi
+        if not high.any():
+            break
+        angle = np.where(high, angle - math.pi * 2, angle)
+    return within & (np.abs(angle) <= half_spread)
+
+
+def contains_point(effect: Any, col: float, row: float, *, pad: float = 0.0) -> bool:
+    shape = compile_shape(effect, pad=pad)
+    if shape is None:
+        return False
+    return _python_predicate(shape)(float(col), float(row))
+
+
+def contains_points(
+    effect: Any,
+    points: Sequence[Tuple[float, float]],
+    *,
+    pad: float = 0.0,
+    backend: Optional[str] = None,
+) -> List[bool]:
+    """Containment flag for each (col, row) in ``points``."""
+    shape = compile_shape(effect, pad=pad)
+    if shape is None:
+        return [False] * len(points)
+    backend = backend or _default_backend()
+    if backend == "numpy" and HAVE_NUMPY and len(points) >= NUMPY_MIN_POINTS:
+        coords = np.asarray(points, dtype=float).reshape(-1, 2)
+        return _contains_numpy(shape, coords[:, 0], coords[:, 1]).tolist()
+    inside = _python_predicate(shape)
+    return [inside(float(px), float(py)) for px, py in points]
+
+
+def included_ids(
+    effect: Any,
+    positions: Dict[Hashable, Tuple[float, float]],
+    footprints: Optional[Dict[Hashable, Iterable[Tuple[float, float]]]] = None,
+    *,
+    pad: float = TOKEN_HALF,
+    backend: Optional[str] = None,
+) -> List[Hashable]:
+    """Ids whose token is inside ``effect``, in ``positions`` order.
+
+    ``footprints`` maps an id to every square it occupies (Large and bigger creatures); a
+    token counts as inside when any of its squares is. Ids without one use their position.
+    """
+    footprints = footprints or {}
+    backend = backend or _default_backend()
+    if backend != "numpy" or not HAVE_NUMPY or len(positions) < NUMPY_MIN_POINTS:
+        shape = compile_shape(effect, pad=pad)
+        if shape is None:
+            return []
+        inside = _python_predicate(shape)
+        # Most tokens are nowhere near a given effect; reject them on the bounding box.
+        min_x, min_y, max_x, max_y = cell_bounds(effect)
+        min_x, min_y, max_x, max_y = min_x - pad, min_y - pad, max_x + pad, max_y + pad
+        included: List[Hashable] = []
+        for key, (px, py) in positions.items():
+            cells = footprints.get(key) if footprints else None
+            if not cells:
+                if min_x <= px <= max_x and min_y <= py <= max_y and inside(px, py):
+                    included.append(key)
+                continue
+            for qx, qy in cells:
+                if min_x <= qx <= max_x and min_y <= qy <= max_y and inside(qx, qy):
+                    included.append(key)
+                    break
+        return included
+    owners: List[Hashable] = []
+    points: List[Tuple[float, float]] = []
+    for key, pos in positions.items():
+        for cell in footprints.get(key) or (pos,):
+            owners.append(key)
+            points.append((float(cell[0]), float(cell[1])))
+    flags = contains_points(effect, points, pad=pad, backend=backend)
+    included = []
+    seen: set = set()
+    for key, hit in zip(owners, flags):
+        if hit and key not in seen:
+            seen.add(key)
+            included.append(key)
+    return included
+
+
+def cell_bounds(effect: Any) -> Tuple[float, float, float, float]:
+    """Conservative (min_col, min_row, max_col, max_row) box around an effect's squares."""
+    if not isinstance(effect, dict):
+        return (0.0, 0.0, -1.0, -1.0)
+    kind = str(effect.get("kind") or "").strip().lower()
+    try:
+        cx = float(effect.get("cx") or 0.0)
+        cy = float(effect.get("cy") or 0.0)
+        if kind in _CIRCLE_KINDS:
+            reach = float(effect.get("radius_sq") or 0.0)
+        elif kind in _LINE_KINDS:
+            reach = math.hypot(float(effect.get("length_sq") or 0.0) / 2.0, float(effect.get("width_sq") or 0.0) / 2.0)
+        elif kind == "cone":
+            reach = float(effect.get("length_sq") or 0.0)
+        else:
+            reach = float(effect.get("side_sq") or 0.0) / 2.0 * math.sqrt(2.0)
+    except Exception:
+        return (-math.inf, -math.inf, math.inf, math.inf)
+    reach = abs(reach)
+    return (cx - reach, cy - reach, cx + reach, cy + reach)
+
+
+def covered_cells(effect: Any, *, backend: Optional[str] = None) -> List[Tuple[int, int]]:
+    """Every grid square whose centre lies inside ``effect`` (row-major order)."""
+    min_c, min_r, max_c, max_r = cell_bounds(effect)
+    if not all(math.isfinite(value) for value in (min_c, min_r, max_c, max_r)):
+        return []
+    cells = [
+        (col, row)
+        for row in range(int(math.floor(min_r)), int(math.ceil(max_r)) + 1)
+        for col in range(int(math.floor(min_c)), int(math.ceil(max_c)) + 1)
+    ]
+    flags = contains_points(effect, cells, backend=backend)
+    return [cell for cell, hit in zip(cells, flags) if hit]
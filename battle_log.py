@@ -0,0 +1,338 @@
+"""Buffered battle-log service behind ``logs/battle.log``.
+
+:class:`BattleLog` takes over the file work that used to happen inline on every ``_log``
+call:
+
+* :meth:`BattleLog.append` only records the line. A daemon writer thread collects the
+  pending lines for ``flush_interval`` seconds and writes each batch with one ``write``
+  call, so the Tk thread never blocks on disk.
+* Once the file reaches ``max_bytes`` it is rotated to ``battle.log.1`` (older copies
+  shift up to ``battle.log.<backups>``) and a fresh file is started.
+* The most recent entries stay in a ring buffer with a monotonically increasing
+  sequence number. LAN tailing asks for "everything after seq N" instead of
+  re-stat'ing and re-reading the file; recent-history requests are served from it too.
+* A line-offset index (byte offset of every line in the current file) answers
+  paginated history queries with one seek and one read. :meth:`BattleLog.history`
+  stitches the rotated copies back in front of the current file for callers that need
+  the whole log (session snapshots).
+
+``INITTRACKER_BATTLE_LOG_MAX_BYTES`` and ``INITTRACKER_BATTLE_LOG_BACKUPS`` tune rotation.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, List, Optional, Sequence, Tuple
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+DEFAULT_RING_SIZE = 5000
+DEFAULT_FLUSH_INTERVAL = 0.25
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class BattleLogEntry:
+    seq: int
+    stamp: str
+    content: str
+
+    @property
+    def line(self) -> str:
+        return f"{self.stamp}\t{self.content}" if self.stamp else self.content
+
+
+def _entry_from_line(seq: int, line: str) -> BattleLogEntry:
+    stamp, sep, content = line.partition("\t")
+    if not sep:
+        return BattleLogEntry(seq, "", line)
+    return BattleLogEntry(seq, stamp, content)
+
+
+class BattleLog:
+    """Battle log file with a background writer, rotation, a ring buffer and a line index."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: Optional[int] = None,
+        backups: Optional[int] = None,
+        ring_size: int = DEFAULT_RING_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        self.path = Path(path)
+        if max_bytes is None:
+            max_bytes = _env_int("INITTRACKER_BATTLE_LOG_MAX_BYTES", DEFAULT_MAX_BYTES)
+        if backups is None:
+            backups = _env_int("INITTRACKER_BATTLE_LOG_BACKUPS", DEFAULT_BACKUPS)
+        self.max_bytes = max(0, int(max_bytes))
+        self.backups = max(0, int(backups))
+        self.flush_interval = max(0.0, float(flush_interval))
+        # _lock guards the in-memory state; _io_lock serializes every write to the file.
+        self._lock = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._ring: Deque[BattleLogEntry] = deque(maxlen=max(1, int(ring_size)))
+        self._pending: List[BattleLogEntry] = []
+        self._next_seq = 1
+        self._written_seq = 0
+        # Cursors below this seq predate the last rewrite and need a full snapshot.
+        self._reset_seq = 0
+        self._offsets: Optional[List[int]] = None
+        self._size = 0
+        self._flush_requested = False
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------ writing
+    def append(self, stamp: str, content: str) -> int:
+        """Queue one line for the writer thread; returns its sequence number."""
+        with self._lock:
+            self._ensure_loaded_locked()
+            entry = BattleLogEntry(self._next_seq, str(stamp), str(content))
+            self._next_seq += 1
+            self._ring.append(entry)
+            self._pending.append(entry)
+            self._start_locked()
+            self._lock.notify_all()
+            return entry.seq
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every line appended so far is on disk."""
+        with self._lock:
+            target = self._next_seq - 1
+            if self._written_seq >= target:
+                return True
+            if self._thread is None:
+                self._start_locked()
+            self._flush_requested = True
+            self._lock.notify_all()
+            return self._lock.wait_for(lambda: self._written_seq >= target, timeout)
+
+    def rewrite(self, lines: Sequence[str]) -> None:
+        """Replace the file (session load, new session, cleared log) with ``lines``."""
+        clean = [str(line) for line in lines]
+        data = "".join(line + "\n" for line in clean).encode("utf-8")
+        with self._io_lock:
+            with self._lock:
+                # Anything still queued belonged to the session being replaced.
+                self._pending = []
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as handle:
+                handle.write(data)
+            # Rotated copies belong to the replaced session too; history() must not revive them.
+            for backup in self._backup_paths():
+                try:
+                    backup.unlink()
+                except OSError:
+                    pass
+            offsets: List[int] = []
+            position = 0
+            for line in clean:
+                offsets.append(position)
+                position += len(line.encode("utf-8")) + 1
+            with self._lock:
+                self._offsets = offsets
+                self._size = position
+                self._ring.clear()
+                # Burn one seq so every cursor handed out before the rewrite sorts below _reset_seq.
+                self._next_seq += 1
+                for line in clean[-self._ring.maxlen:]:
+                    self._ring.append(_entry_from_line(self._next_seq, line))
+                    self._next_seq += 1
+                self._reset_seq = self._next_seq - 1
+                self._written_seq = self._next_seq - 1
+                self._lock.notify_all()
+
+    def close(self) -> None:
+        self.flush(timeout=2.0)
+        with self._lock:
+            self._stop = True
+            self._lock.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        with self._lock:
+            self._thread = None
+            self._stop = False
+
+    # ------------------------------------------------------------------ reading
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            self._ensure_loaded_locked()
+            return self._next_seq - 1
+
+    def recent(self, limit: int) -> Optional[List[str]]:
+        """The last ``limit`` lines from the ring buffer; None when it cannot hold that many."""
+        with self._lock:
+            self._ensure_loaded_locked()
+            if limit <= 0:
+                return None
+            if limit > len(self._ring) and len(self._ring) < self._line_count_locked():
+                return None
+            start = max(0, len(self._ring) - int(limit))
+            return [entry.line for entry in itertools.islice(self._ring, start, None)]
+
+    def entries_since(self, seq: int) -> Tuple[List[BattleLogEntry], int, bool]:
+        """Entries after ``seq``, the new cursor, and False when ``seq`` fell out of the ring
+        or predates a rewrite (the caller should resend a snapshot instead)."""
+        with self._lock:
+            self._ensure_loaded_locked()
+            last = self._next_seq - 1
+            if seq < self._reset_seq:
+                return [], last, False
+            if seq >= last:
+                return [], last, True
+            oldest = self._ring[0].seq if self._ring else last + 1
+            if seq + 1 < oldest:
+                return [], last, False
+            skip = seq + 1 - oldest
+            return list(itertools.islice(self._ring, skip, None)), last, True
+
+    def line_count(self) -> int:
+        """Lines in the current file, including ones still queued for the writer."""
+        with self._lock:
+            self._ensure_loaded_locked()
+            return self._line_count_locked()
+
+    def history(self) -> List[str]:
+        """Every line still on disk: rotated copies (oldest first), then the current file."""
+        self.flush()
+        lines: List[str] = []
+        with self._io_lock:
+            for path in [*reversed(self._backup_paths()), self.path]:
+                try:
+                    data = path.read_bytes()
+                except OSError:
+                    continue
+                lines.extend(data.decode("utf-8", errors="ignore").splitlines())
+        return lines
+
+    def page(self, start: int, limit: int) -> List[str]:
+        """Lines ``start`` .. ``start + limit`` of the current file, read through the offset index."""
+        self.flush()
+        with self._io_lock:
+            with self._lock:
+                self._ensure_loaded_locked()
+                offsets = self._offsets or []
+                size = self._size
+                start = max(0, int(start))
+                end = len(offsets) if limit <= 0 else min(len(offsets), start + int(limit))
+                if start >= end:
+                    return []
+                begin = offsets[start]
+                finish = offsets[end] if end < len(offsets) else size
+            try:
+                with open(self.path, "rb") as handle:
+                    handle.seek(begin)
+                    data = handle.read(finish - begin)
+            except OSError:
+                return []
+        return data.decode("utf-8", errors="ignore").splitlines()
+
+    # ------------------------------------------------------------------ internals
+    def _backup_paths(self) -> List[Path]:
+        return [self.path.with_name(f"{self.path.name}.{index}") for index in range(1, self.backups + 1)]
+
+    def _line_count_locked(self) -> int:
+        return len(self._offsets or []) + len(self._pending)
+
+    def _ensure_loaded_locked(self) -> None:
+        """Index the existing file and seed the ring buffer from its tail (once)."""
+        if self._offsets is not None:
+            return
+        offsets: List[int] = []
+        tail: Deque[str] = deque(maxlen=self._ring.maxlen)
+        position = 0
+        try:
+            with open(self.path, "rb") as handle:
+                for raw in handle:
+                    offsets.append(position)
+                    position += len(raw)
+                    tail.append(raw.decode("utf-8", errors="ignore").rstrip("\r\n"))
+        except OSError:
+            offsets, position = [], 0
+            tail.clear()
+        self._offsets = offsets
+        self._size = position
+        if not self._ring:
+            for line in tail:
+                self._ring.append(_entry_from_line(self._next_seq, line))
+                self._next_seq += 1
+            self._written_seq = self._next_seq - 1
+
+    def _start_locked(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="battle-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                self._lock.wait_for(lambda: bool(self._pending) or self._stop)
+                if not self._pending and self._stop:
+                    return
+                if not self._flush_requested and not self._stop and self.flush_interval:
+                    # Let a burst of log lines pile up so they share one write.
+                    self._lock.wait_for(lambda: self._flush_requested or self._stop, self.flush_interval)
+            with self._io_lock:
+                with self._lock:
+                    batch, self._pending = self._pending, []
+                    self._flush_requested = False
+                if batch:
+                    self._write_batch(batch)
+                with self._lock:
+                    if batch:
+                        self._written_seq = max(self._written_seq, batch[-1].seq)
+                    self._lock.notify_all()
+
+    def _write_batch(self, batch: List[BattleLogEntry]) -> None:
+        encoded = [(entry.line + "\n").encode("utf-8") for entry in batch]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as handle:
+                start = handle.tell()
+                handle.write(b"".join(encoded))
+        except OSError:
+            return
+        with self._lock:
+            if self._offsets is None or start != self._size:
+                # Someone else touched the file; re-index it lazily on the next read.
+                self._offsets = None
+            else:
+                position = start
+                for chunk in encoded:
+                    self._offsets.append(position)
+                    position += len(chunk)
+                self._size = position
+            rotate = self.max_bytes > 0 and start + sum(len(chunk) for chunk in encoded) >= self.max_bytes
+        if rotate:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        try:
+            if self.backups <= 0:
+                self.path.unlink()
+            else:
+                for index in range(self.backups - 1, 0, -1):
+                    older = self.path.with_name(f"{self.path.name}.{index}")
+                    if older.exists():
+                        os.replace(older, self.path.with_name(f"{self.path.name}.{index + 1}"))
+                os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        except OSError:
+            return
+        with self._lock:
+            self._offsets = []
+            self._size = 0
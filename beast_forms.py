@@ -0,0 +1,149 @@
+"""Precomputed beast-form table for Wild Shape and Polymorph (``logs/beast_forms.json``).
+
+The tracker derives one form row per beast in the monster library. :class:`BeastFormTable`
+holds those rows together with the indexes the Wild Shape rules need:
+
+* ``by_id``: lower-cased form id -> row, so validating a chosen form is a dict lookup;
+* ``by_band``: Wild Shape CR band (the smallest of :data:`CR_BANDS` at or above the
+  form's CR) -> rows, ignoring forms above the highest band;
+* ``by_movement``: ``walk``/``swim``/``fly``/``climb`` -> ids of forms with that speed.
+
+Per-rule results (``wild_shape_forms``) are memoized on the table, so every druid of the
+same tier shares one filtered list. The table is persisted next to the monster catalog
+and reused while the catalog fingerprint it was built from still matches.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+FORMAT_VERSION = 1
+# Wild Shape CR caps by druid tier; nothing above the last band can ever be chosen.
+CR_BANDS: Tuple[float, ...] = (0.25, 0.5, 1.0, 2.0)
+MOVEMENT_TYPES: Tuple[str, ...] = ("walk", "swim", "fly", "climb")
+
+# (max CR, fly allowed, swim allowed, tiny allowed)
+WildShapeRules = Tuple[float, bool, bool, bool]
+
+
+def cr_band(challenge_rating: float) -> Optional[float]:
+    for band in CR_BANDS:
+        if challenge_rating <= band:
+            return band
+    return None
+
+
+def wild_shape_rules(druid_level: int) -> WildShapeRules:
+    if druid_level >= 8:
+        max_cr = 1.0
+    elif druid_level >= 4:
+        max_cr = 0.5
+    else:
+        max_cr = 0.25
+    return (max_cr, druid_level >= 8, druid_level >= 4, druid_level >= 11)
+
+
+def _form_key(form: Dict[str, Any]) -> str:
+    return str(form.get("id") or "").strip().lower()
+
+
+class BeastFormTable:
+    """Beast form rows (sorted by CR, then name) and the indexes derived from them."""
+
+    def __init__(self, forms: List[Dict[str, Any]], fingerprint: Optional[str] = None) -> None:
+        self.forms = forms
+        self.fingerprint = fingerprint
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_band: Dict[float, List[Dict[str, Any]]] = {band: [] for band in CR_BANDS}
+        movement: Dict[str, List[str]] = {kind: [] for kind in MOVEMENT_TYPES}
+        self._position: Dict[int, int] = {}
+        for position, form in enumerate(forms):
+            if not isinstance(form, dict):
+                continue
+            self._position[id(form)] = position
+            key = _form_key(form)
+            if key:
+                self.by_id.setdefault(key, form)
+            band = cr_band(float(form.get("challenge_rating") or 0.0))
+            if band is not None:
+                self.by_band[band].append(form)
+            speed = form.get("speed") if isinstance(form.get("speed"), dict) else {}
+            for kind in MOVEMENT_TYPES:
+                if int(speed.get(kind) or 0) > 0 and key:
+                    movement[kind].append(key)
+        self.by_movement: Dict[str, FrozenSet[str]] = {kind: frozenset(ids) for kind, ids in movement.items()}
+        self._rule_cache: Dict[WildShapeRules, List[Tuple[Dict[str, Any], bool]]] = {}
+        self._aliases: Optional[Dict[str, str]] = None
+
+    def allowed(self, form: Dict[str, Any], rules: WildShapeRules) -> bool:
+        max_cr, fly_ok, swim_ok, tiny_ok = rules
+        if float(form.get("challenge_rating") or 0.0) > max_cr:
+            return False
+        speed = form.get("speed") if isinstance(form.get("speed"), dict) else {}
+        if not fly_ok and int(speed.get("fly") or 0) > 0:
+            return False
+        if not swim_ok and int(speed.get("swim") or 0) > 0:
+            return False
+        if not tiny_ok and str(form.get("size") or "").strip().lower() == "tiny":
+            return False
+        return True
+
+    def wild_shape_forms(self, rules: WildShapeRules) -> List[Tuple[Dict[str, Any], bool]]:
+        """Every form within the CR bands, in table order, with whether ``rules`` allow it."""
+        cached = self._rule_cache.get(rules)
+        if cached is None:
+            banded = [form for band in CR_BANDS for form in self.by_band[band]]
+            banded.sort(key=lambda form: self._position.get(id(form), 0))
+            cached = [(form, self.allowed(form, rules)) for form in banded]
+            self._rule_cache[rules] = cached
+        return cached
+
+    def position(self, form: Dict[str, Any]) -> int:
+        return self._position.get(id(form), len(self.forms))
+
+    def alias_lookup(self, build: Callable[[List[Dict[str, Any]]], Dict[str, str]]) -> Dict[str, str]:
+        """Alias map over every form, built once with the tracker's identifier rules."""
+        if self._aliases is None:
+            self._aliases = build(self.forms)
+        return self._aliases
+
+    # -- persistence -------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        if not self.fingerprint:
+            return
+        payload = {"format_version": FORMAT_VERSION, "fingerprint": self.fingerprint, "forms": self.forms}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: Optional[str]) -> Optional["BeastFormTable"]:
+        """The persisted table when it was built from ``fingerprint``; None otherwise."""
+        if not fingerprint:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format_version") != FORMAT_VERSION
+            or payload.get("fingerprint") != fingerprint
+            or not isinstance(payload.get("forms"), list)
+        ):
+            return None
+        return cls([form for form in payload["forms"] if isinstance(form, dict)], fingerprint)
@@ -0,0 +1,241 @@
+"""Structured combat event store (``logs/combat_events.sqlite3``).
+
+``battle.log`` stays the human-readable history; this store keeps the same fight as typed
+rows so reviewing a long campaign does not mean regex-ing free text. Every event carries
+the session it belongs to, the round/turn it happened in, the acting combatant and
+(optionally) a target, plus a JSON payload specific to its type (see :data:`EVENT_TYPES`).
+
+The database runs in WAL mode. :meth:`CombatEventStore.record` only queues the row; a
+daemon writer thread inserts each batch in one transaction, and readers (the HTTP
+endpoint) use their own connections so they never wait for the writer. Rows are indexed
+by (session, round), (session, type), actor and target, and :meth:`CombatEventStore.query`
+pages with an ``after`` id cursor instead of OFFSET so deep pages stay cheap.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+EVENT_TYPES = frozenset(
+    {
+        "log",
+        "damage",
+        "heal",
+        "move",
+        "cast",
+        "attack",
+        "spell_target",
+        "condition",
+        "concentration",
+        "turn_start",
+        "turn_end",
+    }
+)
+DEFAULT_FLUSH_INTERVAL = 0.5
+MAX_PAGE = 1000
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY,
+        session TEXT NOT NULL,
+        ts REAL NOT NULL,
+        round INTEGER NOT NULL,
+        turn INTEGER NOT NULL,
+        type TEXT NOT NULL,
+        cid INTEGER,
+        target_cid INTEGER,
+        data TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS events_session_round ON events (session, round, id)",
+    "CREATE INDEX IF NOT EXISTS events_session_type ON events (session, type, id)",
+    "CREATE INDEX IF NOT EXISTS events_cid ON events (cid, id)",
+    "CREATE INDEX IF NOT EXISTS events_target_cid ON events (target_cid, id)",
+)
+
+# (session, ts, round, turn, type, cid, target_cid, data)
+_Row = Tuple[str, float, int, int, str, Optional[int], Optional[int], str]
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+class CombatEventStore:
+    """Append-only SQLite event log with a batching writer thread."""
+
+    def __init__(self, path: Path, *, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        self.path = Path(path)
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.session = new_session_id()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+        finally:
+            conn.close()
+        self._lock = threading.Condition()
+        self._pending: List[_Row] = []
+        self._queued = 0
+        self._written = 0
+        self._flush_requested = False
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+
+    def begin_session(self) -> str:
+        """Start a new session id (new blank session or a loaded snapshot)."""
+        self.session = new_session_id()
+        return self.session
+
+    # ------------------------------------------------------------------ writing
+    def record(
+        self,
+        kind: str,
+        *,
+        round_num: int = 0,
+        turn_num: int = 0,
+        cid: Optional[int] = None,
+        target_cid: Optional[int] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if kind not in EVENT_TYPES:
+            raise ValueError(f"unknown combat event type: {kind!r}")
+        row: _Row = (
+            self.session,
+            time.time(),
+            int(round_num),
+            int(turn_num),
+            kind,
+            cid,
+            target_cid,
+            json.dumps(data or {}, separators=(",", ":"), ensure_ascii=False, default=str),
+        )
+        with self._lock:
+            self._pending.append(row)
+            self._queued += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="combat-events-writer", daemon=True)
+                self._thread.start()
+            self._lock.notify_all()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every queued event is committed."""
+        with self._lock:
+            target = self._queued
+            if self._written >= target:
+                return True
+            self._flush_requested = True
+            self._lock.notify_all()
+            return self._lock.wait_for(lambda: self._written >= target, timeout)
+
+    def close(self) -> None:
+        self.flush(timeout=2.0)
+        with self._lock:
+            self._stop = True
+            self._lock.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        with self._lock:
+            self._thread = None
+            self._stop = False
+
+    # ------------------------------------------------------------------ reading
+    def query(
+        self,
+        *,
+        session: Optional[str] = None,
+        round_num: Optional[int] = None,
+        cid: Optional[int] = None,
+        kind: Optional[str] = None,
+        after: int = 0,
+        limit: int = 200,
+    ) -> List[Dict[str, Any]]:
+        """Events matching every given filter, oldest first, with ``id > after``.
+
+        ``cid`` matches the acting combatant or the target. ``session`` defaults to the
+        current session; pass ``"*"`` to search every session.
+        """
+        clauses = ["id > ?"]
+        params: List[Any] = [int(after)]
+        session = self.session if session is None else session
+        if session != "*":
+            clauses.append("session = ?")
+            params.append(session)
+        if round_num is not None:
+            clauses.append("round = ?")
+            params.append(int(round_num))
+        if kind is not None:
+            clauses.append("type = ?")
+            params.append(kind)
+        if cid is not None:
+            clauses.append("(cid = ? OR target_cid = ?)")
+            params.extend((int(cid), int(cid)))
+        params.append(max(1, min(int(limit), MAX_PAGE)))
+        sql = (
+            "SELECT id, session, ts, round, turn, type, cid, target_cid, data FROM events WHERE "
+            + " AND ".join(clauses)
+            + " ORDER BY id LIMIT ?"
+        )
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return [
+            {
+                "id": row[0],
+                "session": row[1],
+                "ts": row[2],
+                "round": row[3],
+                "turn": row[4],
+                "type": row[5],
+                "cid": row[6],
+                "target_cid": row[7],
+                "data": json.loads(row[8]),
+            }
+            for row in rows
+        ]
+
+    # ------------------------------------------------------------------ internals
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path), timeout=5.0)
+
+    def _run(self) -> None:
+        conn = self._connect()
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            while True:
+                with self._lock:
+                    self._lock.wait_for(lambda: bool(self._pending) or self._stop)
+                    if not self._pending and self._stop:
+                        return
+                    if not self._flush_requested and not self._stop and self.flush_interval:
+                        # Let a burst of events (one attack = several rows) share a transaction.
+                        self._lock.wait_for(lambda: self._flush_requested or self._stop, self.flush_interval)
+                    batch, self._pending = self._pending, []
+                    self._flush_requested = False
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT INTO events (session, ts, round, turn, type, cid, target_cid, data)"
+                            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            batch,
+                        )
+                except sqlite3.Error:
+                    pass
+                with self._lock:
+                    self._written += len(batch)
+                    self._lock.notify_all()
+        finally:
+            conn.close()
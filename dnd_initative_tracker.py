@@ -22,6 +22,7 @@ import ipaddress
 import fnmatch
 import importlib.util
 import importlib
+import multiprocessing
 import threading
 import time
 import uuid
@@ -30,6 +31,7 @@ import shutil
 import re
 import os
 import hashlib
+import heapq
 import hmac
 import secrets
 import traceback
@@ -37,10 +39,10 @@ import urllib.parse
 import urllib.request
 import urllib.error
 from datetime import datetime
-from dataclasses import asdict, dataclass, field, is_dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import InitVar, asdict, dataclass, field, is_dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 import copy
-from collections import deque
+from collections import OrderedDict, deque
 import sys
 import tempfile
 
@@ -58,6 +60,12 @@ try:
 except Exception:
     PdfReader = None  # type: ignore
 
+# Optional fast JSON encoder for LAN/HTTP/session payloads (falls back to stdlib json)
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
 try:
     from PIL import Image, ImageTk  # type: ignore
 except Exception:
@@ -69,6 +77,15 @@ except Exception:
 try:
     import helper_script as base
     import update_checker
+    import aoe_geometry
+    import battle_log
+    import beast_forms
+    import combat_events
+    import item_catalog
+    import library_watch
+    import monster_catalog
+    import refresh_scheduler
+    import yaml_batch
 except Exception as e:  # pragma: no cover
     raise SystemExit(
         "Arrr! I can’t find/load helper_script.py in this folder.\n"
@@ -1191,6 +1208,56 @@ def _files_signature(files: List[Path]) -> Tuple[Tuple[str, int, int], ...]:
     return tuple(sorted(rows))
 
 
+# Serialises monster index rebuilds between the background index thread and Tk-thread callers.
+_MONSTER_INDEX_LOCK = threading.Lock()
+
+_MONSTER_RAW_DATA_KEYS = (
+    "name", "size", "type", "alignment", "initiative", "challenge_rating", "ac", "hp", "speed",
+    "traits", "actions", "attacks", "reactions", "legendary_actions", "description", "habitat", "treasure", "levels_allowed",
+    "variants", "damage_type_by_variant", "bonus_actions",
+    "skills", "senses",
+    "tags",
+    "damage_vulnerabilities", "damage_resistances", "damage_immunities", "condition_immunities",
+    "vulnerabilities", "resistances", "immunities",
+    "turn_schedule",
+    "phases",
+)
+
+
+def _parse_monster_yaml_text(raw: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+    """Return (monster mapping, is_legacy) for a Monsters/*.yaml document, or None."""
+    if yaml is None:
+        return None
+    try:
+        data = yaml_batch.safe_load(raw)
+    except Exception:
+        return None
+    return _monster_mapping_from_document(data)
+
+
+def _monster_mapping_from_document(data: Any) -> Optional[Tuple[Dict[str, Any], bool]]:
+    if not isinstance(data, dict):
+        return None
+    if "monster" in data:
+        mon = data.get("monster")
+        return (mon, True) if isinstance(mon, dict) else None
+    return data, False
+
+
+def _monster_raw_data(mon: Dict[str, Any]) -> Dict[str, Any]:
+    """Stat-block fields kept on MonsterSpec.raw_data (ability keys lower-cased)."""
+    raw_data: Dict[str, Any] = {}
+    for key in _MONSTER_RAW_DATA_KEYS:
+        if key in mon:
+            raw_data[key] = mon.get(key)
+    ab = mon.get("abilities")
+    if isinstance(ab, dict):
+        abilities = {key.strip().lower(): val for key, val in ab.items() if isinstance(key, str)}
+        if abilities:
+            raw_data["abilities"] = abilities
+    return raw_data
+
+
 # --- App metadata ---
 APP_VERSION = "41"
 
@@ -1199,6 +1266,156 @@ POC_AUTO_START_LAN = True
 POC_AUTO_SEED_PCS = os.getenv("POC_AUTO_SEED_PCS", "false").lower() == "true"
 LAN_TERRAIN_DEBUG = bool(os.getenv("INITTRACKER_LAN_TERRAIN_DEBUG"))
 
+
+# ----------------------------- JSON encoding -----------------------------
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _json_sanitize(value: Any) -> Any:
+    """``value`` with non-finite floats replaced by 0.0.
+
+    Containers are only copied along the path to a NaN/Infinity, so a finite tree comes
+    back as the very same object.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else 0.0
+    if isinstance(value, dict):
+        out: Optional[Dict[Any, Any]] = None
+        for key, item in value.items():
+            clean = _json_sanitize(item)
+            if clean is not item:
+                if out is None:
+                    out = dict(value)
+                out[key] = clean
+        return value if out is None else out
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+        changed = False
+        for idx, item in enumerate(items):
+            clean = _json_sanitize(item)
+            if clean is not item:
+                items[idx] = clean
+                changed = True
+        return items if changed else value
+    return value
+
+
+def _json_has_non_finite(value: Any) -> bool:
+    """True if ``value`` holds a NaN/Infinity float anywhere (read-only, no copies)."""
+    stack = [value]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        item = pop()
+        kind = type(item)
+        # Exact-type checks first: strings and ints make up most of a payload.
+        if kind is str or kind is int or kind is bool or item is None:
+            continue
+        if kind is float or isinstance(item, float):
+            if item - item != 0.0:
+                return True
+        elif isinstance(item, dict):
+            extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            extend(item)
+    return False
+
+
+class StdlibJsonEncoder:
+    """Single-pass stdlib encoder.
+
+    Encodes straight from the live tree with the C encoder. Only when the output
+    contains a NaN/Infinity token (rare) is the tree sanitized and encoded again,
+    so non-finite floats still come out as 0.0.
+    """
+
+    name = "stdlib"
+    item_separator = ", "
+    key_separator = ": "
+
+    def dumps(self, payload: Any, *, sort_keys: bool = False, indent: bool = False) -> str:
+        indent_value = 2 if indent else None
+        text = json.dumps(payload, default=_json_default, sort_keys=sort_keys, indent=indent_value)
+        if "NaN" in text or "Infinity" in text:
+            text = json.dumps(
+                _json_sanitize(payload),
+                allow_nan=False,
+                default=_json_default,
+                sort_keys=sort_keys,
+                indent=indent_value,
+            )
+        return text
+
+
+class OrjsonEncoder:
+    """orjson-backed encoder; compact output, non-finite floats become 0.0 like stdlib."""
+
+    name = "orjson"
+    item_separator = ","
+    key_separator = ":"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError("orjson is not installed")
+        self._fallback = StdlibJsonEncoder()
+
+    def dumps(self, payload: Any, *, sort_keys: bool = False, indent: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            data = orjson.dumps(payload, default=_json_default, option=option)
+            # orjson writes NaN/Infinity as null. Only when the output has a null can one be
+            # hiding; then re-encode a sanitized copy so non-finite floats become 0.0 as in stdlib.
+            if b"null" in data and _json_has_non_finite(payload):
+                data = orjson.dumps(_json_sanitize(payload), default=_json_default, option=option)
+            return data.decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits or mixed key types; stdlib copes with those.
+            return self._fallback.dumps(payload, sort_keys=sort_keys, indent=indent)
+
+
+JSON_ENCODERS: Dict[str, Callable[[], Any]] = {
+    "stdlib": StdlibJsonEncoder,
+    "orjson": OrjsonEncoder,
+}
+_json_encoder_instance: Optional[Any] = None
+
+
+def _json_encoder() -> Any:
+    """Return the process-wide JSON encoder (INITTRACKER_JSON_ENCODER picks one explicitly)."""
+    global _json_encoder_instance
+    if _json_encoder_instance is None:
+        requested = str(os.getenv("INITTRACKER_JSON_ENCODER") or "").strip().lower()
+        order = [requested] if requested in JSON_ENCODERS else ["orjson", "stdlib"]
+        for name in order + ["stdlib"]:
+            try:
+                _json_encoder_instance = JSON_ENCODERS[name]()
+                break
+            except Exception:
+                continue
+    return _json_encoder_instance
+
+
+def _set_json_encoder(name: str) -> Any:
+    """Swap the process-wide encoder (raises if the backend is unavailable)."""
+    global _json_encoder_instance
+    _json_encoder_instance = JSON_ENCODERS[str(name)]()
+    return _json_encoder_instance
+
+
+def _json_dumps_fast(payload: Any, *, sort_keys: bool = False, indent: bool = False) -> str:
+    return _json_encoder().dumps(payload, sort_keys=sort_keys, indent=indent)
+
+
 DAMAGE_TYPES = list(base.DAMAGE_TYPES)
 if "hellfire" not in {str(dtype).strip().lower() for dtype in DAMAGE_TYPES}:
     DAMAGE_TYPES.append("hellfire")
@@ -1425,10 +1642,322 @@ class MonsterSpec:
     init_mod: Optional[int]
     saving_throws: Dict[str, int]
     ability_mods: Dict[str, int]
-    raw_data: Dict[str, Any]
+    # Init-only: the stat block lives behind the ``raw_data`` property below rather than in a
+    # field, so repr(), == and asdict() never trigger a detail load on an index-built spec.
+    raw_data: InitVar[Dict[str, Any]]
     turn_schedule_mode: Optional[str] = None
     turn_schedule_every_n: Optional[int] = None
     turn_schedule_counts: Optional[str] = None
+    # Summary columns from logs/monster_catalog.bin, so pickers never need the full stat block.
+    ac: Any = None
+    abilities: Dict[str, Any] = field(default_factory=dict)
+    cr_label: Optional[str] = None
+    # Index-built specs start with an empty raw_data and fetch it through this on first read.
+    detail_loader: Optional[Callable[["MonsterSpec"], Optional[Dict[str, Any]]]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self, raw_data: Dict[str, Any]) -> None:
+        self.__dict__["_raw_data"] = raw_data
+
+
+def _monster_spec_get_raw_data(spec: MonsterSpec) -> Dict[str, Any]:
+    data = spec.__dict__.get("_raw_data")
+    if data:
+        return data
+    loader = spec.__dict__.get("detail_loader")
+    if loader is not None:
+        loaded = loader(spec)
+        if isinstance(loaded, dict):
+            return loaded
+    return data if isinstance(data, dict) else {}
+
+
+def _monster_spec_set_raw_data(spec: MonsterSpec, value: Dict[str, Any]) -> None:
+    spec.__dict__["_raw_data"] = value
+
+
+# Assigned after @dataclass so the init-only argument keeps no default; assigning raw_data
+# pins it on the spec.
+MonsterSpec.raw_data = property(_monster_spec_get_raw_data, _monster_spec_set_raw_data)  # type: ignore[assignment]
+
+
+class MonsterDetailCache:
+    """Bounded LRU of parsed monster stat blocks, keyed by library-relative filename."""
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.capacity = max(1, int(capacity))
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, raw_data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = raw_data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SpellPresetIndex:
+    """Slug, id, name and alias lookups over one generation of spell presets.
+
+    Built once per preset-cache revision (see InitiativeTracker._spell_index) and then
+    shared read-only by every caller, so resolving a spell is a few dict probes.
+    """
+
+    def __init__(
+        self,
+        presets: List[Dict[str, Any]],
+        entries: Optional[Dict[str, Any]] = None,
+        revision: Optional[int] = None,
+    ) -> None:
+        self.presets = presets
+        self.entries = entries
+        self.revision = revision
+        self.by_slug: Dict[str, Dict[str, Any]] = {}
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.by_alias: Dict[str, Dict[str, Any]] = {}
+        # Any known key (name, id, filename, file stem) -> display name.
+        self.names: Dict[str, str] = {}
+        for preset in presets:
+            if not isinstance(preset, dict):
+                continue
+            slug = str(preset.get("slug") or "").strip().lower()
+            sid = str(preset.get("id") or "").strip().lower()
+            display = str(preset.get("name") or "").strip()
+            name = display.lower()
+            if slug:
+                self.by_slug.setdefault(slug, preset)
+            if sid:
+                self.by_id.setdefault(sid, preset)
+            if name:
+                self.by_name.setdefault(name, preset)
+                self.names[name] = display
+                if sid:
+                    self.names[sid] = display
+            for alias in self.key_variants(slug, sid, name):
+                self.by_alias.setdefault(alias, preset)
+        for filename, entry in (entries or {}).items():
+            preset = entry.get("preset") if isinstance(entry, dict) else None
+            if not isinstance(preset, dict):
+                continue
+            display = str(preset.get("name") or "").strip()
+            if not display:
+                continue
+            file_key = str(filename or "").strip()
+            if file_key:
+                self.names[file_key.lower()] = display
+                stem = Path(file_key).stem
+                if stem:
+                    self.names[stem.lower()] = display
+                    self.by_alias.setdefault(stem.lower(), preset)
+            sid = str(preset.get("id") or "").strip()
+            if sid:
+                self.names[sid.lower()] = display
+
+    @staticmethod
+    def key_variants(*values: Any) -> List[str]:
+        """Lower-cased keys plus their hyphenated forms ("Cure Wounds" -> "cure-wounds")."""
+        keys: List[str] = []
+        for value in values:
+            raw = str(value or "").strip().lower()
+            if not raw:
+                continue
+            for key in (raw, raw.replace(" ", "-"), raw.replace("_", "-"), "-".join(raw.replace("_", " ").split())):
+                if key and key not in keys:
+                    keys.append(key)
+        return keys
+
+    def find(self, spell_slug: Any = None, spell_id: Any = None) -> Optional[Dict[str, Any]]:
+        """Exact slug match first, then exact id match."""
+        slug = str(spell_slug or "").strip().lower()
+        if slug and slug in self.by_slug:
+            return self.by_slug[slug]
+        sid = str(spell_id or "").strip().lower()
+        if sid and sid in self.by_id:
+            return self.by_id[sid]
+        return None
+
+    def resolve(self, value: Any) -> Optional[Dict[str, Any]]:
+        """Best match for free-form input: slug, id, name, then any alias variant."""
+        keys = self.key_variants(value)
+        for key in keys:
+            preset = self.find(key, key)
+            if preset is not None:
+                return preset
+        if keys and keys[0] in self.by_name:
+            return self.by_name[keys[0]]
+        for key in keys:
+            if key in self.by_alias:
+                return self.by_alias[key]
+        return None
+
+    def display_name(self, value: Any) -> Optional[str]:
+        return self.names.get(str(value or "").strip().lower())
+
+
+class PlayerProfileIndex:
+    """Alias lookups from combatant names to player YAML paths.
+
+    Built once per player name map (see InitiativeTracker._player_profile_index). Every
+    resolution, including misses for monsters and summons, is remembered so repeated
+    lookups during a snapshot are a single dict probe.
+    """
+
+    def __init__(self, name_map: Dict[str, Path], slugify: Callable[[str], str]) -> None:
+        self.name_map = name_map
+        self.size = len(name_map)
+        self._slugify = slugify
+        self.by_key: Dict[str, Path] = {}
+        self.by_slug: Dict[str, Path] = {}
+        for known_name, known_path in name_map.items():
+            if not isinstance(known_path, Path):
+                continue
+            known_lookup = str(known_name or "").strip().casefold()
+            if not known_lookup:
+                continue
+            self.by_key.setdefault(known_lookup, known_path)
+            known_slug = slugify(known_lookup)
+            if known_slug:
+                self.by_slug.setdefault(known_slug, known_path)
+        self.resolved: Dict[str, Optional[Path]] = {}
+
+    def _match(self, lookup: str) -> Optional[Path]:
+        if not lookup:
+            return None
+        path = self.by_key.get(lookup)
+        if path is None:
+            slug = self._slugify(lookup)
+            path = self.by_slug.get(slug) if slug else None
+        return path
+
+    def resolve(self, value: Any) -> Optional[Path]:
+        """Exact or slug match, then without a " 2" duplicate suffix, then without a "(form)" suffix."""
+        text = str(value or "").strip()
+        lookup = text.casefold()
+        if not lookup:
+            return None
+        if lookup in self.resolved:
+            return self.resolved[lookup]
+        path = self._match(lookup)
+        if path is None:
+            # Duplicate combatants can get suffixes like "Name 2".
+            path = self._match(re.sub(r"\s+\d+$", "", lookup).strip())
+        if path is None:
+            stripped = InitiativeTracker._strip_combat_name_suffix(text).casefold()
+            if stripped != lookup:
+                path = self._match(stripped)
+        self.resolved[lookup] = path
+        return path
+
+    def is_known_miss(self, value: Any) -> bool:
+        lookup = str(value or "").strip().casefold()
+        return bool(lookup) and lookup in self.resolved and self.resolved[lookup] is None
+
+
+class CompiledPlayerProfile:
+    """Derived stats and feature grants for one normalized player profile.
+
+    Compiled once per profile generation (see InitiativeTracker._compiled_player_profile).
+    Editing the YAML, levelling up, changing inventory or editing an item the character
+    owns produces a new normalized profile dict, and spell library changes produce new
+    sources; either forces a recompile.
+    """
+
+    def __init__(
+        self,
+        profile: Dict[str, Any],
+        sources: Tuple[Any, ...],
+        resource_pools: List[Dict[str, Any]],
+        spell_config: Dict[str, Any],
+        spell_config_known: Dict[str, Any],
+        save_dc: Optional[int],
+        ac: Optional[int],
+        active_features: List[Dict[str, Any]],
+        feature_runtime: Dict[str, Any],
+        pool_granted_spells: List[Dict[str, Any]],
+    ) -> None:
+        self.profile = profile
+        self.sources = sources
+        self.resource_pools = resource_pools
+        self.spell_config = spell_config
+        # Spell config without placeholder prepared entries (include_missing_prepared=False).
+        self.spell_config_known = spell_config_known
+        self.save_dc = save_dc
+        self.ac = ac
+        # Profile features merged with the grants of equipped/attuned magic items.
+        self.active_features = active_features
+        self.feature_runtime = feature_runtime
+        self.pool_granted_spells = pool_granted_spells
+
+    def matches(self, profile: Dict[str, Any], sources: Tuple[Any, ...]) -> bool:
+        return (
+            self.profile is profile
+            and len(sources) == len(self.sources)
+            # Revisions compare by value, registries by identity.
+            and all(
+                left is right or (isinstance(left, int) and left == right)
+                for left, right in zip(sources, self.sources)
+            )
+        )
+
+
+def _peek_compiled_player_profile(tracker: Any, profile: Any) -> Optional[CompiledPlayerProfile]:
+    # The normalizers consult the compile cache without building it (building calls them),
+    # and only once a tracker has compiled something, so partial test doubles stay untouched.
+    if not isinstance(tracker.__dict__.get("_compiled_player_profiles"), dict):
+        return None
+    return tracker._compiled_player_profile(profile, build=False)
+
+
+def _record_combat_event(tracker: Any, kind: str, cid: Any = None, target_cid: Any = None, **data: Any) -> None:
+    """Queue one typed event for the structured combat log.
+
+    A no-op until the tracker has opened its event store, so test doubles (including the
+    plain namespaces some tests bind tracker methods to) never touch the database.
+    """
+    store = getattr(tracker, "__dict__", {}).get("_combat_event_service")
+    if store is None:
+        return
+    try:
+        store.record(
+            kind,
+            round_num=int(getattr(tracker, "round_num", 0) or 0),
+            turn_num=int(getattr(tracker, "turn_num", 0) or 0),
+            cid=_normalize_cid_value(cid, f"combat_event.{kind}.cid"),
+            target_cid=_normalize_cid_value(target_cid, f"combat_event.{kind}.target_cid"),
+            data=data,
+        )
+    except Exception:
+        return
+
+
+def _record_lan_action_events(tracker: Any, msg: Dict[str, Any]) -> None:
+    """Record the attack/spell-target outcome a LAN action left on ``msg``, if any."""
+    for key, kind in (("_attack_result", "attack"), ("_spell_target_result", "spell_target")):
+        result = msg.get(key)
+        if not isinstance(result, dict) or not result.get("ok"):
+            continue
+        details = {k: v for k, v in result.items() if k not in ("type", "ok", "attacker_cid", "target_cid")}
+        _record_combat_event(tracker, kind, cid=result.get("attacker_cid"), target_cid=result.get("target_cid"), **details)
 
 
 @dataclass
@@ -1486,6 +2015,505 @@ class LanUrlSettings:
     public_http_url: Optional[str] = None
 
 
+class LanChangeJournal:
+    """Per-entity dirty flags recorded by tracker/map mutations between LAN ticks.
+
+    Entities are combatants (cid), map cells (col,row) and AoEs (aid). ``all_units``,
+    ``terrain`` and ``all_aoes`` widen a mark to every entity of that kind; ``full``
+    asks the next tick to fall back to a full snapshot diff.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cids: set[int] = set()
+        self._cells: set[Tuple[int, int]] = set()
+        self._aids: set[int] = set()
+        self._all_units = False
+        self._terrain = False
+        self._all_aoes = False
+        self._full = False
+
+    def mark(
+        self,
+        cids: Iterable[Any] = (),
+        cells: Iterable[Any] = (),
+        aids: Iterable[Any] = (),
+        all_units: bool = False,
+        terrain: bool = False,
+        all_aoes: bool = False,
+        full: bool = False,
+    ) -> None:
+        with self._lock:
+            for cid in cids:
+                try:
+                    self._cids.add(int(cid))
+                except Exception:
+                    self._full = True
+            for cell in cells:
+                try:
+                    self._cells.add((int(cell[0]), int(cell[1])))
+                except Exception:
+                    self._terrain = True
+            for aid in aids:
+                try:
+                    self._aids.add(int(aid))
+                except Exception:
+                    self._all_aoes = True
+            self._all_units = self._all_units or bool(all_units)
+            self._terrain = self._terrain or bool(terrain)
+            self._all_aoes = self._all_aoes or bool(all_aoes)
+            self._full = self._full or bool(full)
+
+    def is_clean(self) -> bool:
+        with self._lock:
+            return not (
+                self._cids or self._cells or self._aids or self._all_units or self._terrain or self._all_aoes or self._full
+            )
+
+    def drain(self) -> Dict[str, Any]:
+        """Return the pending dirty flags and reset the journal."""
+        with self._lock:
+            dirty = {
+                "cids": set(self._cids),
+                "cells": set(self._cells),
+                "aids": set(self._aids),
+                "all_units": self._all_units,
+                "terrain": self._terrain,
+                "all_aoes": self._all_aoes,
+                "full": self._full,
+            }
+            self._cids.clear()
+            self._cells.clear()
+            self._aids.clear()
+            self._all_units = False
+            self._terrain = False
+            self._all_aoes = False
+            self._full = False
+        return dirty
+
+    @staticmethod
+    def is_empty(dirty: Dict[str, Any]) -> bool:
+        return not any(dirty.get(key) for key in ("cids", "cells", "aids", "all_units", "terrain", "all_aoes", "full"))
+
+
+class LanClientOutbox:
+    """Bounded outbound frame queue for one LAN websocket, drained by a sender task.
+
+    Frames that supersede each other are coalesced while they wait: a new ``state``
+    (or ``grid_update``/``terrain_update``) replaces the pending one, and a ``unit_update``
+    or ``terrain_patch`` right behind another one of its kind merges into it per cid/cell.
+    Only used from the server event loop.
+    """
+
+    # Pending frames made obsolete by a newer frame of the given kind.
+    _SUPERSEDES = {
+        "state": frozenset({"state", "unit_update"}),
+        "terrain_update": frozenset({"terrain_update", "terrain_patch"}),
+        "grid_update": frozenset({"grid_update"}),
+    }
+
+    def __init__(self, max_frames: int = 256) -> None:
+        self.max_frames = max(1, int(max_frames))
+        self._frames: deque = deque()
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._busy = False
+        self.closed = False
+        self.resync_pending = False
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def put(self, kind: str, text: Optional[str] = None, payload: Optional[Dict[str, Any]] = None) -> bool:
+        """Queue a frame; return False when the backlog is over its bound."""
+        if self.closed:
+            return True
+        kind = str(kind or "")
+        if kind in self._SUPERSEDES:
+            superseded = self._SUPERSEDES[kind]
+            before = len(self._frames)
+            self._frames = deque(frame for frame in self._frames if frame["kind"] not in superseded)
+            self.coalesced += before - len(self._frames)
+        elif kind in ("unit_update", "terrain_patch") and isinstance(payload, dict):
+            # Only fold into the newest frame: merging past a later frame (a units_snapshot,
+            # a full terrain_update) would deliver the newer delta before that older state.
+            pending = self._frames[-1] if self._frames else None
+            if pending is not None and pending["kind"] == kind and isinstance(pending.get("payload"), dict):
+                merge = self._merge_unit_update if kind == "unit_update" else self._merge_terrain_patch
+                pending["payload"] = merge(pending["payload"], payload)
+                pending["text"] = None
+                self.coalesced += 1
+                return True
+        self._frames.append({"kind": kind, "text": text, "payload": payload})
+        self._idle.clear()
+        self._ready.set()
+        return len(self._frames) <= self.max_frames
+
+    def clear(self) -> None:
+        self._frames.clear()
+        if not self._busy:
+            self._idle.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._frames.clear()
+        self._ready.set()
+        self._idle.set()
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Wait for the next frame; None once the outbox is closed."""
+        self._busy = False
+        while not self._frames:
+            if self.closed:
+                return None
+            self._idle.set()
+            self._ready.clear()
+            await self._ready.wait()
+        if self.closed:
+            return None
+        self._busy = True
+        return self._frames.popleft()
+
+    async def join(self) -> None:
+        await self._idle.wait()
+
+    @staticmethod
+    def _merge_unit_update(pending: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for update in list(pending.get("updates") or []) + list(newer.get("updates") or []):
+            if not isinstance(update, dict):
+                continue
+            cid = update.get("cid")
+            if cid in merged:
+                merged[cid].update(update)
+            else:
+                merged[cid] = dict(update)
+        return {"type": "unit_update", "updates": list(merged.values())}
+
+    @staticmethod
+    def _merge_terrain_patch(pending: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+        rough: Dict[Tuple[Any, Any], Optional[Dict[str, Any]]] = {}
+        obstacles: Dict[Tuple[Any, Any], bool] = {}
+        for patch in (pending, newer):
+            for cell in patch.get("rough_updates") or []:
+                rough[(cell.get("col"), cell.get("row"))] = cell
+            for cell in patch.get("rough_removals") or []:
+                rough[(cell.get("col"), cell.get("row"))] = None
+            for cell in patch.get("obstacle_updates") or []:
+                obstacles[(cell.get("col"), cell.get("row"))] = True
+            for cell in patch.get("obstacle_removals") or []:
+                obstacles[(cell.get("col"), cell.get("row"))] = False
+        merged: Dict[str, Any] = {"type": "terrain_patch"}
+        rough_updates = [cell for cell in rough.values() if cell is not None]
+        rough_removals = [{"col": key[0], "row": key[1]} for key, cell in rough.items() if cell is None]
+        obstacle_updates = [{"col": key[0], "row": key[1]} for key, present in obstacles.items() if present]
+        obstacle_removals = [{"col": key[0], "row": key[1]} for key, present in obstacles.items() if not present]
+        if rough_updates:
+            merged["rough_updates"] = rough_updates
+        if rough_removals:
+            merged["rough_removals"] = rough_removals
+        if obstacle_updates:
+            merged["obstacle_updates"] = obstacle_updates
+        if obstacle_removals:
+            merged["obstacle_removals"] = obstacle_removals
+        return merged
+
+
+class MapEffectIndex:
+    """Rasterized lookup of map-effect AoEs: aid -> covered cells, cell -> environment records.
+
+    Records are ``{"aid", "effect", "environment"}`` dicts with the environment already
+    normalized, shared by every cell the effect covers. InitiativeTracker._map_effect_index
+    keeps the index in step with ``_lan_aoes``, re-rasterizing only effects whose geometry
+    or environment changed, and skips the walk entirely while neither the mapping nor the
+    tracker's AoE revision moved.
+    """
+
+    def __init__(self) -> None:
+        self._signatures: Dict[int, Any] = {}
+        self._cells: Dict[int, frozenset] = {}
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._by_cell: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+        self.revision = 0
+        # The ``_lan_aoes`` mapping and (AoE revision, size) the index was last synced against.
+        self.synced_source: Any = None
+        self.synced_key: Any = None
+
+    def signature(self, aid: int) -> Any:
+        return self._signatures.get(int(aid))
+
+    def aids(self) -> List[int]:
+        return list(self._signatures)
+
+    def put(
+        self,
+        aid: int,
+        signature: Any,
+        cells: Iterable[Tuple[int, int]] = (),
+        record: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Replace the entry for ``aid``; a ``None`` record indexes no cells."""
+        aid = int(aid)
+        self.discard(aid)
+        self._signatures[aid] = signature
+        if record is not None:
+            covered = frozenset((int(col), int(row)) for col, row in cells)
+            self._cells[aid] = covered
+            self._records[aid] = record
+            for cell in covered:
+                bucket = self._by_cell.setdefault(cell, [])
+                bucket.append(record)
+                if len(bucket) > 1:
+                    bucket.sort(key=lambda entry: entry["aid"])
+        self.revision += 1
+
+    def discard(self, aid: int) -> None:
+        aid = int(aid)
+        if aid not in self._signatures:
+            return
+        self._signatures.pop(aid, None)
+        record = self._records.pop(aid, None)
+        for cell in self._cells.pop(aid, frozenset()):
+            bucket = self._by_cell.get(cell)
+            if not bucket:
+                continue
+            bucket[:] = [entry for entry in bucket if entry is not record]
+            if not bucket:
+                self._by_cell.pop(cell, None)
+        self.revision += 1
+
+    def cells_for(self, aid: int) -> frozenset:
+        return self._cells.get(int(aid), frozenset())
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [self._records[aid] for aid in sorted(self._records)]
+
+    def records_at(self, col: int, row: int) -> List[Dict[str, Any]]:
+        return self._by_cell.get((int(col), int(row)), [])
+
+
+class LanMovementGrid:
+    """Battle map compiled into flat per-cell arrays for movement pathing.
+
+    Cells are indexed ``row * cols + col``. ``blocked``, ``water`` and ``rough`` are
+    bytearrays built from obstacles and rough terrain; ``env_mult`` holds the map-effect
+    cost multiplier for entering a cell (never below 1.0). The terrain and environment
+    layers are rebuilt independently by InitiativeTracker._lan_movement_grid when their
+    signatures change.
+    """
+
+    def __init__(self, cols: int, rows: int) -> None:
+        self.cols = max(0, int(cols))
+        self.rows = max(0, int(rows))
+        size = self.cols * self.rows
+        self.blocked = bytearray(size)
+        self.water = bytearray(size)
+        self.rough = bytearray(size)
+        self.env_mult: List[float] = [1.0] * size
+        self.terrain_key: Any = None
+        self.env_key: Any = None
+        # Bumped whenever a layer is rebuilt; keys cached reachability fields.
+        self.revision = 0
+
+    def index(self, col: int, row: int) -> Optional[int]:
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return None
+
+    def load_terrain(self, obstacles: Iterable[Tuple[int, int]], cells: Dict[Tuple[int, int], Tuple[bool, bool]]) -> None:
+        """Reset the terrain layer; ``cells`` maps (col,row) -> (is_water, is_rough)."""
+        size = self.cols * self.rows
+        self.blocked = bytearray(size)
+        self.water = bytearray(size)
+        self.rough = bytearray(size)
+        for col, row in obstacles:
+            idx = self.index(int(col), int(row))
+            if idx is not None:
+                self.blocked[idx] = 1
+        for (col, row), (is_water, is_rough) in cells.items():
+            idx = self.index(int(col), int(row))
+            if idx is None:
+                continue
+            self.water[idx] = 1 if is_water else 0
+            self.rough[idx] = 1 if is_rough else 0
+
+    def shortest_cost(
+        self,
+        origin: Tuple[int, int],
+        dest: Tuple[int, int],
+        max_ft: int,
+        mode: str = "normal",
+        water_multiplier: float = 1.0,
+    ) -> Optional[int]:
+        """A* over (cell, diagonal parity) using the 5/10 alternating diagonal rule.
+
+        Step costs match the original per-edge rules: water scales a step by
+        ``water_multiplier``, rough terrain doubles it (both skipped when flying) and
+        the destination's map-effect multiplier applies last, each rounded up.
+        """
+        if tuple(origin) == tuple(dest):
+            return 0
+        goal = self.index(int(dest[0]), int(dest[1]))
+        if goal is None or self.blocked[goal]:
+            return None
+        if mode == "swim" and not self.water[goal]:
+            return None
+        if mode == "burrow" and self.water[goal]:
+            return None
+        return self._search(origin, (int(dest[0]), int(dest[1])), max_ft, mode, water_multiplier)
+
+    def reachability_field(
+        self,
+        origin: Tuple[int, int],
+        max_ft: int,
+        mode: str = "normal",
+        water_multiplier: float = 1.0,
+    ) -> Dict[Tuple[int, int], int]:
+        """Cheapest cost in feet to every cell reachable from ``origin`` within ``max_ft``."""
+        return self._search(origin, None, max_ft, mode, water_multiplier)
+
+    def _search(
+        self,
+        origin: Tuple[int, int],
+        dest: Optional[Tuple[int, int]],
+        max_ft: int,
+        mode: str,
+        water_multiplier: float,
+    ) -> Any:
+        """A* to ``dest`` (returns its cost or None), or a bounded Dijkstra flood when ``dest`` is None."""
+        cols = self.cols
+        rows = self.rows
+        blocked = self.blocked
+        water = self.water
+        rough = self.rough
+        env_mult = self.env_mult
+        grounded = mode != "fly"
+        swim_only = mode == "swim"
+        land_only = mode == "burrow"
+        scale_water = grounded and water_multiplier != 1.0
+        ceil = math.ceil
+        max_ft = int(max_ft)
+
+        goal = None
+        goal_col = goal_row = 0
+        if dest is not None:
+            goal_col, goal_row = dest
+            goal = goal_row * cols + goal_col
+
+        # Every step costs at least ``floor_step``; with the usual multipliers (>= 1)
+        # the 5/10 diagonal surcharge is also a valid lower bound.
+        floor_step = 5
+        if grounded and water_multiplier < 1.0 and any(water):
+            floor_step = max(1, int(ceil(5 * water_multiplier)))
+        exact_diagonals = floor_step == 5
+
+        def heuristic(col: int, row: int, parity: int) -> int:
+            if goal is None:
+                return 0
+            dx = abs(goal_col - col)
+            dy = abs(goal_row - row)
+            if dx < dy:
+                dx, dy = dy, dx
+            if exact_diagonals:
+                return 5 * dx + 5 * ((dy + parity) // 2)
+            return floor_step * dx
+
+        unreachable = 10**9
+        best: Dict[int, int] = {}
+        settled: Dict[Tuple[int, int], int] = {}
+        # (f, h, g, cell, parity, water under the mover)
+        pq: List[Tuple[int, int, int, int, int, int]] = []
+        oc, orow = int(origin[0]), int(origin[1])
+        start = self.index(oc, orow)
+        if start is not None:
+            best[start * 2] = 0
+            pq.append((heuristic(oc, orow, 0), 0, 0, start, 0, water[start]))
+        else:
+            # Tokens left off a shrunken map may still step back onto it.
+            settled[(oc, orow)] = 0
+            for dc in (-1, 0, 1):
+                for dr in (-1, 0, 1):
+                    nxt = self.index(oc + dc, orow + dr)
+                    if nxt is None or (dc == 0 and dr == 0) or blocked[nxt]:
+                        continue
+                    if (swim_only and not water[nxt]) or (land_only and water[nxt]):
+                        continue
+                    diagonal = dc != 0 and dr != 0
+                    step = 5
+                    if grounded:
+                        if scale_water and water[nxt]:
+                            step = int(ceil(step * water_multiplier))
+                        if rough[nxt]:
+                            step *= 2
+                    if env_mult[nxt] != 1.0:
+                        step = int(ceil(step * env_mult[nxt]))
+                    npar = 1 if diagonal else 0
+                    h = heuristic(oc + dc, orow + dr, npar)
+                    if step + h <= max_ft and step < best.get(nxt * 2 + npar, unreachable):
+                        best[nxt * 2 + npar] = step
+                        heapq.heappush(pq, (step + h, h, step, nxt, npar, water[nxt]))
+
+        # This loop is the hot path, so the heuristic and step rules are inlined.
+        moves = [(dc, dr, dc != 0 and dr != 0) for dc in (-1, 0, 1) for dr in (-1, 0, 1) if dc or dr]
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        best_get = best.get
+        while pq:
+            _f, _h, cost, idx, parity, cur_water = heappop(pq)
+            if cost != best_get(idx * 2 + parity, unreachable):
+                continue
+            row, col = divmod(idx, cols)
+            if goal is None:
+                if (col, row) not in settled:
+                    settled[(col, row)] = cost
+            elif idx == goal:
+                return cost
+            for dc, dr, diagonal in moves:
+                nc = col + dc
+                nr = row + dr
+                if nc < 0 or nc >= cols or nr < 0 or nr >= rows:
+                    continue
+                nxt = nr * cols + nc
+                if blocked[nxt]:
+                    continue
+                nxt_water = water[nxt]
+                if (swim_only and not nxt_water) or (land_only and nxt_water):
+                    continue
+                if diagonal:
+                    step = 10 if parity else 5
+                    npar = 1 - parity
+                else:
+                    step = 5
+                    npar = parity
+                if grounded:
+                    if scale_water and (cur_water or nxt_water):
+                        step = int(ceil(step * water_multiplier))
+                    if rough[nxt]:
+                        step *= 2
+                mult = env_mult[nxt]
+                if mult != 1.0:
+                    step = int(ceil(step * mult))
+                ncost = cost + step
+                key = nxt * 2 + npar
+                if ncost >= best_get(key, unreachable):
+                    continue
+                if goal is None:
+                    h = 0
+                else:
+                    dx = goal_col - nc if goal_col >= nc else nc - goal_col
+                    dy = goal_row - nr if goal_row >= nr else nr - goal_row
+                    if dx < dy:
+                        dx, dy = dy, dx
+                    h = 5 * dx + 5 * ((dy + npar) // 2) if exact_diagonals else floor_step * dx
+                if ncost + h > max_ft:
+                    continue
+                best[key] = ncost
+                heappush(pq, (ncost + h, h, ncost, nxt, npar, nxt_water))
+        return None if goal is not None else settled
+
+
 class LanController:
     """Runs a FastAPI+WebSocket server in a background thread and bridges actions into the Tk thread."""
     _ACTION_MESSAGE_TYPES = (
@@ -1544,7 +2572,11 @@ class LanController:
         "manual_override_hp",
         "manual_override_spell_slot",
         "manual_override_resource_pool",
+        "reachability_request",
     )
+    # Actions whose effects are fully covered by change-journal marks (see _lan_try_move);
+    # reachability_request is read-only.
+    _JOURNALED_ACTION_TYPES = frozenset({"move", "set_facing", "reachability_request"})
 
     def __init__(self, app: "InitiativeTracker") -> None:
         if not isinstance(app, InitiativeTracker):
@@ -1579,10 +2611,8 @@ class LanController:
         self._cid_push_subscriptions: Dict[int, List[Dict[str, Any]]] = {}
         self._battle_log_subscribers: set[int] = set()
         self._battle_log_limit_default: int = 200
-        self._battle_log_follow_offset: int = 0
-        self._battle_log_follow_partial: bytes = b""
-        self._battle_log_follow_inode: Optional[Tuple[int, int]] = None
-        self._battle_log_follow_size: int = 0
+        # Last battle-log ring seq pushed to subscribers (None until the first poll).
+        self._battle_log_follow_seq: Optional[int] = None
         self._battle_log_follow_last_check: float = 0.0
         self._battle_log_follow_interval_s: float = 0.35
         self._client_error_logger = _make_client_error_logger()
@@ -1602,7 +2632,27 @@ class LanController:
 
         self._actions: "queue.Queue[Dict[str, Any]]" = queue.Queue()
         self._last_snapshot: Optional[Dict[str, Any]] = None
-        self._last_static_json: Optional[str] = None
+        # Change-journal mode: ticks build patches only for entities marked dirty by the
+        # tracker/map window, with a periodic full diff to reconcile anything unjournaled.
+        self._journal_enabled: bool = os.getenv("INITTRACKER_LAN_FULL_DIFF") != "1"
+        self._journal_reconcile_interval_s: float = 2.0
+        # Idle ticks still reconcile, less often, so map edits that bypass the journal reach clients.
+        self._journal_idle_reconcile_interval_s: float = 10.0
+        self._last_full_snapshot_ts: float = 0.0
+        # Broadcasts go out to every client concurrently; a client that cannot take a
+        # frame within this window is dropped instead of stalling everyone else.
+        self._send_timeout_s: float = 2.0
+        # Each client gets a bounded, coalescing outbox drained by its own sender task.
+        self._outbox_max_frames: int = 256
+        self._outboxes: Dict[int, LanClientOutbox] = {}
+        self._outbox_tasks: Dict[int, "asyncio.Future[Any]"] = {}
+        # static_data is versioned per section by content hash; clients get a manifest and
+        # fetch changed sections over HTTP (ETag), keeping copies in IndexedDB.
+        self._last_static_manifest: Optional[Dict[str, str]] = None
+        self._static_sections: Dict[str, Tuple[str, str]] = {}
+        self._static_section_memo: Dict[str, Tuple[Any, Any, str, str]] = {}
+        self._static_sections_lock = threading.Lock()
+        self._last_static_sources: Optional[Tuple[Any, Any]] = None
         self._monster_choices_cache: List[Dict[str, Any]] = []
         self._monster_choices_cache_key: Optional[Tuple[int, int]] = None
         self._last_static_check_ts: float = 0.0
@@ -1740,27 +2790,7 @@ class LanController:
 
     @staticmethod
     def _json_dumps(payload: Any) -> str:
-        def sanitize(value: Any) -> Any:
-            if isinstance(value, float):
-                return value if math.isfinite(value) else 0.0
-            if isinstance(value, dict):
-                return {key: sanitize(item) for key, item in value.items()}
-            if isinstance(value, list):
-                return [sanitize(item) for item in value]
-            if isinstance(value, tuple):
-                return [sanitize(item) for item in value]
-            if isinstance(value, set):
-                return [sanitize(item) for item in value]
-            return value
-
-        def default(value: Any) -> Any:
-            if isinstance(value, Path):
-                return str(value)
-            if isinstance(value, (set, tuple)):
-                return list(value)
-            return str(value)
-
-        return json.dumps(sanitize(payload), allow_nan=False, default=default)
+        return _json_dumps_fast(payload)
 
     def _is_admin_token_valid(self, token: str) -> bool:
         token = str(token or "").strip()
@@ -2046,7 +3076,14 @@ class LanController:
         # Lazy imports so the base app still works without these deps installed.
         try:
             from fastapi import Body, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-            from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response, StreamingResponse
+            from fastapi.responses import (
+                FileResponse,
+                HTMLResponse,
+                JSONResponse,
+                RedirectResponse,
+                Response,
+                StreamingResponse,
+            )
             from fastapi.staticfiles import StaticFiles
             import uvicorn
             # Expose these in module globals so FastAPI's type resolver can see 'em even from nested defs.
@@ -2063,7 +3100,12 @@ class LanController:
             )
             return
 
-        self._fastapi_app = FastAPI()
+        class LanJSONResponse(JSONResponse):
+            # Same encoder as the websocket path (tolerates NaN/inf, sets, Paths).
+            def render(self, content: Any) -> bytes:
+                return _json_dumps_fast(content).encode("utf-8")
+
+        self._fastapi_app = FastAPI(default_response_class=LanJSONResponse)
         # Used to bust LAN-client caches for JS/CSS without needing a rebuild.
         app_version = str(APP_VERSION)
         _sync_profile_picture_cache()
@@ -2311,6 +3353,28 @@ class LanController:
             token = self._issue_admin_token()
             return {"token": token, "expires_in": self._admin_token_ttl_seconds}
 
+        @self._fastapi_app.get("/api/lan/static")
+        async def lan_static_data(request: Request):
+            host = getattr(getattr(request, "client", None), "host", "")
+            if not self._is_host_allowed(host):
+                raise HTTPException(status_code=403, detail="Unauthorized host.")
+            return Response(content=self._static_data_response_text(), media_type="application/json")
+
+        @self._fastapi_app.get("/api/lan/static/{section}")
+        async def lan_static_section(request: Request, section: str):
+            host = getattr(getattr(request, "client", None), "host", "")
+            if not self._is_host_allowed(host):
+                raise HTTPException(status_code=403, detail="Unauthorized host.")
+            entry = self._static_section_entry(str(section or "").strip())
+            if entry is None:
+                raise HTTPException(status_code=404, detail="Unknown static section.")
+            etag, text = entry
+            headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+            match = str(request.headers.get("if-none-match") or "")
+            if f'"{etag}"' in match or match.strip() == etag:
+                return Response(status_code=304, headers=headers)
+            return Response(content=text, media_type="application/json", headers=headers)
+
         @self._fastapi_app.get("/api/admin/sessions")
         async def admin_sessions(request: Request):
             self._require_admin(request)
@@ -2328,6 +3392,25 @@ class LanController:
             limit = max(1, min(limit, 1000))
             return {"lines": self._lan_log_lines(limit)}
 
+        # Plain def: FastAPI runs it in its threadpool, so the store flush and the SQLite
+        # query never block the event loop the WebSocket clients share.
+        @self._fastapi_app.get("/api/lan/events")
+        def lan_events(
+            request: Request,
+            session: Optional[str] = None,
+            round: Optional[int] = None,
+            cid: Optional[int] = None,
+            type: Optional[str] = None,
+            after: int = 0,
+            limit: int = 200,
+        ):
+            self._require_admin(request)
+            if type is not None and type not in combat_events.EVENT_TYPES:
+                raise HTTPException(status_code=400, detail="Unknown event type.")
+            return self.app._combat_events_page(
+                session=session, round_num=round, cid=cid, kind=type, after=after, limit=limit
+            )
+
         @self._fastapi_app.post("/api/client-log")
         async def client_log(request: Request, payload: Dict[str, Any] = Body(...)):
             if not isinstance(payload, dict):
@@ -2384,30 +3467,9 @@ class LanController:
 
         @self._fastapi_app.get("/api/spells")
         async def list_spells(details: bool = False, raw: bool = False):
-            spells_dir = self.app._resolve_spells_dir()
-            ids = _scan_spell_ids(spells_dir)
-            payload: Dict[str, Any] = {"ids": ids}
-            if not details:
-                return payload
-            spells: List[Dict[str, Any]] = []
-            if not spells_dir:
-                payload["spells"] = spells
-                return payload
-            for spell_id in ids:
-                text = _read_spell_yaml_text(spells_dir, spell_id)
-                if not text:
-                    spells.append({"id": spell_id, "raw": None, "parsed": None, "error": "Spell not found."})
-                    continue
-                entry: Dict[str, Any] = {"id": spell_id, "raw": text}
-                if not raw and yaml is not None:
-                    try:
-                        entry["parsed"] = yaml.safe_load(text)
-                    except Exception as exc:
-                        entry["parsed"] = None
-                        entry["error"] = f"Failed to parse YAML: {exc}"
-                spells.append(entry)
-            payload["spells"] = spells
-            return payload
+            if details:
+                return self.app._spell_library_records(include_parsed=not raw)
+            return {"ids": _scan_spell_ids(self.app._resolve_spells_dir())}
 
         @self._fastapi_app.get("/api/spells/{spell_id}")
         async def get_spell(spell_id: str, raw: bool = False):
@@ -2418,6 +3480,12 @@ class LanController:
             if not spells_dir:
                 raise HTTPException(status_code=404, detail="Spells directory not found.")
             text = _read_spell_yaml_text(spells_dir, spell_id)
+            if not text:
+                # Also accept a spell's id, name or alias, resolved through the shared spell index.
+                preset = self.app._spell_index().resolve(spell_id)
+                slug = str((preset or {}).get("slug") or "").strip()
+                if slug and slug != spell_id:
+                    text = _read_spell_yaml_text(spells_dir, slug)
             if not text:
                 raise HTTPException(status_code=404, detail="Spell not found.")
             payload: Dict[str, Any] = {"id": spell_id, "raw": text}
@@ -2776,19 +3844,25 @@ class LanController:
             try:
                 await self._send_grid_update_async(ws_id, self._cached_snapshot.get("grid", {}))
                 await self._send_terrain_update_async(ws_id, self._terrain_payload())
-                # Send static data first (spell presets, etc.) - only sent once
-                await ws.send_text(
-                    self._json_dumps({"type": "static_data", "data": self._static_data_payload()})
+                # Send the static data manifest first; the client fetches sections it has not cached
+                self._enqueue_frame(
+                    ws_id,
+                    ws,
+                    "static_manifest",
+                    self._json_dumps(self._static_manifest_message(self._static_manifest(self._static_sections_snapshot()))),
                 )
                 # Then send initial state without static data, with personalized "you" field
                 you_data = self._build_you_payload(ws_id)
-                await ws.send_text(
+                self._enqueue_frame(
+                    ws_id,
+                    ws,
+                    "state",
                     self._json_dumps({
                         "type": "state", 
                         "state": self._dynamic_snapshot_payload(), 
                         "pcs": self._pcs_payload(),
                         "you": you_data
-                    })
+                    }),
                 )
             except (TypeError, ValueError) as exc:
                 error_details = traceback.format_exc()
@@ -2890,7 +3964,7 @@ class LanController:
                     elif typ == "save_preset":
                         preset = msg.get("preset")
                         if preset is not None and not isinstance(preset, dict):
-                            await ws.send_text(self._json_dumps({"type": "preset_error", "error": "Invalid preset payload."}))
+                            await self._send_async(ws_id, {"type": "preset_error", "error": "Invalid preset payload."})
                             continue
                         host_key = self._client_hosts.get(ws_id) or f"ws:{ws_id}"
                         if preset is None:
@@ -2898,11 +3972,11 @@ class LanController:
                         else:
                             self._host_presets[host_key] = preset
                         self._save_host_presets()
-                        await ws.send_text(self._json_dumps({"type": "preset_saved"}))
+                        await self._send_async(ws_id, {"type": "preset_saved"})
                     elif typ == "load_preset":
                         host_key = self._client_hosts.get(ws_id) or f"ws:{ws_id}"
                         preset = self._host_presets.get(host_key)
-                        await ws.send_text(self._json_dumps({"type": "preset", "preset": preset}))
+                        await self._send_async(ws_id, {"type": "preset", "preset": preset})
                     elif typ == "grid_request":
                         await self._send_grid_update_async(ws_id, self._cached_snapshot.get("grid", {}))
                     elif typ == "terrain_request":
@@ -2930,7 +4004,7 @@ class LanController:
                             lines = self.app._lan_battle_log_lines(limit=req_limit)
                         except Exception:
                             lines = []
-                        await ws.send_text(self._json_dumps({"type": "battle_log", "lines": lines}))
+                        await self._send_async(ws_id, {"type": "battle_log", "lines": lines})
                     elif typ == "log_subscribe":
                         try:
                             req_limit = int(msg.get("limit") or self._battle_log_limit_default)
@@ -2943,7 +4017,17 @@ class LanController:
                             lines = self.app._lan_battle_log_lines(limit=req_limit)
                         except Exception:
                             lines = []
-                        await ws.send_text(self._json_dumps({"type": "battle_log", "lines": lines}))
+                        await self._send_async(ws_id, {"type": "battle_log", "lines": lines})
+                    elif typ == "log_history":
+                        try:
+                            before = msg.get("before")
+                            page = self.app._lan_battle_log_page(
+                                before=None if before is None else int(before),
+                                limit=max(1, min(int(msg.get("limit") or self._battle_log_limit_default), 1000)),
+                            )
+                        except Exception:
+                            page = {"lines": [], "start": 0, "total": 0}
+                        await self._send_async(ws_id, {"type": "battle_log_history", **page})
                     elif typ == "log_unsubscribe":
                         with self._clients_lock:
                             self._battle_log_subscribers.discard(ws_id)
@@ -3130,6 +4214,7 @@ class LanController:
                     old = self._drop_claim(ws_id)
                     self._grid_pending.pop(ws_id, None)
                     self._terrain_pending.pop(ws_id, None)
+                self._close_outbox(ws_id)
                 if old is not None:
                     name = self._tracker._pc_name_for(int(old))
                     self.app._oplog(f"LAN session disconnected ws_id={ws_id} (claimed {name})")
@@ -3264,7 +4349,7 @@ class LanController:
             )
             return []
         invalid: List[str] = []
-        data = json.dumps(payload)
+        data = _json_dumps_fast(payload)
         for sub in subscriptions:
             endpoint = str(sub.get("endpoint", "") or "").strip()
             keys = sub.get("keys") if isinstance(sub, dict) else None
@@ -3393,6 +4478,7 @@ class LanController:
         try:
             # 1) process queued actions from clients
             processed_any = False
+            processed_types: set[str] = set()
             while True:
                 try:
                     msg = self._actions.get_nowait()
@@ -3401,6 +4487,7 @@ class LanController:
                 processed_any = True
                 try:
                     typ = str(msg.get("type") or "")
+                    processed_types.add(typ)
                     if typ == "move":
                         to = msg.get("to") or {}
                         self._move_debug_log(
@@ -3432,7 +4519,11 @@ class LanController:
                             f"has_pc_name_for={hasattr(self.app, '_pc_name_for')}",
                             level="debug",
                         )
-                    self._tracker._lan_apply_action(msg)
+                    # Handlers refresh the table/map/broadcast after every step; fold those into
+                    # one idle pass for the whole tick.
+                    with base._refresh_batch(self._tracker):
+                        self._tracker._lan_apply_action(msg)
+                    _record_lan_action_events(self._tracker, msg)
                     if typ == "move":
                         move_debug_entries.append(
                             {
@@ -3477,84 +4568,10 @@ class LanController:
                         self._log_lan_exception("LAN cached PC snapshot failed", exc)
                 return
 
-            # 2) broadcast snapshot if changed (polling-based, avoids wiring every hook)
-            snap = self.app._lan_snapshot(include_static=False)
-            self._cached_snapshot = snap
-            try:
-                self._cached_pcs = list(
-                    self.app._lan_pcs() if hasattr(self.app, "_lan_pcs") else self.app._lan_claimable()
-                )
-            except Exception as exc:
-                self._cached_pcs = []
-                self._log_lan_exception("LAN cached PC snapshot failed", exc)
-            grid = snap.get("grid", {}) if isinstance(snap, dict) else {}
-            if isinstance(grid, dict):
-                cols = grid.get("cols")
-                rows = grid.get("rows")
-                if self._grid_last_sent != (cols, rows):
-                    self._grid_version += 1
-                    self._grid_last_sent = (cols, rows)
-                    self._broadcast_grid_update(grid)
-            prev_snap = self._last_snapshot or {}
-            if self._last_snapshot is None:
-                self._last_snapshot = copy.deepcopy(snap)
-                if move_debug_entries:
-                    for entry in move_debug_entries:
-                        self._move_debug_log(
-                            {
-                                "event": "lan_move_broadcast",
-                                "ws_id": entry.get("ws_id"),
-                                "_claimed_cid": entry.get("_claimed_cid"),
-                                "cid": entry.get("cid"),
-                                "applied": entry.get("applied"),
-                                "reject_reason": entry.get("reject_reason"),
-                                "units_snapshot_sent": False,
-                                "unit_updates_count": 0,
-                                "terrain_patch_sent": False,
-                                "aoe_patch_sent": False,
-                                "initial_snapshot_only": True,
-                            },
-                            level="info",
-                        )
-            else:
-                turn_update = self._build_turn_update(prev_snap, snap)
-                if turn_update:
-                    self._broadcast_payload({"type": "turn_update", **turn_update})
-
-                units_snapshot, unit_updates = self._build_unit_updates(prev_snap, snap)
-                if units_snapshot is not None:
-                    self._broadcast_payload({"type": "units_snapshot", "units": units_snapshot})
-                elif unit_updates:
-                    self._broadcast_payload({"type": "unit_update", "updates": unit_updates})
-
-                terrain_patch = self._build_terrain_patch(prev_snap, snap)
-                if terrain_patch:
-                    self._broadcast_payload({"type": "terrain_patch", **terrain_patch})
-                    self._apply_terrain_patch_to_map(terrain_patch)
-
-                aoe_patch = self._build_aoe_patch(prev_snap, snap)
-                if aoe_patch:
-                    self._broadcast_payload({"type": "aoe_patch", **aoe_patch})
-
-                if move_debug_entries:
-                    for entry in move_debug_entries:
-                        self._move_debug_log(
-                            {
-                                "event": "lan_move_broadcast",
-                                "ws_id": entry.get("ws_id"),
-                                "_claimed_cid": entry.get("_claimed_cid"),
-                                "cid": entry.get("cid"),
-                                "applied": entry.get("applied"),
-                                "reject_reason": entry.get("reject_reason"),
-                                "units_snapshot_sent": units_snapshot is not None,
-                                "unit_updates_count": len(unit_updates),
-                                "terrain_patch_sent": bool(terrain_patch),
-                                "aoe_patch_sent": bool(aoe_patch),
-                            },
-                            level="info",
-                        )
-
-                self._last_snapshot = copy.deepcopy(snap)
+            # 2) broadcast changes: journaled dirty entities when possible, else a full snapshot diff
+            dirty = self._drain_change_journal(processed_types)
+            if dirty is None or not self._broadcast_journal_changes(dirty, move_debug_entries):
+                self._broadcast_snapshot_changes(move_debug_entries)
 
             now = time.monotonic()
             static_check_due = bool(processed_any)
@@ -3563,10 +4580,14 @@ class LanController:
                     now - float(getattr(self, "_last_static_check_ts", 0.0))
                     >= float(getattr(self, "_static_check_interval_s", 0.9))
                 )
+            if static_check_due and not processed_any and self._static_sources_unchanged():
+                # Idle tick and nothing the static sections derive from moved: skip the rebuild.
+                self._last_static_check_ts = now
+                static_check_due = False
             if static_check_due:
                 self._last_static_check_ts = now
                 static_payload: Optional[Dict[str, Any]] = None
-                static_json: Optional[str] = None
+                manifest: Optional[Dict[str, str]] = None
                 static_build_ms = 0.0
                 static_json_ms = 0.0
                 monster_choices_count = 0
@@ -3575,7 +4596,7 @@ class LanController:
                     static_payload = self._static_data_payload()
                     static_build_ms = (time.perf_counter() - build_start) * 1000.0
                     json_start = time.perf_counter()
-                    static_json = json.dumps(static_payload, sort_keys=True, separators=(",", ":"))
+                    manifest = self._static_manifest(self._static_section_table(static_payload))
                     static_json_ms = (time.perf_counter() - json_start) * 1000.0
                     monster_choices_count = len(static_payload.get("monster_choices", []))
                 except Exception as exc:
@@ -3587,12 +4608,13 @@ class LanController:
                         static_json_ms,
                         monster_choices_count,
                     )
-                if static_payload is not None and static_json is not None:
-                    if self._last_static_json is None:
-                        self._last_static_json = static_json
-                    elif static_json != self._last_static_json:
-                        self._last_static_json = static_json
-                        self._broadcast_payload({"type": "static_data", "data": static_payload})
+                if manifest is not None:
+                    last_manifest = getattr(self, "_last_static_manifest", None)
+                    if last_manifest is None:
+                        self._last_static_manifest = manifest
+                    elif manifest != last_manifest:
+                        self._last_static_manifest = manifest
+                        self._broadcast_payload(self._static_manifest_message(manifest, last_manifest))
         except KeyboardInterrupt:
             should_schedule_next = False
             self._polling = False
@@ -3611,66 +4633,249 @@ class LanController:
             if should_schedule_next and self._polling:
                 self.app.after(next_tick_ms, self._tick)
 
+    def _drain_change_journal(self, processed_types: set[str]) -> Optional[Dict[str, Any]]:
+        """Return this tick's journaled dirty flags, or ``None`` when a full snapshot diff is required."""
+        journal_fn = getattr(self.app, "_lan_change_journal", None)
+        if not callable(journal_fn):
+            return None
+        try:
+            dirty = journal_fn().drain()
+        except Exception:
+            return None
+        if not getattr(self, "_journal_enabled", True) or self._last_snapshot is None:
+            return None
+        if dirty.get("full") or set(processed_types) - self._JOURNALED_ACTION_TYPES:
+            return None
+        elapsed = time.monotonic() - float(getattr(self, "_last_full_snapshot_ts", 0.0))
+        if LanChangeJournal.is_empty(dirty) and not processed_types:
+            # Nothing journaled this tick: only the slow idle reconcile runs a full diff.
+            if elapsed >= float(getattr(self, "_journal_idle_reconcile_interval_s", 10.0)):
+                return None
+            return dirty
+        # Something did change: piggyback the regular full diff on it to catch side effects
+        # the journal missed.
+        if elapsed >= float(getattr(self, "_journal_reconcile_interval_s", 2.0)):
+            return None
+        return dirty
+
+    def _broadcast_journal_changes(self, dirty: Dict[str, Any], move_debug_entries: List[Dict[str, Any]]) -> bool:
+        """Patch the cached snapshot for journaled entities only and broadcast the diffs.
+
+        Returns ``False`` when the tracker could not express the change as a delta, in which
+        case the caller falls back to :meth:`_broadcast_snapshot_changes`.
+        """
+        if LanChangeJournal.is_empty(dirty) and not move_debug_entries:
+            return True
+        prev = self._last_snapshot
+        delta_fn = getattr(self.app, "_lan_snapshot_delta", None)
+        if not isinstance(prev, dict) or not callable(delta_fn):
+            return False
+        delta = delta_fn(dirty, prev)
+        if not isinstance(delta, dict):
+            return False
+
+        snap = dict(prev)
+        snap.update(delta.get("header") or {})
+
+        units_delta: Dict[int, Dict[str, Any]] = delta.get("units") or {}
+        unit_updates: List[Dict[str, Any]] = []
+        if units_delta:
+            prev_units = self._unit_lookup(prev.get("units"))
+            _, unit_updates = self._build_unit_updates(
+                {"units": [prev_units[cid] for cid in units_delta if cid in prev_units]},
+                {"units": list(units_delta.values())},
+            )
+            snap["units"] = [
+                units_delta.get(int(unit.get("cid")), unit) if isinstance(unit, dict) else unit
+                for unit in (prev.get("units") or [])
+            ]
+            try:
+                self._cached_pcs = list(
+                    self.app._lan_pcs() if hasattr(self.app, "_lan_pcs") else self.app._lan_claimable()
+                )
+            except Exception as exc:
+                self._cached_pcs = []
+                self._log_lan_exception("LAN cached PC snapshot failed", exc)
+
+        rough_delta: Dict[Tuple[int, int], Optional[Dict[str, Any]]] = delta.get("rough") or {}
+        obstacle_delta: Dict[Tuple[int, int], bool] = delta.get("obstacles") or {}
+        terrain_patch: Dict[str, Any] = {}
+        if rough_delta or obstacle_delta:
+            prev_rough = self._rough_lookup(prev.get("rough_terrain"))
+            prev_obstacles = self._obstacle_lookup(prev.get("obstacles"))
+            terrain_patch = self._build_terrain_patch(
+                {
+                    "rough_terrain": [prev_rough[key] for key in rough_delta if key in prev_rough],
+                    "obstacles": [{"col": key[0], "row": key[1]} for key in obstacle_delta if key in prev_obstacles],
+                },
+                {
+                    "rough_terrain": [cell for cell in rough_delta.values() if cell is not None],
+                    "obstacles": [{"col": key[0], "row": key[1]} for key, present in obstacle_delta.items() if present],
+                },
+            )
+            if terrain_patch:
+                for key, cell in rough_delta.items():
+                    if cell is None:
+                        prev_rough.pop(key, None)
+                    else:
+                        prev_rough[key] = cell
+                for key, present in obstacle_delta.items():
+                    if present:
+                        prev_obstacles.add(key)
+                    else:
+                        prev_obstacles.discard(key)
+                snap["rough_terrain"] = [prev_rough[key] for key in sorted(prev_rough)]
+                snap["obstacles"] = [{"col": int(c), "row": int(r)} for (c, r) in sorted(prev_obstacles)]
+
+        aoes_delta: Dict[int, Optional[Dict[str, Any]]] = delta.get("aoes") or {}
+        aoe_patch: Dict[str, Any] = {}
+        if aoes_delta:
+            prev_aoes = {int(a.get("aid")): a for a in prev.get("aoes", []) if isinstance(a, dict) and "aid" in a}
+            aoe_patch = self._build_aoe_patch(
+                {"aoes": [prev_aoes[aid] for aid in aoes_delta if aid in prev_aoes]},
+                {"aoes": [aoe for aoe in aoes_delta.values() if aoe is not None]},
+            )
+            if aoe_patch:
+                for aid, aoe in aoes_delta.items():
+                    if aoe is None:
+                        prev_aoes.pop(aid, None)
+                    else:
+                        prev_aoes[aid] = aoe
+                snap["aoes"] = [prev_aoes[aid] for aid in sorted(prev_aoes, key=lambda aid: (aid < 0, abs(aid)))]
+
+        turn_update = self._build_turn_update(prev, snap)
+        if turn_update:
+            self._broadcast_payload({"type": "turn_update", **turn_update})
+        if unit_updates:
+            self._broadcast_payload({"type": "unit_update", "updates": unit_updates})
+        if terrain_patch:
+            self._broadcast_payload({"type": "terrain_patch", **terrain_patch})
+            self._apply_terrain_patch_to_map(terrain_patch)
+        if aoe_patch:
+            self._broadcast_payload({"type": "aoe_patch", **aoe_patch})
+        for entry in move_debug_entries:
+            self._move_debug_log(
+                {
+                    "event": "lan_move_broadcast",
+                    "ws_id": entry.get("ws_id"),
+                    "_claimed_cid": entry.get("_claimed_cid"),
+                    "cid": entry.get("cid"),
+                    "applied": entry.get("applied"),
+                    "reject_reason": entry.get("reject_reason"),
+                    "units_snapshot_sent": False,
+                    "unit_updates_count": len(unit_updates),
+                    "terrain_patch_sent": bool(terrain_patch),
+                    "aoe_patch_sent": bool(aoe_patch),
+                    "journaled": True,
+                },
+                level="info",
+            )
+        # Patched entries are freshly built dicts, so the cached and last-sent snapshots can share them.
+        self._cached_snapshot = snap
+        self._last_snapshot = snap
+        return True
+
+    def _broadcast_snapshot_changes(self, move_debug_entries: List[Dict[str, Any]]) -> None:
+        """Rebuild the full snapshot and broadcast whatever differs from the last one."""
+        snap = self.app._lan_snapshot(include_static=False)
+        self._cached_snapshot = snap
+        try:
+            self._cached_pcs = list(
+                self.app._lan_pcs() if hasattr(self.app, "_lan_pcs") else self.app._lan_claimable()
+            )
+        except Exception as exc:
+            self._cached_pcs = []
+            self._log_lan_exception("LAN cached PC snapshot failed", exc)
+        grid = snap.get("grid", {}) if isinstance(snap, dict) else {}
+        if isinstance(grid, dict):
+            cols = grid.get("cols")
+            rows = grid.get("rows")
+            if self._grid_last_sent != (cols, rows):
+                self._grid_version += 1
+                self._grid_last_sent = (cols, rows)
+                self._broadcast_grid_update(grid)
+        prev_snap = self._last_snapshot or {}
+        self._last_full_snapshot_ts = time.monotonic()
+        if self._last_snapshot is None:
+            self._last_snapshot = copy.deepcopy(snap)
+            if move_debug_entries:
+                for entry in move_debug_entries:
+                    self._move_debug_log(
+                        {
+                            "event": "lan_move_broadcast",
+                            "ws_id": entry.get("ws_id"),
+                            "_claimed_cid": entry.get("_claimed_cid"),
+                            "cid": entry.get("cid"),
+                            "applied": entry.get("applied"),
+                            "reject_reason": entry.get("reject_reason"),
+                            "units_snapshot_sent": False,
+                            "unit_updates_count": 0,
+                            "terrain_patch_sent": False,
+                            "aoe_patch_sent": False,
+                            "initial_snapshot_only": True,
+                        },
+                        level="info",
+                    )
+        else:
+            turn_update = self._build_turn_update(prev_snap, snap)
+            if turn_update:
+                self._broadcast_payload({"type": "turn_update", **turn_update})
+
+            units_snapshot, unit_updates = self._build_unit_updates(prev_snap, snap)
+            if units_snapshot is not None:
+                self._broadcast_payload({"type": "units_snapshot", "units": units_snapshot})
+            elif unit_updates:
+                self._broadcast_payload({"type": "unit_update", "updates": unit_updates})
+
+            terrain_patch = self._build_terrain_patch(prev_snap, snap)
+            if terrain_patch:
+                self._broadcast_payload({"type": "terrain_patch", **terrain_patch})
+                self._apply_terrain_patch_to_map(terrain_patch)
+
+            aoe_patch = self._build_aoe_patch(prev_snap, snap)
+            if aoe_patch:
+                self._broadcast_payload({"type": "aoe_patch", **aoe_patch})
+
+            if move_debug_entries:
+                for entry in move_debug_entries:
+                    self._move_debug_log(
+                        {
+                            "event": "lan_move_broadcast",
+                            "ws_id": entry.get("ws_id"),
+                            "_claimed_cid": entry.get("_claimed_cid"),
+                            "cid": entry.get("cid"),
+                            "applied": entry.get("applied"),
+                            "reject_reason": entry.get("reject_reason"),
+                            "units_snapshot_sent": units_snapshot is not None,
+                            "unit_updates_count": len(unit_updates),
+                            "terrain_patch_sent": bool(terrain_patch),
+                            "aoe_patch_sent": bool(aoe_patch),
+                        },
+                        level="info",
+                    )
+
+            self._last_snapshot = copy.deepcopy(snap)
+
     def _poll_battle_log_updates(self) -> None:
         now = time.monotonic()
         if now - self._battle_log_follow_last_check < self._battle_log_follow_interval_s:
             return
         self._battle_log_follow_last_check = now
-        path = self.app._history_file_path()
         try:
-            st = path.stat()
-        except Exception:
-            return
-        inode = (int(getattr(st, "st_dev", 0)), int(getattr(st, "st_ino", 0)))
-        size = int(getattr(st, "st_size", 0))
-        if self._battle_log_follow_inode is None:
-            self._battle_log_follow_inode = inode
-            self._battle_log_follow_offset = size
-            self._battle_log_follow_size = size
-            self._battle_log_follow_partial = b""
-            return
-        rotated = inode != self._battle_log_follow_inode
-        truncated = size < self._battle_log_follow_offset
-        if rotated or truncated:
-            self._battle_log_follow_inode = inode
-            self._battle_log_follow_offset = size
-            self._battle_log_follow_size = size
-            self._battle_log_follow_partial = b""
-            self._broadcast_battle_log_snapshot()
-            return
-        if size <= self._battle_log_follow_offset:
-            self._battle_log_follow_size = size
-            return
-        start = self._battle_log_follow_offset
-        try:
-            with path.open("rb") as fh:
-                fh.seek(start)
-                chunk = fh.read(max(0, size - start))
+            log = self.app._battle_log()
+            cursor = self._battle_log_follow_seq
+            if cursor is None:
+                self._battle_log_follow_seq = log.last_seq
+                return
+            entries, self._battle_log_follow_seq, complete = log.entries_since(cursor)
         except Exception:
             return
-        self._battle_log_follow_offset = size
-        self._battle_log_follow_size = size
-        if not chunk and not self._battle_log_follow_partial:
-            return
-        data = self._battle_log_follow_partial + chunk
-        raw_lines = data.splitlines(keepends=True)
-        complete: List[bytes] = []
-        trailing_partial = b""
-        for raw_line in raw_lines:
-            if raw_line.endswith((b"\n", b"\r")):
-                complete.append(raw_line)
-            else:
-                trailing_partial = raw_line
-        self._battle_log_follow_partial = trailing_partial
         if not complete:
+            # The log was rewritten (session load, clear) or outran the ring buffer.
+            self._broadcast_battle_log_snapshot()
             return
-        try:
-            lines = [line.decode("utf-8", errors="ignore").rstrip("\r\n") for line in complete]
-
-        except Exception:
-            return
-        if lines:
-            self._broadcast_battle_log_append(lines)
+        if entries:
+            self._broadcast_battle_log_append([entry.line for entry in entries])
 
     def _broadcast_battle_log_snapshot(self, limit: Optional[int] = None) -> None:
         if limit is None:
@@ -3710,7 +4915,7 @@ class LanController:
                 to_drop.append(ws_id)
                 continue
             try:
-                await ws.send_text(text)
+                self._enqueue_frame(ws_id, ws, "battle_log", text)
             except Exception as exc:
                 to_drop.append(ws_id)
                 self._log_lan_exception(f"LAN battle log send failed ws_id={ws_id}", exc)
@@ -4088,53 +5293,181 @@ class LanController:
     def _broadcast_payload(self, payload: Dict[str, Any]) -> None:
         if not self._loop:
             return
-        coro = self._broadcast_payload_async(payload)
-        try:
-            asyncio.run_coroutine_threadsafe(coro, self._loop)
-        except Exception as exc:
-            self._log_lan_exception("LAN payload broadcast scheduling failed", exc)
+        coro = self._broadcast_payload_async(payload)
+        try:
+            asyncio.run_coroutine_threadsafe(coro, self._loop)
+        except Exception as exc:
+            self._log_lan_exception("LAN payload broadcast scheduling failed", exc)
+
+    @classmethod
+    def _state_message_text(cls, state_json: str, pcs_json: str, you_data: Dict[str, Any]) -> str:
+        """Splice pre-encoded state/pcs fragments into a per-client state message.
+
+        Produces exactly what _json_dumps would for the equivalent dict (for either
+        encoder backend), so clients cannot tell spliced frames from fully serialized ones.
+        """
+        encoder = _json_encoder()
+        item_sep, key_sep = encoder.item_separator, encoder.key_separator
+        return (
+            '{"type"' + key_sep + '"state"' + item_sep
+            + '"state"' + key_sep + state_json + item_sep
+            + '"pcs"' + key_sep + pcs_json + item_sep
+            + '"you"' + key_sep + cls._json_dumps(you_data)
+            + "}"
+        )
+
+    async def _send_text_with_timeout(self, ws_id: int, ws: Any, text: str) -> Optional[int]:
+        """Send one frame; return ws_id when the client failed or timed out."""
+        timeout = float(getattr(self, "_send_timeout_s", 2.0) or 0.0)
+        try:
+            if timeout > 0:
+                await asyncio.wait_for(ws.send_text(text), timeout=timeout)
+            else:
+                await ws.send_text(text)
+        except asyncio.TimeoutError as exc:
+            self._log_lan_exception(f"LAN send timed out ws_id={ws_id} after {timeout:.1f}s", exc)
+            return ws_id
+        except Exception as exc:
+            self._log_lan_exception(f"LAN broadcast send failed ws_id={ws_id}", exc)
+            return ws_id
+        return None
+
+    async def _fan_out_texts(
+        self,
+        frames: List[Tuple[int, Any, str]],
+        kind: str = "",
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Queue pre-encoded frames on every client's outbox; sender tasks do the I/O."""
+        for ws_id, ws, text in frames:
+            self._enqueue_frame(ws_id, ws, kind, text, payload)
+
+    def _outbox_for(self, ws_id: int, ws: Any) -> Optional[LanClientOutbox]:
+        outboxes = self.__dict__.setdefault("_outboxes", {})
+        outbox = outboxes.get(ws_id)
+        if outbox is not None and not outbox.closed:
+            return outbox
+        outbox = LanClientOutbox(max_frames=int(getattr(self, "_outbox_max_frames", 256) or 256))
+        outboxes[ws_id] = outbox
+        self.__dict__.setdefault("_outbox_tasks", {})[ws_id] = asyncio.ensure_future(
+            self._outbox_sender(ws_id, ws, outbox)
+        )
+        return outbox
+
+    def _enqueue_frame(
+        self,
+        ws_id: int,
+        ws: Any,
+        kind: str,
+        text: Optional[str],
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        outbox = self._outbox_for(ws_id, ws)
+        if outbox is None or outbox.put(kind, text, payload):
+            return
+        if outbox.resync_pending:
+            # Still behind after a resync: give up on this client, it will reconnect.
+            self._append_lan_log(
+                f"LAN client ws_id={ws_id} exceeded {outbox.max_frames} queued frames twice; dropping",
+                level="warning",
+            )
+            self._drop_clients([ws_id])
+            asyncio.ensure_future(self._close_ws_quietly(ws, 1013, "Client fell too far behind."))
+            return
+        self._append_lan_log(
+            f"LAN client ws_id={ws_id} exceeded {outbox.max_frames} queued frames; resyncing",
+            level="warning",
+        )
+        outbox.clear()
+        outbox.resync_pending = True
+        outbox.put("resync")
+
+    async def _outbox_sender(self, ws_id: int, ws: Any, outbox: LanClientOutbox) -> None:
+        while True:
+            frame = await outbox.get()
+            if frame is None:
+                return
+            if frame["kind"] == "resync":
+                await self._send_full_state_async(ws_id)
+                outbox.resync_pending = False
+                continue
+            text = frame.get("text")
+            if text is None:
+                try:
+                    text = self._json_dumps(frame.get("payload"))
+                except Exception as exc:
+                    self._log_lan_exception(f"LAN outbox serialization failed ws_id={ws_id}", exc)
+                    continue
+            failed = await self._send_text_with_timeout(ws_id, ws, text)
+            if failed is not None:
+                self._drop_clients([ws_id])
+                await self._close_ws_quietly(ws, 1011, "Send failed.")
+                return
+
+    @staticmethod
+    async def _close_ws_quietly(ws: Any, code: int, reason: str) -> None:
+        try:
+            await ws.close(code=code, reason=reason)
+        except Exception:
+            pass
+
+    def _close_outbox(self, ws_id: int) -> None:
+        outbox = self.__dict__.get("_outboxes", {}).pop(ws_id, None)
+        if outbox is not None:
+            outbox.close()
+        self.__dict__.get("_outbox_tasks", {}).pop(ws_id, None)
+
+    async def _wait_outboxes_idle(self) -> None:
+        for outbox in list(self.__dict__.get("_outboxes", {}).values()):
+            await outbox.join()
+
+    def _drop_clients(self, ws_ids: Iterable[int]) -> None:
+        ws_ids = list(ws_ids)
+        if not ws_ids:
+            return
+        with self._clients_lock:
+            for ws_id in ws_ids:
+                # cleanup drop
+                self._drop_claim(ws_id)
+                self._clients.pop(ws_id, None)
+                self._clients_meta.pop(ws_id, None)
+                self._client_hosts.pop(ws_id, None)
+        for ws_id in ws_ids:
+            self._close_outbox(ws_id)
 
     async def _broadcast_state_async(self, snap: Dict[str, Any]) -> None:
-        # Build the base state payload once
+        # Build and encode the shared state once; only "you" differs per client.
         try:
             state_data = self._dynamic_snapshot_payload()
             pcs_data = self._pcs_payload()
+            state_json = self._json_dumps(state_data)
+            pcs_json = self._json_dumps(pcs_data)
         except Exception as exc:
             self.app._oplog(f"LAN state broadcast serialization failed: {exc}", level="warning")
             self._log_lan_exception("LAN state broadcast serialization failed", exc)
             return
-        
-        to_drop: List[int] = []
+
         with self._clients_lock:
             items = list(self._clients.items())
             view_only_clients = set(self._view_only_clients)
-        view_only_state = None
+        view_only_json = None
         if view_only_clients:
-            view_only_state = self._view_only_state_payload(state_data)
-        
-        # Send personalized payload to each client with their own "you" field
+            try:
+                view_only_json = self._json_dumps(self._view_only_state_payload(state_data))
+            except Exception as exc:
+                self._log_lan_exception("LAN view-only state serialization failed", exc)
+
+        frames: List[Tuple[int, Any, str]] = []
+        to_drop: List[int] = []
         for ws_id, ws in items:
             try:
-                you_data = self._build_you_payload(ws_id)
-                payload_state = view_only_state if ws_id in view_only_clients and view_only_state is not None else state_data
-                payload = self._json_dumps({
-                    "type": "state", 
-                    "state": payload_state, 
-                    "pcs": pcs_data,
-                    "you": you_data
-                })
-                await ws.send_text(payload)
+                payload_json = view_only_json if ws_id in view_only_clients and view_only_json is not None else state_json
+                frames.append((ws_id, ws, self._state_message_text(payload_json, pcs_json, self._build_you_payload(ws_id))))
             except Exception as exc:
                 to_drop.append(ws_id)
                 self._log_lan_exception(f"LAN state broadcast send failed ws_id={ws_id}", exc)
-        if to_drop:
-            with self._clients_lock:
-                for ws_id in to_drop:
-                    # cleanup drop
-                    self._drop_claim(ws_id)
-                    self._clients.pop(ws_id, None)
-                    self._clients_meta.pop(ws_id, None)
-                    self._client_hosts.pop(ws_id, None)
+        self._drop_clients(to_drop)
+        await self._fan_out_texts(frames, kind="state")
 
     async def _broadcast_payload_async(self, payload: Dict[str, Any]) -> None:
         try:
@@ -4143,22 +5476,11 @@ class LanController:
             self.app._oplog(f"LAN payload broadcast serialization failed: {exc}", level="warning")
             self._log_lan_exception("LAN payload broadcast serialization failed", exc)
             return
-        to_drop: List[int] = []
         with self._clients_lock:
             items = list(self._clients.items())
-        for ws_id, ws in items:
-            try:
-                await ws.send_text(text)
-            except Exception as exc:
-                to_drop.append(ws_id)
-                self._log_lan_exception(f"LAN payload broadcast send failed ws_id={ws_id}", exc)
-        if to_drop:
-            with self._clients_lock:
-                for ws_id in to_drop:
-                    self._drop_claim(ws_id)
-                    self._clients.pop(ws_id, None)
-                    self._clients_meta.pop(ws_id, None)
-                    self._client_hosts.pop(ws_id, None)
+        await self._fan_out_texts(
+            [(ws_id, ws, text) for ws_id, ws in items], kind=str(payload.get("type") or ""), payload=payload
+        )
 
     def _broadcast_grid_update(self, grid: Dict[str, Any]) -> None:
         if not self._loop:
@@ -4188,15 +5510,9 @@ class LanController:
         now = time.time()
         with self._clients_lock:
             items = list(self._clients.items())
-        for ws_id, ws in items:
-            try:
-                await ws.send_text(payload)
-                with self._clients_lock:
-                    self._grid_pending[ws_id] = (self._grid_version, now)
-            except Exception as exc:
-                with self._clients_lock:
-                    self._grid_pending.pop(ws_id, None)
-                self._log_lan_exception(f"LAN grid broadcast send failed ws_id={ws_id}", exc)
+            for ws_id, _ws in items:
+                self._grid_pending[ws_id] = (self._grid_version, now)
+        await self._fan_out_texts([(ws_id, ws, payload) for ws_id, ws in items], kind="grid_update")
 
     async def _broadcast_terrain_update_async(self, terrain: Dict[str, Any]) -> None:
         try:
@@ -4210,15 +5526,9 @@ class LanController:
         now = time.time()
         with self._clients_lock:
             items = list(self._clients.items())
-        for ws_id, ws in items:
-            try:
-                await ws.send_text(payload)
-                with self._clients_lock:
-                    self._terrain_pending[ws_id] = (self._terrain_version, now)
-            except Exception as exc:
-                with self._clients_lock:
-                    self._terrain_pending.pop(ws_id, None)
-                self._log_lan_exception(f"LAN terrain broadcast send failed ws_id={ws_id}", exc)
+            for ws_id, _ws in items:
+                self._terrain_pending[ws_id] = (self._terrain_version, now)
+        await self._fan_out_texts([(ws_id, ws, payload) for ws_id, ws in items], kind="terrain_update")
 
     async def _send_grid_update_async(self, ws_id: int, grid: Dict[str, Any]) -> None:
         payload = self._json_dumps({"type": "grid_update", "grid": grid, "version": self._grid_version})
@@ -4229,7 +5539,7 @@ class LanController:
         if isinstance(grid, dict):
             self._grid_last_sent = (grid.get("cols"), grid.get("rows"))
         try:
-            await ws.send_text(payload)
+            self._enqueue_frame(ws_id, ws, "grid_update", payload)
             with self._clients_lock:
                 self._grid_pending[ws_id] = (self._grid_version, time.time())
         except Exception as exc:
@@ -4244,7 +5554,7 @@ class LanController:
         if not ws:
             return
         try:
-            await ws.send_text(payload)
+            self._enqueue_frame(ws_id, ws, "terrain_update", payload)
             with self._clients_lock:
                 self._terrain_pending[ws_id] = (self._terrain_version, time.time())
         except Exception as exc:
@@ -4273,7 +5583,7 @@ class LanController:
                 continue
             payload = {"type": "grid_update", "grid": self._cached_snapshot.get("grid", {}), "version": self._grid_version}
             try:
-                asyncio.run_coroutine_threadsafe(ws.send_text(self._json_dumps(payload)), self._loop)
+                asyncio.run_coroutine_threadsafe(self._send_async(ws_id, payload), self._loop)
                 with self._clients_lock:
                     self._grid_pending[ws_id] = (self._grid_version, now)
             except Exception:
@@ -4301,7 +5611,7 @@ class LanController:
                 continue
             payload = {"type": "terrain_update", "terrain": self._terrain_payload(), "version": self._terrain_version}
             try:
-                asyncio.run_coroutine_threadsafe(ws.send_text(self._json_dumps(payload)), self._loop)
+                asyncio.run_coroutine_threadsafe(self._send_async(ws_id, payload), self._loop)
                 with self._clients_lock:
                     self._terrain_pending[ws_id] = (self._terrain_version, now)
             except Exception:
@@ -4321,6 +5631,15 @@ class LanController:
         except Exception:
             pass
 
+    def send_reachability(self, ws_id: Optional[int], payload: Dict[str, Any]) -> None:
+        """Reply to a reachability_request with the unit's reachable squares."""
+        if ws_id is None or not self._loop:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._send_async(int(ws_id), payload), self._loop)
+        except Exception:
+            pass
+
     def send_initiative_prompt(self, ws_id: Optional[int], cid: int, name: str) -> None:
         """Prompt a claimed LAN player to roll initiative for their PC."""
         if ws_id is None or not self._loop:
@@ -4384,17 +5703,23 @@ class LanController:
         if not ws:
             return
         try:
-            await ws.send_text(self._json_dumps({"type": "toast", "text": text}))
+            self._enqueue_frame(ws_id, ws, "toast", self._json_dumps({"type": "toast", "text": text}))
         except Exception:
             pass
 
     async def _send_async(self, ws_id: int, payload: Dict[str, Any]) -> None:
+        """Queue one frame for a client behind everything already in its outbox.
+
+        Going through the outbox keeps per-client order: a full ``state`` supersedes the
+        deltas still waiting instead of overtaking them.
+        """
         with self._clients_lock:
             ws = self._clients.get(ws_id)
         if not ws:
             return
         try:
-            await ws.send_text(self._json_dumps(payload))
+            kind = str(payload.get("type") or "") if isinstance(payload, dict) else ""
+            self._enqueue_frame(ws_id, ws, kind, self._json_dumps(payload))
         except Exception as exc:
             self._log_lan_exception(f"LAN send failed ws_id={ws_id}", exc)
 
@@ -4408,7 +5733,8 @@ class LanController:
         except Exception as exc:
             self._log_lan_exception(f"LAN full state terrain send failed ws_id={ws_id}", exc)
         try:
-            await self._send_async(ws_id, {"type": "static_data", "data": self._static_data_payload()})
+            manifest = self._static_manifest(self._static_sections_snapshot())
+            await self._send_async(ws_id, self._static_manifest_message(manifest))
         except Exception as exc:
             self._log_lan_exception(f"LAN full state static send failed ws_id={ws_id}", exc)
         try:
@@ -4732,13 +6058,27 @@ class LanController:
             except Exception:
                 return None
 
-        def _ability_score(raw_data: Dict[str, Any], ability: str) -> int:
-            abilities = raw_data.get("abilities") if isinstance(raw_data.get("abilities"), dict) else {}
+        def _ability_score(abilities: Dict[str, Any], ability: str) -> int:
             score = _as_int(abilities.get(ability))
             if score is None:
                 return 10
             return max(1, min(30, int(score)))
 
+        def _summary_ac(spec: MonsterSpec) -> int:
+            # Index-built specs carry AC and ability scores in their summary columns.
+            ac = _as_int(getattr(spec, "ac", None))
+            if ac is None and getattr(spec, "detail_loader", None) is None:
+                raw_data = spec.raw_data if isinstance(spec.raw_data, dict) else {}
+                ac = _as_int(raw_data.get("ac")) or _as_int(raw_data.get("armor_class"))
+            return max(1, int(ac or 10))
+
+        def _summary_abilities(spec: MonsterSpec) -> Dict[str, Any]:
+            abilities = getattr(spec, "abilities", None)
+            if not abilities and getattr(spec, "detail_loader", None) is None:
+                raw_data = spec.raw_data if isinstance(spec.raw_data, dict) else {}
+                abilities = raw_data.get("abilities")
+            return abilities if isinstance(abilities, dict) else {}
+
         try:
             monster_choices = [
                 {
@@ -4748,14 +6088,7 @@ class LanController:
                         "name": str(spec.name or ""),
                         "type": str(spec.mtype or "construct"),
                         "hp": max(1, int(spec.hp or 1)),
-                        "ac": max(
-                            1,
-                            int(
-                                _as_int((spec.raw_data or {}).get("ac"))
-                                or _as_int((spec.raw_data or {}).get("armor_class"))
-                                or 10
-                            ),
-                        ),
+                        "ac": _summary_ac(spec),
                         "speeds": {
                             "walk": max(1, int(spec.speed or 30)),
                             "swim": max(0, int(spec.swim_speed or 0)),
@@ -4764,12 +6097,8 @@ class LanController:
                             "climb": max(0, int(spec.climb_speed or 0)),
                         },
                         "abilities": {
-                            "str": _ability_score(spec.raw_data if isinstance(spec.raw_data, dict) else {}, "str"),
-                            "dex": _ability_score(spec.raw_data if isinstance(spec.raw_data, dict) else {}, "dex"),
-                            "con": _ability_score(spec.raw_data if isinstance(spec.raw_data, dict) else {}, "con"),
-                            "int": _ability_score(spec.raw_data if isinstance(spec.raw_data, dict) else {}, "int"),
-                            "wis": _ability_score(spec.raw_data if isinstance(spec.raw_data, dict) else {}, "wis"),
-                            "cha": _ability_score(spec.raw_data if isinstance(spec.raw_data, dict) else {}, "cha"),
+                            ability: _ability_score(_summary_abilities(spec), ability)
+                            for ability in ("str", "dex", "con", "int", "wis", "cha")
                         },
                     },
                 }
@@ -4801,6 +6130,114 @@ class LanController:
             "token_colours": ["#6aa9ff", "#ff6a6a", "#66d17a", "#f1c95f", "#c97dff", "#61d8d8"],
         }
 
+    # Sections that are literals in _static_data_payload and never change at runtime.
+    _STATIC_BUILTIN_SECTIONS = ("conditions", "dice_types", "token_colours")
+
+    def _static_section_versions(self) -> Dict[str, Tuple[Any, ...]]:
+        """Revision counters each static section is derived from.
+
+        A ``None`` entry means the counters do not cover the whole section (no library
+        watcher, or runtime state such as wild-shape picks and spent resources); such a
+        section is also re-encoded whenever its payload object is replaced.
+        """
+        try:
+            app = self.app
+            state = app.__dict__
+            revision = app._library_revision
+            specs = getattr(app, "_monster_specs", [])
+        except Exception:
+            return {}
+        players = (revision("players"), state.get("_player_yaml_revision"))
+        versions: Dict[str, Tuple[Any, ...]] = {
+            "spell_presets": (revision("spells"), state.get("_spell_presets_revision")),
+            "player_spells": players,
+            "player_profiles": players + (None,),
+            "resource_pools": (None,),
+            "consumables_library": (revision("items"), state.get("_item_catalog_revision")),
+            # Same key _monster_choices_payload caches its list under.
+            "monster_choices": (id(specs), len(specs) if isinstance(specs, list) else 0),
+        }
+        for name in self._STATIC_BUILTIN_SECTIONS:
+            versions[name] = ("builtin",)
+        return versions
+
+    def _static_section_table(self, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Tuple[str, str]]:
+        """Return ``{section: (etag, json_text)}`` for static_data.
+
+        A section is only re-encoded and re-hashed when the revision counters it is
+        derived from moved (see :meth:`_static_section_versions`); sections those counters
+        don't fully cover are also re-encoded when their payload object is replaced.
+        """
+        if payload is None:
+            payload = self._static_data_payload()
+        versions = self._static_section_versions()
+        lock = self.__dict__.setdefault("_static_sections_lock", threading.Lock())
+        with lock:
+            memo = self.__dict__.setdefault("_static_section_memo", {})
+            table: Dict[str, Tuple[str, str]] = {}
+            for name, value in payload.items():
+                version = versions.get(name, (None,))
+                cached = memo.get(name)
+                if (
+                    cached is not None
+                    and cached[0] == version
+                    and (None not in version or cached[1] is value)
+                ):
+                    table[name] = (cached[2], cached[3])
+                    continue
+                text = _json_dumps_fast(value, sort_keys=True)
+                etag = hashlib.sha1(text.encode("utf-8")).hexdigest()[:20]
+                memo[name] = (version, value, etag, text)
+                table[name] = (etag, text)
+            for name in [name for name in memo if name not in payload]:
+                memo.pop(name, None)
+            self._static_sections = table
+        return table
+
+    def _static_sources_unchanged(self) -> bool:
+        """True when neither the revision counters nor the cached snapshot moved since the last check."""
+        sources = (self._static_section_versions(), self.__dict__.get("_cached_snapshot"))
+        previous = self.__dict__.get("_last_static_sources")
+        self._last_static_sources = sources
+        if not sources[0] or previous is None:
+            return False
+        return previous[0] == sources[0] and previous[1] is sources[1]
+
+    @staticmethod
+    def _static_manifest(table: Dict[str, Tuple[str, str]]) -> Dict[str, str]:
+        return {name: entry[0] for name, entry in table.items()}
+
+    @staticmethod
+    def _static_manifest_message(
+        manifest: Dict[str, str], previous: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        message: Dict[str, Any] = {"type": "static_manifest", "sections": dict(manifest)}
+        if previous is not None:
+            message["changed"] = sorted(name for name, etag in manifest.items() if previous.get(name) != etag)
+        return message
+
+    def _static_sections_snapshot(self) -> Dict[str, Tuple[str, str]]:
+        """The section table last built on the Tk thread (LAN start / tick).
+
+        The HTTP and WebSocket handlers run on the server's event loop, so they serve this
+        snapshot rather than rebuilding static data there; it is only built in place when
+        no table exists yet.
+        """
+        table = self.__dict__.get("_static_sections")
+        if isinstance(table, dict) and table:
+            return table
+        return self._static_section_table()
+
+    def _static_section_entry(self, section: str) -> Optional[Tuple[str, str]]:
+        """Return ``(etag, json_text)`` for one static section of the current snapshot."""
+        return self._static_sections_snapshot().get(section)
+
+    def _static_data_response_text(self) -> str:
+        """``{"sections": manifest, "data": {...}}`` spliced from the snapshot's encoded sections."""
+        table = self._static_sections_snapshot()
+        data = ", ".join(f"{json.dumps(name)}: {entry[1]}" for name, entry in table.items())
+        return f'{{"sections": {json.dumps(self._static_manifest(table))}, "data": {{{data}}}}}'
+
     def _resolve_planning_auth(self, request: "Request", player_cid: Optional[int] = None) -> Dict[str, Any]:
         from fastapi import HTTPException
 
@@ -5119,6 +6556,16 @@ class InitiativeTracker(base.InitiativeTracker):
     def _load_beast_forms(self) -> List[Dict[str, Any]]:
         if isinstance(self._wild_shape_beast_cache, list):
             return self._wild_shape_beast_cache
+        specs = getattr(self, "_monster_specs", None)
+        has_specs = isinstance(specs, list) and bool(specs)
+        # Only a fully loaded monster index has a fingerprint; partial loads stay in memory.
+        fingerprint = self.__dict__.get("_monster_catalog_fingerprint") if has_specs else None
+        table_path = _ensure_logs_dir() / "beast_forms.json" if fingerprint else None
+        table = beast_forms.BeastFormTable.load(table_path, fingerprint) if table_path is not None else None
+        if table is not None:
+            self._wild_shape_beast_cache = table.forms
+            self.__dict__["_beast_form_table_cache"] = table
+            return table.forms
 
         def is_beast_type(value: Any) -> bool:
             text = str(value or "").strip().lower()
@@ -5149,12 +6596,13 @@ class InitiativeTracker(base.InitiativeTracker):
 
         forms: List[Dict[str, Any]] = []
         seen_ids: set[str] = set()
-        specs = getattr(self, "_monster_specs", None)
-        has_specs = isinstance(specs, list) and bool(specs)
         if has_specs:
             for spec in specs:
                 if not isinstance(spec, MonsterSpec):
                     continue
+                if spec.detail_loader is not None and not is_beast_type(spec.mtype):
+                    # Index-built specs carry the YAML type as mtype; skip decoding non-beast details.
+                    continue
                 raw = spec.raw_data if isinstance(spec.raw_data, dict) else {}
                 if not is_beast_type(raw.get("type") or spec.mtype):
                     continue
@@ -5236,8 +6684,23 @@ class InitiativeTracker(base.InitiativeTracker):
                     )
         forms.sort(key=lambda entry: (entry.get("challenge_rating", 0.0), entry.get("name", "")))
         self._wild_shape_beast_cache = forms
+        table = beast_forms.BeastFormTable(forms, fingerprint)
+        self.__dict__["_beast_form_table_cache"] = table
+        if table_path is not None:
+            try:
+                table.save(table_path)
+            except Exception:
+                pass
         return forms
 
+    def _beast_form_table(self) -> beast_forms.BeastFormTable:
+        forms = self._load_beast_forms()
+        table = self.__dict__.get("_beast_form_table_cache")
+        if not isinstance(table, beast_forms.BeastFormTable) or table.forms is not forms:
+            table = beast_forms.BeastFormTable(forms)
+            self.__dict__["_beast_form_table_cache"] = table
+        return table
+
     def _wild_shape_available_forms(
         self,
         profile: Dict[str, Any],
@@ -5248,27 +6711,22 @@ class InitiativeTracker(base.InitiativeTracker):
         known = set(self._normalized_prepared_wild_shapes_from_profile(profile))
         if druid_level < 2:
             return []
-        if druid_level >= 8:
-            max_cr = 1.0
-        elif druid_level >= 4:
-            max_cr = 0.5
-        else:
-            max_cr = 0.25
+        table = self._beast_form_table()
+        rules = beast_forms.wild_shape_rules(druid_level)
         result: List[Dict[str, Any]] = []
-        for form in self._load_beast_forms():
-            form_cr = float(form.get("challenge_rating") or 0.0)
-            if form_cr > 2.0:
-                continue
-            allowed = True
-            if form_cr > max_cr:
-                allowed = False
-            speed = form.get("speed") if isinstance(form.get("speed"), dict) else {}
-            if int(speed.get("fly") or 0) > 0 and druid_level < 8:
-                allowed = False
-            if int(speed.get("swim") or 0) > 0 and druid_level < 4:
-                allowed = False
-            if str(form.get("size") or "").strip().lower() == "tiny" and druid_level < 11:
-                allowed = False
+        if known_only and not include_locked:
+            # Only the known forms can qualify: look them up instead of walking the table.
+            candidates = [table.by_id[key] for key in known if key in table.by_id]
+            candidates.sort(key=table.position)
+            for form in candidates:
+                if beast_forms.cr_band(float(form.get("challenge_rating") or 0.0)) is None:
+                    continue
+                if table.allowed(form, rules):
+                    entry = dict(form)
+                    entry["allowed"] = True
+                    result.append(entry)
+            return result
+        for form, allowed in table.wild_shape_forms(rules):
             if known_only and str(form.get("id") or "").strip().lower() not in known:
                 allowed = False
             if allowed or include_locked:
@@ -5309,6 +6767,15 @@ class InitiativeTracker(base.InitiativeTracker):
         _archive_startup_logs()
         super().__init__()
         self.title(f"DnD Initiative Tracker — v{APP_VERSION}")
+        # Create the battle-log service on the Tk thread before the LAN server can ask for it.
+        self._battle_log()
+        try:
+            self._combat_event_service: Optional[combat_events.CombatEventStore] = combat_events.CombatEventStore(
+                _ensure_logs_dir() / "combat_events.sqlite3"
+            )
+        except Exception as exc:
+            self._combat_event_service = None
+            self._oplog(f"Combat event store unavailable: {exc}", level="warning")
 
         # Operations logger (terminal + ./logs/operations.log)
         self._ops_logger = _make_ops_logger()
@@ -5317,21 +6784,23 @@ class InitiativeTracker(base.InitiativeTracker):
         self._load_lan_url_settings()
         self._install_lan_menu()
 
-        # Monster library (YAML files in ./Monsters)
-        self._monster_specs: List[MonsterSpec] = []
-        self._monsters_by_name: Dict[str, MonsterSpec] = {}
-        self._load_monsters_index()
+        # Monster library (YAML files in ./Monsters) is indexed on the base class's
+        # background index thread; the dropdown fills in as parsed batches land.
         # Swap the Name entry for a monster dropdown + library button
         self.after(0, self._install_monster_dropdown_widget)
 
+        # Change notifications for the YAML library directories
+        self._start_library_watcher()
+
         # Spell preset cache (YAML files in ./Spells)
         self._spell_presets_cache: Optional[List[Dict[str, Any]]] = None
         self._spell_index_entries: Dict[str, Any] = {}
         self._spell_index_loaded = False
         self._spell_dir_notice: Optional[str] = None
         self._spell_dir_signature: Optional[Tuple[int, int, Tuple[str, ...]]] = None
-        self._items_registry_cache: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
-        self._items_dir_signature: Optional[Tuple[Tuple[int, int, Tuple[str, ...]], Tuple[int, int, Tuple[str, ...]], Tuple[int, int, Tuple[str, ...]], Tuple[Tuple[str, int, int], ...], Tuple[Tuple[str, int, int], ...], Tuple[Tuple[str, int, int], ...]]] = None
+        self._spell_presets_revision: Optional[int] = None
+        self._item_catalog_service: Optional[item_catalog.ItemCatalog] = None
+        self._item_catalog_revision: Optional[int] = None
         self._items_dir_cache: Optional[Path] = None
         self._wild_shape_known_by_player: Dict[str, List[str]] = {}
         self._player_yaml_cache_by_path: Dict[Path, Optional[Dict[str, Any]]] = {}
@@ -5340,6 +6809,7 @@ class InitiativeTracker(base.InitiativeTracker):
         self._player_yaml_name_map: Dict[str, Path] = {}
         self._player_yaml_dir_signature: Optional[Tuple[int, int, Tuple[str, ...]]] = None
         self._player_yaml_last_refresh = 0.0
+        self._player_yaml_revision: Optional[int] = None
         self._player_yaml_refresh_interval_s = 1.0
         self._lan_resource_pools_last_build = 0.0
         self._player_yaml_lock = threading.Lock()
@@ -5567,6 +7037,8 @@ class InitiativeTracker(base.InitiativeTracker):
     def _yaml_players_save_index(self, entries: Dict[str, Dict[str, Any]]) -> None:
         payload = {"version": 1, "entries": dict(entries)}
         _write_index_file(self._yaml_players_index_path(), payload)
+        # The roster index lives in logs/, outside the watched players/ directory.
+        self.__dict__["_player_yaml_revision"] = None
 
     def _yaml_players_sync_index(self, files: List[Path]) -> Dict[str, Dict[str, Any]]:
         index_data = self._yaml_players_load_index()
@@ -5697,6 +7169,7 @@ class InitiativeTracker(base.InitiativeTracker):
         self._player_yaml_name_map = {}
         self._player_yaml_dir_signature = None
         self._player_yaml_last_refresh = 0.0
+        self._player_yaml_revision = None
         if rebuild:
             self._load_player_yaml_cache(force_refresh=True)
         try:
@@ -5709,7 +7182,7 @@ class InitiativeTracker(base.InitiativeTracker):
                 "round_num": 0,
             }
             self._lan._last_snapshot = None
-            self._lan._last_static_json = None
+            self._lan._last_static_manifest = None
         except Exception:
             pass
         try:
@@ -5738,6 +7211,48 @@ class InitiativeTracker(base.InitiativeTracker):
         self._spell_index_entries = {}
         self._spell_index_loaded = False
         self._spell_dir_signature = None
+        self._spell_presets_revision = None
+
+    def _start_library_watcher(self) -> None:
+        """Watch players/, Spells/, Items/ and Monsters/ so caches compare revisions instead of re-scanning."""
+        watcher = library_watch.LibraryWatcher()
+        dirs: Dict[str, Path] = {}
+        try:
+            dirs["players"] = self._players_dir()
+            dirs["items"] = _seed_user_items_dir()
+            dirs["monsters"] = self._monsters_dir_path()
+            spells_dir = _seed_user_spells_dir()
+            if spells_dir is not None:
+                dirs["spells"] = spells_dir
+        except Exception as exc:
+            self._oplog(f"Library watcher setup failed: {exc}", level="warning")
+        for kind, directory in dirs.items():
+            watcher.watch(directory, recursive=kind in ("items", "monsters"))
+        watcher.start()
+        self._library_watcher = watcher
+        self._library_watch_dirs = dirs
+        self._oplog(f"Library watcher backend: {watcher.backend}", level="info")
+
+    def _library_revision(self, kind: str) -> Optional[int]:
+        """Revision of a watched library directory, or None when callers must re-scan it themselves."""
+        watcher = self.__dict__.get("_library_watcher")
+        directory = (self.__dict__.get("_library_watch_dirs") or {}).get(kind)
+        if watcher is None or directory is None:
+            return None
+        return watcher.revision(directory)
+
+    def _library_changes(self, kind: str, revision: Optional[int]) -> Optional[FrozenSet[Path]]:
+        watcher = self.__dict__.get("_library_watcher")
+        directory = (self.__dict__.get("_library_watch_dirs") or {}).get(kind)
+        if watcher is None or directory is None:
+            return None
+        return watcher.changed_since(directory, revision)
+
+    def _note_library_write(self, path: Path) -> None:
+        """Bump the watcher for a file the app just wrote so its own caches see it immediately."""
+        watcher = self.__dict__.get("_library_watcher")
+        if watcher is not None:
+            watcher.note_changed(path)
 
     def _resolve_items_dir(self) -> Optional[Path]:
         cached = self.__dict__.get("_items_dir_cache")
@@ -5749,219 +7264,52 @@ class InitiativeTracker(base.InitiativeTracker):
             return items_dir
         return None
 
-    def _items_registry_payload(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        cached = self.__dict__.get("_items_registry_cache")
-        cached_signature = self.__dict__.get("_items_dir_signature")
+    def _item_catalog(self) -> item_catalog.ItemCatalog:
+        """The Items/ catalog, refreshed from the files changed since it was last used."""
+        catalog = self.__dict__.get("_item_catalog_service")
+        if catalog is None:
+            catalog = item_catalog.ItemCatalog(
+                lambda text: yaml.safe_load(text) if yaml is not None else None,
+                lambda message: self._oplog(message, level="warning"),
+            )
+            self._item_catalog_service = catalog
+        revision = self._library_revision("items")
+        previous_revision = self.__dict__.get("_item_catalog_revision")
+        if revision is not None and catalog.root is not None and revision == previous_revision:
+            return catalog
         items_dir = self._resolve_items_dir()
-        if items_dir is None:
-            self._items_registry_cache = {"weapons": {}, "armors": {}}
-            self._items_dir_signature = None
-            return {"weapons": {}, "armors": {}}
-
-        weapons_dir = items_dir / "Weapons"
-        armor_dir = items_dir / "Armor"
-        magic_dir = items_dir / "Magic_Items"
-        weapon_files = sorted(list(weapons_dir.glob("*.yaml")) + list(weapons_dir.glob("*.yml"))) if weapons_dir.is_dir() else []
-        armor_files = sorted(list(armor_dir.glob("*.yaml")) + list(armor_dir.glob("*.yml"))) if armor_dir.is_dir() else []
-        magic_files = sorted(list(magic_dir.glob("*.yaml")) + list(magic_dir.glob("*.yml"))) if magic_dir.is_dir() else []
-        signature = (
-            _directory_signature(weapons_dir, weapon_files) if weapons_dir.is_dir() else (0, 0, tuple()),
-            _directory_signature(armor_dir, armor_files) if armor_dir.is_dir() else (0, 0, tuple()),
-            _directory_signature(magic_dir, magic_files) if magic_dir.is_dir() else (0, 0, tuple()),
-            _files_signature(weapon_files),
-            _files_signature(armor_files),
-            _files_signature(magic_files),
-        )
-        if isinstance(cached, dict) and signature == cached_signature:
-            return cached
-
-        def parse_items_from_file(path: Path, bucket_key: str) -> List[Tuple[str, Dict[str, Any], bool]]:
-            try:
-                parsed = yaml.safe_load(path.read_text(encoding="utf-8")) if yaml is not None else None
-            except Exception as exc:
-                self._oplog(f"Items YAML parse failed for {path}: {exc}", level="warning")
-                return []
-            if not isinstance(parsed, dict):
-                return []
-
-            if bucket_key == "weapons":
-                if "weapons" in parsed and isinstance(parsed.get("weapons"), list):
-                    out: List[Tuple[str, Dict[str, Any], bool]] = []
-                    for raw_entry in parsed.get("weapons") or []:
-                        if not isinstance(raw_entry, dict):
-                            continue
-                        item_id = str(raw_entry.get("id") or "").strip().lower()
-                        if not item_id:
-                            continue
-                        out.append((item_id, dict(raw_entry), False))
-                    return out
-                if "properties" in parsed and "id" not in parsed:
-                    return []
-            else:
-                if "armors" in parsed and isinstance(parsed.get("armors"), list):
-                    out = []
-                    for raw_entry in parsed.get("armors") or []:
-                        if not isinstance(raw_entry, dict):
-                            continue
-                        item_id = str(raw_entry.get("id") or "").strip().lower()
-                        if not item_id:
-                            continue
-                        out.append((item_id, dict(raw_entry), False))
-                    return out
-
-            item_id = str(parsed.get("id") or "").strip().lower()
-            if not item_id:
-                return []
-            return [(item_id, dict(parsed), True)]
-
-        registry: Dict[str, Dict[str, Dict[str, Any]]] = {"weapons": {}, "armors": {}}
-        sources: Dict[str, Dict[str, str]] = {"weapons": {}, "armors": {}}
-
-        for bucket_key, files in (("weapons", weapon_files), ("armors", armor_files)):
-            for path in files:
-                entries = parse_items_from_file(path, bucket_key)
-                for item_id, item_data, is_per_item in entries:
-                    prior = registry[bucket_key].get(item_id)
-                    if prior is None:
-                        registry[bucket_key][item_id] = item_data
-                        sources[bucket_key][item_id] = "per-item" if is_per_item else "catalog"
-                        continue
-                    prior_source = sources[bucket_key].get(item_id, "catalog")
-                    if prior_source == "per-item" and not is_per_item:
-                        self._oplog(
-                            f"Duplicate {bucket_key[:-1]} id '{item_id}' in {path.name}; keeping per-item definition.",
-                            level="warning",
-                        )
-                        continue
-                    if prior_source == "catalog" and is_per_item:
-                        self._oplog(
-                            f"Duplicate {bucket_key[:-1]} id '{item_id}' in {path.name}; preferring per-item definition.",
-                            level="warning",
-                        )
-                        registry[bucket_key][item_id] = item_data
-                        sources[bucket_key][item_id] = "per-item"
-                        continue
-                    self._oplog(
-                        f"Duplicate {bucket_key[:-1]} id '{item_id}' in {path.name}; keeping latest {prior_source} definition.",
-                        level="warning",
-                    )
-                    registry[bucket_key][item_id] = item_data
-                    sources[bucket_key][item_id] = "per-item" if is_per_item else "catalog"
-
-        for path in magic_files:
-            try:
-                parsed = yaml.safe_load(path.read_text(encoding="utf-8")) if yaml is not None else None
-            except Exception as exc:
-                self._oplog(f"Items YAML parse failed for {path}: {exc}", level="warning")
-                continue
-            if not isinstance(parsed, dict):
-                continue
-            item_id = str(parsed.get("id") or "").strip().lower()
-            if not item_id:
-                continue
-
-            item_type = str(parsed.get("type") or "").strip().lower()
-            if item_type == "weapon" and isinstance(parsed.get("damage"), dict):
-                prior_source = sources["weapons"].get(item_id)
-                if prior_source and prior_source != "magic-item":
-                    self._oplog(
-                        f"Duplicate weapon id '{item_id}' in {path.name}; preferring Magic_Items definition.",
-                        level="warning",
-                    )
-                registry["weapons"][item_id] = dict(parsed)
-                sources["weapons"][item_id] = "magic-item"
-            if item_type == "armor":
-                ac_data = parsed.get("ac")
-                if isinstance(ac_data, dict) and any(k in ac_data for k in ("base_formula", "value", "ac", "formula")):
-                    prior_source = sources["armors"].get(item_id)
-                    if prior_source and prior_source != "magic-item":
-                        self._oplog(
-                            f"Duplicate armor id '{item_id}' in {path.name}; keeping Items/Armor definition.",
-                            level="warning",
-                        )
-                    else:
-                        registry["armors"][item_id] = dict(parsed)
-                        sources["armors"][item_id] = "magic-item"
+        changed = self._library_changes("items", previous_revision) if items_dir == catalog.root else None
+        catalog.refresh(items_dir, changed)
+        self._item_catalog_revision = revision
+        return catalog
 
-        self._items_registry_cache = registry
-        self._items_dir_signature = signature
-        return registry
+    def _items_registry_payload(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        return self._item_catalog().equippable
 
     def _magic_items_registry_payload(self) -> Dict[str, Dict[str, Any]]:
-        cached = self.__dict__.get("_magic_items_registry_cache")
-        cached_signature = self.__dict__.get("_magic_items_dir_signature")
-        items_dir = self._resolve_items_dir()
-        if items_dir is None:
-            self._magic_items_registry_cache = {}
-            self._magic_items_dir_signature = None
-            return {}
-
-        magic_dir = items_dir / "Magic_Items"
-        files = sorted(list(magic_dir.glob("*.yaml")) + list(magic_dir.glob("*.yml"))) if magic_dir.is_dir() else []
-        signature = (
-            _directory_signature(magic_dir, files) if magic_dir.is_dir() else (0, 0, tuple()),
-            _files_signature(files),
-        )
-        if isinstance(cached, dict) and signature == cached_signature:
-            return cached
-
-        payload: Dict[str, Dict[str, Any]] = {}
-        for path in files:
-            try:
-                parsed = yaml.safe_load(path.read_text(encoding="utf-8")) if yaml is not None else None
-            except Exception as exc:
-                self._oplog(f"Magic item YAML parse failed for {path}: {exc}", level="warning")
-                continue
-            if not isinstance(parsed, dict):
-                continue
-            item_id = str(parsed.get("id") or "").strip().lower()
-            if not item_id:
-                continue
-            payload[item_id] = dict(parsed)
-
-        self._magic_items_registry_cache = payload
-        self._magic_items_dir_signature = signature
-        return payload
+        return self._item_catalog().magic_items
 
     def _consumables_registry_payload(self) -> Dict[str, Dict[str, Any]]:
-        cached = self.__dict__.get("_consumables_registry_cache")
-        cached_signature = self.__dict__.get("_consumables_dir_signature")
-        items_dir = self._resolve_items_dir()
-        if items_dir is None:
-            self._consumables_registry_cache = {}
-            self._consumables_dir_signature = None
-            return {}
-
-        consumables_dir = items_dir / "Consumables"
-        files = (
-            sorted(list(consumables_dir.glob("*.yaml")) + list(consumables_dir.glob("*.yml")))
-            if consumables_dir.is_dir()
-            else []
-        )
-        signature = (
-            _directory_signature(consumables_dir, files) if consumables_dir.is_dir() else (0, 0, tuple()),
-            _files_signature(files),
-        )
-        if isinstance(cached, dict) and signature == cached_signature:
-            return cached
-
-        payload: Dict[str, Dict[str, Any]] = {}
-        for path in files:
-            try:
-                parsed = yaml.safe_load(path.read_text(encoding="utf-8")) if yaml is not None else None
-            except Exception as exc:
-                self._oplog(f"Consumable YAML parse failed for {path}: {exc}", level="warning")
-                continue
-            if not isinstance(parsed, dict):
-                continue
-            item_id = str(parsed.get("id") or "").strip().lower()
-            if not item_id:
-                continue
-            payload[item_id] = dict(parsed)
-
-        self._consumables_registry_cache = payload
-        self._consumables_dir_signature = signature
-        return payload
+        return self._item_catalog().consumables
+
+    def _item_name_index(self, kind: str, registry: Dict[str, Any]) -> Tuple[Dict[str, str], FrozenSet[str]]:
+        """Unique item names -> id for a registry payload; the catalog's copy when it is the catalog's registry."""
+        catalog = self.__dict__.get("_item_catalog_service")
+        catalog_registry = None
+        if catalog is not None:
+            catalog_registry = catalog.equippable if kind == "equippable" else catalog.registry(kind)
+        if catalog_registry is not None and registry is catalog_registry:
+            return catalog.name_index(kind)
+        if kind == "equippable":
+            merged: Dict[str, Any] = {}
+            for bucket in ("weapons", "armors"):
+                bucket_entries = registry.get(bucket) if isinstance(registry.get(bucket), dict) else {}
+                for item_id, payload in bucket_entries.items():
+                    normalized_item_id = str(item_id or "").strip().lower()
+                    if normalized_item_id:
+                        merged[normalized_item_id] = payload if isinstance(payload, dict) else {}
+            registry = merged
+        return item_catalog.build_name_index(registry)
 
     def _consumables_registry_list_payload(self) -> List[Dict[str, Any]]:
         rows: List[Dict[str, Any]] = []
@@ -5988,14 +7336,24 @@ class InitiativeTracker(base.InitiativeTracker):
         item_bucket: str,
         relative_dir: str,
     ) -> Dict[str, Dict[str, Any]]:
-        bucket_dir = items_dir / relative_dir
-        files = sorted(list(bucket_dir.glob("*.yaml")) + list(bucket_dir.glob("*.yml"))) if bucket_dir.is_dir() else []
+        catalog = self._item_catalog()
+        catalog_bucket = {dirname: bucket for bucket, dirname in item_catalog.BUCKET_DIRS}.get(relative_dir)
+        if catalog.root == items_dir and catalog_bucket is not None:
+            # Reuse the catalog's parsed documents instead of reading the bucket again.
+            documents = catalog.documents(catalog_bucket)
+        else:
+            bucket_dir = items_dir / relative_dir
+            files = sorted(list(bucket_dir.glob("*.yaml")) + list(bucket_dir.glob("*.yml"))) if bucket_dir.is_dir() else []
+            documents = []
+            for path in files:
+                try:
+                    documents.append((path, yaml.safe_load(path.read_text(encoding="utf-8")) if yaml is not None else None, None))
+                except Exception as exc:
+                    documents.append((path, None, exc))
         definitions: Dict[str, Dict[str, Any]] = {}
-        for path in files:
-            try:
-                parsed = yaml.safe_load(path.read_text(encoding="utf-8")) if yaml is not None else None
-            except Exception as exc:
-                raise ValueError(f"Failed to parse {item_bucket} definition YAML at {path}: {exc}") from exc
+        for path, parsed, error in documents:
+            if error is not None:
+                raise ValueError(f"Failed to parse {item_bucket} definition YAML at {path}: {error}") from error
             if not isinstance(parsed, dict):
                 continue
             item_id = str(parsed.get("id") or "").strip().lower()
@@ -6171,6 +7529,7 @@ class InitiativeTracker(base.InitiativeTracker):
                     handle.flush()
                     tmp_path = Path(handle.name)
                 tmp_path.replace(path)
+                self._note_library_write(path)
             except Exception:
                 if isinstance(tmp_path, Path):
                     try:
@@ -6189,6 +7548,10 @@ class InitiativeTracker(base.InitiativeTracker):
         return {"format_version": 1, "entries": copy.deepcopy(validated.get("entries") or [])}
 
     def _load_shop_catalog_normalized(self) -> List[Dict[str, Any]]:
+        revision = self._library_revision("items")
+        cached = self.__dict__.get("_shop_catalog_cache")
+        if cached is not None and revision is not None and cached[0] == revision:
+            return copy.deepcopy(cached[1])
         items_dir = self._resolve_items_dir()
         if items_dir is None:
             raise ValueError("Items directory is unavailable; cannot load shop catalog.")
@@ -6204,37 +7567,19 @@ class InitiativeTracker(base.InitiativeTracker):
         if not isinstance(parsed, dict):
             raise ValueError(f"Shop catalog YAML at {catalog_path} must parse to a mapping.")
 
-        return self._normalize_shop_catalog_entries(
+        entries = self._normalize_shop_catalog_entries(
             parsed.get("entries"),
             catalog_path=catalog_path,
             definitions_by_bucket=definitions_by_bucket,
         )
+        if revision is not None:
+            self._shop_catalog_cache = (revision, copy.deepcopy(entries))
+        return entries
 
     def _normalize_inventory_item_entries(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
         inventory = profile.get("inventory") if isinstance(profile.get("inventory"), dict) else {}
         items = inventory.get("items") if isinstance(inventory.get("items"), list) else []
-        item_registry = self._items_registry_payload()
-        equippable_registry: Dict[str, Dict[str, Any]] = {}
-        for bucket in ("weapons", "armors"):
-            bucket_entries = item_registry.get(bucket) if isinstance(item_registry.get(bucket), dict) else {}
-            for item_id, payload in bucket_entries.items():
-                normalized_item_id = str(item_id or "").strip().lower()
-                if not normalized_item_id:
-                    continue
-                equippable_registry[normalized_item_id] = payload if isinstance(payload, dict) else {}
-        name_to_id: Dict[str, str] = {}
-        duplicate_names: set[str] = set()
-        for item_id, payload in equippable_registry.items():
-            item_name = str((payload or {}).get("name") or "").strip().lower()
-            if not item_name:
-                continue
-            existing = name_to_id.get(item_name)
-            if existing and existing != item_id:
-                duplicate_names.add(item_name)
-                name_to_id.pop(item_name, None)
-                continue
-            if item_name not in duplicate_names:
-                name_to_id[item_name] = item_id
+        name_to_id, duplicate_names = self._item_name_index("equippable", self._items_registry_payload())
 
         normalized: List[Dict[str, Any]] = []
         instance_id_counts: Dict[str, int] = {}
@@ -6321,17 +7666,7 @@ class InitiativeTracker(base.InitiativeTracker):
         registry = self._magic_items_registry_payload()
         if not registry:
             return []
-        name_to_id: Dict[str, str] = {}
-        duplicate_names: set[str] = set()
-        for item_id, payload in registry.items():
-            name = str((payload or {}).get("name") or "").strip().lower()
-            if not name:
-                continue
-            if name in name_to_id and name_to_id.get(name) != item_id:
-                duplicate_names.add(name)
-                continue
-            if name not in duplicate_names:
-                name_to_id[name] = item_id
+        name_to_id, duplicate_names = self._item_name_index("magic_items", registry)
 
         player_name = str(profile.get("name") or "unknown").strip() or "unknown"
         normalized: List[Dict[str, Any]] = []
@@ -6645,6 +7980,9 @@ class InitiativeTracker(base.InitiativeTracker):
             defenses["save_bonuses"] = save_bonus_map
 
     def _all_active_features(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+        compiled = _peek_compiled_player_profile(self, profile)
+        if compiled is not None:
+            return copy.deepcopy(compiled.active_features)
         base_features = profile.get("features") if isinstance(profile.get("features"), list) else []
         merged: List[Dict[str, Any]] = [dict(entry) for entry in base_features if isinstance(entry, dict)]
         existing_ids = {
@@ -6681,9 +8019,55 @@ class InitiativeTracker(base.InitiativeTracker):
             self._spell_index_loaded = False
             self._spell_dir_notice = None
             self._spell_dir_signature = None
-        self._load_monsters_index()
+        self._load_monsters_index(on_progress=self._note_monster_index_progress)
         self._spell_presets_payload()
 
+    def _note_monster_index_progress(self, parsed: int, total: int) -> None:
+        # Index thread side; the Tk thread picks this up in _index_loading_tick.
+        self.__dict__["_monster_index_progress"] = (parsed, total)
+
+    def _index_loading_tick(self) -> None:
+        """Tk thread: refill the monster dropdown and progress label from the latest published batch."""
+        specs = self.__dict__.get("_monster_specs")
+        combo = self.__dict__.get("_monster_combo")
+        if combo is not None and isinstance(specs, list) and specs is not self.__dict__.get("_monster_combo_specs"):
+            self.__dict__["_monster_combo_specs"] = specs
+            values = [spec.name for spec in specs]
+            try:
+                combo.configure(values=values)
+                if values and not self.name_var.get().strip():
+                    self.name_var.set(values[0])
+                    self._on_monster_selected()
+            except Exception:
+                pass
+        label = self.__dict__.get("_monster_progress_label")
+        progress = self.__dict__.get("_monster_index_progress")
+        if label is not None:
+            text = ""
+            if progress and progress[0] < progress[1]:
+                text = f"Parsing monsters {progress[0]}/{progress[1]}…"
+            try:
+                label.configure(text=text)
+            except Exception:
+                pass
+
+    def destroy(self) -> None:
+        # Stop background library parsing so pool workers don't outlive the window.
+        self._index_cancel_event().set()
+        watcher = self.__dict__.get("_library_watcher")
+        if watcher is not None:
+            watcher.stop()
+        service = self.__dict__.get("_battle_log_service")
+        if service is not None:
+            service.close()
+        store = self.__dict__.get("_combat_event_service")
+        if store is not None:
+            store.close()
+        scheduler = refresh_scheduler.scheduler_for(self)
+        if scheduler is not None and scheduler.stats():
+            self._oplog(scheduler.summary())
+        super().destroy()
+
     # --------------------- Logging split: battle vs operations ---------------------
 
     def _history_file_path(self) -> Path:
@@ -6704,45 +8088,68 @@ class InitiativeTracker(base.InitiativeTracker):
             except Exception:
                 pass
 
-    def _lan_battle_log_lines(self, limit: int = 200) -> List[str]:
-        path = self._history_file_path()
-        try:
-            if not path.exists():
-                return []
-        except Exception:
-            return []
-        if limit <= 0:
-            try:
-                return path.read_text(encoding="utf-8", errors="ignore").splitlines()
-            except Exception:
-                return []
-        max_lines = max(1, int(limit))
-        chunk_size = 8192
-        try:
-            with path.open("rb") as fh:
-                fh.seek(0, os.SEEK_END)
-                file_size = fh.tell()
-                if file_size <= 0:
-                    return []
-                blocks: List[bytes] = []
-                bytes_remaining = file_size
-                newline_count = 0
-                while bytes_remaining > 0 and newline_count <= max_lines:
-                    read_size = min(chunk_size, bytes_remaining)
-                    bytes_remaining -= read_size
-                    fh.seek(bytes_remaining)
-                    block = fh.read(read_size)
-                    if not block:
-                        break
-                    blocks.append(block)
-                    newline_count += block.count(b"\n")
-                data = b"".join(reversed(blocks))
-            lines = data.decode("utf-8", errors="ignore").splitlines()
-        except Exception:
-            return []
-        if len(lines) > max_lines:
-            return lines[-max_lines:]
-        return lines
+    def _battle_log(self) -> "battle_log.BattleLog":
+        """Buffered writer, ring buffer and line index behind :meth:`_history_file_path`."""
+        service = self.__dict__.get("_battle_log_service")
+        if service is None:
+            service = battle_log.BattleLog(self._history_file_path())
+            self._battle_log_service = service
+        return service
+
+    def _log(self, msg: str, cid: Optional[int] = None) -> None:
+        super()._log(msg, cid=cid)
+        _record_combat_event(self, "log", cid=cid, text=str(msg))
+
+    def _combat_events_page(
+        self,
+        *,
+        session: Optional[str] = None,
+        round_num: Optional[int] = None,
+        cid: Optional[int] = None,
+        kind: Optional[str] = None,
+        after: int = 0,
+        limit: int = 200,
+    ) -> Dict[str, Any]:
+        store = self.__dict__.get("_combat_event_service")
+        if store is None:
+            return {"events": [], "session": None, "next_after": None}
+        store.flush()
+        events = store.query(session=session, round_num=round_num, cid=cid, kind=kind, after=after, limit=limit)
+        return {
+            "events": events,
+            "session": store.session,
+            "next_after": events[-1]["id"] if len(events) >= max(1, min(int(limit), combat_events.MAX_PAGE)) else None,
+        }
+
+    def _append_log_line(self, stamp: str, content: str, write_file: bool) -> None:
+        super()._append_log_line(stamp, content, False)
+        if write_file and hasattr(self, "log_text"):
+            self._battle_log().append(stamp, content)
+
+    def _clear_log(self) -> None:
+        log = self._battle_log()
+        log.flush()
+        super()._clear_log()
+        log.rewrite([])
+
+    def _lan_battle_log_lines(self, limit: int = 200) -> List[str]:
+        """The last ``limit`` battle-log lines (the whole log, rotated copies included, when ``limit <= 0``)."""
+        log = self._battle_log()
+        if limit <= 0:
+            return log.history()
+        limit = int(limit)
+        lines = log.recent(limit)
+        if lines is not None:
+            return lines
+        return log.page(max(0, log.line_count() - limit), limit)
+
+    def _lan_battle_log_page(self, before: Optional[int] = None, limit: int = 200) -> Dict[str, Any]:
+        """One page of battle-log history ending just before line ``before`` (newest page by default)."""
+        log = self._battle_log()
+        total = log.line_count()
+        end = total if before is None else max(0, min(int(before), total))
+        start = max(0, end - max(1, int(limit)))
+        return {"lines": log.page(start, end - start), "start": start, "total": total}
 
     def _resolve_spells_dir(self) -> Optional[Path]:
         spells_dir = _seed_user_spells_dir()
@@ -6962,7 +8369,9 @@ class InitiativeTracker(base.InitiativeTracker):
                     except Exception:
                         before_hp_int = None
                     if before_hp_int is not None and applied_amount > 0:
-                        damage_state = self._apply_damage_to_target_with_temp_hp(c, int(applied_amount))
+                        damage_state = self._apply_damage_to_target_with_temp_hp(
+                            c, int(applied_amount), source_cid=rider.get("source_cid")
+                        )
                         after_hp = int(damage_state.get("hp_after", before_hp_int))
                         rider_msgs.append(f"takes {int(applied_amount)} {dtype} from {source}")
                     elif before_hp_int is not None:
@@ -7223,6 +8632,7 @@ class InitiativeTracker(base.InitiativeTracker):
 
     def _log_turn_start(self, cid: int) -> None:
         super()._log_turn_start(cid)
+        _record_combat_event(self, "turn_start", cid=cid)
         try:
             if not bool(getattr(self, "_turn_timing_active", False)):
                 return
@@ -7239,6 +8649,7 @@ class InitiativeTracker(base.InitiativeTracker):
 
     def _log_turn_end(self, cid: int, note: str = "") -> None:
         super()._log_turn_end(cid, note=note)
+        _record_combat_event(self, "turn_end", cid=cid, note=note)
         try:
             if not bool(getattr(self, "_turn_timing_active", False)):
                 return
@@ -7658,7 +9069,7 @@ class InitiativeTracker(base.InitiativeTracker):
                         applied_entries = list(adjusted.get("entries") or [])
                         applied_amount = int(sum(int(entry.get("amount", 0) or 0) for entry in applied_entries))
                         if applied_amount > 0:
-                            self._apply_damage_to_target_with_temp_hp(c, int(applied_amount))
+                            self._apply_damage_to_target_with_temp_hp(c, int(applied_amount), source_cid=rider.get("source_cid"))
                             self._log(
                                 f"{c.name} takes {int(applied_amount)} {dtype} damage from {str(rider.get('source') or 'an effect')}.",
                                 cid=cid,
@@ -7700,7 +9111,7 @@ class InitiativeTracker(base.InitiativeTracker):
             except Exception:
                 before_hp_int = None
             if before_hp_int is not None and applied_amount > 0:
-                damage_state = self._apply_damage_to_target_with_temp_hp(c, int(applied_amount))
+                damage_state = self._apply_damage_to_target_with_temp_hp(c, int(applied_amount), source_cid=rider.get("source_cid"))
                 after_hp = int(damage_state.get("hp_after", before_hp_int))
                 self._log(
                     f"{c.name} takes {int(applied_amount)} {dtype} damage from {source} at end of turn.",
@@ -8106,7 +9517,7 @@ class InitiativeTracker(base.InitiativeTracker):
     def _save_session_to_path(self, path: Path, label: Optional[str] = None) -> None:
         payload = self._session_snapshot_payload(label=label)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        path.write_text(_json_dumps_fast(payload, sort_keys=True, indent=True), encoding="utf-8")
         self._session_has_saved = True
 
     def _load_session_from_path(self, path: Path) -> None:
@@ -8174,6 +9585,7 @@ class InitiativeTracker(base.InitiativeTracker):
         combat = payload.get("combat") if isinstance(payload.get("combat"), dict) else {}
         map_state = payload.get("map") if isinstance(payload.get("map"), dict) else {}
         log_state = payload.get("log") if isinstance(payload.get("log"), dict) else {}
+        self._lan_mark_dirty(full=True)
 
         existing_cids = [int(cid) for cid in list(getattr(self, "combatants", {}).keys())]
         if existing_cids:
@@ -8327,11 +9739,11 @@ class InitiativeTracker(base.InitiativeTracker):
         self._map_open_without_prompt_size = (int(self._lan_grid_cols), int(self._lan_grid_rows))
 
         lines = log_state.get("lines") if isinstance(log_state.get("lines"), list) else []
-        history = self._history_file_path()
-        history.parent.mkdir(parents=True, exist_ok=True)
-        clean_lines = [str(line) for line in lines]
-        history.write_text("\n".join(clean_lines) + ("\n" if clean_lines else ""), encoding="utf-8")
+        self._battle_log().rewrite([str(line) for line in lines])
         self._load_history_into_log()
+        store = self.__dict__.get("_combat_event_service")
+        if store is not None:
+            store.begin_session()
 
         # Always open map mode when loading a snapshot so saved grid + placements are immediately applied.
         try:
@@ -8429,6 +9841,7 @@ class InitiativeTracker(base.InitiativeTracker):
 
     def _reset_map_state(self) -> None:
         """Clear map layout, token placements, overlays, and backgrounds."""
+        self._lan_mark_dirty(full=True)
         self._lan_positions = {}
         self._lan_obstacles = set()
         self._lan_rough_terrain = {}
@@ -9289,10 +10702,11 @@ class InitiativeTracker(base.InitiativeTracker):
 
         self._reset_map_state()
 
-        history_path = self._history_file_path()
-        history_path.parent.mkdir(parents=True, exist_ok=True)
-        history_path.write_text("", encoding="utf-8")
+        self._battle_log().rewrite([])
         self._load_history_into_log()
+        store = self.__dict__.get("_combat_event_service")
+        if store is not None:
+            store.begin_session()
 
         self._update_turn_ui()
         self._rebuild_table(scroll_to_current=True)
@@ -9842,6 +11256,8 @@ class InitiativeTracker(base.InitiativeTracker):
         else:
             for aid in aoe_ids:
                 self._lan_aoes.pop(aid, None)
+        if aoe_ids:
+            self._lan_touch_aoes()
 
         if mw is not None:
             for cid in removed:
@@ -10844,6 +12260,332 @@ class InitiativeTracker(base.InitiativeTracker):
                 except Exception:
                     pass
 
+        try:
+            for aid, d in sorted((aoe_source or {}).items()):
+                payload = self._lan_aoe_payload(aid, d, positions)
+                if payload is not None:
+                    aoes.append(payload)
+        except Exception:
+            pass
+
+        feet_per_square = 5.0
+        try:
+            if map_ready and mw is not None and mw.winfo_exists():
+                feet_per_square = float(getattr(mw, "feet_per_square", 5.0) or 5.0)
+        except Exception:
+            feet_per_square = 5.0
+
+        # Ensure any combatant has a position (spawn near center in a square spiral)
+        if self.combatants and len(positions) < len(self.combatants):
+            positions = self._lan_seed_missing_positions(positions, cols, rows)
+
+        active_auras = self._lan_active_aura_contexts(positions=positions, feet_per_square=feet_per_square)
+        aoes.extend(self._lan_aura_overlay_payloads(active_auras, positions, feet_per_square))
+
+        units: List[Dict[str, Any]] = []
+        for c in sorted(self.combatants.values(), key=lambda x: int(x.cid)):
+            pos = positions.get(c.cid, (max(0, cols // 2), max(0, rows // 2)))
+            units.append(self._lan_cached_unit_payload(c, pos, active_auras))
+        self._lan_prune_unit_rows(self.combatants.keys())
+
+        # Active creature
+        active = self.current_cid if getattr(self, "current_cid", None) is not None else None
+
+        grid_payload = None
+        if map_ready:
+            grid_payload = {"cols": int(cols), "rows": int(rows), "feet_per_square": float(feet_per_square)}
+        turn_order = self._lan_turn_order_payload()
+        rough_payload = [self._lan_rough_cell_payload(c, r, cell) for (c, r), cell in sorted(rough_terrain.items())]
+
+        snap: Dict[str, Any] = {
+            "grid": grid_payload,
+            "obstacles": [{"col": int(c), "row": int(r)} for (c, r) in sorted(obstacles)],
+            "rough_terrain": rough_payload,
+            "aoes": aoes,
+            "units": units,
+            "active_cid": active,
+            "active_turn_kind": str(getattr(self, "_current_turn_kind", "normal") or "normal"),
+            "up_next_cid": self._peek_next_turn_cid(active),
+            "round_num": int(getattr(self, "round_num", 0) or 0),
+            "turn_order": turn_order,
+            "auras_enabled": bool(self.__dict__.get("_lan_auras_enabled", True)),
+        }
+        if self._lan_reaction_debug_enabled():
+            snap["reaction_debug"] = self._lan_reaction_debug_payload(
+                positions=positions,
+                cols=int(cols),
+                rows=int(rows),
+                feet_per_square=float(feet_per_square),
+            )
+        if include_static:
+            snap["spell_presets"] = self._spell_presets_payload()
+            snap["player_spells"] = self._player_spell_config_payload()
+            snap["player_profiles"] = self._player_profiles_payload()
+            snap["resource_pools"] = self._player_resource_pools_payload()
+            snap["consumables_library"] = self._consumables_registry_list_payload()
+            snap["beast_forms"] = self._load_beast_forms()
+        else:
+            cached_snapshot = getattr(getattr(self, "_lan", None), "_cached_snapshot", {})
+            if not isinstance(cached_snapshot, dict):
+                cached_snapshot = {}
+
+            static_defaults: Dict[str, Any] = {
+                "spell_presets": [],
+                "player_spells": {},
+                "player_profiles": {},
+                "resource_pools": {},
+                "consumables_library": [],
+                "beast_forms": [],
+            }
+            static_builders = {
+                "spell_presets": self._spell_presets_payload,
+                "player_spells": self._player_spell_config_payload,
+                "player_profiles": self._player_profiles_payload,
+                "resource_pools": self._player_resource_pools_payload,
+                "consumables_library": self._consumables_registry_list_payload,
+                "beast_forms": self._load_beast_forms,
+            }
+            resource_refresh_interval_s = max(
+                0.25, float(self.__dict__.get("_player_yaml_refresh_interval_s", 1.0) or 1.0)
+            )
+            now = time.monotonic()
+            last_resource_build = float(self.__dict__.get("_lan_resource_pools_last_build", 0.0))
+            for key, default in static_defaults.items():
+                if key in cached_snapshot:
+                    if key != "resource_pools" or (now - last_resource_build) < resource_refresh_interval_s:
+                        snap[key] = cached_snapshot.get(key)
+                        continue
+                if not hydrate_static:
+                    snap[key] = default
+                    continue
+                try:
+                    snap[key] = static_builders[key]()
+                    if key == "resource_pools":
+                        self._lan_resource_pools_last_build = now
+                except Exception:
+                    snap[key] = default
+        return snap
+
+    def _lan_change_journal(self) -> LanChangeJournal:
+        journal = self.__dict__.get("_lan_journal")
+        if not isinstance(journal, LanChangeJournal):
+            journal = LanChangeJournal()
+            self.__dict__["_lan_journal"] = journal
+        return journal
+
+    def _lan_mark_dirty(
+        self,
+        cids: Iterable[Any] = (),
+        cells: Iterable[Any] = (),
+        aids: Iterable[Any] = (),
+        all_units: bool = False,
+        terrain: bool = False,
+        all_aoes: bool = False,
+        full: bool = False,
+    ) -> None:
+        """Flag entities whose LAN payload changed so the next tick only rebuilds those."""
+        aids = tuple(aids)
+        if aids or all_aoes or full:
+            # Same bump as _lan_touch_aoes: the map-effect index re-syncs on its next lookup.
+            self.__dict__["_lan_aoe_revision"] = int(self.__dict__.get("_lan_aoe_revision", 0) or 0) + 1
+        if all_units or full:
+            # Nested edits (condition_stacks.append, resource dicts) don't bump a combatant's
+            # revision, so a blanket unit refresh must not be served from cached rows.
+            rows = self.__dict__.get("_lan_unit_rows")
+            if isinstance(rows, dict):
+                rows.clear()
+        try:
+            self._lan_change_journal().mark(
+                cids=cids,
+                cells=cells,
+                aids=aids,
+                all_units=all_units,
+                terrain=terrain,
+                all_aoes=all_aoes,
+                full=full,
+            )
+        except Exception:
+            pass
+
+    def _lan_touch_aoes(self) -> None:
+        """Note an in-place AoE edit so the map-effect index re-syncs on its next lookup."""
+        self.__dict__["_lan_aoe_revision"] = int(self.__dict__.get("_lan_aoe_revision", 0) or 0) + 1
+
+    def _rebuild_table(self, scroll_to_top: bool = False, scroll_to_current: bool = False) -> None:
+        # Table rebuilds follow nearly every combatant mutation made through the Tk UI.
+        self._lan_mark_dirty(all_units=True)
+        super()._rebuild_table(scroll_to_top=scroll_to_top, scroll_to_current=scroll_to_current)
+
+    def _lan_snapshot_delta(self, dirty: Dict[str, Any], prev: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build snapshot fragments for journaled entities only.
+
+        Returns ``None`` whenever the change cannot be expressed as a patch against ``prev``
+        (roster or grid changed, positions missing, map mid-batch), so the caller falls back
+        to a full :meth:`_lan_snapshot` diff.
+        """
+        if not isinstance(prev, dict) or self._lan_reaction_debug_enabled():
+            return None
+        mw = None
+        try:
+            mw = getattr(self, "_map_window", None)
+            if mw is not None and not mw.winfo_exists():
+                mw = None
+        except Exception:
+            mw = None
+
+        cols = int(self._lan_grid_cols)
+        rows = int(self._lan_grid_rows)
+        feet_per_square = 5.0
+        obstacles_src: Any = self._lan_obstacles
+        rough_src: Any = self.__dict__.get("_lan_rough_terrain", {}) or {}
+        aoe_source: Dict[Any, Dict[str, Any]] = self.__dict__.get("_lan_aoes", {}) or {}
+        positions = dict(self._lan_positions)
+        grid_payload = None
+        if mw is not None:
+            if (
+                getattr(mw, "_suspend_lan_sync", False)
+                or getattr(mw, "_drawing_obstacles", False)
+                or getattr(mw, "_drawing_rough", False)
+            ):
+                return None
+            try:
+                cols = int(getattr(mw, "cols", cols))
+                rows = int(getattr(mw, "rows", rows))
+                feet_per_square = float(getattr(mw, "feet_per_square", 5.0) or 5.0)
+                obstacles_src = getattr(mw, "obstacles", obstacles_src) or set()
+                rough_src = getattr(mw, "rough_terrain", rough_src) or {}
+                for cid, tok in (getattr(mw, "unit_tokens", {}) or {}).items():
+                    positions[int(cid)] = (int(tok.get("col")), int(tok.get("row")))
+            except Exception:
+                return None
+            grid_payload = {"cols": int(cols), "rows": int(rows), "feet_per_square": float(feet_per_square)}
+        if grid_payload != prev.get("grid"):
+            return None
+
+        prev_units = LanController._unit_lookup(prev.get("units"))
+        combatant_ids = {int(cid) for cid in self.combatants.keys()}
+        if set(prev_units.keys()) != combatant_ids or not combatant_ids.issubset(positions.keys()):
+            return None
+
+        units: Dict[int, Dict[str, Any]] = {}
+        aoes: Dict[int, Optional[Dict[str, Any]]] = {}
+        rough: Dict[Tuple[int, int], Optional[Dict[str, Any]]] = {}
+        obstacles: Dict[Tuple[int, int], bool] = {}
+        need_units = bool(dirty.get("all_units") or dirty.get("cids"))
+        try:
+            if need_units:
+                active_auras = self._lan_active_aura_contexts(positions=positions, feet_per_square=feet_per_square)
+                if dirty.get("all_units"):
+                    targets = set(combatant_ids)
+                else:
+                    targets = {int(cid) for cid in dirty.get("cids", ()) if int(cid) in combatant_ids}
+                    # Aura effect icons depend on where everyone stands: refresh anyone who is or was inside one.
+                    for aura in active_auras:
+                        targets.update(int(cid) for cid in (aura.get("affected") or ()) if int(cid) in combatant_ids)
+                    targets.update(cid for cid, unit in prev_units.items() if unit.get("effects"))
+                explicit = {int(cid) for cid in dirty.get("cids", ())}
+                for cid in sorted(targets):
+                    units[cid] = self._lan_cached_unit_payload(
+                        self.combatants[cid], positions[cid], active_auras, force=cid in explicit
+                    )
+                overlays = self._lan_aura_overlay_payloads(active_auras, positions, feet_per_square)
+                for overlay in overlays:
+                    aoes[int(overlay["aid"])] = overlay
+                for entry in prev.get("aoes") or []:
+                    if isinstance(entry, dict) and int(entry.get("aid", 0)) < 0 and int(entry["aid"]) not in aoes:
+                        aoes[int(entry["aid"])] = None
+
+            if need_units or dirty.get("all_aoes") or dirty.get("aids"):
+                if mw is not None:
+                    self._lan_sync_aoes_to_map(mw)
+                    aoe_source = getattr(mw, "aoes", {}) or {}
+                    self._lan_aoes = dict(aoe_source)
+                    if aoe_source:
+                        max_aid = max(int(aid) for aid in aoe_source.keys())
+                        self._lan_next_aoe_id = max(self._lan_next_aoe_id, max_aid + 1)
+                source_by_aid = {int(aid): d for aid, d in aoe_source.items()}
+                if need_units or dirty.get("all_aoes"):
+                    aid_targets = set(source_by_aid.keys())
+                    aid_targets.update(
+                        int(entry.get("aid"))
+                        for entry in (prev.get("aoes") or [])
+                        if isinstance(entry, dict) and int(entry.get("aid", 0)) >= 0
+                    )
+                else:
+                    aid_targets = {int(aid) for aid in dirty.get("aids", ())}
+                for aid in aid_targets:
+                    d = source_by_aid.get(aid)
+                    aoes[aid] = self._lan_aoe_payload(aid, d, positions) if isinstance(d, dict) else None
+
+            if dirty.get("terrain") or dirty.get("cells"):
+                if dirty.get("terrain"):
+                    keys = set(rough_src.keys()) | set(obstacles_src)
+                    keys.update(LanController._rough_lookup(prev.get("rough_terrain")).keys())
+                    keys.update(LanController._obstacle_lookup(prev.get("obstacles")))
+                else:
+                    keys = set(dirty.get("cells", ()))
+                for key in keys:
+                    col, row = int(key[0]), int(key[1])
+                    cell = rough_src.get(key)
+                    rough[(col, row)] = self._lan_rough_cell_payload(col, row, cell) if key in rough_src else None
+                    obstacles[(col, row)] = key in obstacles_src
+                if mw is not None:
+                    for key, is_obstacle in obstacles.items():
+                        if is_obstacle:
+                            self._lan_obstacles.add(key)
+                        else:
+                            self._lan_obstacles.discard(key)
+                    lan_rough = self.__dict__.get("_lan_rough_terrain")
+                    if isinstance(lan_rough, dict):
+                        for key in rough:
+                            if key in rough_src:
+                                lan_rough[key] = rough_src[key]
+                            else:
+                                lan_rough.pop(key, None)
+        except Exception:
+            return None
+
+        active = self.current_cid if getattr(self, "current_cid", None) is not None else None
+        header = {
+            "active_cid": active,
+            "active_turn_kind": str(getattr(self, "_current_turn_kind", "normal") or "normal"),
+            "up_next_cid": self._peek_next_turn_cid(active),
+            "round_num": int(getattr(self, "round_num", 0) or 0),
+            "turn_order": self._lan_turn_order_payload(),
+            "auras_enabled": bool(self.__dict__.get("_lan_auras_enabled", True)),
+        }
+        return {"header": header, "units": units, "aoes": aoes, "rough": rough, "obstacles": obstacles}
+
+    def _lan_turn_order_payload(self) -> List[int]:
+        try:
+            ordered = self._display_order()
+            return [int(c.cid) for c in ordered if getattr(c, "cid", None) is not None]
+        except Exception:
+            try:
+                return [int(c.cid) for c in sorted(self.combatants.values(), key=lambda x: int(x.cid))]
+            except Exception:
+                return []
+
+    def _lan_rough_cell_payload(self, col: int, row: int, cell: object) -> Dict[str, Any]:
+        if isinstance(cell, dict):
+            color = str(cell.get("color") or "")
+            is_rough = bool(cell.get("is_rough", False))
+            movement_type = self._normalize_movement_type(cell.get("movement_type"), is_swim=bool(cell.get("is_swim", False)))
+        else:
+            color = str(cell)
+            is_rough = True
+            movement_type = "ground"
+        return {
+            "col": int(col),
+            "row": int(row),
+            "color": color,
+            "movement_type": movement_type,
+            "is_swim": movement_type == "water",
+            "is_rough": is_rough,
+        }
+
+    def _lan_aoe_payload(self, aid: Any, d: Dict[str, Any], positions: Dict[int, Tuple[int, int]]) -> Optional[Dict[str, Any]]:
+        """Build the LAN overlay payload for one AoE entry, or ``None`` for unsupported shapes."""
         def _log_invalid_aoe_value(aid_value: int, name_value: str, kind_value: str, key: str, raw_value: Any) -> None:
             self._oplog(
                 f"LAN AoE invalid value aid={aid_value} name={name_value} kind={kind_value} key={key} value={raw_value!r}",
@@ -10870,178 +12612,170 @@ class InitiativeTracker(base.InitiativeTracker):
                 return None if skip_invalid else default
             return candidate
 
-        try:
-            for aid, d in sorted((aoe_source or {}).items()):
-                kind = str(d.get("kind") or d.get("shape") or "").lower()
-                if kind not in ("circle", "square", "line", "sphere", "cube", "cone", "cylinder", "wall"):
-                    continue
-                aid_int = int(aid)
-                name = str(d.get("name") or f"AoE {aid}")
-                payload: Dict[str, Any] = {
-                    "aid": aid_int,
-                    "kind": kind,
-                    "name": name,
-                    "color": str(d.get("color") or ""),
-                    "cx": _finite_float(d.get("cx") or 0.0, aid_int, name, kind, "cx") or 0.0,
-                    "cy": _finite_float(d.get("cy") or 0.0, aid_int, name, kind, "cy") or 0.0,
-                    "pinned": bool(d.get("pinned")),
-                    "duration_turns": d.get("duration_turns"),
-                    "remaining_turns": d.get("remaining_turns"),
-                }
-                if bool(d.get("fixed_to_caster")) and d.get("anchor_cid") is not None:
-                    try:
-                        anchor_cid = int(d.get("anchor_cid"))
-                        anchor_pos = positions.get(anchor_cid)
-                    except Exception:
-                        anchor_pos = None
-                    if isinstance(anchor_pos, tuple) and len(anchor_pos) == 2:
-                        payload["cx"] = float(anchor_pos[0])
-                        payload["cy"] = float(anchor_pos[1])
-                for extra_key in (
-                    "dc",
-                    "save_type",
-                    "damage_type",
-                    "half_on_pass",
-                    "default_damage",
-                    "owner",
-                    "owner_cid",
-                    "owner_ws_id",
-                    "over_time",
-                    "move_per_turn_ft",
-                    "move_remaining_ft",
-                    "trigger_on_start_or_enter",
-                    "persistent",
-                    "anchor_cid",
-                    "fixed_to_caster",
-                    "move_action_type",
-                ):
-                    if d.get(extra_key) not in (None, ""):
-                        payload[extra_key] = d.get(extra_key)
-                if kind in ("circle", "sphere", "cylinder"):
-                    payload["radius_sq"] = _finite_float(
-                        d.get("radius_sq") or 0.0, aid_int, name, kind, "radius_sq"
-                    ) or 0.0
-                    if d.get("radius_ft") is not None:
-                        radius_ft = _finite_float(
-                            d.get("radius_ft"), aid_int, name, kind, "radius_ft", skip_invalid=True
-                        )
-                        if radius_ft is not None:
-                            payload["radius_ft"] = radius_ft
-                    if d.get("height_ft") is not None:
-                        height_ft = _finite_float(
-                            d.get("height_ft"), aid_int, name, kind, "height_ft", skip_invalid=True
-                        )
-                        if height_ft is not None:
-                            payload["height_ft"] = height_ft
-                elif kind in ("line", "wall"):
-                    payload["length_sq"] = _finite_float(
-                        d.get("length_sq") or 0.0, aid_int, name, kind, "length_sq"
-                    ) or 0.0
-                    payload["width_sq"] = _finite_float(
-                        d.get("width_sq") or 0.0, aid_int, name, kind, "width_sq"
-                    ) or 0.0
-                    if d.get("ax") is not None:
-                        ax = _finite_float(d.get("ax"), aid_int, name, kind, "ax", skip_invalid=True)
-                        if ax is not None:
-                            payload["ax"] = ax
-                    if d.get("ay") is not None:
-                        ay = _finite_float(d.get("ay"), aid_int, name, kind, "ay", skip_invalid=True)
-                        if ay is not None:
-                            payload["ay"] = ay
-                    payload["orient"] = str(d.get("orient") or "vertical")
-                    if d.get("angle_deg") is not None:
-                        angle_deg = _finite_float(
-                            d.get("angle_deg"), aid_int, name, kind, "angle_deg", skip_invalid=True
-                        )
-                        if angle_deg is not None:
-                            payload["angle_deg"] = angle_deg
-                    if d.get("length_ft") is not None:
-                        length_ft = _finite_float(
-                            d.get("length_ft"), aid_int, name, kind, "length_ft", skip_invalid=True
-                        )
-                        if length_ft is not None:
-                            payload["length_ft"] = length_ft
-                    if d.get("width_ft") is not None:
-                        width_ft = _finite_float(
-                            d.get("width_ft"), aid_int, name, kind, "width_ft", skip_invalid=True
-                        )
-                        if width_ft is not None:
-                            payload["width_ft"] = width_ft
-                    if d.get("thickness_ft") is not None:
-                        thickness_ft = _finite_float(
-                            d.get("thickness_ft"), aid_int, name, kind, "thickness_ft", skip_invalid=True
-                        )
-                        if thickness_ft is not None:
-                            payload["thickness_ft"] = thickness_ft
-                    if d.get("height_ft") is not None:
-                        height_ft = _finite_float(
-                            d.get("height_ft"), aid_int, name, kind, "height_ft", skip_invalid=True
-                        )
-                        if height_ft is not None:
-                            payload["height_ft"] = height_ft
-                elif kind == "cone":
-                    payload["length_sq"] = _finite_float(
-                        d.get("length_sq") or 0.0, aid_int, name, kind, "length_sq"
-                    ) or 0.0
-                    if d.get("ax") is not None:
-                        ax = _finite_float(d.get("ax"), aid_int, name, kind, "ax", skip_invalid=True)
-                        if ax is not None:
-                            payload["ax"] = ax
-                    if d.get("ay") is not None:
-                        ay = _finite_float(d.get("ay"), aid_int, name, kind, "ay", skip_invalid=True)
-                        if ay is not None:
-                            payload["ay"] = ay
-                    payload["orient"] = str(d.get("orient") or "vertical")
-                    if d.get("angle_deg") is not None:
-                        angle_deg = _finite_float(
-                            d.get("angle_deg"), aid_int, name, kind, "angle_deg", skip_invalid=True
-                        )
-                        if angle_deg is not None:
-                            payload["angle_deg"] = angle_deg
-                    if d.get("spread_deg") is not None:
-                        spread_deg = _finite_float(
-                            d.get("spread_deg"), aid_int, name, kind, "spread_deg", skip_invalid=True
-                        )
-                        if spread_deg is not None:
-                            payload["spread_deg"] = spread_deg
-                    if d.get("length_ft") is not None:
-                        length_ft = _finite_float(
-                            d.get("length_ft"), aid_int, name, kind, "length_ft", skip_invalid=True
-                        )
-                        if length_ft is not None:
-                            payload["length_ft"] = length_ft
-                else:
-                    payload["side_sq"] = _finite_float(
-                        d.get("side_sq") or 0.0, aid_int, name, kind, "side_sq"
-                    ) or 0.0
-                    if d.get("angle_deg") is not None:
-                        angle_deg = _finite_float(
-                            d.get("angle_deg"), aid_int, name, kind, "angle_deg", skip_invalid=True
-                        )
-                        if angle_deg is not None:
-                            payload["angle_deg"] = angle_deg
-                    if d.get("side_ft") is not None:
-                        side_ft = _finite_float(
-                            d.get("side_ft"), aid_int, name, kind, "side_ft", skip_invalid=True
-                        )
-                        if side_ft is not None:
-                            payload["side_ft"] = side_ft
-                aoes.append(payload)
-        except Exception:
-            pass
-
-        feet_per_square = 5.0
-        try:
-            if map_ready and mw is not None and mw.winfo_exists():
-                feet_per_square = float(getattr(mw, "feet_per_square", 5.0) or 5.0)
-        except Exception:
-            feet_per_square = 5.0
-
-        # Ensure any combatant has a position (spawn near center in a square spiral)
-        if self.combatants and len(positions) < len(self.combatants):
-            positions = self._lan_seed_missing_positions(positions, cols, rows)
+        kind = str(d.get("kind") or d.get("shape") or "").lower()
+        if kind not in ("circle", "square", "line", "sphere", "cube", "cone", "cylinder", "wall"):
+            return None
+        aid_int = int(aid)
+        name = str(d.get("name") or f"AoE {aid}")
+        payload: Dict[str, Any] = {
+            "aid": aid_int,
+            "kind": kind,
+            "name": name,
+            "color": str(d.get("color") or ""),
+            "cx": _finite_float(d.get("cx") or 0.0, aid_int, name, kind, "cx") or 0.0,
+            "cy": _finite_float(d.get("cy") or 0.0, aid_int, name, kind, "cy") or 0.0,
+            "pinned": bool(d.get("pinned")),
+            "duration_turns": d.get("duration_turns"),
+            "remaining_turns": d.get("remaining_turns"),
+        }
+        if bool(d.get("fixed_to_caster")) and d.get("anchor_cid") is not None:
+            try:
+                anchor_cid = int(d.get("anchor_cid"))
+                anchor_pos = positions.get(anchor_cid)
+            except Exception:
+                anchor_pos = None
+            if isinstance(anchor_pos, tuple) and len(anchor_pos) == 2:
+                payload["cx"] = float(anchor_pos[0])
+                payload["cy"] = float(anchor_pos[1])
+        for extra_key in (
+            "dc",
+            "save_type",
+            "damage_type",
+            "half_on_pass",
+            "default_damage",
+            "owner",
+            "owner_cid",
+            "owner_ws_id",
+            "over_time",
+            "move_per_turn_ft",
+            "move_remaining_ft",
+            "trigger_on_start_or_enter",
+            "persistent",
+            "anchor_cid",
+            "fixed_to_caster",
+            "move_action_type",
+        ):
+            if d.get(extra_key) not in (None, ""):
+                payload[extra_key] = d.get(extra_key)
+        if kind in ("circle", "sphere", "cylinder"):
+            payload["radius_sq"] = _finite_float(
+                d.get("radius_sq") or 0.0, aid_int, name, kind, "radius_sq"
+            ) or 0.0
+            if d.get("radius_ft") is not None:
+                radius_ft = _finite_float(
+                    d.get("radius_ft"), aid_int, name, kind, "radius_ft", skip_invalid=True
+                )
+                if radius_ft is not None:
+                    payload["radius_ft"] = radius_ft
+            if d.get("height_ft") is not None:
+                height_ft = _finite_float(
+                    d.get("height_ft"), aid_int, name, kind, "height_ft", skip_invalid=True
+                )
+                if height_ft is not None:
+                    payload["height_ft"] = height_ft
+        elif kind in ("line", "wall"):
+            payload["length_sq"] = _finite_float(
+                d.get("length_sq") or 0.0, aid_int, name, kind, "length_sq"
+            ) or 0.0
+            payload["width_sq"] = _finite_float(
+                d.get("width_sq") or 0.0, aid_int, name, kind, "width_sq"
+            ) or 0.0
+            if d.get("ax") is not None:
+                ax = _finite_float(d.get("ax"), aid_int, name, kind, "ax", skip_invalid=True)
+                if ax is not None:
+                    payload["ax"] = ax
+            if d.get("ay") is not None:
+                ay = _finite_float(d.get("ay"), aid_int, name, kind, "ay", skip_invalid=True)
+                if ay is not None:
+                    payload["ay"] = ay
+            payload["orient"] = str(d.get("orient") or "vertical")
+            if d.get("angle_deg") is not None:
+                angle_deg = _finite_float(
+                    d.get("angle_deg"), aid_int, name, kind, "angle_deg", skip_invalid=True
+                )
+                if angle_deg is not None:
+                    payload["angle_deg"] = angle_deg
+            if d.get("length_ft") is not None:
+                length_ft = _finite_float(
+                    d.get("length_ft"), aid_int, name, kind, "length_ft", skip_invalid=True
+                )
+                if length_ft is not None:
+                    payload["length_ft"] = length_ft
+            if d.get("width_ft") is not None:
+                width_ft = _finite_float(
+                    d.get("width_ft"), aid_int, name, kind, "width_ft", skip_invalid=True
+                )
+                if width_ft is not None:
+                    payload["width_ft"] = width_ft
+            if d.get("thickness_ft") is not None:
+                thickness_ft = _finite_float(
+                    d.get("thickness_ft"), aid_int, name, kind, "thickness_ft", skip_invalid=True
+                )
+                if thickness_ft is not None:
+                    payload["thickness_ft"] = thickness_ft
+            if d.get("height_ft") is not None:
+                height_ft = _finite_float(
+                    d.get("height_ft"), aid_int, name, kind, "height_ft", skip_invalid=True
+                )
+                if height_ft is not None:
+                    payload["height_ft"] = height_ft
+        elif kind == "cone":
+            payload["length_sq"] = _finite_float(
+                d.get("length_sq") or 0.0, aid_int, name, kind, "length_sq"
+            ) or 0.0
+            if d.get("ax") is not None:
+                ax = _finite_float(d.get("ax"), aid_int, name, kind, "ax", skip_invalid=True)
+                if ax is not None:
+                    payload["ax"] = ax
+            if d.get("ay") is not None:
+                ay = _finite_float(d.get("ay"), aid_int, name, kind, "ay", skip_invalid=True)
+                if ay is not None:
+                    payload["ay"] = ay
+            payload["orient"] = str(d.get("orient") or "vertical")
+            if d.get("angle_deg") is not None:
+                angle_deg = _finite_float(
+                    d.get("angle_deg"), aid_int, name, kind, "angle_deg", skip_invalid=True
+                )
+                if angle_deg is not None:
+                    payload["angle_deg"] = angle_deg
+            if d.get("spread_deg") is not None:
+                spread_deg = _finite_float(
+                    d.get("spread_deg"), aid_int, name, kind, "spread_deg", skip_invalid=True
+                )
+                if spread_deg is not None:
+                    payload["spread_deg"] = spread_deg
+            if d.get("length_ft") is not None:
+                length_ft = _finite_float(
+                    d.get("length_ft"), aid_int, name, kind, "length_ft", skip_invalid=True
+                )
+                if length_ft is not None:
+                    payload["length_ft"] = length_ft
+        else:
+            payload["side_sq"] = _finite_float(
+                d.get("side_sq") or 0.0, aid_int, name, kind, "side_sq"
+            ) or 0.0
+            if d.get("angle_deg") is not None:
+                angle_deg = _finite_float(
+                    d.get("angle_deg"), aid_int, name, kind, "angle_deg", skip_invalid=True
+                )
+                if angle_deg is not None:
+                    payload["angle_deg"] = angle_deg
+            if d.get("side_ft") is not None:
+                side_ft = _finite_float(
+                    d.get("side_ft"), aid_int, name, kind, "side_ft", skip_invalid=True
+                )
+                if side_ft is not None:
+                    payload["side_ft"] = side_ft
+        return payload
 
-        active_auras = self._lan_active_aura_contexts(positions=positions, feet_per_square=feet_per_square)
+    def _lan_aura_overlay_payloads(
+        self,
+        active_auras: List[Dict[str, Any]],
+        positions: Dict[int, Tuple[int, int]],
+        feet_per_square: float,
+    ) -> List[Dict[str, Any]]:
+        """Return the circle overlays drawn for visible auras (negative aids)."""
+        overlays: List[Dict[str, Any]] = []
         for idx, aura in enumerate(active_auras):
             if not bool(aura.get("visible", True)):
                 continue
@@ -11049,7 +12783,7 @@ class InitiativeTracker(base.InitiativeTracker):
             source_pos = positions.get(int(source_cid)) if source_cid is not None else None
             if not (isinstance(source_pos, tuple) and len(source_pos) == 2):
                 continue
-            aoes.append(
+            overlays.append(
                 {
                     "aid": -1001 - int(idx),
                     "kind": "circle",
@@ -11066,212 +12800,215 @@ class InitiativeTracker(base.InitiativeTracker):
                     "light": True,
                 }
             )
+        return overlays
 
-        units: List[Dict[str, Any]] = []
-        for c in sorted(self.combatants.values(), key=lambda x: int(x.cid)):
-            role = self._name_role_memory.get(str(c.name), "enemy")
-            pos = positions.get(c.cid, (max(0, cols // 2), max(0, rows // 2)))
-            is_invisible = self._has_condition(c, "invisible")
-            is_hidden = bool(getattr(c, "is_hidden", False))
-            marks = self._lan_marks_for(c)
-            actions = self._normalize_action_entries(getattr(c, "actions", []), "action")
-            bonus_actions = self._normalize_action_entries(getattr(c, "bonus_actions", []), "bonus_action")
-            reactions = self._normalize_action_entries(getattr(c, "reactions", []), "reaction")
-            effect_icons: List[Dict[str, str]] = []
-            for aura in active_auras:
-                if int(c.cid) not in (aura.get("affected") or set()):
-                    continue
-                effect = aura.get("effect") if isinstance(aura.get("effect"), dict) else {}
-                if not effect:
-                    continue
-                effect_icons.append(
-                    {
-                        "id": str(effect.get("id") or "effect"),
-                        "name": str(effect.get("name") or "Effect"),
-                        "icon": str(effect.get("icon") or "✨"),
-                        "description": str(effect.get("description") or ""),
-                    }
-                )
-
-            beguiling_magic_window_s = self._beguiling_magic_window_remaining(c)
-            units.append(
+    def _lan_unit_payload(
+        self,
+        c: Any,
+        pos: Tuple[int, int],
+        active_auras: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the LAN snapshot row for one combatant."""
+        role = self._name_role_memory.get(str(c.name), "enemy")
+        is_invisible = self._has_condition(c, "invisible")
+        is_hidden = bool(getattr(c, "is_hidden", False))
+        marks = self._lan_marks_for(c)
+        actions = self._normalize_action_entries(getattr(c, "actions", []), "action")
+        bonus_actions = self._normalize_action_entries(getattr(c, "bonus_actions", []), "bonus_action")
+        reactions = self._normalize_action_entries(getattr(c, "reactions", []), "reaction")
+        effect_icons: List[Dict[str, str]] = []
+        for aura in active_auras:
+            if int(c.cid) not in (aura.get("affected") or set()):
+                continue
+            effect = aura.get("effect") if isinstance(aura.get("effect"), dict) else {}
+            if not effect:
+                continue
+            effect_icons.append(
                 {
-                    "cid": c.cid,
-                    "name": str(c.name),
-                    "role": role if role in ("pc", "ally", "enemy") else "enemy",
-                    "ally": bool(role in ("pc", "ally")),
-                    "token_color": self._token_color_payload(c),
-                    "token_border_color": self._token_border_color_payload(c),
-                    "hp": int(getattr(c, "hp", 0) or 0),
-                    "max_hp": int(getattr(c, "max_hp", getattr(c, "hp", 0)) or 0),
-                    "speed": int(getattr(c, "speed", 0) or 0),
-                    "swim_speed": int(getattr(c, "swim_speed", 0) or 0),
-                    "fly_speed": int(getattr(c, "fly_speed", 0) or 0),
-                    "burrow_speed": int(getattr(c, "burrow_speed", 0) or 0),
-                    "move_remaining": int(getattr(c, "move_remaining", 0) or 0),
-                    "move_total": int(getattr(c, "move_total", 0) or 0),
-                    "movement_mode": self._movement_mode_label(getattr(c, "movement_mode", "normal")),
-                    "action_remaining": int(getattr(c, "action_remaining", 0) or 0),
-                    "action_total": int(getattr(c, "action_total", 1) or 1),
-                    "attack_resource_remaining": int(getattr(c, "attack_resource_remaining", 0) or 0),
-                    "bonus_action_remaining": int(getattr(c, "bonus_action_remaining", 0) or 0),
-                    "reaction_remaining": int(getattr(c, "reaction_remaining", 0) or 0),
-                    "spell_cast_remaining": int(getattr(c, "spell_cast_remaining", 0) or 0),
-                    "actions": actions,
-                    "bonus_actions": bonus_actions,
-                    "reactions": reactions,
-                    "is_prone": self._has_condition(c, "prone"),
-                    "is_spellcaster": bool(getattr(c, "is_spellcaster", False)),
-                    "is_wild_shaped": bool(getattr(c, "is_wild_shaped", False)),
-                    "wild_shape_form": str(getattr(c, "wild_shape_form_name", "") or "") or None,
-                    "elemental_attunement_active": self._elemental_attunement_active(c),
-                    "summoned_by_cid": _normalize_cid_value(getattr(c, "summoned_by_cid", None), "snapshot.summoned_by"),
-                    "summon_source_spell": str(getattr(c, "summon_source_spell", "") or "") or None,
-                    "summon_group_id": str(getattr(c, "summon_group_id", "") or "") or None,
-                    "summon_controller_mode": str(getattr(c, "summon_controller_mode", "") or "") or None,
-                    "summon_shared_turn": bool(getattr(c, "summon_shared_turn", False)),
-                    "monster_slug": str(getattr(c, "monster_slug", "") or "") or None,
-                    "concentrating": bool(getattr(c, "concentrating", False)),
-                    "concentration_spell": str(getattr(c, "concentration_spell", "") or "") or None,
-                    "concentration_started_turn": self._json_safe(getattr(c, "concentration_started_turn", None)),
-                    "concentration_total_rounds": self._concentration_total_rounds_for_combatant(c),
-                    "smite_charge": self._json_safe(getattr(c, "pending_smite_charge", None)),
-                    "produce_flame": self._json_safe(self._active_produce_flame_state(c)),
-                    "is_mount": bool(getattr(c, "is_mount", False)),
-                    "is_hidden": bool(is_hidden),
-                    "is_invisible": bool(is_invisible),
-                    "is_unseen": bool(is_hidden or is_invisible),
-                    "rider_cid": _normalize_cid_value(getattr(c, "rider_cid", None), "snapshot.rider_cid"),
-                    "mounted_by_cid": _normalize_cid_value(getattr(c, "mounted_by_cid", None), "snapshot.mounted_by"),
-                    "mount_shared_turn": bool(getattr(c, "mount_shared_turn", False)),
-                    "mount_controller_mode": str(getattr(c, "mount_controller_mode", "") or "") or None,
-                    "has_mounted_this_turn": bool(getattr(c, "has_mounted_this_turn", False)),
-                    "can_be_mounted": bool(getattr(c, "can_be_mounted", False)),
-                    "facing_deg": int(self._normalize_facing_degrees(getattr(c, "facing_deg", 0))),
-                    "vexed_by_cid": _normalize_cid_value(getattr(c, "_vexed_by_cid", None), "snapshot.vexed_by"),
-                    "has_star_advantage": self._has_condition(c, "star_advantage"),
-                    "attackers_have_advantage_against_target": bool(
-                        self._collect_combat_modifiers(c).get("attackers_have_advantage_against_target")
-                    ),
-                    "has_attack_disadvantage": bool(self._collect_combat_modifiers(c).get("target_attack_disadvantage")),
-                    "summon_variant": str(getattr(c, "summon_variant", "") or "") or None,
-                    "summon_type_override": str(getattr(c, "summon_type_override", "") or "") or None,
-                    "summon_lifecycle": self._json_safe(getattr(c, "summon_lifecycle", None)),
-                    "summon_dismissed": bool(getattr(c, "summon_dismissed", False)),
-                    "slot_level": getattr(c, "summon_slot_level", None),
-                    "pos": {"col": int(pos[0]), "row": int(pos[1])},
-                    "marks": marks,
-                    "effects": effect_icons,
-                    "beguiling_magic_window_s": float(beguiling_magic_window_s),
+                    "id": str(effect.get("id") or "effect"),
+                    "name": str(effect.get("name") or "Effect"),
+                    "icon": str(effect.get("icon") or "✨"),
+                    "description": str(effect.get("description") or ""),
                 }
             )
 
-        # Active creature
-        active = self.current_cid if getattr(self, "current_cid", None) is not None else None
+        beguiling_magic_window_s = self._beguiling_magic_window_remaining(c)
+        return {
+            "cid": c.cid,
+            "name": str(c.name),
+            "role": role if role in ("pc", "ally", "enemy") else "enemy",
+            "ally": bool(role in ("pc", "ally")),
+            "token_color": self._token_color_payload(c),
+            "token_border_color": self._token_border_color_payload(c),
+            "hp": int(getattr(c, "hp", 0) or 0),
+            "max_hp": int(getattr(c, "max_hp", getattr(c, "hp", 0)) or 0),
+            "speed": int(getattr(c, "speed", 0) or 0),
+            "swim_speed": int(getattr(c, "swim_speed", 0) or 0),
+            "fly_speed": int(getattr(c, "fly_speed", 0) or 0),
+            "burrow_speed": int(getattr(c, "burrow_speed", 0) or 0),
+            "move_remaining": int(getattr(c, "move_remaining", 0) or 0),
+            "move_total": int(getattr(c, "move_total", 0) or 0),
+            "movement_mode": self._movement_mode_label(getattr(c, "movement_mode", "normal")),
+            "action_remaining": int(getattr(c, "action_remaining", 0) or 0),
+            "action_total": int(getattr(c, "action_total", 1) or 1),
+            "attack_resource_remaining": int(getattr(c, "attack_resource_remaining", 0) or 0),
+            "bonus_action_remaining": int(getattr(c, "bonus_action_remaining", 0) or 0),
+            "reaction_remaining": int(getattr(c, "reaction_remaining", 0) or 0),
+            "spell_cast_remaining": int(getattr(c, "spell_cast_remaining", 0) or 0),
+            "actions": actions,
+            "bonus_actions": bonus_actions,
+            "reactions": reactions,
+            "is_prone": self._has_condition(c, "prone"),
+            "is_spellcaster": bool(getattr(c, "is_spellcaster", False)),
+            "is_wild_shaped": bool(getattr(c, "is_wild_shaped", False)),
+            "wild_shape_form": str(getattr(c, "wild_shape_form_name", "") or "") or None,
+            "elemental_attunement_active": self._elemental_attunement_active(c),
+            "summoned_by_cid": _normalize_cid_value(getattr(c, "summoned_by_cid", None), "snapshot.summoned_by"),
+            "summon_source_spell": str(getattr(c, "summon_source_spell", "") or "") or None,
+            "summon_group_id": str(getattr(c, "summon_group_id", "") or "") or None,
+            "summon_controller_mode": str(getattr(c, "summon_controller_mode", "") or "") or None,
+            "summon_shared_turn": bool(getattr(c, "summon_shared_turn", False)),
+            "monster_slug": str(getattr(c, "monster_slug", "") or "") or None,
+            "concentrating": bool(getattr(c, "concentrating", False)),
+            "concentration_spell": str(getattr(c, "concentration_spell", "") or "") or None,
+            "concentration_started_turn": self._json_safe(getattr(c, "concentration_started_turn", None)),
+            "concentration_total_rounds": self._concentration_total_rounds_for_combatant(c),
+            "smite_charge": self._json_safe(getattr(c, "pending_smite_charge", None)),
+            "produce_flame": self._json_safe(self._active_produce_flame_state(c)),
+            "is_mount": bool(getattr(c, "is_mount", False)),
+            "is_hidden": bool(is_hidden),
+            "is_invisible": bool(is_invisible),
+            "is_unseen": bool(is_hidden or is_invisible),
+            "rider_cid": _normalize_cid_value(getattr(c, "rider_cid", None), "snapshot.rider_cid"),
+            "mounted_by_cid": _normalize_cid_value(getattr(c, "mounted_by_cid", None), "snapshot.mounted_by"),
+            "mount_shared_turn": bool(getattr(c, "mount_shared_turn", False)),
+            "mount_controller_mode": str(getattr(c, "mount_controller_mode", "") or "") or None,
+            "has_mounted_this_turn": bool(getattr(c, "has_mounted_this_turn", False)),
+            "can_be_mounted": bool(getattr(c, "can_be_mounted", False)),
+            "facing_deg": int(self._normalize_facing_degrees(getattr(c, "facing_deg", 0))),
+            "vexed_by_cid": _normalize_cid_value(getattr(c, "_vexed_by_cid", None), "snapshot.vexed_by"),
+            "has_star_advantage": self._has_condition(c, "star_advantage"),
+            "attackers_have_advantage_against_target": bool(
+                self._collect_combat_modifiers(c).get("attackers_have_advantage_against_target")
+            ),
+            "has_attack_disadvantage": bool(self._collect_combat_modifiers(c).get("target_attack_disadvantage")),
+            "summon_variant": str(getattr(c, "summon_variant", "") or "") or None,
+            "summon_type_override": str(getattr(c, "summon_type_override", "") or "") or None,
+            "summon_lifecycle": self._json_safe(getattr(c, "summon_lifecycle", None)),
+            "summon_dismissed": bool(getattr(c, "summon_dismissed", False)),
+            "slot_level": getattr(c, "summon_slot_level", None),
+            "pos": {"col": int(pos[0]), "row": int(pos[1])},
+            "marks": marks,
+            "effects": effect_icons,
+            "beguiling_magic_window_s": float(beguiling_magic_window_s),
+        }
 
-        grid_payload = None
-        if map_ready:
-            grid_payload = {"cols": int(cols), "rows": int(rows), "feet_per_square": float(feet_per_square)}
-        turn_order: List[int] = []
+    def _lan_unit_row_key(
+        self,
+        c: Any,
+        pos: Tuple[int, int],
+        active_auras: List[Dict[str, Any]],
+    ) -> Tuple[Any, ...]:
+        """Cheap fingerprint of everything a unit row reads besides the clock."""
+        cid = int(c.cid)
+        stacks = tuple(
+            (
+                getattr(st, "sid", None),
+                getattr(st, "ctype", None),
+                getattr(st, "remaining_turns", None),
+                getattr(st, "dot_type", None),
+            )
+            for st in list(getattr(c, "condition_stacks", []) or [])
+        )
+        containers = tuple(
+            (id(value), len(value)) if isinstance(value, (list, dict)) else None
+            for value in (
+                getattr(c, "actions", None),
+                getattr(c, "bonus_actions", None),
+                getattr(c, "reactions", None),
+                getattr(c, "ongoing_spell_effects", None),
+                getattr(c, "produce_flame_state", None),
+            )
+        )
+        auras = tuple(
+            id(aura.get("effect"))
+            for aura in active_auras
+            if cid in (aura.get("affected") or set())
+        )
+        return (
+            base.combatant_revision(c),
+            (int(pos[0]), int(pos[1])),
+            self._name_role_memory.get(str(c.name), "enemy"),
+            stacks,
+            containers,
+            auras,
+        )
+
+    def _lan_cached_unit_payload(
+        self,
+        c: Any,
+        pos: Tuple[int, int],
+        active_auras: List[Dict[str, Any]],
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Return the unit row, reusing the last one while the combatant is untouched.
+
+        Rows are shared with the previous snapshot, so a cached row is never
+        edited in place; a changed field always produces a fresh dict.
+        """
+        rows = self.__dict__.get("_lan_unit_rows")
+        if not isinstance(rows, dict):
+            rows = {}
+            self.__dict__["_lan_unit_rows"] = rows
+        cid = int(c.cid)
+        now = time.monotonic()
         try:
-            ordered = self._display_order()
-            turn_order = [int(c.cid) for c in ordered if getattr(c, "cid", None) is not None]
+            key = self._lan_unit_row_key(c, pos, active_auras)
         except Exception:
-            try:
-                turn_order = [int(c.cid) for c in sorted(self.combatants.values(), key=lambda x: int(x.cid))]
+            key = None
+        cached = rows.get(cid)
+        max_age = float(self.__dict__.get("_lan_unit_row_max_age_s", 5.0) or 0.0)
+        if (
+            not force
+            and key is not None
+            and cached is not None
+            and cached[0] == key
+            and now - cached[1] < max_age
+        ):
+            self._lan_unit_row_hits = int(self.__dict__.get("_lan_unit_row_hits", 0) or 0) + 1
+            row = cached[2]
+            window = float(self._beguiling_magic_window_remaining(c))
+            if window == row.get("beguiling_magic_window_s"):
+                return row
+            row = dict(row)
+            row["beguiling_magic_window_s"] = window
+            rows[cid] = (key, cached[1], row)
+            return row
+        self._lan_unit_row_misses = int(self.__dict__.get("_lan_unit_row_misses", 0) or 0) + 1
+        row = self._lan_unit_payload(c, pos, active_auras)
+        if key is not None:
+            # Building the row can normalize state on the combatant (e.g. produce flame); re-key afterwards.
+            try:
+                key = self._lan_unit_row_key(c, pos, active_auras)
             except Exception:
-                turn_order = []
-        rough_payload: List[Dict[str, Any]] = []
-        for (c, r), cell in sorted(rough_terrain.items()):
-            if isinstance(cell, dict):
-                color = str(cell.get("color") or "")
-                is_rough = bool(cell.get("is_rough", False))
-                movement_type = self._normalize_movement_type(cell.get("movement_type"), is_swim=bool(cell.get("is_swim", False)))
-            else:
-                color = str(cell)
-                is_rough = True
-                movement_type = "ground"
-            rough_payload.append(
-                {
-                    "col": int(c),
-                    "row": int(r),
-                    "color": color,
-                    "movement_type": movement_type,
-                    "is_swim": movement_type == "water",
-                    "is_rough": is_rough,
-                }
-            )
-
-        snap: Dict[str, Any] = {
-            "grid": grid_payload,
-            "obstacles": [{"col": int(c), "row": int(r)} for (c, r) in sorted(obstacles)],
-            "rough_terrain": rough_payload,
-            "aoes": aoes,
-            "units": units,
-            "active_cid": active,
-            "active_turn_kind": str(getattr(self, "_current_turn_kind", "normal") or "normal"),
-            "up_next_cid": self._peek_next_turn_cid(active),
-            "round_num": int(getattr(self, "round_num", 0) or 0),
-            "turn_order": turn_order,
-            "auras_enabled": bool(self.__dict__.get("_lan_auras_enabled", True)),
-        }
-        if self._lan_reaction_debug_enabled():
-            snap["reaction_debug"] = self._lan_reaction_debug_payload(
-                positions=positions,
-                cols=int(cols),
-                rows=int(rows),
-                feet_per_square=float(feet_per_square),
-            )
-        if include_static:
-            snap["spell_presets"] = self._spell_presets_payload()
-            snap["player_spells"] = self._player_spell_config_payload()
-            snap["player_profiles"] = self._player_profiles_payload()
-            snap["resource_pools"] = self._player_resource_pools_payload()
-            snap["consumables_library"] = self._consumables_registry_list_payload()
-            snap["beast_forms"] = self._load_beast_forms()
+                key = None
+        if key is not None:
+            rows[cid] = (key, now, row)
         else:
-            cached_snapshot = getattr(getattr(self, "_lan", None), "_cached_snapshot", {})
-            if not isinstance(cached_snapshot, dict):
-                cached_snapshot = {}
+            rows.pop(cid, None)
+        return row
 
-            static_defaults: Dict[str, Any] = {
-                "spell_presets": [],
-                "player_spells": {},
-                "player_profiles": {},
-                "resource_pools": {},
-                "consumables_library": [],
-                "beast_forms": [],
-            }
-            static_builders = {
-                "spell_presets": self._spell_presets_payload,
-                "player_spells": self._player_spell_config_payload,
-                "player_profiles": self._player_profiles_payload,
-                "resource_pools": self._player_resource_pools_payload,
-                "consumables_library": self._consumables_registry_list_payload,
-                "beast_forms": self._load_beast_forms,
-            }
-            resource_refresh_interval_s = max(
-                0.25, float(self.__dict__.get("_player_yaml_refresh_interval_s", 1.0) or 1.0)
-            )
-            now = time.monotonic()
-            last_resource_build = float(self.__dict__.get("_lan_resource_pools_last_build", 0.0))
-            for key, default in static_defaults.items():
-                if key in cached_snapshot:
-                    if key != "resource_pools" or (now - last_resource_build) < resource_refresh_interval_s:
-                        snap[key] = cached_snapshot.get(key)
-                        continue
-                if not hydrate_static:
-                    snap[key] = default
-                    continue
-                try:
-                    snap[key] = static_builders[key]()
-                    if key == "resource_pools":
-                        self._lan_resource_pools_last_build = now
-                except Exception:
-                    snap[key] = default
-        return snap
+    def _lan_prune_unit_rows(self, live_cids: Iterable[int]) -> None:
+        rows = self.__dict__.get("_lan_unit_rows")
+        if not isinstance(rows, dict) or not rows:
+            return
+        live = {int(cid) for cid in live_cids}
+        for cid in [cid for cid in rows if cid not in live]:
+            rows.pop(cid, None)
 
     def _lan_force_state_broadcast(self) -> None:
+        if base._defer_refresh(self, "lan_broadcast", self._lan_force_state_broadcast):
+            return
         try:
             snap = self._lan_snapshot()
             self._lan._cached_snapshot = snap
@@ -11286,10 +13023,9 @@ class InitiativeTracker(base.InitiativeTracker):
             except Exception:
                 pass
             try:
-                static_payload = self._lan._static_data_payload()
-                static_json = json.dumps(static_payload, sort_keys=True, separators=(",", ":"))
-                self._lan._last_static_json = static_json
-                self._lan._broadcast_payload({"type": "static_data", "data": static_payload})
+                manifest = self._lan._static_manifest(self._lan._static_section_table())
+                self._lan._last_static_manifest = manifest
+                self._lan._broadcast_payload(self._lan._static_manifest_message(manifest))
             except Exception:
                 pass
             self._lan._broadcast_state(snap)
@@ -11554,6 +13290,22 @@ class InitiativeTracker(base.InitiativeTracker):
         allowed = {str(dtype or "").strip().lower() for dtype in DAMAGE_TYPES if str(dtype or "").strip()}
         return text if text in allowed else ""
 
+    def _ensure_condition_stack(self, c: base.Combatant, ctype: str, remaining_turns: Optional[int]) -> None:
+        ctype_key = str(ctype or "").strip().lower()
+        had = any(getattr(st, "ctype", None) == ctype_key for st in getattr(c, "condition_stacks", []) or [])
+        # Called unbound: several tests bind these two methods onto plain namespaces.
+        base.InitiativeTracker._ensure_condition_stack(self, c, ctype, remaining_turns)
+        if ctype_key and not had:
+            _record_combat_event(
+                self, "condition", target_cid=getattr(c, "cid", None), condition=ctype_key, action="apply", remaining_turns=remaining_turns
+            )
+
+    def _remove_condition_type(self, c: base.Combatant, ctype: str) -> None:
+        before = len(getattr(c, "condition_stacks", []) or [])
+        base.InitiativeTracker._remove_condition_type(self, c, ctype)
+        if len(getattr(c, "condition_stacks", []) or []) < before:
+            _record_combat_event(self, "condition", target_cid=getattr(c, "cid", None), condition=ctype, action="remove")
+
     def _canonical_condition_key(self, value: Any) -> str:
         text = str(value or "").strip().lower()
         if not text:
@@ -11742,82 +13494,16 @@ class InitiativeTracker(base.InitiativeTracker):
         if not kind:
             return []
         _cols, _rows, _obstacles, _rough, positions = self._lan_live_map_data()
-        cx = float(aoe.get("cx") or 0.0)
-        cy = float(aoe.get("cy") or 0.0)
-        included: List[int] = []
-        token_half = 0.5
-        if kind in ("circle", "sphere", "cylinder"):
-            r2 = float(aoe.get("radius_sq") or 0.0) ** 2
-            for cid, pos in positions.items():
-                px, py = float(pos[0]), float(pos[1])
-                if (px - cx) ** 2 + (py - cy) ** 2 <= r2:
-                    included.append(int(cid))
-        elif kind in ("line", "wall"):
-            length_sq = float(aoe.get("length_sq") or 0.0)
-            width_sq = float(aoe.get("width_sq") or 0.0)
-            angle_deg = aoe.get("angle_deg")
-            if angle_deg is None:
-                orient = str(aoe.get("orient") or "vertical").strip().lower()
-                angle_deg = 0.0 if orient == "horizontal" else 90.0
-            angle_rad = math.radians(float(angle_deg))
-            cos_a = math.cos(-angle_rad)
-            sin_a = math.sin(-angle_rad)
-            for cid, pos in positions.items():
-                dx = float(pos[0]) - cx
-                dy = float(pos[1]) - cy
-                rx = dx * cos_a - dy * sin_a
-                ry = dx * sin_a + dy * cos_a
-                if abs(rx) <= (length_sq / 2.0) + token_half and abs(ry) <= (width_sq / 2.0):
-                    included.append(int(cid))
-        elif kind == "cone":
-            length_sq = float(aoe.get("length_sq") or 0.0)
-            spread_deg = aoe.get("spread_deg")
-            has_spread = spread_deg is not None
-            if spread_deg is None:
-                spread_deg = aoe.get("angle_deg")
-            if spread_deg is None:
-                spread_deg = 90.0
-            spread_deg = float(spread_deg)
-            orient = str(aoe.get("orient") or "vertical").strip().lower()
-            heading_deg = 0.0 if orient == "horizontal" else -90.0
-            if has_spread and aoe.get("angle_deg") is not None:
-                heading_deg = float(aoe.get("angle_deg"))
-            heading_rad = math.radians(float(heading_deg))
-            half_spread = math.radians(spread_deg / 2.0)
-            for cid, pos in positions.items():
-                dx = float(pos[0]) - cx
-                dy = float(pos[1]) - cy
-                dist = math.hypot(dx, dy)
-                if dist > length_sq + token_half:
-                    continue
-                angle = math.atan2(dy, dx) - heading_rad
-                while angle <= -math.pi:
-                    angle += math.pi * 2
-                while angle > math.pi:
-                    angle -= math.pi * 2
-                if abs(angle) <= half_spread:
-                    included.append(int(cid))
-        else:
-            half = float(aoe.get("side_sq") or 0.0) / 2.0
-            angle = aoe.get("angle_deg") if kind in ("square", "cube") else None
-            if angle is None:
-                x1, y1 = cx - half, cy - half
-                x2, y2 = cx + half, cy + half
-                for cid, pos in positions.items():
-                    px, py = float(pos[0]), float(pos[1])
-                    if x1 <= px <= x2 and y1 <= py <= y2:
-                        included.append(int(cid))
-            else:
-                angle_rad = math.radians(float(angle))
-                cos_a = math.cos(-angle_rad)
-                sin_a = math.sin(-angle_rad)
-                for cid, pos in positions.items():
-                    dx = float(pos[0]) - cx
-                    dy = float(pos[1]) - cy
-                    rx = dx * cos_a - dy * sin_a
-                    ry = dx * sin_a + dy * cos_a
-                    if abs(rx) <= half and abs(ry) <= half:
-                        included.append(int(cid))
+        footprints: Dict[int, List[Tuple[int, int]]] = {}
+        combatants = self.__dict__.get("combatants") or {}
+        for cid, pos in positions.items():
+            combatant = combatants.get(cid)
+            if combatant is None or str(getattr(combatant, "size", "") or "").strip().lower() not in ("large", "huge", "gargantuan"):
+                continue
+            cells = self._combatant_space_cells(combatant, destination=(int(pos[0]), int(pos[1])))
+            if cells:
+                footprints[cid] = cells
+        included = [int(cid) for cid in aoe_geometry.included_ids(aoe, positions, footprints)]
         order = [c.cid for c in self._display_order()] if hasattr(self, "_display_order") else []
         order_idx = {int(c): i for i, c in enumerate(order)}
         included.sort(key=lambda item: order_idx.get(int(item), 10**9))
@@ -12015,17 +13701,18 @@ class InitiativeTracker(base.InitiativeTracker):
             result["ambiguous"] = True
             return result
         cell_set = {(int(c), int(r)) for c, r in occupied_cells}
-        for aid, aoe in list((self.__dict__.get("_lan_aoes", {}) or {}).items()):
-            if not isinstance(aoe, dict) or not bool(aoe.get("map_effect")):
-                continue
-            env = self._normalize_map_environment_metadata(aoe.get("environment"))
-            if not env:
-                continue
-            included = {cell for cell in cell_set if self._map_effect_contains_cell(aoe, int(cell[0]), int(cell[1]))}
-            if not included:
-                continue
-            any_inside = bool(included)
-            fully_inside = len(included) == len(cell_set)
+        index = self._map_effect_index()
+        covering: Dict[int, Dict[str, Any]] = {}
+        included_counts: Dict[int, int] = {}
+        for cell in cell_set:
+            for record in index.records_at(cell[0], cell[1]):
+                covering[record["aid"]] = record
+                included_counts[record["aid"]] = included_counts.get(record["aid"], 0) + 1
+        for aid in sorted(covering):
+            aoe = covering[aid]["effect"]
+            env = covering[aid]["environment"]
+            any_inside = True
+            fully_inside = included_counts[aid] == len(cell_set)
 
             def _rule_active(rule: Dict[str, Any]) -> bool:
                 requires = str(rule.get("requires") or "any").strip().lower()
@@ -12056,85 +13743,68 @@ class InitiativeTracker(base.InitiativeTracker):
         return result
 
     def _map_effect_contains_cell(self, effect: Dict[str, Any], col: int, row: int) -> bool:
-        if not isinstance(effect, dict):
-            return False
-        kind = str(effect.get("kind") or "").strip().lower()
-        if not kind:
-            return False
-        px = float(col)
-        py = float(row)
-        cx = float(effect.get("cx") or 0.0)
-        cy = float(effect.get("cy") or 0.0)
-        if kind in ("circle", "sphere", "cylinder"):
-            r2 = float(effect.get("radius_sq") or 0.0) ** 2
-            return ((px - cx) ** 2 + (py - cy) ** 2) <= r2
-        if kind in ("line", "wall"):
-            length_sq = float(effect.get("length_sq") or 0.0)
-            width_sq = float(effect.get("width_sq") or 0.0)
-            angle_deg = effect.get("angle_deg")
-            if angle_deg is None:
-                orient = str(effect.get("orient") or "vertical").strip().lower()
-                angle_deg = 0.0 if orient == "horizontal" else 90.0
-            angle_rad = math.radians(float(angle_deg))
-            cos_a = math.cos(-angle_rad)
-            sin_a = math.sin(-angle_rad)
-            dx = px - cx
-            dy = py - cy
-            rx = dx * cos_a - dy * sin_a
-            ry = dx * sin_a + dy * cos_a
-            return abs(rx) <= (length_sq / 2.0) and abs(ry) <= (width_sq / 2.0)
-        if kind == "cone":
-            length_sq = float(effect.get("length_sq") or 0.0)
-            spread_deg = effect.get("spread_deg")
-            has_spread = spread_deg is not None
-            if spread_deg is None:
-                spread_deg = effect.get("angle_deg")
-            if spread_deg is None:
-                spread_deg = 90.0
-            spread_deg = float(spread_deg)
-            orient = str(effect.get("orient") or "vertical").strip().lower()
-            heading_deg = 0.0 if orient == "horizontal" else -90.0
-            if has_spread and effect.get("angle_deg") is not None:
-                heading_deg = float(effect.get("angle_deg"))
-            heading_rad = math.radians(float(heading_deg))
-            dx = px - cx
-            dy = py - cy
-            dist = math.hypot(dx, dy)
-            if dist > length_sq:
-                return False
-            angle = math.atan2(dy, dx) - heading_rad
-            while angle <= -math.pi:
-                angle += math.pi * 2
-            while angle > math.pi:
-                angle -= math.pi * 2
-            return abs(angle) <= math.radians(spread_deg / 2.0)
-        half = float(effect.get("side_sq") or 0.0) / 2.0
-        angle = effect.get("angle_deg") if kind in ("square", "cube") else None
-        if angle is None:
-            return (cx - half) <= px <= (cx + half) and (cy - half) <= py <= (cy + half)
-        angle_rad = math.radians(float(angle))
-        cos_a = math.cos(-angle_rad)
-        sin_a = math.sin(-angle_rad)
-        dx = px - cx
-        dy = py - cy
-        rx = dx * cos_a - dy * sin_a
-        ry = dx * sin_a + dy * cos_a
-        return abs(rx) <= half and abs(ry) <= half
+        return aoe_geometry.contains_point(effect, int(col), int(row))
+
+    # Everything _map_effect_contains_cell reads; a change to any of these re-rasterizes the effect.
+    _MAP_EFFECT_GEOMETRY_KEYS = (
+        "kind",
+        "cx",
+        "cy",
+        "radius_sq",
+        "length_sq",
+        "width_sq",
+        "side_sq",
+        "angle_deg",
+        "spread_deg",
+        "orient",
+    )
 
-    def _collect_environmental_effects_for_cell(self, col: int, row: int, *, combatant: Any = None) -> List[Dict[str, Any]]:
-        _ = combatant
-        effects: List[Dict[str, Any]] = []
-        for aid, aoe in list((self.__dict__.get("_lan_aoes", {}) or {}).items()):
+    def _map_effect_signature(self, effect: Dict[str, Any]) -> Tuple[Any, ...]:
+        geometry = tuple(effect.get(key) for key in self._MAP_EFFECT_GEOMETRY_KEYS)
+        return (id(effect), geometry, repr(effect.get("environment")))
+
+    def _map_effect_cells(self, effect: Dict[str, Any]) -> List[Tuple[int, int]]:
+        return aoe_geometry.covered_cells(effect)
+
+    def _map_effect_index(self) -> MapEffectIndex:
+        """Return the map-effect spatial index, synced with the current ``_lan_aoes``."""
+        index = self.__dict__.get("_map_effect_index_cache")
+        if not isinstance(index, MapEffectIndex):
+            index = MapEffectIndex()
+            self.__dict__["_map_effect_index_cache"] = index
+        source = self.__dict__.get("_lan_aoes")
+        # Added/removed entries change the size; in-place edits bump the revision.
+        key = (int(self.__dict__.get("_lan_aoe_revision", 0) or 0), len(source or {}))
+        if index.synced_source is source and index.synced_key == key:
+            return index
+        live: set[int] = set()
+        for aid, aoe in list((source or {}).items()):
             if not isinstance(aoe, dict) or not bool(aoe.get("map_effect")):
                 continue
-            env = self._normalize_map_environment_metadata(aoe.get("environment"))
-            if not env:
+            aid_value = _normalize_cid_value(aid, "map_effect_index.aid")
+            if aid_value is None:
                 continue
-            if not self._map_effect_contains_cell(aoe, int(col), int(row)):
+            live.add(aid_value)
+            signature = self._map_effect_signature(aoe)
+            if index.signature(aid_value) == signature:
                 continue
-            entry = {"aid": int(aid), "effect": aoe, "environment": env}
-            effects.append(entry)
-        return effects
+            env = self._normalize_map_environment_metadata(aoe.get("environment"))
+            if not env:
+                index.put(aid_value, signature)
+                continue
+            record = {"aid": aid_value, "effect": aoe, "environment": env}
+            index.put(aid_value, signature, self._map_effect_cells(aoe), record)
+        for aid_value in index.aids():
+            if aid_value not in live:
+                index.discard(aid_value)
+        # Holding the mapping itself (not its id) keeps a rebound _lan_aoes from aliasing it.
+        index.synced_source = source
+        index.synced_key = key
+        return index
+
+    def _collect_environmental_effects_for_cell(self, col: int, row: int, *, combatant: Any = None) -> List[Dict[str, Any]]:
+        _ = combatant
+        return list(self._map_effect_index().records_at(int(col), int(row)))
 
     def _cell_has_silence(self, col: int, row: int) -> bool:
         for entry in self._collect_environmental_effects_for_cell(int(col), int(row)):
@@ -12176,16 +13846,22 @@ class InitiativeTracker(base.InitiativeTracker):
         multiplier = 1.0
         for entry in self._collect_environmental_effects_for_cell(int(dest_col), int(dest_row), combatant=combatant):
             env = entry.get("environment") if isinstance(entry.get("environment"), dict) else {}
-            if bool(env.get("difficult_terrain")):
-                multiplier = max(multiplier, 2.0)
-            try:
-                mult = float(env.get("movement_cost_multiplier") or 0.0)
-            except Exception:
-                mult = 0.0
-            if mult > 0:
-                multiplier = max(multiplier, mult)
+            multiplier = max(multiplier, self._environment_movement_multiplier(env))
         return max(1.0, float(multiplier))
 
+    @staticmethod
+    def _environment_movement_multiplier(env: Dict[str, Any]) -> float:
+        multiplier = 1.0
+        if bool(env.get("difficult_terrain")):
+            multiplier = max(multiplier, 2.0)
+        try:
+            mult = float(env.get("movement_cost_multiplier") or 0.0)
+        except Exception:
+            mult = 0.0
+        if mult > 0:
+            multiplier = max(multiplier, mult)
+        return multiplier
+
     def _spell_has_verbal_component(self, preset: Any) -> bool:
         if not isinstance(preset, dict):
             return False
@@ -12485,6 +14161,7 @@ class InitiativeTracker(base.InitiativeTracker):
             before = self._map_spell_effect_targets(aoe)
             aoe["cx"] = float(current_pos[0])
             aoe["cy"] = float(current_pos[1])
+            self._lan_touch_aoes()
             self._lan_handle_aoe_enter_triggers_for_aoe_move(int(aid), aoe, before)
 
     def _combatant_has_monster_tag(self, target: base.Combatant, tag: str) -> bool:
@@ -13532,7 +15209,9 @@ class InitiativeTracker(base.InitiativeTracker):
                 except Exception:
                     pass
             if total_damage > 0:
-                damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage))
+                damage_state = self._apply_damage_to_target_with_temp_hp(
+                    target, int(total_damage), source_cid=getattr(caster, "cid", None)
+                )
                 after = int(damage_state.get("hp_after", before))
                 self._queue_concentration_save(target, "aoe")
             else:
@@ -13598,6 +15277,13 @@ class InitiativeTracker(base.InitiativeTracker):
     def _spell_presets_payload(self) -> List[Dict[str, Any]]:
         if yaml is None:
             return []
+        revision = self._library_revision("spells")
+        if (
+            self._spell_presets_cache is not None
+            and revision is not None
+            and revision == self.__dict__.get("_spell_presets_revision")
+        ):
+            return list(self._spell_presets_cache)
         spells_dir = self._resolve_spells_dir()
         if spells_dir is None:
             return []
@@ -13614,35 +15300,188 @@ class InitiativeTracker(base.InitiativeTracker):
             self._spell_index_entries = {}
             self._spell_index_loaded = True
             self._spell_dir_signature = dir_signature
+            self._spell_presets_revision = revision
             _write_index_file(self._spell_index_path(), {"version": 1, "entries": {}})
             return []
 
         if self._spell_presets_cache is not None and dir_signature == self._spell_dir_signature:
+            self._spell_presets_revision = revision
+            return list(self._spell_presets_cache)
+
+        cached_entries = self._load_spell_index_entries()
+        cache_keys = set(cached_entries.keys()) if isinstance(cached_entries, dict) else set()
+        file_keys = {fp.name for fp in files}
+        cache_names_match = cache_keys == file_keys
+
+        def cache_is_valid(entries: Dict[str, Any]) -> bool:
+            if not cache_names_match:
+                return False
+            for fp in files:
+                meta = _file_stat_metadata(fp)
+                entry = entries.get(fp.name) if isinstance(entries, dict) else None
+                if not isinstance(entry, dict):
+                    return False
+                if not _metadata_matches(entry, meta):
+                    return False
+                if not isinstance(entry.get("preset"), dict):
+                    return False
+            return True
+
+        if self._spell_presets_cache is not None and cache_is_valid(cached_entries):
+            self._spell_presets_revision = revision
             return list(self._spell_presets_cache)
 
-        cached_entries = self._load_spell_index_entries()
-        cache_keys = set(cached_entries.keys()) if isinstance(cached_entries, dict) else set()
-        file_keys = {fp.name for fp in files}
-        cache_names_match = cache_keys == file_keys
+        presets: List[Dict[str, Any]] = []
+
+        def parse_spell_file(fp: Path, prepared: Optional[yaml_batch.ParseResult] = None) -> Optional[Tuple[Dict[str, Any], str]]:
+            if prepared is not None:
+                _path, raw, parsed, error = prepared
+                if raw is None:
+                    ops.warning("Failed reading spell YAML %s: %s", fp.name, error)
+                    return None
+                if error:
+                    ops.warning("Failed parsing spell YAML %s: %s", fp.name, error)
+                    return None
+            else:
+                try:
+                    raw = fp.read_text(encoding="utf-8")
+                except Exception as exc:
+                    ops.warning("Failed reading spell YAML %s: %s", fp.name, exc)
+                    return None
+                try:
+                    parsed = yaml_batch.safe_load(raw)
+                except Exception as exc:
+                    ops.warning("Failed parsing spell YAML %s: %s", fp.name, exc)
+                    return None
+            preset = self._compile_spell_preset(fp, parsed, ops)
+            if preset is None:
+                return None
+            return preset, raw
+
+        metas = {fp: _file_stat_metadata(fp) for fp in files}
+
+        def cached_preset_entry(fp: Path) -> Optional[Dict[str, Any]]:
+            entry = cached_entries.get(fp.name) if isinstance(cached_entries, dict) else None
+            if isinstance(entry, dict) and _metadata_matches(entry, metas[fp]) and isinstance(entry.get("preset"), dict):
+                return entry
+            return None
+
+        # A stat miss whose content hash still matches its index entry (touched, re-saved
+        # unchanged, checked out again) keeps its compiled preset; the rest are recompiled.
+        rehashed: Dict[Path, Dict[str, Any]] = {}
+        misses: List[Path] = []
+        for fp in files:
+            if cached_preset_entry(fp) is not None:
+                continue
+            entry = cached_entries.get(fp.name) if isinstance(cached_entries, dict) else None
+            if isinstance(entry, dict) and entry.get("hash") and isinstance(entry.get("preset"), dict):
+                try:
+                    if _hash_text(fp.read_text(encoding="utf-8")) == entry.get("hash"):
+                        rehashed[fp] = entry
+                        continue
+                except Exception:
+                    pass
+            misses.append(fp)
+
+        # Parse every remaining miss up front, in a process pool when there are many of them.
+        prepared_by_path: Dict[str, yaml_batch.ParseResult] = {}
+        if misses:
+            parser = yaml_batch.YamlBatchParser(misses, cancel=self._index_cancel_event())
+            for result in parser.parse_all():
+                prepared_by_path[result[0]] = result
+
+        new_entries: Dict[str, Any] = {}
+        used_cached_only = True
+        for fp in files:
+            meta = metas[fp]
+            entry = cached_preset_entry(fp)
+            if entry is None and fp in rehashed:
+                entry = rehashed[fp]
+                used_cached_only = False
+            if entry is not None:
+                preset = entry.get("preset")
+                if isinstance(preset, dict):
+                    if "slug" not in preset:
+                        preset = dict(preset)
+                        preset["slug"] = fp.stem
+                        entry["preset"] = preset
+                    presets.append(preset)
+                    new_entry = dict(entry)
+                    new_entry["mtime_ns"] = meta.get("mtime_ns")
+                    new_entry["size"] = meta.get("size")
+                    new_entries[fp.name] = new_entry
+                    continue
+            used_cached_only = False
+            parsed = parse_spell_file(fp, prepared_by_path.get(str(fp)))
+            if parsed is None:
+                continue
+            preset, raw = parsed
+            presets.append(preset)
+            new_entries[fp.name] = {
+                "mtime_ns": meta.get("mtime_ns"),
+                "size": meta.get("size"),
+                "hash": _hash_text(raw),
+                "preset": preset,
+            }
+
+        self._spell_presets_cache = presets
+        self._spell_index_entries = new_entries
+        self._spell_index_loaded = True
+        self._spell_dir_signature = dir_signature
+        self._spell_presets_revision = revision
+        if not used_cached_only or not cache_names_match:
+            _write_index_file(self._spell_index_path(), {"version": 1, "entries": new_entries})
 
-        def cache_is_valid(entries: Dict[str, Any]) -> bool:
-            if not cache_names_match:
-                return False
-            for fp in files:
-                meta = _file_stat_metadata(fp)
-                entry = entries.get(fp.name) if isinstance(entries, dict) else None
-                if not isinstance(entry, dict):
-                    return False
-                if not _metadata_matches(entry, meta):
-                    return False
-                if not isinstance(entry.get("preset"), dict):
-                    return False
-            return True
+        return presets
 
-        if self._spell_presets_cache is not None and cache_is_valid(cached_entries):
-            return list(self._spell_presets_cache)
+    def _recompile_spell_preset(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Recompile one edited spell file and patch it into the cached presets.
 
-        presets: List[Dict[str, Any]] = []
+        The rest of the preset list and spell_index.json entries are reused as-is; when
+        there is no warm cache to patch (or the file no longer compiles) the spell cache
+        is invalidated and rebuilt on the next read instead.
+        """
+        entries = self._spell_index_entries if self._spell_index_loaded else None
+        if self._spell_presets_cache is None or not isinstance(entries, dict) or path.name not in entries:
+            self._invalidate_spell_index_cache()
+            return None
+        ops = _make_ops_logger()
+        try:
+            raw = path.read_text(encoding="utf-8")
+            preset = self._compile_spell_preset(path, yaml_batch.safe_load(raw), ops)
+        except Exception as exc:
+            ops.warning("Failed recompiling spell YAML %s: %s", path.name, exc)
+            preset = None
+        if preset is None:
+            self._invalidate_spell_index_cache()
+            return None
+        meta = _file_stat_metadata(path)
+        new_entries = dict(entries)
+        new_entries[path.name] = {
+            "mtime_ns": meta.get("mtime_ns"),
+            "size": meta.get("size"),
+            "hash": _hash_text(raw),
+            "preset": preset,
+        }
+        # Entries are kept in file order, so the preset list is their presets in sequence.
+        self._spell_presets_cache = [
+            entry["preset"] for entry in new_entries.values() if isinstance(entry, dict) and isinstance(entry.get("preset"), dict)
+        ]
+        self._spell_index_entries = new_entries
+        signature = self._spell_dir_signature
+        if signature is not None:
+            # Replacing the file bumps the directory mtime; the file names are unchanged.
+            self._spell_dir_signature = _directory_signature(path.parent, [path.parent / name for name in signature[2]])
+        revision = self._library_revision("spells")
+        if revision is not None:
+            self._spell_presets_revision = revision
+        _write_index_file(self._spell_index_path(), {"version": 1, "entries": new_entries})
+        return preset
+
+    def _compile_spell_preset(self, fp: Path, parsed: Any, ops: Any = None) -> Optional[Dict[str, Any]]:
+        """Normalize one parsed Spells/*.yaml document into a preset; None when it can't be used."""
+        if ops is None:
+            ops = _make_ops_logger()
         ability_map = {
             "strength": "str",
             "str": "str",
@@ -13705,439 +15544,388 @@ class InitiativeTracker(base.InitiativeTracker):
                 return None
             return copy.deepcopy(summon_data)
 
-        def parse_spell_file(fp: Path) -> Optional[Tuple[Dict[str, Any], str]]:
-            try:
-                raw = fp.read_text(encoding="utf-8")
-            except Exception as exc:
-                ops.warning("Failed reading spell YAML %s: %s", fp.name, exc)
-                return None
-            try:
-                parsed = yaml.safe_load(raw)
-            except Exception as exc:
-                ops.warning("Failed parsing spell YAML %s: %s", fp.name, exc)
-                return None
-            if not isinstance(parsed, dict):
-                ops.warning("Spell YAML %s did not parse to a dict.", fp.name)
-                return None
+        if not isinstance(parsed, dict):
+            ops.warning("Spell YAML %s did not parse to a dict.", fp.name)
+            return None
 
-            name = str(parsed.get("name") or "").strip()
-            if not name:
-                ops.warning("Spell YAML %s missing name; skipping preset.", fp.name)
-                return None
+        name = str(parsed.get("name") or "").strip()
+        if not name:
+            ops.warning("Spell YAML %s missing name; skipping preset.", fp.name)
+            return None
 
-            schema = parsed.get("schema")
-            spell_id = parsed.get("id")
-            level = parsed.get("level")
-            school = parsed.get("school")
-            tags_raw = parsed.get("tags")
-            tags = [str(tag).strip() for tag in tags_raw if str(tag).strip()] if isinstance(tags_raw, list) else []
-            casting_time = parsed.get("casting_time")
-            spell_range = parsed.get("range")
-            ritual = parsed.get("ritual")
-            concentration = parsed.get("concentration")
-            color = normalize_color(parsed.get("color"))
-            import_data = parsed.get("import") if isinstance(parsed.get("import"), dict) else {}
-            url = import_data.get("url")
-            import_raw = import_data.get("raw") if isinstance(import_data.get("raw"), dict) else {}
-            import_description = import_raw.get("description")
-            if import_description in (None, ""):
-                text_block = parsed.get("text") if isinstance(parsed.get("text"), dict) else {}
-                import_description = text_block.get("rules")
-            lists = parsed.get("lists") if isinstance(parsed.get("lists"), dict) else {}
-            mechanics = parsed.get("mechanics") if isinstance(parsed.get("mechanics"), dict) else {}
-            ui_block = mechanics.get("ui") if isinstance(mechanics.get("ui"), dict) else {}
-            summon_config = normalize_summon_config(parsed, mechanics)
-            if summon_config is not None and "summon" not in mechanics:
-                mechanics = dict(mechanics)
-                mechanics["summon"] = copy.deepcopy(summon_config)
-            automation_raw = str(mechanics.get("automation") or "").strip().lower()
-            automation = automation_raw if automation_raw in ("full", "partial", "manual") else "manual"
-            errors: List[str] = []
-            warnings: List[str] = []
-            if not schema:
-                errors.append("missing schema")
-            if not spell_id:
-                errors.append("missing id")
-            if level is None:
-                errors.append("missing level")
-            if not school:
-                errors.append("missing school")
-            if errors:
-                ops.warning("Spell YAML %s has issues: %s", fp.name, ", ".join(errors))
-
-            preset: Dict[str, Any] = {
-                "slug": fp.stem,
-                "schema": schema,
-                "id": spell_id,
-                "name": name,
-                "level": level,
-                "school": school,
-                "tags": tags,
-                "casting_time": self._normalize_casting_time(casting_time),
-                "range": str(spell_range).strip() if spell_range not in (None, "") else None,
-                "ritual": ritual if isinstance(ritual, bool) else None,
-                "concentration": concentration if isinstance(concentration, bool) else None,
-                "lists": lists,
-                "mechanics": mechanics,
-                "automation": automation,
-            }
-            if summon_config is not None:
-                preset["summon"] = summon_config
-            appearance_options = ui_block.get("appearance_options")
-            if isinstance(appearance_options, list):
-                cleaned_options = [
-                    str(option).strip()
-                    for option in appearance_options
-                    if str(option).strip()
-                ]
-                if cleaned_options:
-                    preset["appearance_options"] = cleaned_options
-            if color:
-                preset["color"] = color
-            if isinstance(url, str) and url.strip():
-                preset["url"] = url.strip()
-            if isinstance(import_description, str) and import_description.strip():
-                preset["description"] = import_description.strip()
-
-            targeting = mechanics.get("targeting") if isinstance(mechanics.get("targeting"), dict) else {}
-            range_data = targeting.get("range") if isinstance(targeting.get("range"), dict) else {}
-            range_kind = str(range_data.get("kind") or "").strip().lower() if isinstance(range_data, dict) else ""
-            if range_kind == "distance" and range_data.get("distance_ft") in (None, ""):
-                range_from_text: Optional[float] = None
-                if spell_range not in (None, ""):
-                    range_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:ft|feet)", str(spell_range), flags=re.IGNORECASE)
-                    if range_match:
-                        try:
-                            parsed_range = float(range_match.group(1))
-                        except Exception:
-                            parsed_range = None
-                        if parsed_range is not None and math.isfinite(parsed_range) and parsed_range >= 0:
-                            range_from_text = parsed_range
-                if range_from_text is not None:
-                    mechanics = copy.deepcopy(mechanics)
-                    targeting = mechanics.get("targeting") if isinstance(mechanics.get("targeting"), dict) else {}
-                    targeting = copy.deepcopy(targeting)
-                    range_data = targeting.get("range") if isinstance(targeting.get("range"), dict) else {}
-                    range_data = copy.deepcopy(range_data)
-                    range_data["distance_ft"] = range_from_text
-                    targeting["range"] = range_data
-                    mechanics["targeting"] = targeting
-                    preset["mechanics"] = mechanics
-            area = targeting.get("area") if isinstance(targeting.get("area"), dict) else {}
-            shape_raw = str(area.get("shape") or "").strip().lower()
-            shape_map = {
-                "circle": "sphere",
-                "square": "cube",
-            }
-            shape = shape_map.get(shape_raw, shape_raw)
-            has_area = bool(shape)
-            has_aoe_tag = any(str(tag).strip().lower() == "aoe" for tag in tags)
-            valid_aoe_shapes = ("sphere", "cube", "cone", "cylinder", "wall", "line")
-            aoe_dimensions_present = False
-            if shape in valid_aoe_shapes:
-                if shape == "sphere":
-                    aoe_dimensions_present = parse_number(area.get("radius_ft")) is not None
-                elif shape == "cube":
-                    aoe_dimensions_present = parse_number(area.get("side_ft")) is not None
-                elif shape == "cylinder":
-                    aoe_dimensions_present = (
-                        parse_number(area.get("radius_ft")) is not None
-                        and parse_number(area.get("height_ft")) is not None
-                    )
-                elif shape == "line":
-                    aoe_dimensions_present = (
-                        parse_number(area.get("length_ft")) is not None
-                        and parse_number(area.get("width_ft")) is not None
-                    )
-                elif shape == "cone":
-                    aoe_dimensions_present = parse_number(area.get("length_ft")) is not None
-                elif shape == "wall":
-                    aoe_dimensions_present = (
-                        parse_number(area.get("length_ft")) is not None
-                        and parse_number(area.get("width_ft")) is not None
-                        and parse_number(area.get("height_ft")) is not None
-                    )
-            missing_required_fields = False
-            if automation in ("full", "partial"):
-                if str(range_data.get("kind") or "").strip().lower() == "distance":
-                    distance_ft = parse_number(range_data.get("distance_ft"))
-                    if distance_ft is None and not aoe_dimensions_present:
-                        warnings.append("missing targeting.range.distance_ft")
-                        missing_required_fields = True
-                if shape and shape not in valid_aoe_shapes:
-                    warnings.append(f"unsupported area shape '{shape_raw or shape}'")
+        schema = parsed.get("schema")
+        spell_id = parsed.get("id")
+        level = parsed.get("level")
+        school = parsed.get("school")
+        tags_raw = parsed.get("tags")
+        tags = [str(tag).strip() for tag in tags_raw if str(tag).strip()] if isinstance(tags_raw, list) else []
+        casting_time = parsed.get("casting_time")
+        spell_range = parsed.get("range")
+        ritual = parsed.get("ritual")
+        concentration = parsed.get("concentration")
+        color = normalize_color(parsed.get("color"))
+        import_data = parsed.get("import") if isinstance(parsed.get("import"), dict) else {}
+        url = import_data.get("url")
+        import_raw = import_data.get("raw") if isinstance(import_data.get("raw"), dict) else {}
+        import_description = import_raw.get("description")
+        if import_description in (None, ""):
+            text_block = parsed.get("text") if isinstance(parsed.get("text"), dict) else {}
+            import_description = text_block.get("rules")
+        lists = parsed.get("lists") if isinstance(parsed.get("lists"), dict) else {}
+        mechanics = parsed.get("mechanics") if isinstance(parsed.get("mechanics"), dict) else {}
+        ui_block = mechanics.get("ui") if isinstance(mechanics.get("ui"), dict) else {}
+        summon_config = normalize_summon_config(parsed, mechanics)
+        if summon_config is not None and "summon" not in mechanics:
+            mechanics = dict(mechanics)
+            mechanics["summon"] = copy.deepcopy(summon_config)
+        automation_raw = str(mechanics.get("automation") or "").strip().lower()
+        automation = automation_raw if automation_raw in ("full", "partial", "manual") else "manual"
+        errors: List[str] = []
+        warnings: List[str] = []
+        if not schema:
+            errors.append("missing schema")
+        if not spell_id:
+            errors.append("missing id")
+        if level is None:
+            errors.append("missing level")
+        if not school:
+            errors.append("missing school")
+        if errors:
+            ops.warning("Spell YAML %s has issues: %s", fp.name, ", ".join(errors))
+
+        preset: Dict[str, Any] = {
+            "slug": fp.stem,
+            "schema": schema,
+            "id": spell_id,
+            "name": name,
+            "level": level,
+            "school": school,
+            "tags": tags,
+            "casting_time": self._normalize_casting_time(casting_time),
+            "range": str(spell_range).strip() if spell_range not in (None, "") else None,
+            "ritual": ritual if isinstance(ritual, bool) else None,
+            "concentration": concentration if isinstance(concentration, bool) else None,
+            "lists": lists,
+            "mechanics": mechanics,
+            "automation": automation,
+        }
+        if summon_config is not None:
+            preset["summon"] = summon_config
+        appearance_options = ui_block.get("appearance_options")
+        if isinstance(appearance_options, list):
+            cleaned_options = [
+                str(option).strip()
+                for option in appearance_options
+                if str(option).strip()
+            ]
+            if cleaned_options:
+                preset["appearance_options"] = cleaned_options
+        if color:
+            preset["color"] = color
+        if isinstance(url, str) and url.strip():
+            preset["url"] = url.strip()
+        if isinstance(import_description, str) and import_description.strip():
+            preset["description"] = import_description.strip()
+
+        targeting = mechanics.get("targeting") if isinstance(mechanics.get("targeting"), dict) else {}
+        range_data = targeting.get("range") if isinstance(targeting.get("range"), dict) else {}
+        range_kind = str(range_data.get("kind") or "").strip().lower() if isinstance(range_data, dict) else ""
+        if range_kind == "distance" and range_data.get("distance_ft") in (None, ""):
+            range_from_text: Optional[float] = None
+            if spell_range not in (None, ""):
+                range_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:ft|feet)", str(spell_range), flags=re.IGNORECASE)
+                if range_match:
+                    try:
+                        parsed_range = float(range_match.group(1))
+                    except Exception:
+                        parsed_range = None
+                    if parsed_range is not None and math.isfinite(parsed_range) and parsed_range >= 0:
+                        range_from_text = parsed_range
+            if range_from_text is not None:
+                mechanics = copy.deepcopy(mechanics)
+                targeting = mechanics.get("targeting") if isinstance(mechanics.get("targeting"), dict) else {}
+                targeting = copy.deepcopy(targeting)
+                range_data = targeting.get("range") if isinstance(targeting.get("range"), dict) else {}
+                range_data = copy.deepcopy(range_data)
+                range_data["distance_ft"] = range_from_text
+                targeting["range"] = range_data
+                mechanics["targeting"] = targeting
+                preset["mechanics"] = mechanics
+        area = targeting.get("area") if isinstance(targeting.get("area"), dict) else {}
+        shape_raw = str(area.get("shape") or "").strip().lower()
+        shape_map = {
+            "circle": "sphere",
+            "square": "cube",
+        }
+        shape = shape_map.get(shape_raw, shape_raw)
+        has_area = bool(shape)
+        has_aoe_tag = any(str(tag).strip().lower() == "aoe" for tag in tags)
+        valid_aoe_shapes = ("sphere", "cube", "cone", "cylinder", "wall", "line")
+        aoe_dimensions_present = False
+        if shape in valid_aoe_shapes:
+            if shape == "sphere":
+                aoe_dimensions_present = parse_number(area.get("radius_ft")) is not None
+            elif shape == "cube":
+                aoe_dimensions_present = parse_number(area.get("side_ft")) is not None
+            elif shape == "cylinder":
+                aoe_dimensions_present = (
+                    parse_number(area.get("radius_ft")) is not None
+                    and parse_number(area.get("height_ft")) is not None
+                )
+            elif shape == "line":
+                aoe_dimensions_present = (
+                    parse_number(area.get("length_ft")) is not None
+                    and parse_number(area.get("width_ft")) is not None
+                )
+            elif shape == "cone":
+                aoe_dimensions_present = parse_number(area.get("length_ft")) is not None
+            elif shape == "wall":
+                aoe_dimensions_present = (
+                    parse_number(area.get("length_ft")) is not None
+                    and parse_number(area.get("width_ft")) is not None
+                    and parse_number(area.get("height_ft")) is not None
+                )
+        missing_required_fields = False
+        if automation in ("full", "partial"):
+            if str(range_data.get("kind") or "").strip().lower() == "distance":
+                distance_ft = parse_number(range_data.get("distance_ft"))
+                if distance_ft is None and not aoe_dimensions_present:
+                    warnings.append("missing targeting.range.distance_ft")
                     missing_required_fields = True
-            preset["is_aoe"] = False
-            if shape in valid_aoe_shapes:
-                preset["shape"] = shape
-                preset["is_aoe"] = True
-                missing_dimensions: List[str] = []
-                if shape == "sphere":
-                    radius_ft = parse_number(area.get("radius_ft"))
-                    if radius_ft is not None:
-                        preset["radius_ft"] = radius_ft
-                    else:
-                        missing_dimensions.append("radius_ft")
-                if shape == "cube":
-                    side_ft = parse_number(area.get("side_ft"))
-                    if side_ft is not None:
-                        preset["side_ft"] = side_ft
-                    else:
-                        missing_dimensions.append("side_ft")
-                if shape == "cylinder":
-                    radius_ft = parse_number(area.get("radius_ft"))
-                    if radius_ft is not None:
-                        preset["radius_ft"] = radius_ft
-                    else:
-                        missing_dimensions.append("radius_ft")
-                    height_ft = parse_number(area.get("height_ft"))
-                    if height_ft is not None:
-                        preset["height_ft"] = height_ft
-                    else:
-                        missing_dimensions.append("height_ft")
-                if shape == "line":
-                    length_ft = parse_number(area.get("length_ft"))
-                    width_ft = parse_number(area.get("width_ft"))
-                    if length_ft is not None:
-                        preset["length_ft"] = length_ft
-                    else:
-                        missing_dimensions.append("length_ft")
-                    if width_ft is not None:
-                        preset["width_ft"] = width_ft
-                    else:
-                        missing_dimensions.append("width_ft")
-                    angle_deg = parse_number(area.get("angle_deg"))
-                    if angle_deg is not None:
-                        preset["angle_deg"] = angle_deg
-                if shape == "cone":
-                    length_ft = parse_number(area.get("length_ft"))
-                    if length_ft is not None:
-                        preset["length_ft"] = length_ft
-                    else:
-                        missing_dimensions.append("length_ft")
-                    angle_deg = parse_number(area.get("angle_deg"))
-                    if angle_deg is not None:
-                        preset["angle_deg"] = angle_deg
-                if shape == "wall":
-                    length_ft = parse_number(area.get("length_ft"))
-                    width_ft = parse_number(area.get("width_ft"))
-                    height_ft = parse_number(area.get("height_ft"))
-                    if length_ft is not None:
-                        preset["length_ft"] = length_ft
-                    else:
-                        missing_dimensions.append("length_ft")
-                    if width_ft is not None:
-                        preset["width_ft"] = width_ft
-                    else:
-                        missing_dimensions.append("width_ft")
-                    if height_ft is not None:
-                        preset["height_ft"] = height_ft
-                    else:
-                        missing_dimensions.append("height_ft")
-                    angle_deg = parse_number(area.get("angle_deg"))
-                    if angle_deg is not None:
-                        preset["angle_deg"] = angle_deg
-                if missing_dimensions:
-                    preset["incomplete"] = True
-                    preset["incomplete_fields"] = missing_dimensions
-                    if automation in ("full", "partial"):
-                        warnings.append("missing area dimensions: " + ", ".join(missing_dimensions))
-                        missing_required_fields = True
-            elif has_aoe_tag:
-                preset["is_aoe"] = True
-
-            casting_time = str(preset.get("casting_time") or "").strip().lower()
-            if "bonus" in casting_time and "action" in casting_time:
-                preset["action_type"] = "bonus_action"
-            elif "reaction" in casting_time:
-                preset["action_type"] = "reaction"
-            else:
-                preset["action_type"] = "action"
+            if shape and shape not in valid_aoe_shapes:
+                warnings.append(f"unsupported area shape '{shape_raw or shape}'")
+                missing_required_fields = True
+        preset["is_aoe"] = False
+        if shape in valid_aoe_shapes:
+            preset["shape"] = shape
+            preset["is_aoe"] = True
+            missing_dimensions: List[str] = []
+            if shape == "sphere":
+                radius_ft = parse_number(area.get("radius_ft"))
+                if radius_ft is not None:
+                    preset["radius_ft"] = radius_ft
+                else:
+                    missing_dimensions.append("radius_ft")
+            if shape == "cube":
+                side_ft = parse_number(area.get("side_ft"))
+                if side_ft is not None:
+                    preset["side_ft"] = side_ft
+                else:
+                    missing_dimensions.append("side_ft")
+            if shape == "cylinder":
+                radius_ft = parse_number(area.get("radius_ft"))
+                if radius_ft is not None:
+                    preset["radius_ft"] = radius_ft
+                else:
+                    missing_dimensions.append("radius_ft")
+                height_ft = parse_number(area.get("height_ft"))
+                if height_ft is not None:
+                    preset["height_ft"] = height_ft
+                else:
+                    missing_dimensions.append("height_ft")
+            if shape == "line":
+                length_ft = parse_number(area.get("length_ft"))
+                width_ft = parse_number(area.get("width_ft"))
+                if length_ft is not None:
+                    preset["length_ft"] = length_ft
+                else:
+                    missing_dimensions.append("length_ft")
+                if width_ft is not None:
+                    preset["width_ft"] = width_ft
+                else:
+                    missing_dimensions.append("width_ft")
+                angle_deg = parse_number(area.get("angle_deg"))
+                if angle_deg is not None:
+                    preset["angle_deg"] = angle_deg
+            if shape == "cone":
+                length_ft = parse_number(area.get("length_ft"))
+                if length_ft is not None:
+                    preset["length_ft"] = length_ft
+                else:
+                    missing_dimensions.append("length_ft")
+                angle_deg = parse_number(area.get("angle_deg"))
+                if angle_deg is not None:
+                    preset["angle_deg"] = angle_deg
+            if shape == "wall":
+                length_ft = parse_number(area.get("length_ft"))
+                width_ft = parse_number(area.get("width_ft"))
+                height_ft = parse_number(area.get("height_ft"))
+                if length_ft is not None:
+                    preset["length_ft"] = length_ft
+                else:
+                    missing_dimensions.append("length_ft")
+                if width_ft is not None:
+                    preset["width_ft"] = width_ft
+                else:
+                    missing_dimensions.append("width_ft")
+                if height_ft is not None:
+                    preset["height_ft"] = height_ft
+                else:
+                    missing_dimensions.append("height_ft")
+                angle_deg = parse_number(area.get("angle_deg"))
+                if angle_deg is not None:
+                    preset["angle_deg"] = angle_deg
+            if missing_dimensions:
+                preset["incomplete"] = True
+                preset["incomplete_fields"] = missing_dimensions
+                if automation in ("full", "partial"):
+                    warnings.append("missing area dimensions: " + ", ".join(missing_dimensions))
+                    missing_required_fields = True
+        elif has_aoe_tag:
+            preset["is_aoe"] = True
+
+        casting_time = str(preset.get("casting_time") or "").strip().lower()
+        if "bonus" in casting_time and "action" in casting_time:
+            preset["action_type"] = "bonus_action"
+        elif "reaction" in casting_time:
+            preset["action_type"] = "reaction"
+        else:
+            preset["action_type"] = "action"
 
-            damage_types: List[str] = []
-            dice: Optional[str] = None
-            effect_scaling: Optional[Dict[str, Any]] = None
-            save_type: Optional[str] = None
-            save_dc: Optional[int] = None
-            half_on_pass: Optional[bool] = None
-            condition_key: Optional[str] = None
-            condition_turns: Optional[int] = None
+        damage_types: List[str] = []
+        dice: Optional[str] = None
+        effect_scaling: Optional[Dict[str, Any]] = None
+        save_type: Optional[str] = None
+        save_dc: Optional[int] = None
+        half_on_pass: Optional[bool] = None
+        condition_key: Optional[str] = None
+        condition_turns: Optional[int] = None
 
-            sequence = mechanics.get("sequence") if isinstance(mechanics.get("sequence"), list) else []
-            for step in sequence:
-                if not isinstance(step, dict):
+        sequence = mechanics.get("sequence") if isinstance(mechanics.get("sequence"), list) else []
+        for step in sequence:
+            if not isinstance(step, dict):
+                continue
+            check = step.get("check") if isinstance(step.get("check"), dict) else {}
+            if save_type is None and check.get("kind") == "saving_throw":
+                save_type = normalize_save_type(check.get("ability"))
+                dc_value = check.get("dc")
+                if isinstance(dc_value, (int, float)):
+                    save_dc = int(dc_value)
+                elif isinstance(dc_value, str) and dc_value.strip().isdigit():
+                    save_dc = int(dc_value.strip())
+            outcomes = step.get("outcomes") if isinstance(step.get("outcomes"), dict) else {}
+            for outcome_key, outcome_list in outcomes.items():
+                if not isinstance(outcome_list, list):
                     continue
-                check = step.get("check") if isinstance(step.get("check"), dict) else {}
-                if save_type is None and check.get("kind") == "saving_throw":
-                    save_type = normalize_save_type(check.get("ability"))
-                    dc_value = check.get("dc")
-                    if isinstance(dc_value, (int, float)):
-                        save_dc = int(dc_value)
-                    elif isinstance(dc_value, str) and dc_value.strip().isdigit():
-                        save_dc = int(dc_value.strip())
-                outcomes = step.get("outcomes") if isinstance(step.get("outcomes"), dict) else {}
-                for outcome_key, outcome_list in outcomes.items():
-                    if not isinstance(outcome_list, list):
+                outcome_label = str(outcome_key or "").strip().lower()
+                is_fail_outcome = outcome_label in FAIL_OUTCOME_LABELS
+                for effect in outcome_list:
+                    if not isinstance(effect, dict):
                         continue
-                    outcome_label = str(outcome_key or "").strip().lower()
-                    is_fail_outcome = outcome_label in FAIL_OUTCOME_LABELS
-                    for effect in outcome_list:
-                        if not isinstance(effect, dict):
-                            continue
-                        if effect.get("effect") == "condition":
-                            if is_fail_outcome and condition_key is None:
-                                raw_condition = effect.get("condition")
-                                if raw_condition not in (None, ""):
-                                    condition_key = str(raw_condition).strip().lower()
-                                raw_turns = effect.get("duration_turns")
-                                if raw_turns not in (None, ""):
-                                    if isinstance(raw_turns, int):
-                                        parsed_turns = raw_turns
-                                    else:
-                                        try:
-                                            parsed_turns = int(str(raw_turns).strip())
-                                        except ValueError:
-                                            parsed_turns = None
-                                    if parsed_turns is not None:
-                                        if parsed_turns < 0:
-                                            condition_name = condition_key or "condition"
-                                            warnings.append(
-                                                f"negative condition duration for {name} ({condition_name}); using 0"
-                                            )
-                                            parsed_turns = 0
-                                        condition_turns = parsed_turns
-                            continue
-                        if effect.get("effect") != "damage":
-                            continue
-                        dtype = str(effect.get("damage_type") or "").strip()
-                        if dtype and dtype not in damage_types:
-                            damage_types.append(dtype)
-                        if dice is None:
-                            dice = parse_dice(effect.get("dice"))
-                        if effect_scaling is None and isinstance(effect.get("scaling"), dict):
-                            effect_scaling = effect.get("scaling")
-                        if half_on_pass is None:
-                            multiplier = parse_number(effect.get("multiplier"))
-                            if multiplier is not None and abs(multiplier - 0.5) < 1e-9:
-                                outcome_label = str(outcome_key or "").strip().lower()
-                                if outcome_label in ("success", "pass", "save", "saved", "succeed"):
-                                    half_on_pass = True
-
-            scaling = mechanics.get("scaling") if isinstance(mechanics.get("scaling"), dict) else None
-            if scaling is None:
-                scaling = effect_scaling
-            if isinstance(scaling, dict):
-                preset["scaling"] = copy.deepcopy(scaling)
-
-            if save_type:
-                preset["save_type"] = save_type
-            if save_dc is not None:
-                preset["save_dc"] = save_dc
-            if dice:
-                preset["dice"] = dice
-            if damage_types:
-                preset["damage_types"] = damage_types
-            if half_on_pass:
-                preset["half_on_pass"] = True
-            if condition_key:
-                preset["condition_on_fail"] = True
-                preset["condition_key"] = condition_key
-                if condition_turns is not None:
-                    preset["condition_turns"] = condition_turns
-
-            upcast: Optional[Dict[str, Any]] = None
-            if isinstance(scaling, dict) and scaling.get("kind") == "slot_level":
-                base_slot = scaling.get("base_slot")
-                add_per_slot = scaling.get("add_per_slot_above")
-                base_level = int(base_slot) if isinstance(base_slot, int) else None
-                add_dice = parse_dice(add_per_slot)
-                if base_level is None and isinstance(base_slot, str) and base_slot.strip().isdigit():
-                    base_level = int(base_slot.strip())
-                if base_level is not None and add_dice:
-                    upcast = {
-                        "base_level": base_level,
-                        "add_per_slot_above": add_dice,
-                    }
-            if isinstance(scaling, dict) and scaling.get("kind") == "character_level":
-                thresholds = scaling.get("thresholds") if isinstance(scaling.get("thresholds"), dict) else {}
-                increments: List[Dict[str, Any]] = []
-                for threshold, data in thresholds.items():
-                    if not isinstance(data, dict):
+                    if effect.get("effect") == "condition":
+                        if is_fail_outcome and condition_key is None:
+                            raw_condition = effect.get("condition")
+                            if raw_condition not in (None, ""):
+                                condition_key = str(raw_condition).strip().lower()
+                            raw_turns = effect.get("duration_turns")
+                            if raw_turns not in (None, ""):
+                                if isinstance(raw_turns, int):
+                                    parsed_turns = raw_turns
+                                else:
+                                    try:
+                                        parsed_turns = int(str(raw_turns).strip())
+                                    except ValueError:
+                                        parsed_turns = None
+                                if parsed_turns is not None:
+                                    if parsed_turns < 0:
+                                        condition_name = condition_key or "condition"
+                                        warnings.append(
+                                            f"negative condition duration for {name} ({condition_name}); using 0"
+                                        )
+                                        parsed_turns = 0
+                                    condition_turns = parsed_turns
                         continue
-                    try:
-                        level = int(str(threshold).strip())
-                    except ValueError:
+                    if effect.get("effect") != "damage":
                         continue
-                    add_dice = parse_dice(data.get("add"))
-                    if add_dice:
-                        increments.append({"level": level, "add_dice": add_dice})
-                if increments:
-                    increments.sort(key=lambda entry: entry.get("level", 0))
-                    upcast = {
-                        "base_level": 1,
-                        "increments": increments,
-                    }
-            if upcast:
-                preset["upcast"] = upcast
-
-            if not preset.get("shape") and has_aoe_tag and not has_area:
-                warnings.append("tagged aoe but missing targeting area")
-            if automation == "full":
-                if has_aoe_tag and "shape" not in preset:
-                    automation = "partial"
-                if not dice and not damage_types and not save_type:
-                    automation = "partial"
-            if not mechanics:
-                automation = "manual"
-            if missing_required_fields and automation == "full":
-                automation = "partial"
-            if errors and automation == "full":
-                automation = "partial"
-            preset["automation"] = automation
-            if warnings:
-                ops.warning("Spell YAML %s has automation warnings: %s", fp.name, ", ".join(warnings))
-
-            return preset, raw
-
-        new_entries: Dict[str, Any] = {}
-        used_cached_only = True
-        for fp in files:
-            meta = _file_stat_metadata(fp)
-            entry = cached_entries.get(fp.name) if isinstance(cached_entries, dict) else None
-            if isinstance(entry, dict) and _metadata_matches(entry, meta):
-                preset = entry.get("preset")
-                if isinstance(preset, dict):
-                    if "slug" not in preset:
-                        preset = dict(preset)
-                        preset["slug"] = fp.stem
-                        entry["preset"] = preset
-                    presets.append(preset)
-                    new_entry = dict(entry)
-                    new_entry["mtime_ns"] = meta.get("mtime_ns")
-                    new_entry["size"] = meta.get("size")
-                    new_entries[fp.name] = new_entry
+                    dtype = str(effect.get("damage_type") or "").strip()
+                    if dtype and dtype not in damage_types:
+                        damage_types.append(dtype)
+                    if dice is None:
+                        dice = parse_dice(effect.get("dice"))
+                    if effect_scaling is None and isinstance(effect.get("scaling"), dict):
+                        effect_scaling = effect.get("scaling")
+                    if half_on_pass is None:
+                        multiplier = parse_number(effect.get("multiplier"))
+                        if multiplier is not None and abs(multiplier - 0.5) < 1e-9:
+                            outcome_label = str(outcome_key or "").strip().lower()
+                            if outcome_label in ("success", "pass", "save", "saved", "succeed"):
+                                half_on_pass = True
+
+        scaling = mechanics.get("scaling") if isinstance(mechanics.get("scaling"), dict) else None
+        if scaling is None:
+            scaling = effect_scaling
+        if isinstance(scaling, dict):
+            preset["scaling"] = copy.deepcopy(scaling)
+
+        if save_type:
+            preset["save_type"] = save_type
+        if save_dc is not None:
+            preset["save_dc"] = save_dc
+        if dice:
+            preset["dice"] = dice
+        if damage_types:
+            preset["damage_types"] = damage_types
+        if half_on_pass:
+            preset["half_on_pass"] = True
+        if condition_key:
+            preset["condition_on_fail"] = True
+            preset["condition_key"] = condition_key
+            if condition_turns is not None:
+                preset["condition_turns"] = condition_turns
+
+        upcast: Optional[Dict[str, Any]] = None
+        if isinstance(scaling, dict) and scaling.get("kind") == "slot_level":
+            base_slot = scaling.get("base_slot")
+            add_per_slot = scaling.get("add_per_slot_above")
+            base_level = int(base_slot) if isinstance(base_slot, int) else None
+            add_dice = parse_dice(add_per_slot)
+            if base_level is None and isinstance(base_slot, str) and base_slot.strip().isdigit():
+                base_level = int(base_slot.strip())
+            if base_level is not None and add_dice:
+                upcast = {
+                    "base_level": base_level,
+                    "add_per_slot_above": add_dice,
+                }
+        if isinstance(scaling, dict) and scaling.get("kind") == "character_level":
+            thresholds = scaling.get("thresholds") if isinstance(scaling.get("thresholds"), dict) else {}
+            increments: List[Dict[str, Any]] = []
+            for threshold, data in thresholds.items():
+                if not isinstance(data, dict):
                     continue
-            used_cached_only = False
-            parsed = parse_spell_file(fp)
-            if parsed is None:
-                continue
-            preset, raw = parsed
-            presets.append(preset)
-            new_entries[fp.name] = {
-                "mtime_ns": meta.get("mtime_ns"),
-                "size": meta.get("size"),
-                "hash": _hash_text(raw),
-                "preset": preset,
-            }
-
-        self._spell_presets_cache = presets
-        self._spell_index_entries = new_entries
-        self._spell_index_loaded = True
-        self._spell_dir_signature = dir_signature
-        if not used_cached_only or not cache_names_match:
-            _write_index_file(self._spell_index_path(), {"version": 1, "entries": new_entries})
+                try:
+                    level = int(str(threshold).strip())
+                except ValueError:
+                    continue
+                add_dice = parse_dice(data.get("add"))
+                if add_dice:
+                    increments.append({"level": level, "add_dice": add_dice})
+            if increments:
+                increments.sort(key=lambda entry: entry.get("level", 0))
+                upcast = {
+                    "base_level": 1,
+                    "increments": increments,
+                }
+        if upcast:
+            preset["upcast"] = upcast
 
-        return presets
+        if not preset.get("shape") and has_aoe_tag and not has_area:
+            warnings.append("tagged aoe but missing targeting area")
+        if automation == "full":
+            if has_aoe_tag and "shape" not in preset:
+                automation = "partial"
+            if not dice and not damage_types and not save_type:
+                automation = "partial"
+        if not mechanics:
+            automation = "manual"
+        if missing_required_fields and automation == "full":
+            automation = "partial"
+        if errors and automation == "full":
+            automation = "partial"
+        preset["automation"] = automation
+        if warnings:
+            ops.warning("Spell YAML %s has automation warnings: %s", fp.name, ", ".join(warnings))
+
+        return preset
 
     def _players_dir(self) -> Path:
         _seed_user_players_dir()
@@ -14156,6 +15944,7 @@ class InitiativeTracker(base.InitiativeTracker):
             path.parent.mkdir(parents=True, exist_ok=True)
             tmp_path.write_text(yaml_text, encoding="utf-8")
             tmp_path.replace(path)
+        self._note_library_write(path)
 
     @staticmethod
     def _normalize_character_lookup_key(value: Any) -> str:
@@ -14170,45 +15959,17 @@ class InitiativeTracker(base.InitiativeTracker):
         without_dupe = re.sub(r"\s+\d+$", "", without_form).strip()
         return without_dupe or text
 
+    def _player_profile_index(self) -> PlayerProfileIndex:
+        """The alias index over the current player name map, rebuilt only when the map changes."""
+        name_map = self._player_yaml_name_map
+        index = self.__dict__.get("_player_profile_alias_index")
+        if index is None or index.name_map is not name_map or index.size != len(name_map):
+            index = PlayerProfileIndex(name_map, self._character_slugify)
+            self.__dict__["_player_profile_alias_index"] = index
+        return index
+
     def _find_player_profile_path(self, player_name: Any) -> Optional[Path]:
-        lookup = self._normalize_character_lookup_key(player_name)
-        if not lookup:
-            return None
-        lookup_slug = self._character_slugify(str(player_name or ""))
-        path = self._player_yaml_name_map.get(lookup)
-        if isinstance(path, Path):
-            return path
-        # Fallback: case-insensitive lookup from canonical profile names.
-        for known_name, known_path in self._player_yaml_name_map.items():
-            known_lookup = self._normalize_character_lookup_key(known_name)
-            if known_lookup == lookup:
-                return known_path
-            if lookup_slug and self._character_slugify(known_lookup) == lookup_slug:
-                return known_path
-        # Duplicate combatants can get suffixes like "Name 2".
-        base_lookup = re.sub(r"\s+\d+$", "", lookup).strip()
-        base_lookup_slug = self._character_slugify(base_lookup)
-        if base_lookup:
-            for known_name, known_path in self._player_yaml_name_map.items():
-                known_lookup = self._normalize_character_lookup_key(known_name)
-                if known_lookup == base_lookup:
-                    return known_path
-                if base_lookup_slug and self._character_slugify(known_lookup) == base_lookup_slug:
-                    return known_path
-        stripped = self._strip_combat_name_suffix(player_name)
-        stripped_lookup = self._normalize_character_lookup_key(stripped)
-        stripped_slug = self._character_slugify(stripped_lookup)
-        if stripped_lookup and stripped_lookup != lookup:
-            direct = self._player_yaml_name_map.get(stripped_lookup)
-            if isinstance(direct, Path):
-                return direct
-            for known_name, known_path in self._player_yaml_name_map.items():
-                known_lookup = self._normalize_character_lookup_key(known_name)
-                if known_lookup == stripped_lookup:
-                    return known_path
-                if stripped_slug and self._character_slugify(known_lookup) == stripped_slug:
-                    return known_path
-        return None
+        return self._player_profile_index().resolve(player_name)
 
     @staticmethod
     def _wild_shape_identifier_key(value: Any) -> str:
@@ -14235,10 +15996,21 @@ class InitiativeTracker(base.InitiativeTracker):
         return aliases
 
     def _profile_for_player_name(self, player_name: Any) -> Optional[Dict[str, Any]]:
-        self._load_player_yaml_cache()
         lookup_name = str(player_name or "").strip()
         if not lookup_name:
             return None
+        index = self.__dict__.get("_player_profile_alias_index")
+        if (
+            index is not None
+            and index.name_map is self._player_yaml_name_map
+            and index.is_known_miss(lookup_name)
+        ):
+            # Monsters and summons are looked up for every snapshot; trust the cached miss
+            # until the players library changes (or, unwatched, until the next PC lookup reloads it).
+            revision = self._library_revision("players")
+            if revision is None or revision == self.__dict__.get("_player_yaml_revision"):
+                return None
+        self._load_player_yaml_cache()
         profile = self._player_yaml_data_by_name.get(lookup_name)
         if isinstance(profile, dict):
             return profile
@@ -14330,8 +16102,11 @@ class InitiativeTracker(base.InitiativeTracker):
             path.parent.mkdir(parents=True, exist_ok=True)
             tmp_path.write_text(yaml_text, encoding="utf-8")
             tmp_path.replace(path)
+        self._note_library_write(path)
 
     def _schedule_player_yaml_refresh(self) -> None:
+        # Callers have just edited the name map in place.
+        self.__dict__.pop("_player_profile_alias_index", None)
         if self._player_yaml_refresh_scheduled:
             return
         self._player_yaml_refresh_scheduled = True
@@ -14584,10 +16359,9 @@ class InitiativeTracker(base.InitiativeTracker):
         item_name = str(entry.get("name") or "").strip().lower()
         if not item_name:
             return None
-        matches = [payload for payload in registry.values() if isinstance(payload, dict) and str(payload.get("name") or "").strip().lower() == item_name]
-        if len(matches) == 1:
-            return matches[0]
-        return None
+        name_to_id, _duplicates = self._item_name_index("magic_items", registry)
+        item = registry.get(name_to_id.get(item_name, ""))
+        return item if isinstance(item, dict) else None
 
     def _mutate_owned_magic_item_state(self, name: str, instance_id: str, operation: str) -> Dict[str, Any]:
         player_name = str(name or "").strip()
@@ -14841,42 +16615,11 @@ class InitiativeTracker(base.InitiativeTracker):
         return host
 
     def _spell_preset_name_lookup(self) -> Dict[str, str]:
-        lookup: Dict[str, str] = {}
+        """Lower-cased name/id/filename -> display name; shared with the spell index, so read-only."""
         try:
-            presets = self._spell_presets_payload()
+            return self._spell_index().names
         except Exception:
-            presets = []
-        for preset in presets if isinstance(presets, list) else []:
-            if not isinstance(preset, dict):
-                continue
-            name = str(preset.get("name") or "").strip()
-            if not name:
-                continue
-            lookup[name.lower()] = name
-            preset_id = str(preset.get("id") or "").strip()
-            if preset_id:
-                lookup[preset_id.lower()] = name
-
-        entries = self._load_spell_index_entries()
-        for filename, entry in entries.items():
-            if not isinstance(entry, dict):
-                continue
-            preset = entry.get("preset")
-            if not isinstance(preset, dict):
-                continue
-            name = str(preset.get("name") or "").strip()
-            if not name:
-                continue
-            file_key = str(filename or "").strip()
-            if file_key:
-                lookup[file_key.lower()] = name
-                stem = Path(file_key).stem
-                if stem:
-                    lookup[stem.lower()] = name
-            preset_id = str(preset.get("id") or "").strip()
-            if preset_id:
-                lookup[preset_id.lower()] = name
-        return lookup
+            return {}
 
     def _normalize_spell_reference_list(self, value: Any) -> List[str]:
         def normalize_name(raw: Any) -> Optional[str]:
@@ -15674,6 +17417,9 @@ class InitiativeTracker(base.InitiativeTracker):
     def _compute_spell_save_dc(self, profile: Dict[str, Any]) -> Optional[int]:
         if not isinstance(profile, dict):
             return None
+        compiled = _peek_compiled_player_profile(self, profile)
+        if compiled is not None:
+            return compiled.save_dc
         spellcasting = profile.get("spellcasting")
         if not isinstance(spellcasting, dict):
             return None
@@ -15807,6 +17553,10 @@ class InitiativeTracker(base.InitiativeTracker):
         return True
 
     def _resolve_player_ac(self, profile: Dict[str, Any], defenses: Any) -> Optional[int]:
+        compiled = _peek_compiled_player_profile(self, profile)
+        if compiled is not None and defenses is profile.get("defenses"):
+            return compiled.ac
+
         def to_int(value: Any, fallback: Optional[int] = None) -> Optional[int]:
             try:
                 return int(value)
@@ -15940,6 +17690,10 @@ class InitiativeTracker(base.InitiativeTracker):
         data: Dict[str, Any],
         include_missing_prepared: bool = True,
     ) -> Dict[str, Any]:
+        compiled = _peek_compiled_player_profile(self, data)
+        if compiled is not None:
+            return copy.deepcopy(compiled.spell_config if include_missing_prepared else compiled.spell_config_known)
+
         def normalize_limit(value: Any, fallback: int) -> int:
             try:
                 num = int(value)
@@ -16057,6 +17811,9 @@ class InitiativeTracker(base.InitiativeTracker):
         return payload
 
     def _normalize_player_resource_pools(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        compiled = _peek_compiled_player_profile(self, data)
+        if compiled is not None:
+            return copy.deepcopy(compiled.resource_pools)
         resources = data.get("resources") if isinstance(data.get("resources"), dict) else {}
         pools = resources.get("pools") if isinstance(resources.get("pools"), list) else []
         normalized: List[Dict[str, Any]] = []
@@ -16216,6 +17973,9 @@ class InitiativeTracker(base.InitiativeTracker):
         return max(0, int(math.floor(result)))
 
     def _feature_runtime_from_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        compiled = _peek_compiled_player_profile(self, profile)
+        if compiled is not None:
+            return copy.deepcopy(compiled.feature_runtime)
         features = self._all_active_features(profile)
         compiled_actions: Dict[str, List[Dict[str, Any]]] = {"actions": [], "bonus_actions": [], "reactions": []}
         feature_state: Dict[str, Dict[str, Any]] = {}
@@ -16342,6 +18102,9 @@ class InitiativeTracker(base.InitiativeTracker):
         }
 
     def _player_pool_granted_spells(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+        compiled = _peek_compiled_player_profile(self, profile)
+        if compiled is not None:
+            return copy.deepcopy(compiled.pool_granted_spells)
         pools = self._normalize_player_resource_pools(profile)
         pool_by_id = {str(pool.get("id") or "").strip().lower(): pool for pool in pools if isinstance(pool, dict)}
         features = self._all_active_features(profile)
@@ -16399,13 +18162,124 @@ class InitiativeTracker(base.InitiativeTracker):
                 )
         return granted
 
+    def _player_compile_sources(self) -> Tuple[Any, ...]:
+        catalog = self.__dict__.get("_item_catalog_service")
+        if catalog is None or self._library_revision("items") is not None:
+            # Watched item edits replace the owning profiles instead (_refresh_item_owner_profiles).
+            items: Tuple[Any, ...] = (None, None)
+        else:
+            items = (catalog.magic_items, catalog.consumables)
+        return (self._library_revision("spells"), self.__dict__.get("_spell_presets_cache")) + items
+
+    def _player_item_keys(self, profile: Dict[str, Any]) -> set[str]:
+        """Item catalog keys a normalized profile references through its inventory or weapons."""
+        keys: set[str] = set()
+        inventory = profile.get("inventory") if isinstance(profile.get("inventory"), dict) else {}
+        attacks = profile.get("attacks") if isinstance(profile.get("attacks"), dict) else {}
+        entries = list(inventory.get("items") if isinstance(inventory.get("items"), list) else [])
+        entries += attacks.get("weapons") if isinstance(attacks.get("weapons"), list) else []
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            item_id = str(entry.get("id") or "").strip().lower()
+            keys |= item_catalog.item_keys(entry, re.sub(r"[\s-]+", "_", item_id))
+        for item_id in inventory.get("equipped") if isinstance(inventory.get("equipped"), list) else []:
+            if str(item_id or "").strip():
+                keys.add(str(item_id).strip().lower())
+        return keys
+
+    def _refresh_item_owner_profiles(self) -> None:
+        """Re-normalize only the cached profiles that reference items edited since the last check."""
+        if self._library_revision("items") is None:
+            # Unwatched, this would stat Items/ on every player lookup; profiles refresh with their own files.
+            return
+        catalog = self._item_catalog()
+        seen = self.__dict__.get("_player_item_generation") or 0
+        if catalog.generation == seen:
+            return
+        self._player_item_generation = catalog.generation
+        data_by_name = self.__dict__.get("_player_yaml_data_by_name")
+        if not isinstance(data_by_name, dict) or not data_by_name:
+            return
+        for owner in catalog.owner_names():
+            if owner not in data_by_name:
+                catalog.drop_owner(owner)
+        for name, profile in data_by_name.items():
+            if isinstance(profile, dict):
+                catalog.sync_owner(name, profile, lambda profile=profile: self._player_item_keys(profile))
+        affected = catalog.owners_of(catalog.changed_keys(seen))
+        if not affected:
+            return
+        updated = dict(data_by_name)
+        for name in sorted(affected):
+            path = self._player_yaml_name_map.get(self._normalize_character_lookup_key(name))
+            raw = self._player_yaml_cache_by_path.get(path) if isinstance(path, Path) else None
+            if isinstance(raw, dict) and name in updated:
+                updated[name] = self._normalize_player_profile(raw, path.stem)
+        self._player_yaml_data_by_name = updated
+
+    def _compiled_player_profile(self, profile: Any, build: bool = True) -> Optional[CompiledPlayerProfile]:
+        """Derived stats for a profile held in the player cache; None for any other dict.
+
+        With build=False this is a pure lookup, which is what the normalizers use so that
+        compiling a profile (which calls them) never recurses.
+        """
+        if not isinstance(profile, dict):
+            return None
+        self._refresh_item_owner_profiles()
+        data_by_name = self.__dict__.get("_player_yaml_data_by_name")
+        name = profile.get("name")
+        if not isinstance(data_by_name, dict) or not isinstance(name, str) or data_by_name.get(name) is not profile:
+            return None
+        cache = self.__dict__.get("_compiled_player_profiles")
+        if not isinstance(cache, dict):
+            cache = {}
+            self._compiled_player_profiles = cache
+        if self.__dict__.get("_compiled_player_profiles_source") is not data_by_name:
+            for stale in [key for key in cache if key not in data_by_name]:
+                cache.pop(stale, None)
+            self._compiled_player_profiles_source = data_by_name
+        compiled = cache.get(name)
+        if compiled is not None and compiled.matches(profile, self._player_compile_sources()):
+            return compiled
+        if not build:
+            return None
+        resource_pools = self._normalize_player_resource_pools(profile)
+        spell_config = self._normalize_player_spell_config(profile)
+        spell_config_known = self._normalize_player_spell_config(profile, include_missing_prepared=False)
+        save_dc = self._compute_spell_save_dc(profile)
+        ac = self._resolve_player_ac(profile, profile.get("defenses"))
+        active_features = self._all_active_features(profile)
+        feature_runtime = self._feature_runtime_from_profile(profile)
+        pool_granted_spells = self._player_pool_granted_spells(profile)
+        # Sources are read after compiling: the normalizers may have just (re)loaded the registries.
+        compiled = CompiledPlayerProfile(
+            profile,
+            self._player_compile_sources(),
+            resource_pools,
+            spell_config,
+            spell_config_known,
+            save_dc,
+            ac,
+            active_features,
+            feature_runtime,
+            pool_granted_spells,
+        )
+        cache[name] = compiled
+        return compiled
+
     def _player_resource_pools_payload(self) -> Dict[str, List[Dict[str, Any]]]:
         self._load_player_yaml_cache()
         payload: Dict[str, List[Dict[str, Any]]] = {}
         for name, data in self._player_yaml_data_by_name.items():
             if not isinstance(data, dict):
                 continue
-            payload[name] = self._normalize_player_resource_pools(data)
+            compiled = self._compiled_player_profile(data)
+            payload[name] = (
+                copy.deepcopy(compiled.resource_pools)
+                if compiled is not None
+                else self._normalize_player_resource_pools(data)
+            )
         self._augment_resource_pools_with_temporary_conditions(payload)
         return payload
 
@@ -16490,12 +18364,20 @@ class InitiativeTracker(base.InitiativeTracker):
             pools.append(temp_pool)
 
     def _load_player_yaml_cache(self, force_refresh: bool = False) -> None:
+        self._refresh_item_owner_profiles()
+        revision = self._library_revision("players")
+        previous_revision = self.__dict__.get("_player_yaml_revision")
         if not force_refresh:
-            now = time.monotonic()
-            if self._player_yaml_last_refresh and (
-                now - self._player_yaml_last_refresh < self._player_yaml_refresh_interval_s
-            ):
-                return
+            if revision is not None:
+                # The library watcher bumps the revision on any change under players/.
+                if revision == previous_revision:
+                    return
+            else:
+                now = time.monotonic()
+                if self._player_yaml_last_refresh and (
+                    now - self._player_yaml_last_refresh < self._player_yaml_refresh_interval_s
+                ):
+                    return
         if yaml is None:
             self._player_yaml_cache_by_path = {}
             self._player_yaml_meta_by_path = {}
@@ -16503,6 +18385,7 @@ class InitiativeTracker(base.InitiativeTracker):
             self._player_yaml_name_map = {}
             self._player_yaml_dir_signature = None
             self._player_yaml_last_refresh = time.monotonic()
+            self._player_yaml_revision = revision
             return
 
         players_dir = self._players_dir()
@@ -16513,6 +18396,7 @@ class InitiativeTracker(base.InitiativeTracker):
             self._player_yaml_name_map = {}
             self._player_yaml_dir_signature = None
             self._player_yaml_last_refresh = time.monotonic()
+            self._player_yaml_revision = revision
             return
 
         try:
@@ -16530,12 +18414,16 @@ class InitiativeTracker(base.InitiativeTracker):
         dir_signature = _directory_signature(players_dir, files)
         enabled_signature = tuple(sorted(path.name for path in enabled_files))
         combined_signature = (dir_signature, enabled_signature)
+        # Paths the watcher saw change since the last load; anything else keeps its cached entry unstat-ed.
+        changed_paths = None if force_refresh else self._library_changes("players", previous_revision)
         if (
             not force_refresh
+            and not changed_paths
             and self._player_yaml_cache_by_path
             and combined_signature == self._player_yaml_dir_signature
         ):
             self._player_yaml_last_refresh = time.monotonic()
+            self._player_yaml_revision = revision
             return
 
         data_by_path = dict(self._player_yaml_cache_by_path)
@@ -16561,6 +18449,8 @@ class InitiativeTracker(base.InitiativeTracker):
                 purge_path_entries(cached_path)
 
         for path in enabled_files:
+            if changed_paths is not None and path not in changed_paths and path in meta_by_path:
+                continue
             meta = _file_stat_metadata(path)
             cached_meta = meta_by_path.get(path)
             if cached_meta and _metadata_matches(cached_meta, meta):
@@ -16586,13 +18476,19 @@ class InitiativeTracker(base.InitiativeTracker):
         self._player_yaml_name_map = name_map
         self._player_yaml_dir_signature = combined_signature
         self._player_yaml_last_refresh = time.monotonic()
+        self._player_yaml_revision = revision
     def _player_spell_config_payload(self) -> Dict[str, Dict[str, Any]]:
         self._load_player_yaml_cache()
         payload: Dict[str, Dict[str, Any]] = {}
         for name, data in self._player_yaml_data_by_name.items():
             if not isinstance(data, dict):
                 continue
-            payload[name] = self._normalize_player_spell_config(data)
+            compiled = self._compiled_player_profile(data)
+            payload[name] = (
+                copy.deepcopy(compiled.spell_config)
+                if compiled is not None
+                else self._normalize_player_spell_config(data)
+            )
         return payload
 
     def _player_profiles_payload(self) -> Dict[str, Dict[str, Any]]:
@@ -16615,7 +18511,8 @@ class InitiativeTracker(base.InitiativeTracker):
                 if "spell_slots" not in spellcasting:
                     spellcasting = dict(spellcasting)
                     spellcasting["spell_slots"] = self._normalize_spell_slots(None)
-                save_dc = self._compute_spell_save_dc(profile_payload)
+                compiled = self._compiled_player_profile(data)
+                save_dc = compiled.save_dc if compiled is not None else self._compute_spell_save_dc(profile_payload)
                 if save_dc is not None:
                     spellcasting = dict(spellcasting)
                     spellcasting["save_dc"] = save_dc
@@ -17825,6 +19722,12 @@ class InitiativeTracker(base.InitiativeTracker):
         if spells_dir is None:
             raise FileNotFoundError("Spells directory not found.")
         path = spells_dir / f"{slug}.yaml"
+        if not path.exists():
+            preset = self._spell_index().resolve(slug)
+            indexed_slug = str((preset or {}).get("slug") or "").strip()
+            if indexed_slug:
+                slug = indexed_slug
+                path = spells_dir / f"{slug}.yaml"
         if not path.exists():
             raise FileNotFoundError("Spell not found.")
         try:
@@ -17835,7 +19738,7 @@ class InitiativeTracker(base.InitiativeTracker):
             raise ValueError("Spell YAML did not parse to a dict.")
         parsed["color"] = normalized
         self._write_spell_yaml_atomic(path, parsed)
-        self._invalidate_spell_index_cache()
+        self._recompile_spell_preset(path)
         return {"slug": slug, "color": normalized}
 
     def _lan_seed_missing_positions(self, positions: Dict[int, Tuple[int, int]], cols: int, rows: int) -> Dict[int, Tuple[int, int]]:
@@ -19232,7 +21135,7 @@ class InitiativeTracker(base.InitiativeTracker):
             }
 
         old_hp = int(getattr(target, "hp", 0) or 0)
-        damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage))
+        damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage), source_cid=int(attacker_cid))
         new_hp = int(damage_state.get("hp_after", old_hp))
         if new_hp < old_hp:
             self._queue_concentration_save(target, "damage")
@@ -20088,19 +21991,84 @@ class InitiativeTracker(base.InitiativeTracker):
         ordered.sort(key=key)
         return ordered
 
+    def _spell_index(self) -> SpellPresetIndex:
+        """The shared multi-key spell lookup, rebuilt only when the preset cache changes."""
+        index = self.__dict__.get("_spell_preset_index")
+        revision = self._library_revision("spells")
+        if (
+            index is not None
+            and revision is not None
+            and index.revision == revision
+            and index.presets is self.__dict__.get("_spell_presets_cache")
+        ):
+            return index
+        presets = self._spell_presets_payload()
+        cached = self.__dict__.get("_spell_presets_cache")
+        entries = self.__dict__.get("_spell_index_entries") if self.__dict__.get("_spell_index_loaded") else None
+        if not isinstance(cached, list):
+            # No preset cache to key on; index the payload as returned.
+            return SpellPresetIndex(presets if isinstance(presets, list) else [], entries)
+        if (
+            index is not None
+            and index.presets is cached
+            and index.entries is entries
+        ):
+            index.revision = revision
+            return index
+        index = SpellPresetIndex(cached, entries, revision)
+        self.__dict__["_spell_preset_index"] = index
+        return index
+
+    def _spell_library_records(self, include_parsed: bool = True) -> Dict[str, Any]:
+        """Payload for GET /api/spells?details=true: raw text (and parsed YAML) per spell file.
+
+        Files are re-read only when their mtime/size changes, and with the library watcher
+        running the whole payload is reused until the Spells/ revision moves.
+        """
+        revision = self._library_revision("spells")
+        cached = self.__dict__.get("_spell_library_records_cache")
+        if cached is not None and revision is not None and cached[0] == (revision, include_parsed):
+            return cached[1]
+        spells_dir = self._resolve_spells_dir()
+        ids = _scan_spell_ids(spells_dir)
+        payload: Dict[str, Any] = {"ids": ids}
+        spells: List[Dict[str, Any]] = []
+        payload["spells"] = spells
+        if not spells_dir:
+            return payload
+        previous = self.__dict__.get("_spell_library_file_cache") or {}
+        file_cache: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        for spell_id in ids:
+            meta = _file_stat_metadata(spells_dir / f"{spell_id}.yaml")
+            stamp = (meta.get("mtime_ns"), meta.get("size"))
+            hit = previous.get(spell_id)
+            if hit is not None and hit[0] == stamp:
+                record = hit[1]
+            else:
+                text = _read_spell_yaml_text(spells_dir, spell_id)
+                if not text:
+                    record = {"id": spell_id, "raw": None, "parsed": None, "error": "Spell not found."}
+                else:
+                    record = {"id": spell_id, "raw": text}
+                    if yaml is not None:
+                        try:
+                            record["parsed"] = yaml_batch.safe_load(text)
+                        except Exception as exc:
+                            record["parsed"] = None
+                            record["error"] = f"Failed to parse YAML: {exc}"
+            file_cache[spell_id] = (stamp, record)
+            if include_parsed or record.get("raw") is None:
+                spells.append(record)
+            else:
+                spells.append({"id": spell_id, "raw": record["raw"]})
+        self.__dict__["_spell_library_file_cache"] = file_cache
+        if revision is not None:
+            self.__dict__["_spell_library_records_cache"] = ((revision, include_parsed), payload)
+        return payload
+
     def _spell_preset_lookup(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
-        by_slug: Dict[str, Dict[str, Any]] = {}
-        by_id: Dict[str, Dict[str, Any]] = {}
-        for preset in self._spell_presets_payload():
-            if not isinstance(preset, dict):
-                continue
-            slug = str(preset.get("slug") or "").strip().lower()
-            sid = str(preset.get("id") or "").strip().lower()
-            if slug and slug not in by_slug:
-                by_slug[slug] = preset
-            if sid and sid not in by_id:
-                by_id[sid] = preset
-        return by_slug, by_id
+        index = self._spell_index()
+        return index.by_slug, index.by_id
 
     @staticmethod
     def _spell_label_from_identifiers(*values: Any) -> str:
@@ -20233,14 +22201,7 @@ class InitiativeTracker(base.InitiativeTracker):
         return f"{int(total_count)}d{int(sides)}{modifier}"
 
     def _find_spell_preset(self, spell_slug: Any, spell_id: Any) -> Optional[Dict[str, Any]]:
-        by_slug, by_id = self._spell_preset_lookup()
-        slug = str(spell_slug or "").strip().lower()
-        sid = str(spell_id or "").strip().lower()
-        if slug and slug in by_slug:
-            return by_slug[slug]
-        if sid and sid in by_id:
-            return by_id[sid]
-        return None
+        return self._spell_index().find(spell_slug, spell_id)
 
     def _find_monster_spec_by_slug(self, monster_slug: Any) -> Optional[MonsterSpec]:
         normalized = self._normalize_monster_slug_value(monster_slug)
@@ -22987,6 +24948,7 @@ class InitiativeTracker(base.InitiativeTracker):
             facing = int(self._normalize_facing_degrees(msg.get("facing_deg")))
             setattr(c, "facing_deg", facing)
             self._sync_owned_rotatable_aoes_with_facing(int(cid), getattr(c, "facing_deg", 0))
+            self._lan_mark_dirty(cids=(int(cid),), all_aoes=True)
             mw = getattr(self, "_map_window", None)
             if mw is not None and hasattr(mw, "winfo_exists"):
                 try:
@@ -23215,7 +25177,7 @@ class InitiativeTracker(base.InitiativeTracker):
             "yes",
             "on",
         )
-        if not is_admin and typ not in ("cast_aoe", "cast_spell", "aoe_move", "aoe_remove", "dismiss_summons", "beguiling_magic_use", "beguiling_magic_restore", "command_resolve", "bardic_inspiration_grant", "bardic_inspiration_use", "mantle_of_inspiration", "reaction_response", "hellish_rebuke_resolve"):
+        if not is_admin and typ not in ("cast_aoe", "cast_spell", "aoe_move", "aoe_remove", "dismiss_summons", "beguiling_magic_use", "beguiling_magic_restore", "command_resolve", "bardic_inspiration_grant", "bardic_inspiration_use", "mantle_of_inspiration", "reaction_response", "hellish_rebuke_resolve", "reachability_request"):
             if in_combat:
                 if typ == "attack_request" and opportunity_attack_requested:
                     pass
@@ -23559,6 +25521,7 @@ class InitiativeTracker(base.InitiativeTracker):
                         self._lan.toast(ws_id, "No actions left, matey.")
                         return
                 c.spell_cast_remaining = max(0, int(getattr(c, "spell_cast_remaining", 0) or 0) - 1)
+                _record_combat_event(self, "cast", cid=c.cid, spell=spell_name, slot_level=slot_level, spend=spend)
                 self._rebuild_table(scroll_to_current=True)
             def parse_positive_float(value: Any) -> Optional[float]:
                 try:
@@ -24240,6 +26203,7 @@ class InitiativeTracker(base.InitiativeTracker):
                         self._lan.toast(ws_id, "No actions left, matey.")
                         return
                 c.spell_cast_remaining = max(0, int(getattr(c, "spell_cast_remaining", 0) or 0) - 1)
+                _record_combat_event(self, "cast", cid=c.cid, spell=spell_name, slot_level=slot_level, spend=spend)
                 smite_slug = self._smite_slug_from_preset(preset)
                 if smite_slug and smite_slug in _SMITE_SPELL_CONFIG:
                     setattr(
@@ -25350,6 +27314,7 @@ class InitiativeTracker(base.InitiativeTracker):
                     d["ay"] = float(ay)
                 if kind == "cone" and spread_deg is not None:
                     d["spread_deg"] = float(spread_deg)
+            self._lan_touch_aoes()
             facing_synced = False
             if angle_deg is not None:
                 facing_synced = self._sync_owner_facing_from_rotatable_aoe(d, angle_deg)
@@ -25577,6 +27542,7 @@ class InitiativeTracker(base.InitiativeTracker):
                         level="info",
                     )
                     self._lan_apply_action(resume_msg)
+                    _record_lan_action_events(self, resume_msg)
                 return
             if str(offer.get("trigger") or "").strip().lower() == "hellish_rebuke":
                 pending = (getattr(self, "_pending_hellish_rebuke_resolutions", {}) or {}).get(request_id)
@@ -25641,11 +27607,13 @@ class InitiativeTracker(base.InitiativeTracker):
                     if isinstance(resume_msg, dict):
                         resume_msg["_absorb_elements_resolution_done"] = True
                         self._lan_apply_action(resume_msg)
+                        _record_lan_action_events(self, resume_msg)
                     return
                 if not choice.startswith("cast_absorb_elements_"):
                     if isinstance(resume_msg, dict):
                         resume_msg["_absorb_elements_resolution_done"] = True
                         self._lan_apply_action(resume_msg)
+                        _record_lan_action_events(self, resume_msg)
                     return
                 chosen_type = self._canonical_damage_type(choice.replace("cast_absorb_elements_", "", 1))
                 allowed_types = {
@@ -25658,12 +27626,14 @@ class InitiativeTracker(base.InitiativeTracker):
                     if isinstance(resume_msg, dict):
                         resume_msg["_absorb_elements_resolution_done"] = True
                         self._lan_apply_action(resume_msg)
+                        _record_lan_action_events(self, resume_msg)
                     return
                 if not self._use_reaction(reactor):
                     self._lan.toast(ws_id, "No reactions left for Absorb Elements, matey.")
                     if isinstance(resume_msg, dict):
                         resume_msg["_absorb_elements_resolution_done"] = True
                         self._lan_apply_action(resume_msg)
+                        _record_lan_action_events(self, resume_msg)
                     return
                 try:
                     slot_level = int(msg.get("slot_level")) if msg.get("slot_level") is not None else 1
@@ -25677,6 +27647,7 @@ class InitiativeTracker(base.InitiativeTracker):
                     if isinstance(resume_msg, dict):
                         resume_msg["_absorb_elements_resolution_done"] = True
                         self._lan_apply_action(resume_msg)
+                        _record_lan_action_events(self, resume_msg)
                     return
                 spend_level = int(spent_level) if spent_level is not None else int(slot_level)
                 self._activate_absorb_elements(reactor, chosen_type, max(1, int(spend_level)))
@@ -25687,6 +27658,7 @@ class InitiativeTracker(base.InitiativeTracker):
                 if isinstance(resume_msg, dict):
                     resume_msg["_absorb_elements_resolution_done"] = True
                     self._lan_apply_action(resume_msg)
+                    _record_lan_action_events(self, resume_msg)
                 return
             if choice in ("", "decline", "ignore"):
                 self._pending_reaction_offers.pop(request_id, None)
@@ -25741,6 +27713,23 @@ class InitiativeTracker(base.InitiativeTracker):
             self._lan.toast(ws_id, f"Initiative set to {int(roll_total)}.")
             return
 
+        if typ == "reachability_request":
+            if cid is None:
+                self._lan.toast(ws_id, "Pick a character first, matey.")
+                return
+            positions = self._lan_live_map_data()[4]
+            origin = positions.get(int(cid))
+            field = self._lan_reachability_field(int(cid))
+            payload = {
+                "type": "reachable",
+                "cid": int(cid),
+                "origin": {"col": int(origin[0]), "row": int(origin[1])} if origin is not None else None,
+                "move_remaining": int(getattr(self.combatants.get(int(cid)), "move_remaining", 0) or 0),
+                "cells": [[int(col), int(row), int(cost)] for (col, row), cost in sorted(field.items())],
+            }
+            self._lan.send_reachability(ws_id, payload)
+            return
+
         if typ == "move":
             to = msg.get("to") or {}
             try:
@@ -27038,13 +29027,14 @@ class InitiativeTracker(base.InitiativeTracker):
                         "save_dc": int(save_dc) if save_dc > 0 else 0,
                         "clear_group": heat_metal_group,
                         "end_caster_concentration_on_save": int(c.cid),
+                        "source_cid": int(c.cid),
                     }
                 )
                 setattr(target, "start_turn_damage_riders", start_turn_damage_riders)
 
             if hit and total_damage > 0:
                 before_hp = _parse_int(getattr(target, "hp", None), None)
-                damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage))
+                damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage), source_cid=int(c.cid))
                 if before_hp is not None:
                     after_hp = int(damage_state.get("hp_after", before_hp))
                     if int(before_hp) > 0 and int(after_hp) <= 0:
@@ -27225,7 +29215,7 @@ class InitiativeTracker(base.InitiativeTracker):
             total_damage = int(math.floor(rolled / 2.0)) if save_passed else int(rolled)
             before_hp = int(getattr(target, "hp", 0) or 0)
             if total_damage > 0:
-                damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage))
+                damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage), source_cid=int(caster.cid))
                 after_hp = int(damage_state.get("hp_after", before_hp))
             else:
                 after_hp = before_hp
@@ -28322,7 +30312,7 @@ class InitiativeTracker(base.InitiativeTracker):
                 setattr(target, "_rage_took_damage_this_turn", True)
                 before_hp = _parse_int(getattr(target, "hp", None), None)
                 if before_hp is not None:
-                    damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage))
+                    damage_state = self._apply_damage_to_target_with_temp_hp(target, int(total_damage), source_cid=int(cid))
                     after_hp = int(damage_state.get("hp_after", before_hp))
                     if int(before_hp) > 0 and int(after_hp) <= 0:
                         pre_order: List[int] = []
@@ -28733,6 +30723,7 @@ class InitiativeTracker(base.InitiativeTracker):
                                     "save_ability": str(start_turn_rider_cfg.get("save_ability") or "").strip().lower(),
                                     "save_dc": int(start_turn_rider_cfg.get("save_dc") or 0),
                                     "clear_group": f"rider_{str(rider_entry.get('slug') or '')}_{int(cid)}",
+                                    "source_cid": int(cid),
                                 }
                             )
                             setattr(target, "start_turn_damage_riders", riders)
@@ -28753,6 +30744,7 @@ class InitiativeTracker(base.InitiativeTracker):
                                 "type": "hellfire",
                                 "remaining_turns": 1,
                                 "source": f"{result_payload['weapon_name']} ({c.name})",
+                                "source_cid": int(cid),
                             }
                         )
                         setattr(target, "end_turn_damage_riders", riders)
@@ -28785,6 +30777,7 @@ class InitiativeTracker(base.InitiativeTracker):
                                 "save_ability": "con",
                                 "save_dc": 15,
                                 "clear_group": "sword_of_wounding",
+                                "source_cid": int(cid),
                             }
                         )
                         setattr(target, "start_turn_damage_riders", riders)
@@ -31079,14 +33072,7 @@ class InitiativeTracker(base.InitiativeTracker):
                 break
 
         if not isinstance(preset, dict):
-            lowered_spell = raw_spell.lower()
-            for entry in self._spell_presets_payload():
-                if not isinstance(entry, dict):
-                    continue
-                entry_name = str(entry.get("name") or "").strip().lower()
-                if entry_name and entry_name == lowered_spell:
-                    preset = entry
-                    break
+            preset = self._spell_index().by_name.get(raw_spell.lower())
 
         return self._spell_duration_to_turns(preset)
 
@@ -31287,18 +33273,23 @@ class InitiativeTracker(base.InitiativeTracker):
 
     def _apply_heal_to_combatant(self, cid: int, amount: int, *, is_temp_hp: bool = False) -> bool:
         if not is_temp_hp:
-            return super()._apply_heal_to_combatant(cid, amount, is_temp_hp=is_temp_hp)
+            healed = super()._apply_heal_to_combatant(cid, amount, is_temp_hp=is_temp_hp)
+            if healed:
+                hp_after = getattr(self.combatants.get(cid), "hp", None)
+                _record_combat_event(self, "heal", target_cid=cid, amount=int(amount), temp_hp=False, hp_after=hp_after)
+            return healed
         c = self.combatants.get(int(cid))
         if c is None:
             return False
         temp_before = max(0, int(getattr(c, "temp_hp", 0) or 0))
         temp_after = max(0, int(amount))
         setattr(c, "temp_hp", int(temp_after))
+        _record_combat_event(self, "heal", target_cid=cid, amount=int(amount), temp_hp=True, temp_before=temp_before)
         self._maybe_end_polymorph_from_temp_hp(c, temp_before=temp_before, temp_after=temp_after)
         return True
 
-    def _apply_damage_to_combatant(self, c: Any, amount: int) -> Dict[str, int]:
-        return self._apply_damage_to_target_with_temp_hp(c, amount)
+    def _apply_damage_to_combatant(self, c: Any, amount: int, source_cid: Optional[int] = None) -> Dict[str, int]:
+        return self._apply_damage_to_target_with_temp_hp(c, amount, source_cid=source_cid)
 
     def _materialize_registered_spell_effect(self, target: Any, effect_entry: Dict[str, Any]) -> None:
         if target is None or not isinstance(effect_entry, dict):
@@ -31900,7 +33891,7 @@ class InitiativeTracker(base.InitiativeTracker):
         ]
         setattr(caster, "concentration_target", current_targets)
 
-    def _apply_damage_to_target_with_temp_hp(self, target: Any, raw_damage: int) -> Dict[str, int]:
+    def _apply_damage_to_target_with_temp_hp(self, target: Any, raw_damage: int, source_cid: Any = None) -> Dict[str, int]:
         damage = max(0, int(raw_damage or 0))
         temp_before = max(0, int(getattr(target, "temp_hp", 0) or 0))
         hp_before = max(0, int(getattr(target, "hp", 0) or 0))
@@ -31910,6 +33901,16 @@ class InitiativeTracker(base.InitiativeTracker):
         hp_after = max(0, hp_before - hp_damage)
         setattr(target, "temp_hp", int(temp_after))
         setattr(target, "hp", int(hp_after))
+        _record_combat_event(
+            self,
+            "damage",
+            cid=source_cid,
+            target_cid=getattr(target, "cid", None),
+            amount=int(damage),
+            temp_absorbed=int(absorbed),
+            hp_damage=int(hp_damage),
+            hp_after=int(hp_after),
+        )
         self._refresh_monster_phase_for_combatant(target, reason="damage")
         if damage > 0:
             self._remove_condition_type(target, "star_advantage")
@@ -32027,10 +34028,33 @@ class InitiativeTracker(base.InitiativeTracker):
             if caster is not None and bool(getattr(caster, "concentrating", False)) and str(getattr(caster, "concentration_spell", "") or "").strip().lower() == "polymorph":
                 self._end_concentration(caster)
 
+    def _start_concentration(
+        self,
+        caster: base.Combatant,
+        spell_key: str,
+        spell_level: Optional[int] = None,
+        *,
+        targets: Optional[List[int]] = None,
+        aoe_ids: Optional[List[int]] = None,
+    ) -> None:
+        super()._start_concentration(caster, spell_key, spell_level, targets=targets, aoe_ids=aoe_ids)
+        if caster is not None and bool(getattr(caster, "concentrating", False)):
+            _record_combat_event(
+                self,
+                "concentration",
+                cid=getattr(caster, "cid", None),
+                action="start",
+                spell=getattr(caster, "concentration_spell", ""),
+                spell_level=getattr(caster, "concentration_spell_level", None),
+                targets=list(getattr(caster, "concentration_target", []) or []),
+            )
+
     def _end_concentration(self, c: base.Combatant) -> None:
         spell_key = str(getattr(c, "concentration_spell", "") or "").strip().lower()
         targets = list(getattr(c, "concentration_target", []) or [])
         caster_cid = int(getattr(c, "cid", 0) or 0)
+        if bool(getattr(c, "concentrating", False)):
+            _record_combat_event(self, "concentration", cid=caster_cid, action="end", spell=spell_key)
         super()._end_concentration(c)
         if caster_cid > 0:
             self._clear_concentration_bound_map_effects(caster_cid)
@@ -32163,6 +34187,10 @@ class InitiativeTracker(base.InitiativeTracker):
         self._lan_positions[cid] = (col, row)
         if rider_cid is not None:
             self._lan_positions[int(rider_cid)] = (col, row)
+        self._lan_mark_dirty(
+            cids=(int(cid), int(movement_owner.cid)) + ((int(rider_cid),) if rider_cid is not None else ()),
+            all_aoes=True,
+        )
         try:
             self._apply_environmental_move_damage(c, origin_cell, (int(col), int(row)), int(cost))
         except Exception:
@@ -32187,6 +34215,15 @@ class InitiativeTracker(base.InitiativeTracker):
         except Exception:
             pass
 
+        _record_combat_event(
+            self,
+            "move",
+            cid=cid,
+            origin=list(origin_cell),
+            dest=[int(col), int(row)],
+            cost_ft=int(cost),
+            remaining_ft=int(getattr(movement_owner, "move_remaining", 0) or 0),
+        )
         self._log(f"moved to ({col},{row}) (spent {cost} ft; {movement_owner.move_remaining}/{movement_owner.move_total} left)", cid=cid)
         self._rebuild_table(scroll_to_current=True)
         return (True, "", int(cost))
@@ -32231,6 +34268,113 @@ class InitiativeTracker(base.InitiativeTracker):
             return 1.0
         return float(land_speed) / float(swim_speed)
 
+    def _lan_movement_grid(
+        self,
+        cols: int,
+        rows: int,
+        obstacles: set[Tuple[int, int]],
+        rough_terrain: Dict[Tuple[int, int], Dict[str, object]],
+    ) -> LanMovementGrid:
+        """Return the compiled movement grid, rebuilding only the layers whose inputs changed."""
+        grid = self.__dict__.get("_lan_movement_grid_cache")
+        if not isinstance(grid, LanMovementGrid) or grid.cols != int(cols) or grid.rows != int(rows):
+            previous_revision = grid.revision if isinstance(grid, LanMovementGrid) else 0
+            grid = LanMovementGrid(int(cols), int(rows))
+            grid.revision = previous_revision
+            self.__dict__["_lan_movement_grid_cache"] = grid
+
+        terrain_key = grid.terrain_key
+        if terrain_key is None or terrain_key[0] != obstacles or terrain_key[1] != rough_terrain:
+            cells: Dict[Tuple[int, int], Tuple[bool, bool]] = {}
+            for key, cell in rough_terrain.items():
+                if not isinstance(cell, dict):
+                    continue
+                movement_type = self._normalize_movement_type(cell.get("movement_type"), is_swim=bool(cell.get("is_swim", False)))
+                cells[key] = (movement_type == "water", bool(cell.get("is_rough", False)))
+            grid.load_terrain(obstacles, cells)
+            # Snapshot the inputs (cell dicts included) so later in-place edits still compare unequal.
+            grid.terrain_key = (
+                set(obstacles),
+                {key: dict(cell) if isinstance(cell, dict) else cell for key, cell in rough_terrain.items()},
+            )
+            grid.revision += 1
+
+        index = self._map_effect_index()
+        if index.revision != grid.env_key:
+            env_mult = [1.0] * (grid.cols * grid.rows)
+            for record in index.records():
+                mult = self._environment_movement_multiplier(record["environment"])
+                if mult <= 1.0:
+                    continue
+                for col, row in index.cells_for(record["aid"]):
+                    cell_idx = grid.index(col, row)
+                    if cell_idx is not None and mult > env_mult[cell_idx]:
+                        env_mult[cell_idx] = mult
+            grid.env_mult = env_mult
+            grid.env_key = index.revision
+            grid.revision += 1
+        return grid
+
+    def _lan_reachability_key(
+        self,
+        grid: LanMovementGrid,
+        cid: int,
+        origin: Tuple[int, int],
+        max_ft: int,
+        creature: Optional[base.Combatant] = None,
+    ) -> Tuple[Any, ...]:
+        mode = self._normalize_movement_mode(getattr(creature, "movement_mode", "normal"))
+        water_multiplier = self._water_movement_multiplier(creature, mode)
+        origin = (int(origin[0]), int(origin[1]))
+        return (int(cid), origin, max(0, int(max_ft)), mode, float(water_multiplier), grid.revision)
+
+    def _lan_cached_reachability(
+        self,
+        grid: LanMovementGrid,
+        cid: int,
+        origin: Tuple[int, int],
+        max_ft: int,
+        creature: Optional[base.Combatant] = None,
+    ) -> Dict[Tuple[int, int], int]:
+        key = self._lan_reachability_key(grid, cid, origin, max_ft, creature)
+        cache: Dict[Any, Dict[Tuple[int, int], int]] = self.__dict__.setdefault("_lan_reach_fields", {})
+        field = cache.get(key)
+        if field is None:
+            field = grid.reachability_field(key[1], key[2], key[3], key[4])
+            cache[key] = field
+            while len(cache) > int(self.__dict__.get("_lan_reach_field_cache_size", 32) or 1):
+                cache.pop(next(iter(cache)))
+        return field
+
+    def _lan_reachability_field(
+        self,
+        cid: int,
+        max_ft: Optional[int] = None,
+        origin: Optional[Tuple[int, int]] = None,
+    ) -> Dict[Tuple[int, int], int]:
+        """Cheapest cost in feet to every square ``cid`` can reach, keyed by (col, row).
+
+        Defaults to the unit's live position and remaining movement (the rider's when a mount
+        uses it). Fields are cached per (cid, origin, budget, movement mode, map revision), so
+        the DM move highlight, LAN move validation and player requests share one flood.
+        """
+        c = self.combatants.get(int(cid))
+        if c is None:
+            return {}
+        cols, rows, obstacles, rough_terrain, positions = self._lan_live_map_data()
+        if origin is None:
+            origin = positions.get(int(cid))
+        if origin is None:
+            return {}
+        if max_ft is None:
+            movement_owner = c
+            rider_cid = _normalize_cid_value(getattr(c, "mounted_by_cid", None), "reach.mount.rider")
+            if rider_cid is not None and rider_cid in self.combatants and self._mount_uses_rider_movement(c):
+                movement_owner = self.combatants[int(rider_cid)]
+            max_ft = int(getattr(movement_owner, "move_remaining", 0) or 0)
+        grid = self._lan_movement_grid(cols, rows, obstacles, rough_terrain)
+        return self._lan_cached_reachability(grid, int(cid), origin, int(max_ft), c)
+
     def _lan_shortest_cost(
         self,
         origin: Tuple[int, int],
@@ -32242,85 +34386,26 @@ class InitiativeTracker(base.InitiativeTracker):
         max_ft: int,
         creature: Optional[base.Combatant] = None,
     ) -> Optional[int]:
-        """Dijkstra over (col,row,diagParity) to match 5/10 diagonal rule.
+        """A* over (col,row,diagParity) to match 5/10 diagonal rule.
 
         diagParity toggles when you take a diagonal step; first diagonal costs 5, second costs 10, then 5, etc.
-        Orthogonal steps always cost 5 and do not change parity.
+        Orthogonal steps always cost 5 and do not change parity. Terrain and map-effect costs come from the
+        cached per-cell grid (see _lan_movement_grid). A reachability field the overlay already flooded for
+        this combatant answers directly; otherwise a targeted search runs, never a fresh flood.
         """
         if origin == dest:
             return 0
 
-        import heapq
-
+        grid = self._lan_movement_grid(cols, rows, obstacles, rough_terrain)
+        cid = _normalize_cid_value(getattr(creature, "cid", None), "shortest_cost.cid")
+        if cid is not None:
+            key = self._lan_reachability_key(grid, cid, origin, max_ft, creature)
+            field = (self.__dict__.get("_lan_reach_fields") or {}).get(key)
+            if field is not None:
+                return field.get((int(dest[0]), int(dest[1])))
         mode = self._normalize_movement_mode(getattr(creature, "movement_mode", "normal"))
         water_multiplier = self._water_movement_multiplier(creature, mode)
-
-        def in_bounds(c: int, r: int) -> bool:
-            return 0 <= c < cols and 0 <= r < rows
-
-        # (cost, col, row, parity)
-        pq: List[Tuple[int, int, int, int]] = [(0, origin[0], origin[1], 0)]
-        best: Dict[Tuple[int, int, int], int] = {(origin[0], origin[1], 0): 0}
-
-        while pq:
-            cost, c, r, parity = heapq.heappop(pq)
-            if cost != best.get((c, r, parity), 10**9):
-                continue
-            if cost > max_ft:
-                continue
-            if (c, r) == dest:
-                return cost
-
-            # neighbors 8-dir
-            for dc in (-1, 0, 1):
-                for dr in (-1, 0, 1):
-                    if dc == 0 and dr == 0:
-                        continue
-                    nc, nr = c + dc, r + dr
-                    if not in_bounds(nc, nr):
-                        continue
-                    if (nc, nr) in obstacles:
-                        continue
-
-                    diag = (dc != 0 and dr != 0)
-                    if diag:
-                        step = 5 if parity == 0 else 10
-                        npar = 1 - parity
-                    else:
-                        step = 5
-                        npar = parity
-
-                    target_cell = rough_terrain.get((nc, nr))
-                    current_cell = rough_terrain.get((c, r))
-                    target_is_rough = bool(target_cell.get("is_rough", False)) if isinstance(target_cell, dict) else False
-                    current_type = self._normalize_movement_type(
-                        current_cell.get("movement_type") if isinstance(current_cell, dict) else None,
-                        is_swim=bool(current_cell.get("is_swim", False))
-                        if isinstance(current_cell, dict)
-                        else False,
-                    )
-                    target_type = self._normalize_movement_type(
-                        target_cell.get("movement_type") if isinstance(target_cell, dict) else None,
-                        is_swim=bool(target_cell.get("is_swim", False)) if isinstance(target_cell, dict) else False,
-                    )
-                    if mode == "swim" and target_type != "water":
-                        continue
-                    if mode == "burrow" and target_type == "water":
-                        continue
-                    if mode != "fly":
-                        if current_type == "water" or target_type == "water":
-                            step = int(math.ceil(step * water_multiplier))
-                        if target_is_rough:
-                            step *= 2
-                    step = int(math.ceil(step * self._movement_cost_multiplier_for_step(c, r, nc, nr, combatant=creature)))
-
-                    ncost = cost + step
-                    key = (nc, nr, npar)
-                    if ncost < best.get(key, 10**9) and ncost <= max_ft:
-                        best[key] = ncost
-                        heapq.heappush(pq, (ncost, nc, nr, npar))
-
-        return None
+        return grid.shortest_cost(origin, dest, max_ft, mode, water_multiplier)
 
     def _apply_environmental_move_damage(self, mover: Any, origin_cell: Tuple[int, int], dest_cell: Tuple[int, int], moved_cost_ft: int) -> None:
         if mover is None or moved_cost_ft <= 0:
@@ -32373,375 +34458,345 @@ class InitiativeTracker(base.InitiativeTracker):
     def _monsters_dir_path(self) -> Path:
         return _seed_user_monsters_dir()
 
-    def _load_monsters_index(self) -> None:
-        """Load ./Monsters/**/*.yml|*.yaml and build an index for monster lookups."""
-        self._monster_specs = []
-        self._monsters_by_name = {}
-        self._wild_shape_beast_cache = None
-        try:
-            cache = self.__dict__.get("_wild_shape_available_cache")
-            if isinstance(cache, dict):
-                cache.clear()
-            self.__dict__["_wild_shape_available_cache_source"] = None
-        except Exception:
-            pass
-
-        mdir = self._monsters_dir_path()
-        try:
-            mdir.mkdir(parents=True, exist_ok=True)
-        except Exception:
-            pass
-
-        files: List[Path] = []
-        try:
-            files = sorted(
-                [
-                    fp
-                    for fp in mdir.rglob("*")
-                    if fp.is_file() and fp.suffix.lower() in {".yml", ".yaml"}
-                ],
-                key=lambda fp: fp.relative_to(mdir).as_posix().lower(),
-            )
-        except Exception:
-            files = []
+    def _load_monsters_index(self, on_progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """Load ./Monsters/**/*.yml|*.yaml and build an index for monster lookups.
 
-        index_path = _ensure_logs_dir() / "monster_index.json"
-        index_data = _read_index_file(index_path)
-        cache_version = int(index_data.get("version") or 0) if isinstance(index_data, dict) else 0
-        cached_entries = index_data.get("entries") if isinstance(index_data.get("entries"), dict) else {}
-        if cache_version < 4:
-            cached_entries = {}
-        new_entries: Dict[str, Any] = {}
-        yaml_missing_logged = False
+        Summaries come from the memory-mapped logs/monster_catalog.bin; only files whose
+        mtime/size changed are parsed again (through yaml_batch, which uses a process pool
+        for large batches), and the catalog is rewritten only then. Parsed specs are
+        published in sorted batches as they arrive and ``on_progress`` gets (parsed, total)
+        after each batch; closing the app cancels whatever is still queued. Each spec's
+        raw_data is decoded from the catalog on first read and held in a small LRU.
+        """
+        with _MONSTER_INDEX_LOCK:
+            self._load_monsters_index_locked(on_progress)
 
-        if not files:
-            _write_index_file(index_path, {"version": 4, "entries": {}})
+    def _load_monsters_index_locked(self, on_progress: Optional[Callable[[int, int], None]]) -> None:
+        revision = self._library_revision("monsters")
+        if (
+            revision is not None
+            and revision == self.__dict__.get("_monster_index_revision")
+            and self.__dict__.get("_monster_catalog") is not None
+        ):
             return
+        specs: List[MonsterSpec] = []
+        by_name: Dict[str, MonsterSpec] = {}
 
-        for fp in files:
-            rel_key = fp.relative_to(mdir).as_posix()
-            rel_filename = rel_key
-            meta = _file_stat_metadata(fp)
-            entry = cached_entries.get(rel_key) if isinstance(cached_entries, dict) else None
-            if isinstance(entry, dict) and _metadata_matches(entry, meta):
-                summary = entry.get("summary")
-                if isinstance(summary, dict):
-                    name = str(summary.get("name") or "").strip()
-                    if name:
-                        spec = MonsterSpec(
-                            filename=rel_filename,
-                            name=name,
-                            mtype=str(summary.get("mtype") or "unknown").strip() or "unknown",
-                            cr=summary.get("cr"),
-                            hp=summary.get("hp"),
-                            speed=summary.get("speed"),
-                            swim_speed=summary.get("swim_speed"),
-                            fly_speed=summary.get("fly_speed"),
-                            burrow_speed=summary.get("burrow_speed"),
-                            climb_speed=summary.get("climb_speed"),
-                            dex=summary.get("dex"),
-                            init_mod=summary.get("init_mod"),
-                            saving_throws=summary.get("saving_throws") if isinstance(summary.get("saving_throws"), dict) else {},
-                            ability_mods=summary.get("ability_mods") if isinstance(summary.get("ability_mods"), dict) else {},
-                            raw_data=summary.get("raw_data") if isinstance(summary.get("raw_data"), dict) else {},
-                            turn_schedule_mode=summary.get("turn_schedule_mode"),
-                            turn_schedule_every_n=summary.get("turn_schedule_every_n"),
-                            turn_schedule_counts=summary.get("turn_schedule_counts"),
-                        )
-                        if name not in self._monsters_by_name:
-                            self._monsters_by_name[name] = spec
-                        self._monster_specs.append(spec)
-
-                        new_entry = dict(entry)
-                        new_entry["mtime_ns"] = meta.get("mtime_ns")
-                        new_entry["size"] = meta.get("size")
-                        if not new_entry.get("hash"):
-                            try:
-                                raw = fp.read_text(encoding="utf-8")
-                                new_entry["hash"] = _hash_text(raw)
-                            except Exception:
-                                pass
-                        new_entries[rel_key] = new_entry
-                        continue
+        def add_spec(spec: MonsterSpec) -> None:
+            if spec.name not in by_name:
+                by_name[spec.name] = spec
+            specs.append(spec)
 
-            if yaml is None:
-                if not yaml_missing_logged:
-                    try:
-                        self._log("Monster YAML support requires PyYAML. Install: sudo apt install python3-yaml")
-                    except Exception:
-                        pass
-                    yaml_missing_logged = True
-                continue
+        def publish() -> None:
+            # Swap in fresh sorted containers so readers on other threads never see a partial list.
+            self._monster_specs = sorted(specs, key=lambda spec: (spec.name.lower(), str(spec.filename).lower()))
+            self._monsters_by_name = dict(by_name)
 
-            try:
-                raw = fp.read_text(encoding="utf-8")
-            except Exception:
-                continue
-            try:
-                data = yaml.safe_load(raw)
-            except Exception:
-                continue
-            if not isinstance(data, dict):
-                continue
-            legacy_mon = data.get("monster")
-            is_legacy = "monster" in data
-            if is_legacy:
-                if not isinstance(legacy_mon, dict):
-                    continue
-                mon = legacy_mon
-            else:
-                mon = data
-
-            raw_data: Dict[str, Any] = {}
-            abilities: Dict[str, Any] = {}
-            if not is_legacy:
-                for key in (
-                    "name", "size", "type", "alignment", "initiative", "challenge_rating", "ac", "hp", "speed",
-                    "traits", "actions", "attacks", "reactions", "legendary_actions", "description", "habitat", "treasure", "levels_allowed",
-                    "variants", "damage_type_by_variant", "bonus_actions",
-                    "skills", "senses",
-                    "tags",
-                    "damage_vulnerabilities", "damage_resistances", "damage_immunities", "condition_immunities",
-                    "vulnerabilities", "resistances", "immunities",
-                    "turn_schedule",
-                    "phases",
-                ):
-                    if key in mon:
-                        raw_data[key] = mon.get(key)
-                ab = mon.get("abilities")
-                if isinstance(ab, dict):
-                    for key, val in ab.items():
-                        if not isinstance(key, str):
-                            continue
-                        abilities[key.strip().lower()] = val
-                    if abilities:
-                        raw_data["abilities"] = abilities
+        self.__dict__.pop("_monster_catalog_fingerprint", None)
+        self._reset_beast_forms()
+        self._monster_detail_lru().clear()
 
-            name = str(mon.get("name") or "").strip()
-            if not name:
-                continue
-            mtype = str(mon.get("type") or "unknown").strip() or "unknown"
-            cr = mon.get("challenge_rating")
-            if isinstance(cr, str):
-                cr_text = cr.strip()
-                if cr_text:
-                    cr = _cr_to_float(cr_text)
-                else:
-                    cr = None
-            elif not isinstance(cr, (int, float)):
-                cr = None
+        mdir = self._monsters_dir_path()
+        try:
+            mdir.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
 
-            hp = self._monster_int_from_value(mon.get("hp"))
-            speed = self._monster_int_from_value(mon.get("speed"))
-            swim_speed = self._monster_int_from_value(mon.get("swim_speed"))
-            fly_speed = self._monster_int_from_value(mon.get("fly_speed"))
-            burrow_speed = self._monster_int_from_value(mon.get("burrow_speed"))
-            climb_speed = self._monster_int_from_value(mon.get("climb_speed"))
-
-            if speed is None:
-                speed_data = mon.get("speed")
-                if isinstance(speed_data, dict):
-                    speed = self._monster_int_from_value(speed_data.get("walk"))
-                    swim_speed = self._monster_int_from_value(speed_data.get("swim"))
-                    fly_speed = self._monster_int_from_value(speed_data.get("fly"))
-                    burrow_speed = self._monster_int_from_value(speed_data.get("burrow"))
-                    climb_speed = self._monster_int_from_value(speed_data.get("climb"))
-                elif isinstance(speed_data, str):
-                    parsed = self._parse_monster_speed_string(speed_data)
-                    speed = parsed.get("walk")
-                    swim_speed = parsed.get("swim")
-                    fly_speed = parsed.get("fly")
-                    burrow_speed = parsed.get("burrow")
-                    climb_speed = parsed.get("climb")
+        files = monster_catalog.scan_library(mdir)
+        catalog_path = _ensure_logs_dir() / "monster_catalog.bin"
+        previous = self.__dict__.pop("_monster_catalog", None)
+        if previous is not None:
+            previous.close()
+        catalog = monster_catalog.MonsterCatalog.open(catalog_path)
+        # (filename, mtime_ns, size, summary, detail bytes or the catalog row to copy them from)
+        rows: List[Tuple[str, int, int, Dict[str, Any], Any]] = []
+        misses: List[Tuple[str, Path, int, int]] = []
+
+        for rel_key, fp, mtime_ns, size in files:
+            row_index = catalog.find(rel_key) if catalog is not None else None
+            if row_index is not None and catalog.stat(row_index) == (mtime_ns, size):
+                summary = catalog.summary(row_index)
+                if str(summary.get("name") or "").strip():
+                    add_spec(self._monster_spec_from_summary(rel_key, summary))
+                    rows.append((rel_key, mtime_ns, size, summary, row_index))
+                    continue
+            misses.append((rel_key, fp, mtime_ns, size))
+        changed = catalog is None or catalog.count != len(files) or bool(misses)
+        publish()
 
-            dex = None
+        if misses and yaml is None:
             try:
-                dex = self._monster_int_from_value(mon.get("dex"))
-                if dex is None and isinstance(mon.get("abilities"), dict):
-                    dex = self._monster_int_from_value(mon.get("abilities", {}).get("dex"))
-                if dex is None and isinstance(mon.get("abilities"), dict):
-                    dex = self._monster_int_from_value(mon.get("abilities", {}).get("Dex"))
+                self._log("Monster YAML support requires PyYAML. Install: sudo apt install python3-yaml")
             except Exception:
-                dex = None
+                pass
+        elif misses:
+            miss_by_path = {str(fp): (rel_key, mtime_ns, size) for rel_key, fp, mtime_ns, size in misses}
+            parser = yaml_batch.YamlBatchParser([fp for _key, fp, _mtime, _size in misses], cancel=self._index_cancel_event())
+            parsed_count = 0
+            for batch in parser.batches():
+                for path, _text, document, _error in batch:
+                    rel_key, mtime_ns, size = miss_by_path[path]
+                    parsed = _monster_mapping_from_document(document)
+                    summary = self._monster_summary_from_yaml(parsed[0]) if parsed is not None else None
+                    if summary is None:
+                        continue
+                    raw_data = _monster_raw_data(parsed[0])
+                    # Seed the detail LRU with what was just parsed; older entries age out.
+                    self._monster_detail_lru().put(rel_key, raw_data)
+                    add_spec(self._monster_spec_from_summary(rel_key, summary))
+                    rows.append((rel_key, mtime_ns, size, summary, monster_catalog.encode_detail(raw_data)))
+                parsed_count += len(batch)
+                publish()
+                if on_progress is not None:
+                    on_progress(parsed_count, len(misses))
 
-            init_mod = None
-            try:
-                ini = mon.get("initiative")
-                if isinstance(ini, dict):
-                    init_mod = self._monster_int_from_value(ini.get("modifier"))
-                else:
-                    init_mod = self._monster_int_from_value(ini)
+        if changed:
+            entries = []
+            for rel_key, mtime_ns, size, summary, detail in rows:
+                if isinstance(detail, int):
+                    detail = catalog.detail_bytes(detail)
+                entries.append((rel_key, mtime_ns, size, summary, detail))
+            if catalog is not None:
+                catalog.close()
+            try:
+                monster_catalog.write_catalog(catalog_path, entries)
             except Exception:
-                init_mod = None
+                pass
+            catalog = monster_catalog.MonsterCatalog.open(catalog_path)
+        if catalog is not None:
+            self.__dict__["_monster_catalog"] = catalog
+        if not self._index_cancel_event().is_set():
+            self.__dict__["_monster_index_revision"] = revision
+            digest = hashlib.sha1()
+            for rel_key, _fp, mtime_ns, size in files:
+                digest.update(f"{rel_key}\0{mtime_ns}\0{size}\n".encode("utf-8"))
+            self.__dict__["_monster_catalog_fingerprint"] = digest.hexdigest()
+            # Forms derived mid-load only saw part of the library; rebuild (or reload) them lazily.
+            self._reset_beast_forms()
+
+    def _reset_beast_forms(self) -> None:
+        self._wild_shape_beast_cache = None
+        self.__dict__.pop("_beast_form_table_cache", None)
+        try:
+            cache = self.__dict__.get("_wild_shape_available_cache")
+            if isinstance(cache, dict):
+                cache.clear()
+            self.__dict__["_wild_shape_available_cache_source"] = None
+        except Exception:
+            pass
 
-            saving_throws: Dict[str, int] = {}
+    def _index_cancel_event(self) -> threading.Event:
+        """Set when the app closes so background library parsing stops early."""
+        return self.__dict__.setdefault("_index_cancel", threading.Event())
+
+    def _monster_detail_lru(self) -> MonsterDetailCache:
+        cache = self.__dict__.get("_monster_detail_lru_cache")
+        if not isinstance(cache, MonsterDetailCache):
             try:
-                saves = mon.get("saving_throws") or {}
-                if isinstance(saves, dict):
-                    for key, val in saves.items():
-                        if not isinstance(key, str):
-                            continue
-                        ability = key.strip().lower()
-                        if ability not in {"str", "dex", "con", "int", "wis", "cha"}:
-                            continue
-                        if isinstance(val, int):
-                            saving_throws[ability] = int(val)
-                        elif isinstance(val, str):
-                            raw_save = val.strip()
-                            if raw_save.startswith("+"):
-                                raw_save = raw_save[1:]
-                            if raw_save.lstrip("-").isdigit():
-                                saving_throws[ability] = int(raw_save)
-            except Exception:
-                saving_throws = {}
+                capacity = int(os.getenv("INITTRACKER_MONSTER_DETAIL_CACHE") or 64)
+            except ValueError:
+                capacity = 64
+            cache = MonsterDetailCache(capacity)
+            self.__dict__["_monster_detail_lru_cache"] = cache
+        return cache
 
-            ability_mods: Dict[str, int] = {}
+    def _monster_spec_from_summary(self, filename: str, summary: Dict[str, Any]) -> MonsterSpec:
+        return MonsterSpec(
+            filename=filename,
+            name=str(summary.get("name") or "").strip(),
+            mtype=str(summary.get("mtype") or "unknown").strip() or "unknown",
+            cr=summary.get("cr"),
+            hp=summary.get("hp"),
+            speed=summary.get("speed"),
+            swim_speed=summary.get("swim_speed"),
+            fly_speed=summary.get("fly_speed"),
+            burrow_speed=summary.get("burrow_speed"),
+            climb_speed=summary.get("climb_speed"),
+            dex=summary.get("dex"),
+            init_mod=summary.get("init_mod"),
+            saving_throws=summary.get("saving_throws") if isinstance(summary.get("saving_throws"), dict) else {},
+            ability_mods=summary.get("ability_mods") if isinstance(summary.get("ability_mods"), dict) else {},
+            raw_data={},
+            turn_schedule_mode=summary.get("turn_schedule_mode"),
+            turn_schedule_every_n=summary.get("turn_schedule_every_n"),
+            turn_schedule_counts=summary.get("turn_schedule_counts"),
+            ac=summary.get("ac"),
+            abilities=summary.get("abilities") if isinstance(summary.get("abilities"), dict) else {},
+            cr_label=summary.get("cr_label"),
+            detail_loader=self._monster_spec_details,
+        )
+
+    def _monster_spec_details(self, spec: MonsterSpec) -> Optional[Dict[str, Any]]:
+        """Detail-tier loader: raw_data for an index-built spec, decoded on demand."""
+        filename = str(spec.filename or "")
+        cache = self._monster_detail_lru()
+        cached = cache.get(filename)
+        if cached is not None:
+            return cached
+        catalog = self.__dict__.get("_monster_catalog")
+        if catalog is not None:
             try:
-                ab = abilities if abilities else (mon.get("abilities") or {})
-                if isinstance(ab, dict):
-                    for key, val in ab.items():
-                        if not isinstance(key, str):
-                            continue
-                        ability = key.strip().lower()
-                        if ability not in {"str", "dex", "con", "int", "wis", "cha"}:
-                            continue
-                        score = None
-                        if isinstance(val, int):
-                            score = int(val)
-                        elif isinstance(val, str):
-                            raw_score = val.strip()
-                            if raw_score.lstrip("-").isdigit():
-                                score = int(raw_score)
-                        if score is None:
-                            continue
-                        ability_mods[ability] = (score - 10) // 2
+                row_index = catalog.find(filename)
+                raw_data = catalog.detail(row_index) if row_index is not None else None
             except Exception:
-                ability_mods = {}
-
-            turn_schedule_mode, turn_schedule_every_n, turn_schedule_counts = _normalize_turn_schedule_config(raw_data.get("turn_schedule"))
+                # The catalog may be mid-rebuild on the index thread; fall back to the YAML.
+                raw_data = None
+            if raw_data is not None:
+                cache.put(filename, raw_data)
+                return raw_data
+        try:
+            raw = (self._monsters_dir_path() / filename).read_text(encoding="utf-8")
+        except Exception:
+            return None
+        parsed = _parse_monster_yaml_text(raw)
+        if parsed is None:
+            return None
+        raw_data = _monster_raw_data(parsed[0])
+        cache.put(filename, raw_data)
+        return raw_data
 
-            spec = MonsterSpec(
-                filename=rel_filename,
-                name=name,
-                mtype=mtype,
-                cr=cr,
-                hp=hp,
-                speed=speed,
-                swim_speed=swim_speed,
-                fly_speed=fly_speed,
-                burrow_speed=burrow_speed,
-                climb_speed=climb_speed,
-                dex=dex,
-                init_mod=init_mod,
-                saving_throws=saving_throws,
-                ability_mods=ability_mods,
-                raw_data=raw_data,
-                turn_schedule_mode=turn_schedule_mode,
-                turn_schedule_every_n=turn_schedule_every_n,
-                turn_schedule_counts=turn_schedule_counts,
-            )
+    def _monster_summary_from_yaml(self, mon: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Summary columns stored per file in logs/monster_catalog.bin (None if unnamed)."""
+        name = str(mon.get("name") or "").strip()
+        if not name:
+            return None
+        mtype = str(mon.get("type") or "unknown").strip() or "unknown"
+        cr_raw = mon.get("challenge_rating")
+        cr = cr_raw
+        if isinstance(cr, str):
+            cr_text = cr.strip()
+            if cr_text:
+                cr = _cr_to_float(cr_text)
+            else:
+                cr = None
+        elif not isinstance(cr, (int, float)):
+            cr = None
+        cr_label: Optional[str] = None
+        if isinstance(cr_raw, str) and cr_raw.strip():
+            cr_label = cr_raw.strip()
+        elif isinstance(cr_raw, (int, float)) and not isinstance(cr_raw, bool):
+            cr_label = str(int(cr_raw)) if float(cr_raw).is_integer() else str(cr_raw)
+
+        hp = self._monster_int_from_value(mon.get("hp"))
+        speed = self._monster_int_from_value(mon.get("speed"))
+        swim_speed = self._monster_int_from_value(mon.get("swim_speed"))
+        fly_speed = self._monster_int_from_value(mon.get("fly_speed"))
+        burrow_speed = self._monster_int_from_value(mon.get("burrow_speed"))
+        climb_speed = self._monster_int_from_value(mon.get("climb_speed"))
+
+        if speed is None:
+            speed_data = mon.get("speed")
+            if isinstance(speed_data, dict):
+                speed = self._monster_int_from_value(speed_data.get("walk"))
+                swim_speed = self._monster_int_from_value(speed_data.get("swim"))
+                fly_speed = self._monster_int_from_value(speed_data.get("fly"))
+                burrow_speed = self._monster_int_from_value(speed_data.get("burrow"))
+                climb_speed = self._monster_int_from_value(speed_data.get("climb"))
+            elif isinstance(speed_data, str):
+                parsed = self._parse_monster_speed_string(speed_data)
+                speed = parsed.get("walk")
+                swim_speed = parsed.get("swim")
+                fly_speed = parsed.get("fly")
+                burrow_speed = parsed.get("burrow")
+                climb_speed = parsed.get("climb")
+
+        abilities: Dict[str, Any] = {}
+        ab = mon.get("abilities")
+        if isinstance(ab, dict):
+            for key, val in ab.items():
+                if isinstance(key, str):
+                    abilities[key.strip().lower()] = val
+
+        dex = None
+        try:
+            dex = self._monster_int_from_value(mon.get("dex"))
+            if dex is None and isinstance(mon.get("abilities"), dict):
+                dex = self._monster_int_from_value(mon.get("abilities", {}).get("dex"))
+            if dex is None and isinstance(mon.get("abilities"), dict):
+                dex = self._monster_int_from_value(mon.get("abilities", {}).get("Dex"))
+        except Exception:
+            dex = None
 
-            if name not in self._monsters_by_name:
-                self._monsters_by_name[name] = spec
-            self._monster_specs.append(spec)
+        init_mod = None
+        try:
+            ini = mon.get("initiative")
+            if isinstance(ini, dict):
+                init_mod = self._monster_int_from_value(ini.get("modifier"))
+            else:
+                init_mod = self._monster_int_from_value(ini)
+        except Exception:
+            init_mod = None
 
-            new_entries[rel_key] = {
-                "mtime_ns": meta.get("mtime_ns"),
-                "size": meta.get("size"),
-                "hash": _hash_text(raw),
-                "summary": {
-                    "name": name,
-                    "mtype": mtype,
-                    "cr": cr,
-                    "hp": hp,
-                    "speed": speed,
-                    "swim_speed": swim_speed,
-                    "fly_speed": fly_speed,
-                    "burrow_speed": burrow_speed,
-                    "climb_speed": climb_speed,
-                    "dex": dex,
-                    "init_mod": init_mod,
-                    "saving_throws": saving_throws,
-                    "ability_mods": ability_mods,
-                    "raw_data": raw_data,
-                    "turn_schedule_mode": turn_schedule_mode,
-                    "turn_schedule_every_n": turn_schedule_every_n,
-                    "turn_schedule_counts": turn_schedule_counts,
-                },
-            }
+        saving_throws: Dict[str, int] = {}
+        try:
+            saves = mon.get("saving_throws") or {}
+            if isinstance(saves, dict):
+                for key, val in saves.items():
+                    if not isinstance(key, str):
+                        continue
+                    ability = key.strip().lower()
+                    if ability not in {"str", "dex", "con", "int", "wis", "cha"}:
+                        continue
+                    if isinstance(val, int):
+                        saving_throws[ability] = int(val)
+                    elif isinstance(val, str):
+                        raw_save = val.strip()
+                        if raw_save.startswith("+"):
+                            raw_save = raw_save[1:]
+                        if raw_save.lstrip("-").isdigit():
+                            saving_throws[ability] = int(raw_save)
+        except Exception:
+            saving_throws = {}
+
+        ability_mods: Dict[str, int] = {}
+        ability_scores: Dict[str, int] = {}
+        for ability, val in abilities.items():
+            if ability not in {"str", "dex", "con", "int", "wis", "cha"}:
+                continue
+            score = None
+            if isinstance(val, int):
+                score = int(val)
+            elif isinstance(val, str):
+                raw_score = val.strip()
+                if raw_score.lstrip("-").isdigit():
+                    score = int(raw_score)
+            if score is None:
+                continue
+            ability_scores[ability] = score
+            ability_mods[ability] = (score - 10) // 2
 
-        self._monster_specs.sort(key=lambda spec: (spec.name.lower(), str(spec.filename).lower()))
-        _write_index_file(index_path, {"version": 4, "entries": new_entries})
+        ac = mon.get("ac")
+        if not isinstance(ac, (int, float, str)) or isinstance(ac, bool):
+            ac = None
 
+        turn_schedule_mode, turn_schedule_every_n, turn_schedule_counts = _normalize_turn_schedule_config(
+            mon.get("turn_schedule")
+        )
+        return {
+            "name": name,
+            "mtype": mtype,
+            "cr": cr,
+            "cr_label": cr_label,
+            "hp": hp,
+            "ac": ac,
+            "speed": speed,
+            "swim_speed": swim_speed,
+            "fly_speed": fly_speed,
+            "burrow_speed": burrow_speed,
+            "climb_speed": climb_speed,
+            "dex": dex,
+            "init_mod": init_mod,
+            "saving_throws": saving_throws,
+            "ability_mods": ability_mods,
+            "abilities": ability_scores,
+            "turn_schedule_mode": turn_schedule_mode,
+            "turn_schedule_every_n": turn_schedule_every_n,
+            "turn_schedule_counts": turn_schedule_counts,
+        }
 
     def _load_monster_details(self, name: str) -> Optional[MonsterSpec]:
-        spec = self._monsters_by_name.get(str(name or "").strip())
-        if spec is None:
-            return None
-        if isinstance(spec.raw_data, dict) and spec.raw_data:
-            return spec
-        if yaml is None:
-            return spec
-        fp = self._monsters_dir_path() / spec.filename
-        try:
-            raw = fp.read_text(encoding="utf-8")
-            parsed = yaml.safe_load(raw)
-        except Exception:
-            return spec
-        if not isinstance(parsed, dict):
-            return spec
-
-        monster_data = parsed.get("monster") if isinstance(parsed.get("monster"), dict) else parsed
-        if not isinstance(monster_data, dict):
-            return spec
-        raw_data: Dict[str, Any] = {}
-        for key in (
-            "name",
-            "size",
-            "type",
-            "alignment",
-            "initiative",
-            "challenge_rating",
-            "ac",
-            "hp",
-            "speed",
-            "traits",
-            "actions",
-            "attacks",
-            "reactions",
-            "legendary_actions",
-            "description",
-            "habitat",
-            "treasure",
-            "levels_allowed",
-            "variants",
-            "damage_type_by_variant",
-            "bonus_actions",
-            "skills",
-            "senses",
-            "tags",
-            "damage_vulnerabilities",
-            "damage_resistances",
-            "damage_immunities",
-            "condition_immunities",
-            "vulnerabilities",
-            "resistances",
-            "immunities",
-            "turn_schedule",
-            "phases",
-        ):
-            if key in monster_data:
-                raw_data[key] = monster_data.get(key)
-        abilities = monster_data.get("abilities")
-        if isinstance(abilities, dict):
-            raw_data["abilities"] = abilities
-        if raw_data:
-            spec.raw_data = raw_data
-            mode, every_n, counts = _normalize_turn_schedule_config(raw_data.get("turn_schedule"))
-            spec.turn_schedule_mode = mode
-            spec.turn_schedule_every_n = every_n
-            spec.turn_schedule_counts = counts
-        return spec
+        """Return the named spec; its raw_data is read from the detail tier on first access."""
+        return self._monsters_by_name.get(str(name or "").strip())
 
     def _monster_names_sorted(self) -> List[str]:
         return [s.name for s in self._monster_specs]
@@ -32749,8 +34804,9 @@ class InitiativeTracker(base.InitiativeTracker):
     def _monster_cr_display(self, spec: Optional[MonsterSpec]) -> str:
         if spec is None:
             return ""
-        raw = None
-        if isinstance(spec.raw_data, dict):
+        # Index-built specs carry the label in their summary; don't load the stat block for it.
+        raw = getattr(spec, "cr_label", None)
+        if raw is None and getattr(spec, "detail_loader", None) is None and isinstance(spec.raw_data, dict):
             raw = spec.raw_data.get("challenge_rating")
         if isinstance(raw, str) and raw.strip():
             return raw.strip()
@@ -32810,7 +34866,12 @@ class InitiativeTracker(base.InitiativeTracker):
             info_btn = ttk.Button(holder, text="Info", width=5, command=self._open_monster_stat_block)
             info_btn.pack(side="left", padx=(4, 0))
 
+            progress_label = ttk.Label(holder, text="")
+            progress_label.pack(side="left", padx=(6, 0))
+
             self._monster_combo = combo  # type: ignore[attr-defined]
+            self._monster_progress_label = progress_label  # type: ignore[attr-defined]
+            self._monster_combo_specs = self._monster_specs  # type: ignore[attr-defined]
 
             if values and not self.name_var.get().strip():
                 self.name_var.set(values[0])
@@ -33236,4 +35297,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Frozen builds re-launch the executable for yaml_batch pool workers.
+    multiprocessing.freeze_support()
     main()
@@ -32,6 +32,7 @@ import re
 import json
 import hashlib
 import threading
+import contextlib
 import copy
 import time
 from pathlib import Path
@@ -47,6 +48,9 @@ from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Tuple, Set, Union
 from tkinter import messagebox, ttk, simpledialog, filedialog
 
+import aoe_geometry
+import refresh_scheduler
+
 PIL_IMAGE_IMPORT_ERROR: Optional[str] = None
 PIL_IMAGETK_IMPORT_ERROR: Optional[str] = None
 USER_YAML_DIRNAME = "Dnd-Init-Yamls"
@@ -361,6 +365,31 @@ class Combatant:
     concentration_started_turn: Optional[Tuple[int, int]] = None
     concentration_aoe_ids: List[int] = field(default_factory=list)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Bump the revision on every write so snapshot caches can tell an idle
+        # combatant from a touched one without re-reading every field. Only
+        # re-assigning the very same object is free; equal values are still
+        # stored so callers keep the object they assigned.
+        state = self.__dict__
+        same = name in state and state[name] is value
+        state[name] = value
+        if not same:
+            state["_rev"] = state.get("_rev", 0) + 1
+
+    def bump_revision(self) -> int:
+        """Mark in-place edits (e.g. condition_stacks.append) as a change."""
+        rev = self.__dict__.get("_rev", 0) + 1
+        self.__dict__["_rev"] = rev
+        return rev
+
+
+def combatant_revision(c: Any) -> int:
+    """Return the mutation counter for a combatant (0 for foreign objects)."""
+    try:
+        return int(c.__dict__.get("_rev", 0))
+    except Exception:
+        return 0
+
 
 @dataclass
 class MonsterSpec:
@@ -634,9 +663,136 @@ def _load_rough_terrain_presets() -> List[TerrainPreset]:
     return fallback
 
 
+def _split_history_line(line: str) -> Optional[Tuple[str, str]]:
+    """(stamp, content) for one history-file line; None for lines the Log box skips."""
+    if not line.strip():
+        return None
+    # Skip old redundant "next up" lines if present
+    if " - next up" in line:
+        return None
+    stamp = ""
+    content = line
+    if "\t" in line:
+        stamp, content = line.split("\t", 1)
+    elif line.startswith("[") and "]" in line:
+        # Legacy format: [timestamp] ... - msg
+        try:
+            stamp = line.split("]", 1)[0].lstrip("[")
+            content = line.split("]", 1)[1].strip()
+        except Exception:
+            stamp = ""
+            content = line
+    if not stamp:
+        stamp = "[" + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "]"
+    return stamp, content
+
+
+def _defer_refresh(app: Any, region: str, callback: Callable[..., Any], **flags: bool) -> bool:
+    """True when ``app`` has a refresh batch open and ``region`` was queued for idle."""
+    scheduler = refresh_scheduler.scheduler_for(app)
+    return scheduler is not None and scheduler.defer(region, callback, **flags)
+
+
+def _refresh_batch(app: Any) -> Any:
+    """Context manager folding the refreshes made inside it into one idle pass."""
+    scheduler = refresh_scheduler.scheduler_for(app)
+    return scheduler.batch() if scheduler is not None else contextlib.nullcontext()
+
+
+class LogView:
+    """The Log box: batched inserts, capped scrollback and lazy name highlighting.
+
+    Lines are ``stamp<TAB>content``. Inserts go through a single ``Text.insert`` call per
+    batch, and once the widget holds more than ``max_lines + TRIM_SLACK`` lines the oldest
+    are dropped in one delete. Name tags are only computed for lines that scroll into
+    view; each highlighted line carries the ``nm_done`` marker tag so it is not re-scanned.
+    """
+
+    TRIM_SLACK = 500
+
+    def __init__(
+        self,
+        text: tk.Text,
+        highlight: Callable[[str], List[Tuple[int, int, str]]],
+        max_lines: int = 5000,
+    ) -> None:
+        self.text = text
+        self.highlight = highlight
+        self.max_lines = max(1, int(max_lines))
+        self._line_count = 0
+        self._highlight_pending = False
+
+    def attach_scrollbar(self, scrollbar: ttk.Scrollbar) -> None:
+        def on_scroll(first: str, last: str) -> None:
+            scrollbar.set(first, last)
+            self.schedule_highlight()
+
+        self.text.configure(yscrollcommand=on_scroll)
+
+    def append(self, stamp: str, content: str) -> None:
+        self.extend([(stamp, content)])
+
+    def extend(self, entries: List[Tuple[str, str]], *, follow: Optional[bool] = None) -> None:
+        if not entries:
+            return
+        if follow is None:
+            # Only keep scrolling to the newest line while the DM is already at the bottom.
+            follow = self.text.yview()[1] >= 0.999
+        chunks: List[Any] = []
+        for stamp, content in entries:
+            chunks.extend((stamp + "\t", ("ts",), content + "\n", ()))
+        self.text.configure(state="normal")
+        self.text.insert(tk.END, *chunks)
+        self._line_count += len(entries)
+        if self._line_count > self.max_lines + self.TRIM_SLACK:
+            excess = self._line_count - self.max_lines
+            self.text.delete("1.0", f"{excess + 1}.0")
+            self._line_count -= excess
+        self.text.configure(state="disabled")
+        if follow:
+            self.text.see(tk.END)
+        self.schedule_highlight()
+
+    def replace(self, entries: List[Tuple[str, str]]) -> None:
+        self.clear()
+        self.extend(entries[-self.max_lines :], follow=True)
+
+    def clear(self) -> None:
+        self.text.configure(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.configure(state="disabled")
+        self._line_count = 0
+
+    def schedule_highlight(self) -> None:
+        if self._highlight_pending:
+            return
+        self._highlight_pending = True
+        self.text.after_idle(self._highlight_visible)
+
+    def _highlight_visible(self) -> None:
+        self._highlight_pending = False
+        try:
+            first = int(self.text.index("@0,0").split(".")[0])
+            last = int(self.text.index(f"@0,{self.text.winfo_height()}").split(".")[0])
+        except (tk.TclError, ValueError):
+            return
+        for line_no in range(first, last + 1):
+            start = f"{line_no}.0"
+            if "nm_done" in self.text.tag_names(start):
+                continue
+            line = self.text.get(start, f"{line_no}.end")
+            if not line:
+                continue
+            offset = line.find("\t") + 1
+            for span_start, span_end, tag in self.highlight(line[offset:]):
+                self.text.tag_add(tag, f"{start}+{offset + span_start}c", f"{start}+{offset + span_end}c")
+            self.text.tag_add("nm_done", start, f"{line_no}.end")
+
+
 class InitiativeTracker(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
+        self._refresh_scheduler = refresh_scheduler.RefreshScheduler(self.after_idle)
         self.title("DnD Initiative Tracker")
         self.geometry("1120x720")
         icon_path = Path(__file__).resolve().parent / "assets" / "graphic-512.png"
@@ -883,7 +1039,8 @@ class InitiativeTracker(tk.Tk):
         self.log_text = tk.Text(log_body, height=10, wrap="word")
         self.log_text.configure(state="disabled")
         log_scroll = ttk.Scrollbar(log_body, orient="vertical", command=self.log_text.yview)
-        self.log_text.configure(yscrollcommand=log_scroll.set)
+        self._log_view = LogView(self.log_text, self._log_name_spans)
+        self._log_view.attach_scrollbar(log_scroll)
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         log_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
@@ -1440,44 +1597,24 @@ class InitiativeTracker(tk.Tk):
                 self._name_highlight_regex = None
         return self._name_highlight_regex, self._name_highlight_tag_by_name
 
-    def _apply_name_tags_in_range(self, start: str, end: str, content_text: Optional[str] = None) -> None:
-        """Bold/italic/underline known names in a given text range."""
-        if not hasattr(self, "log_text"):
-            return
-        text = content_text if content_text is not None else self.log_text.get(start, end)
-        if not text:
-            return
-        if not self._line_likely_has_name_highlight(text):
-            return
+    def _log_name_spans(self, content: str) -> List[Tuple[int, int, str]]:
+        """(start, end, tag) for every known name in one log line's content."""
+        if not content or not self._line_likely_has_name_highlight(content):
+            return []
         regex, tags_by_name = self._name_highlight_state()
         if not regex:
-            return
-        for match in regex.finditer(text):
-            name = match.group(1)
-            tag = tags_by_name.get(name)
-            if not tag:
-                continue
-            match_start = f"{start}+{match.start(1)}c"
-            match_end = f"{start}+{match.end(1)}c"
-            try:
-                self.log_text.tag_add(tag, match_start, match_end)
-            except Exception:
-                pass
+            return []
+        spans: List[Tuple[int, int, str]] = []
+        for match in regex.finditer(content):
+            tag = tags_by_name.get(match.group(1))
+            if tag:
+                spans.append((match.start(1), match.end(1), tag))
+        return spans
 
     def _append_log_line(self, stamp: str, content: str, write_file: bool) -> None:
         if not hasattr(self, "log_text"):
             return
-        self.log_text.configure(state="normal")
-        # Timestamp column
-        self.log_text.insert(tk.END, stamp + "\t", ("ts",))
-        # Content column
-        content_start = self.log_text.index(tk.END)
-        self.log_text.insert(tk.END, content)
-        content_end = self.log_text.index(tk.END)
-        self.log_text.insert(tk.END, "\n")
-        self._apply_name_tags_in_range(content_start, content_end, content_text=content)
-        self.log_text.configure(state="disabled")
-        self.log_text.see(tk.END)
+        self._log_view.append(stamp, content)
 
         if write_file:
             try:
@@ -1497,35 +1634,8 @@ class InitiativeTracker(tk.Tk):
             lines = p.read_text(encoding="utf-8", errors="ignore").splitlines()
             if len(lines) > max_lines:
                 lines = lines[-max_lines:]
-
-            self.log_text.configure(state="normal")
-            self.log_text.delete("1.0", tk.END)
-            self.log_text.configure(state="disabled")
-
-            for line in lines:
-                if not line.strip():
-                    continue
-                # Skip old redundant "next up" lines if present
-                if " - next up" in line:
-                    continue
-                stamp = ""
-                content = line
-
-                if "\t" in line:
-                    stamp, content = line.split("\t", 1)
-                elif line.startswith("[") and "]" in line:
-                    # Legacy format: [timestamp] ... - msg
-                    try:
-                        stamp = line.split("]", 1)[0].lstrip("[")
-                        content = line.split("]", 1)[1].strip()
-                    except Exception:
-                        stamp = ""
-                        content = line
-
-                if not stamp:
-                    stamp = "[" + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "]"
-
-                self._append_log_line(stamp, content, write_file=False)
+            entries = [entry for entry in map(_split_history_line, lines) if entry is not None]
+            self._log_view.replace(entries)
         except Exception:
             pass
 
@@ -1638,9 +1748,7 @@ class InitiativeTracker(tk.Tk):
 
         # 2) Clear on-screen log
         if hasattr(self, "log_text"):
-            self.log_text.configure(state="normal")
-            self.log_text.delete("1.0", tk.END)
-            self.log_text.configure(state="disabled")
+            self._log_view.clear()
 
     def _load_starting_players_roster(self) -> List[str]:
         players_dir = self._players_file_path()
@@ -3507,15 +3615,14 @@ class InitiativeTracker(tk.Tk):
             pass
 
     def _rebuild_table(self, scroll_to_top: bool = False, scroll_to_current: bool = False) -> None:
-        # preserve selection
-        prev_sel = set(self.tree.selection())
+        if _defer_refresh(self, "table", self._rebuild_table, scroll_to_top=scroll_to_top, scroll_to_current=scroll_to_current):
+            return
         try:
             prev_y = self.tree.yview()[0]
         except Exception:
             prev_y = 0.0
 
-        self.tree.delete(*self.tree.get_children())
-
+        rows: List[Tuple[str, Tuple[Any, ...], Tuple[str, ...]]] = []
         ordered = self._display_order()
         for i, c in enumerate(ordered):
             side = "Player Character" if getattr(c, "is_pc", False) else ("Ally" if c.ally else "Enemy")
@@ -3533,13 +3640,9 @@ class InitiativeTracker(tk.Tk):
                 tags.append("current")
             if self.start_cid == c.cid:
                 tags.append("start")
+            rows.append((str(c.cid), values, tuple(tags)))
 
-            self.tree.insert("", tk.END, iid=str(c.cid), values=values, tags=tuple(tags))
-
-        # restore selection
-        for it in prev_sel:
-            if it in self.tree.get_children():
-                self.tree.selection_add(it)
+        self._sync_table_rows(rows)
 
         if scroll_to_top:
             self.tree.yview_moveto(0.0)
@@ -3554,6 +3657,40 @@ class InitiativeTracker(tk.Tk):
         self._update_turn_ui()
         self._sync_move_mode_selector()
 
+    def _sync_table_rows(self, rows: List[Tuple[str, Tuple[Any, ...], Tuple[str, ...]]]) -> None:
+        """Make the Treeview show ``rows`` (iid, values, tags) in order, touching only what changed.
+
+        Rows are never deleted and re-inserted just to refresh them, so selection and
+        scroll position survive; a row that changed place is moved, one whose values or
+        tags changed is updated with a single ``item`` call.
+        """
+        shown: Dict[str, Tuple[Tuple[Any, ...], Tuple[str, ...]]] = self.__dict__.get("_table_rows") or {}
+        order = list(self.tree.get_children())
+        if set(order) != set(shown):
+            # Something else edited the tree; start over from an empty table.
+            if order:
+                self.tree.delete(*order)
+            order = []
+            shown = {}
+        wanted = {iid for iid, _values, _tags in rows}
+        stale = [iid for iid in order if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            order = [iid for iid in order if iid in wanted]
+        for index, (iid, values, tags) in enumerate(rows):
+            previous = shown.get(iid)
+            if previous is None:
+                self.tree.insert("", index, iid=iid, values=values, tags=tags)
+                order.insert(index, iid)
+                continue
+            if previous != (values, tags):
+                self.tree.item(iid, values=values, tags=tags)
+            if order[index] != iid:
+                self.tree.move(iid, "", index)
+                order.remove(iid)
+                order.insert(index, iid)
+        self._table_rows = {iid: (values, tags) for iid, values, tags in rows}
+
     def _center_current_turn_row(self) -> None:
         if self.current_cid is None:
             return
@@ -3934,7 +4071,7 @@ class InitiativeTracker(tk.Tk):
         self._refresh_monster_phase_for_combatant(c, reason="heal")
         return True
 
-    def _apply_damage_to_combatant(self, c: Any, amount: int) -> Dict[str, int]:
+    def _apply_damage_to_combatant(self, c: Any, amount: int, source_cid: Optional[int] = None) -> Dict[str, int]:
         damage = max(0, int(amount or 0))
         temp_before = max(0, int(getattr(c, "temp_hp", 0) or 0))
         hp_before = max(0, int(getattr(c, "hp", 0) or 0))
@@ -4170,6 +4307,7 @@ class InitiativeTracker(tk.Tk):
         worker.start()
 
         def check_done() -> None:
+            self._index_loading_tick()
             if worker.is_alive():
                 self.after(50, check_done)
                 return
@@ -4181,6 +4319,10 @@ class InitiativeTracker(tk.Tk):
 
         self.after(50, check_done)
 
+    def _index_loading_tick(self) -> None:
+        """Called on the Tk thread while indexes load in the background, and once when done."""
+        return
+
     def _load_monsters_and_spells(self) -> None:
         self._load_monsters_index()
 
@@ -4604,8 +4746,8 @@ class InitiativeTracker(tk.Tk):
     def _monster_spec_cr_value(self, spec: Optional[MonsterSpec]) -> float:
         if spec is None:
             return 0.0
-        raw = None
-        if isinstance(spec.raw_data, dict):
+        raw = getattr(spec, "cr_label", None)
+        if raw is None and getattr(spec, "detail_loader", None) is None and isinstance(spec.raw_data, dict):
             raw = spec.raw_data.get("challenge_rating")
         try:
             if isinstance(raw, (int, float)):
@@ -5558,7 +5700,7 @@ class InitiativeTracker(tk.Tk):
                         self._log(f"Damage to {target_name} was blocked — immune.{adjustment_note}")
 
                 old_hp = int(c.hp)
-                damage_state = self._apply_damage_to_combatant(c, int(total_applied))
+                damage_state = self._apply_damage_to_combatant(c, int(total_applied), source_cid=attacker_cid)
                 new_hp = int(damage_state.get("hp_after", old_hp))
                 if total_applied > 0 and new_hp < old_hp:
                     self._queue_concentration_save(c, "damage")
@@ -6359,8 +6501,18 @@ class BattleMapWindow(tk.Toplevel):
             pass
         return cols, rows
 
+    def _mark_lan_dirty(self, **dirty: Any) -> None:
+        """Record a map mutation in the tracker's LAN change journal (if the tracker keeps one)."""
+        mark_fn = getattr(self.app, "_lan_mark_dirty", None)
+        if callable(mark_fn):
+            try:
+                mark_fn(**dirty)
+            except Exception:
+                pass
+
     def _apply_lan_map_state(self) -> None:
         redraw_move_highlight = False
+        self._mark_lan_dirty(terrain=True)
         lan_rough = getattr(self.app, "_lan_rough_terrain", None)
         if isinstance(lan_rough, dict):
             loaded_rough: Dict[Tuple[int, int], Dict[str, object]] = {}
@@ -7494,6 +7646,7 @@ class BattleMapWindow(tk.Toplevel):
 
     def _clear_obstacles(self) -> None:
         self.obstacles.clear()
+        self._mark_lan_dirty(terrain=True)
         self._redraw_all()
         self._update_move_highlight()
 
@@ -7501,6 +7654,7 @@ class BattleMapWindow(tk.Toplevel):
         if not self._obstacle_history:
             return
         self.obstacles = self._obstacle_history.pop()
+        self._mark_lan_dirty(terrain=True)
         self._draw_obstacles()
         self._update_move_highlight()
 
@@ -7632,6 +7786,7 @@ class BattleMapWindow(tk.Toplevel):
                 "is_rough": bool(cell_data.get("is_rough")),
             }
         self.rough_terrain = loaded_rough
+        self._mark_lan_dirty(terrain=True)
         self._redraw_all()
         self._draw_rough_terrain()
         self._update_move_highlight()
@@ -7736,8 +7891,10 @@ class BattleMapWindow(tk.Toplevel):
         radius = self._normalize_obstacle_brush()
         base_col = int(col)
         base_row = int(row)
+        painted: List[Tuple[int, int]] = []
         if self.obstacle_single_var.get():
             key = (base_col, base_row)
+            painted.append(key)
             if erase:
                 self.obstacles.discard(key)
             else:
@@ -7753,10 +7910,12 @@ class BattleMapWindow(tk.Toplevel):
                     if target_col < 0 or target_row < 0 or target_col >= self.cols or target_row >= self.rows:
                         continue
                     key = (target_col, target_row)
+                    painted.append(key)
                     if erase:
                         self.obstacles.discard(key)
                     else:
                         self.obstacles.add(key)
+        self._mark_lan_dirty(cells=painted)
         # Redraw obstacles + recompute movement highlight (obstacles affect it)
         self._draw_obstacles()
         self._update_move_highlight()
@@ -7775,8 +7934,10 @@ class BattleMapWindow(tk.Toplevel):
         base_col = int(col)
         base_row = int(row)
         terrain = self._rough_preset_from_ui()
+        painted: List[Tuple[int, int]] = []
         if self.obstacle_single_var.get():
             key = (base_col, base_row)
+            painted.append(key)
             if erase:
                 self.rough_terrain.pop(key, None)
             else:
@@ -7792,10 +7953,12 @@ class BattleMapWindow(tk.Toplevel):
                     if target_col < 0 or target_row < 0 or target_col >= self.cols or target_row >= self.rows:
                         continue
                     key = (target_col, target_row)
+                    painted.append(key)
                     if erase:
                         self.rough_terrain.pop(key, None)
                     else:
                         self.rough_terrain[key] = dict(terrain)
+        self._mark_lan_dirty(cells=painted)
         self._draw_rough_terrain()
         self._update_move_highlight()
 
@@ -8186,6 +8349,7 @@ class BattleMapWindow(tk.Toplevel):
             pass
         self.unit_tokens.pop(cid, None)
         self._token_facing.pop(cid, None)
+        self._mark_lan_dirty(cids=(cid,))
 
         # Group labels and move highlight may change when a token leaves the map
         self._update_groups()
@@ -8285,6 +8449,7 @@ class BattleMapWindow(tk.Toplevel):
         tok = self.unit_tokens.get(cid)
         if not tok:
             return
+        self._mark_lan_dirty(cids=(cid,))
 
         col = int(tok["col"])
         row = int(tok["row"])
@@ -8361,6 +8526,8 @@ class BattleMapWindow(tk.Toplevel):
 
     def _update_groups(self) -> None:
         """Recompute shared-square groups, update group labels, and relayout all tokens."""
+        if _defer_refresh(self.app, "map_tokens", self._update_groups):
+            return
         cell_to: Dict[Tuple[int, int], List[int]] = {}
         for cid, tok in self.unit_tokens.items():
             try:
@@ -8571,9 +8738,19 @@ class BattleMapWindow(tk.Toplevel):
         Compute minimal movement cost (in feet) from a start square to all squares, up to max_ft.
 
         Uses the common 5e diagonal rule: diagonals alternate 5/10 ft (scaled by feet_per_square).
-        Blocks movement through obstacles, applies swim/rough terrain multipliers, and prevents
-        corner-cutting around obstacle squares.
+        Blocks movement through obstacles and applies swim/rough terrain multipliers. On 5 ft grids
+        this answers from the tracker's shared reachability field, the same one LAN move validation
+        uses (so diagonal steps past obstacle corners are allowed, as on the server). The local
+        fallback search also prevents corner-cutting around obstacle squares.
         """
+        field_fn = getattr(self.app, "_lan_reachability_field", None)
+        cid = getattr(creature, "cid", None)
+        if callable(field_fn) and cid is not None and int(self.feet_per_square) == 5:
+            try:
+                return field_fn(int(cid), max_ft=int(max_ft), origin=(int(start_col), int(start_row)))
+            except Exception:
+                pass
+
         import heapq
 
         step = int(self.feet_per_square)
@@ -8665,6 +8842,8 @@ class BattleMapWindow(tk.Toplevel):
 
     def _update_move_highlight(self) -> None:
         """Highlight reachable squares for the active creature, based on its remaining movement."""
+        if _defer_refresh(self.app, "move_overlay", self._update_move_highlight):
+            return
         try:
             self.canvas.delete("movehl")
         except Exception:
@@ -8811,6 +8990,7 @@ class BattleMapWindow(tk.Toplevel):
                 self._sync_aoe_duration_ui(aid)
                 return
         self.aoes[aid]["duration_turns"] = duration
+        self._mark_lan_dirty(aids=(aid,))
         self._refresh_aoe_list(select=aid)
 
     def _apply_aoe_color(self, aid: int) -> None:
@@ -8820,6 +9000,7 @@ class BattleMapWindow(tk.Toplevel):
         kind = str(d.get("kind") or "")
         color = self._normalize_aoe_color(d.get("color"), kind)
         d["color"] = color
+        self._mark_lan_dirty(aids=(aid,))
         try:
             self.canvas.itemconfigure(int(d["shape"]), outline=color)
         except Exception:
@@ -8922,6 +9103,7 @@ class BattleMapWindow(tk.Toplevel):
                           "color": self._aoe_default_color("circle"),
                           "name": f"AoE {aid}", "shape": None, "label": None,
                           "duration_turns": None, "remaining_turns": None}
+        self._mark_lan_dirty(aids=(aid,))
         self._create_aoe_items(aid)
         self._refresh_aoe_list(select=aid)
 
@@ -8943,6 +9125,7 @@ class BattleMapWindow(tk.Toplevel):
                           "color": self._aoe_default_color("sphere"),
                           "name": f"AoE {aid}", "shape": None, "label": None,
                           "duration_turns": None, "remaining_turns": None}
+        self._mark_lan_dirty(aids=(aid,))
         self._create_aoe_items(aid)
         self._refresh_aoe_list(select=aid)
 
@@ -8962,6 +9145,7 @@ class BattleMapWindow(tk.Toplevel):
                           "color": self._aoe_default_color("cube"),
                           "name": f"AoE {aid}", "shape": None, "label": None,
                           "duration_turns": None, "remaining_turns": None}
+        self._mark_lan_dirty(aids=(aid,))
         self._create_aoe_items(aid)
         self._refresh_aoe_list(select=aid)
 
@@ -8981,6 +9165,7 @@ class BattleMapWindow(tk.Toplevel):
                           "color": self._aoe_default_color("square"),
                           "name": f"AoE {aid}", "shape": None, "label": None,
                           "duration_turns": None, "remaining_turns": None}
+        self._mark_lan_dirty(aids=(aid,))
         self._create_aoe_items(aid)
         self._refresh_aoe_list(select=aid)
 
@@ -9412,6 +9597,7 @@ class BattleMapWindow(tk.Toplevel):
         d = self.aoes.get(aid)
         if not d:
             return
+        self._mark_lan_dirty(aids=(aid,))
         kind = str(d["kind"])
         anchor = None
         if kind in ("line", "cone") or (bool(d.get("fixed_to_caster")) and kind in ("circle", "sphere", "cylinder", "square", "cube")):
@@ -9809,6 +9995,7 @@ class BattleMapWindow(tk.Toplevel):
                 self.aoes[aid]["remaining_turns"] = None
         else:
             self.aoes[aid]["remaining_turns"] = None
+        self._mark_lan_dirty(aids=(aid,))
         self._refresh_aoe_list(select=aid)
 
 
@@ -9830,6 +10017,7 @@ class BattleMapWindow(tk.Toplevel):
         if not name:
             name = f"AoE {aid}"
         self.aoes[aid]["name"] = name
+        self._mark_lan_dirty(aids=(aid,))
         self._refresh_aoe_list(select=aid)
         # Update label text immediately (count will be appended by _update_included_for_selected)
         self._update_included_for_selected()
@@ -10079,6 +10267,7 @@ class BattleMapWindow(tk.Toplevel):
         if aid not in self.aoes:
             return
         d = self.aoes.pop(aid)
+        self._mark_lan_dirty(aids=(aid,))
         app = getattr(self, "app", None)
         should_break_concentration = bool(d.get("concentration_bound"))
         if app is not None:
@@ -10833,6 +11022,8 @@ class BattleMapWindow(tk.Toplevel):
 
     # ---------------- AoE inclusion ----------------
     def _update_included_for_selected(self) -> None:
+        if _defer_refresh(self.app, "aoe_includes", self._update_included_for_selected):
+            return
         aid = self._selected_aoe
         if aid is None or aid not in self.aoes:
             self._set_included_text("")
@@ -11669,7 +11860,12 @@ class BattleMapWindow(tk.Toplevel):
             if close_after_var.get():
                 dlg.destroy()
 
-        ttk.Button(btns, text="Apply damage", command=apply_damage).pack(side=tk.LEFT, padx=(8, 0))
+        def apply_damage_batched() -> None:
+            # One table/overlay refresh for the whole AoE instead of one per target.
+            with _refresh_batch(self.app):
+                apply_damage()
+
+        ttk.Button(btns, text="Apply damage", command=apply_damage_batched).pack(side=tk.LEFT, padx=(8, 0))
         ttk.Button(btns, text="Close", command=dlg.destroy).pack(side=tk.RIGHT)
         close_after_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(btns, text="Close after apply", variable=close_after_var).pack(side=tk.RIGHT, padx=(0, 8))
@@ -11697,91 +11893,25 @@ class BattleMapWindow(tk.Toplevel):
 
     def _compute_included_units(self, aid: int) -> List[int]:
         d = self.aoes[aid]
-        kind = str(d["kind"])
-        cx_px = self.x0 + (float(d["cx"]) + 0.5) * self.cell
-        cy_px = self.y0 + (float(d["cy"]) + 0.5) * self.cell
-
-        included: List[int] = []
-        if kind in ("circle", "sphere", "cylinder"):
-            r_px = float(d["radius_sq"]) * self.cell
-            r2 = r_px * r_px
-            for cid, tok in self.unit_tokens.items():
-                x, y = self._grid_to_pixel(int(tok["col"]), int(tok["row"]))
-                if (x - cx_px) ** 2 + (y - cy_px) ** 2 <= r2:
-                    included.append(cid)
-        elif kind in ("line", "wall"):
-            length_px = float(d["length_sq"]) * self.cell
-            width_px = float(d["width_sq"]) * self.cell
-            angle_deg = d.get("angle_deg")
-            if angle_deg is None:
-                orient = str(d.get("orient") or "vertical")
-                angle_deg = 0.0 if orient == "horizontal" else 90.0
-            angle_rad = math.radians(float(angle_deg))
-            cos_a = math.cos(-angle_rad)
-            sin_a = math.sin(-angle_rad)
-            for cid, tok in self.unit_tokens.items():
-                x, y = self._grid_to_pixel(int(tok["col"]), int(tok["row"]))
-                dx = x - cx_px
-                dy = y - cy_px
-                rx = dx * cos_a - dy * sin_a
-                ry = dx * sin_a + dy * cos_a
-                token_half = self.cell / 2.0
-                if abs(rx) <= length_px / 2.0 + token_half and abs(ry) <= width_px / 2.0:
-                    included.append(cid)
-        elif kind == "cone":
-            length_px = float(d.get("length_sq") or 0.0) * self.cell
-            spread_deg = d.get("spread_deg")
-            has_spread = spread_deg is not None
-            if spread_deg is None:
-                spread_deg = d.get("angle_deg")
-            if spread_deg is None:
-                spread_deg = 90.0
-            else:
-                spread_deg = float(spread_deg)
-            orient = str(d.get("orient") or "vertical")
-            heading_deg = 0.0 if orient == "horizontal" else -90.0
-            if has_spread:
-                angle = d.get("angle_deg")
-                if angle is not None:
-                    heading_deg = float(angle)
-            heading_rad = math.radians(heading_deg)
-            half_spread = math.radians(spread_deg / 2.0)
-            for cid, tok in self.unit_tokens.items():
-                x, y = self._grid_to_pixel(int(tok["col"]), int(tok["row"]))
-                dx = x - cx_px
-                dy = y - cy_px
-                dist = math.hypot(dx, dy)
-                if dist > length_px + (self.cell / 2.0):
-                    continue
-                angle = math.atan2(dy, dx) - heading_rad
-                while angle <= -math.pi:
-                    angle += math.pi * 2
-                while angle > math.pi:
-                    angle -= math.pi * 2
-                if abs(angle) <= half_spread:
-                    included.append(cid)
-        else:
-            half = float(d["side_sq"]) * self.cell / 2.0
-            angle = d.get("angle_deg") if kind in ("square", "cube") else None
-            if angle is None:
-                x1, y1 = cx_px - half, cy_px - half
-                x2, y2 = cx_px + half, cy_px + half
-                for cid, tok in self.unit_tokens.items():
-                    x, y = self._grid_to_pixel(int(tok["col"]), int(tok["row"]))
-                    if x1 <= x <= x2 and y1 <= y <= y2:
-                        included.append(cid)
-            else:
-                angle_rad = math.radians(float(angle))
-                cos_a = math.cos(-angle_rad)
-                sin_a = math.sin(-angle_rad)
-                for cid, tok in self.unit_tokens.items():
-                    x, y = self._grid_to_pixel(int(tok["col"]), int(tok["row"]))
-                    dx = x - cx_px
-                    dy = y - cy_px
-                    rx = dx * cos_a - dy * sin_a
-                    ry = dx * sin_a + dy * cos_a
-                    if abs(rx) <= half and abs(ry) <= half:
-                        included.append(cid)
+        # Token centres and the AoE anchor share the same half-square offset, so the test
+        # runs in grid squares and stays identical to the LAN server's inclusion.
+        positions: Dict[int, Tuple[int, int]] = {}
+        footprints: Dict[int, List[Tuple[int, int]]] = {}
+        space_cells = getattr(self.app, "_combatant_space_cells", None)
+        for cid, tok in self.unit_tokens.items():
+            pos = (int(tok["col"]), int(tok["row"]))
+            positions[cid] = pos
+            c = self.app.combatants.get(cid)
+            size_name = str(getattr(c, "size", "") or "").strip().lower()
+            if c is None or size_name not in ("large", "huge", "gargantuan") or not callable(space_cells):
+                continue
+            try:
+                cells = space_cells(c, destination=pos)
+            except Exception:
+                cells = None
+            if cells:
+                footprints[cid] = cells
+        included: List[int] = list(aoe_geometry.included_ids(d, positions, footprints))
 
         # stable order: by initiative order if possible
         order = [c.cid for c in self.app._display_order()] if hasattr(self.app, "_display_order") else []
@@ -0,0 +1,360 @@
+"""Incrementally reloaded view of the ``Items/`` library (weapons, armor, magic items, consumables).
+
+:class:`ItemCatalog` keeps the parsed YAML of every item file keyed by path together with
+its ``(mtime_ns, size)``, so a refresh only re-reads files that changed (or just the paths
+a :class:`library_watch.LibraryWatcher` reported). The merged registries the tracker
+serves are rebuilt from those cached documents, which is plain dict work.
+
+On top of the registries it maintains:
+
+* name indexes per registry (unique lower-cased names -> id, plus the ambiguous names);
+* a generation per item key (``id`` and ``name:<lower name>``), bumped whenever a file
+  defining that key is added, edited or removed;
+* a reverse index from item keys to the characters whose profiles reference them, so
+  an item edit only re-derives the characters that own or equip the item.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+# (registry bucket, directory under Items/)
+BUCKET_DIRS: Tuple[Tuple[str, str], ...] = (
+    ("weapons", "Weapons"),
+    ("armors", "Armor"),
+    ("magic_items", "Magic_Items"),
+    ("consumables", "Consumables"),
+)
+ITEM_SUFFIXES = (".yaml", ".yml")
+
+# (item id, definition, is a per-item file rather than a catalog list)
+_Entry = Tuple[str, Dict[str, Any], bool]
+
+
+class _ItemFile:
+    __slots__ = ("bucket", "stat", "document", "error", "entries")
+
+    def __init__(
+        self,
+        bucket: str,
+        stat: Tuple[int, int],
+        document: Optional[Dict[str, Any]],
+        error: Optional[Exception],
+        entries: List[_Entry],
+    ) -> None:
+        self.bucket = bucket
+        self.stat = stat
+        self.document = document
+        self.error = error
+        self.entries = entries
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (int(st.st_mtime_ns), int(st.st_size))
+
+
+def _item_id(raw: Any) -> str:
+    return str(raw or "").strip().lower()
+
+
+def item_keys(entry: Dict[str, Any], item_id: str = "") -> Set[str]:
+    """Generation keys for an item definition or an inventory reference to one."""
+    keys: Set[str] = set()
+    if item_id:
+        keys.add(item_id)
+    name = str(entry.get("name") or "").strip().lower()
+    if name:
+        keys.add(f"name:{name}")
+    return keys
+
+
+def build_name_index(registry: Dict[str, Any]) -> Tuple[Dict[str, str], FrozenSet[str]]:
+    """Unique lower-cased item names -> id, and the names shared by several ids."""
+    name_to_id: Dict[str, str] = {}
+    duplicates: Set[str] = set()
+    for item_id, payload in registry.items():
+        name = str((payload or {}).get("name") or "").strip().lower() if isinstance(payload, dict) else ""
+        if not name or name in duplicates:
+            continue
+        existing = name_to_id.get(name)
+        if existing and existing != item_id:
+            duplicates.add(name)
+            name_to_id.pop(name, None)
+            continue
+        name_to_id[name] = item_id
+    return name_to_id, frozenset(duplicates)
+
+
+def _entries_for(bucket: str, parsed: Dict[str, Any]) -> List[_Entry]:
+    list_key = {"weapons": "weapons", "armors": "armors"}.get(bucket)
+    if list_key and isinstance(parsed.get(list_key), list):
+        out: List[_Entry] = []
+        for raw_entry in parsed.get(list_key) or []:
+            if not isinstance(raw_entry, dict):
+                continue
+            item_id = _item_id(raw_entry.get("id"))
+            if item_id:
+                out.append((item_id, dict(raw_entry), False))
+        return out
+    if bucket == "weapons" and "properties" in parsed and "id" not in parsed:
+        return []
+    item_id = _item_id(parsed.get("id"))
+    if not item_id:
+        return []
+    return [(item_id, dict(parsed), True)]
+
+
+class ItemCatalog:
+    """Parsed ``Items/`` files plus the registries, indexes and owner map derived from them."""
+
+    def __init__(self, parse: Callable[[str], Any], log: Callable[[str], None]) -> None:
+        self._parse = parse
+        self._log = log
+        self.root: Optional[Path] = None
+        self._files: Dict[Path, _ItemFile] = {}
+        self.generation = 0
+        self._key_generation: Dict[str, int] = {}
+        self.equippable: Dict[str, Dict[str, Dict[str, Any]]] = {"weapons": {}, "armors": {}}
+        self.magic_items: Dict[str, Dict[str, Any]] = {}
+        self.consumables: Dict[str, Dict[str, Any]] = {}
+        self._name_indexes: Dict[str, Tuple[Dict[str, str], FrozenSet[str]]] = {}
+        self._owner_keys: Dict[str, Tuple[Any, FrozenSet[str]]] = {}
+        self._owners_by_key: Dict[str, Set[str]] = {}
+
+    # -- loading -----------------------------------------------------------------
+
+    def _bucket_dirs(self) -> Dict[Path, str]:
+        if self.root is None:
+            return {}
+        return {self.root / dirname: bucket for bucket, dirname in BUCKET_DIRS}
+
+    def _scan(self) -> Dict[Path, Tuple[str, Tuple[int, int]]]:
+        found: Dict[Path, Tuple[str, Tuple[int, int]]] = {}
+        for directory, bucket in self._bucket_dirs().items():
+            if not directory.is_dir():
+                continue
+            for path in directory.iterdir():
+                if path.suffix.lower() not in ITEM_SUFFIXES:
+                    continue
+                stat = _stat_key(path)
+                if stat is not None:
+                    found[path] = (bucket, stat)
+        return found
+
+    def _load(self, path: Path, bucket: str, stat: Tuple[int, int]) -> _ItemFile:
+        try:
+            parsed = self._parse(path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            label = {"magic_items": "Magic item", "consumables": "Consumable"}.get(bucket, "Items")
+            self._log(f"{label} YAML parse failed for {path}: {exc}")
+            return _ItemFile(bucket, stat, None, exc, [])
+        if not isinstance(parsed, dict):
+            return _ItemFile(bucket, stat, None, None, [])
+        return _ItemFile(bucket, stat, parsed, None, _entries_for(bucket, parsed))
+
+    def refresh(self, root: Optional[Path], changed: Optional[Iterable[Path]] = None) -> bool:
+        """Bring the catalog up to date with ``root``; True when any item file changed.
+
+        ``changed`` limits the check to those paths (as reported by the library watcher);
+        None, a different root or a change to a bucket directory itself means a full stat scan.
+        """
+        if root != self.root:
+            self.root = root
+            changed = None
+            stale = list(self._files)
+        else:
+            stale = []
+        bucket_dirs = self._bucket_dirs()
+        updates: Dict[Path, Optional[_ItemFile]] = {path: None for path in stale}
+        candidates: Optional[List[Path]] = None
+        if changed is not None:
+            candidates = []
+            for path in changed:
+                if path.parent in bucket_dirs and path.suffix.lower() in ITEM_SUFFIXES:
+                    candidates.append(path)
+                elif path == self.root or path in bucket_dirs:
+                    candidates = None
+                    break
+        if candidates is None:
+            found = self._scan()
+            for path in self._files:
+                if path not in found:
+                    updates[path] = None
+            for path, (bucket, stat) in found.items():
+                cached = self._files.get(path)
+                if cached is None or cached.stat != stat:
+                    updates[path] = self._load(path, bucket, stat)
+        else:
+            for path in candidates:
+                stat = _stat_key(path)
+                cached = self._files.get(path)
+                if stat is None:
+                    if cached is not None:
+                        updates[path] = None
+                elif cached is None or cached.stat != stat:
+                    updates[path] = self._load(path, bucket_dirs[path.parent], stat)
+        if not updates:
+            return False
+
+        self.generation += 1
+        touched: Set[str] = set()
+        for path, loaded in updates.items():
+            previous = self._files.pop(path, None)
+            for item_file in (previous, loaded):
+                if item_file is None:
+                    continue
+                for item_id, data, _per_item in item_file.entries:
+                    touched |= item_keys(data, item_id)
+            if loaded is not None:
+                self._files[path] = loaded
+        for key in touched:
+            self._key_generation[key] = self.generation
+        self._rebuild()
+        return True
+
+    def _bucket_files(self, bucket: str) -> List[Tuple[Path, _ItemFile]]:
+        return sorted(
+            ((path, item_file) for path, item_file in self._files.items() if item_file.bucket == bucket),
+            key=lambda pair: pair[0],
+        )
+
+    def _rebuild(self) -> None:
+        registry: Dict[str, Dict[str, Dict[str, Any]]] = {"weapons": {}, "armors": {}}
+        sources: Dict[str, Dict[str, str]] = {"weapons": {}, "armors": {}}
+
+        for bucket_key in ("weapons", "armors"):
+            for path, item_file in self._bucket_files(bucket_key):
+                for item_id, item_data, is_per_item in item_file.entries:
+                    prior = registry[bucket_key].get(item_id)
+                    if prior is None:
+                        registry[bucket_key][item_id] = dict(item_data)
+                        sources[bucket_key][item_id] = "per-item" if is_per_item else "catalog"
+                        continue
+                    prior_source = sources[bucket_key].get(item_id, "catalog")
+                    if prior_source == "per-item" and not is_per_item:
+                        self._log(f"Duplicate {bucket_key[:-1]} id '{item_id}' in {path.name}; keeping per-item definition.")
+                        continue
+                    if prior_source == "catalog" and is_per_item:
+                        self._log(f"Duplicate {bucket_key[:-1]} id '{item_id}' in {path.name}; preferring per-item definition.")
+                        registry[bucket_key][item_id] = dict(item_data)
+                        sources[bucket_key][item_id] = "per-item"
+                        continue
+                    self._log(
+                        f"Duplicate {bucket_key[:-1]} id '{item_id}' in {path.name}; keeping latest {prior_source} definition."
+                    )
+                    registry[bucket_key][item_id] = dict(item_data)
+                    sources[bucket_key][item_id] = "per-item" if is_per_item else "catalog"
+
+        magic_items: Dict[str, Dict[str, Any]] = {}
+        for path, item_file in self._bucket_files("magic_items"):
+            for item_id, parsed, _per_item in item_file.entries:
+                magic_items[item_id] = dict(parsed)
+                item_type = str(parsed.get("type") or "").strip().lower()
+                if item_type == "weapon" and isinstance(parsed.get("damage"), dict):
+                    prior_source = sources["weapons"].get(item_id)
+                    if prior_source and prior_source != "magic-item":
+                        self._log(f"Duplicate weapon id '{item_id}' in {path.name}; preferring Magic_Items definition.")
+                    registry["weapons"][item_id] = dict(parsed)
+                    sources["weapons"][item_id] = "magic-item"
+                if item_type == "armor":
+                    ac_data = parsed.get("ac")
+                    if isinstance(ac_data, dict) and any(k in ac_data for k in ("base_formula", "value", "ac", "formula")):
+                        prior_source = sources["armors"].get(item_id)
+                        if prior_source and prior_source != "magic-item":
+                            self._log(f"Duplicate armor id '{item_id}' in {path.name}; keeping Items/Armor definition.")
+                        else:
+                            registry["armors"][item_id] = dict(parsed)
+                            sources["armors"][item_id] = "magic-item"
+
+        consumables: Dict[str, Dict[str, Any]] = {}
+        for _path, item_file in self._bucket_files("consumables"):
+            for item_id, parsed, _per_item in item_file.entries:
+                consumables[item_id] = dict(parsed)
+
+        self.equippable = registry
+        self.magic_items = magic_items
+        self.consumables = consumables
+        self._name_indexes = {}
+
+    # -- lookups -----------------------------------------------------------------
+
+    def documents(self, bucket: str) -> List[Tuple[Path, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """Every file of one bucket in path order with its parsed mapping or parse error."""
+        return [(path, item_file.document, item_file.error) for path, item_file in self._bucket_files(bucket)]
+
+    def registry(self, kind: str) -> Dict[str, Dict[str, Any]]:
+        if kind == "magic_items":
+            return self.magic_items
+        if kind == "consumables":
+            return self.consumables
+        # Weapons and armor share one id space for inventory lookups; armor wins a clash.
+        merged: Dict[str, Dict[str, Any]] = {}
+        for bucket in ("weapons", "armors"):
+            merged.update(self.equippable.get(bucket) or {})
+        return merged
+
+    def name_index(self, kind: str) -> Tuple[Dict[str, str], FrozenSet[str]]:
+        """``build_name_index`` for ``equippable``, ``magic_items`` or ``consumables``, kept until the next change."""
+        index = self._name_indexes.get(kind)
+        if index is None:
+            index = build_name_index(self.registry(kind))
+            self._name_indexes[kind] = index
+        return index
+
+    def key_generation(self, key: str) -> int:
+        return self._key_generation.get(key, 0)
+
+    def changed_keys(self, since: int) -> FrozenSet[str]:
+        return frozenset(key for key, generation in self._key_generation.items() if generation > since)
+
+    # -- owners ------------------------------------------------------------------
+
+    def sync_owner(self, owner: str, token: Any, keys_for: Callable[[], Iterable[str]]) -> FrozenSet[str]:
+        """Record the item keys ``owner`` references; ``keys_for`` only runs when ``token`` changed."""
+        recorded = self._owner_keys.get(owner)
+        if recorded is not None and recorded[0] is token:
+            return recorded[1]
+        keys = frozenset(keys_for())
+        previous = recorded[1] if recorded is not None else frozenset()
+        for key in previous - keys:
+            owners = self._owners_by_key.get(key)
+            if owners is not None:
+                owners.discard(owner)
+                if not owners:
+                    self._owners_by_key.pop(key, None)
+        for key in keys - previous:
+            self._owners_by_key.setdefault(key, set()).add(owner)
+        self._owner_keys[owner] = (token, keys)
+        return keys
+
+    def drop_owner(self, owner: str) -> None:
+        recorded = self._owner_keys.pop(owner, None)
+        if recorded is None:
+            return
+        for key in recorded[1]:
+            owners = self._owners_by_key.get(key)
+            if owners is not None:
+                owners.discard(owner)
+                if not owners:
+                    self._owners_by_key.pop(key, None)
+
+    def owner_names(self) -> List[str]:
+        return list(self._owner_keys)
+
+    def owners_of(self, keys: Iterable[str]) -> Set[str]:
+        found: Set[str] = set()
+        for key in keys:
+            found |= self._owners_by_key.get(key, set())
+        return found
+
+    def owner_stamp(self, owner: str) -> int:
+        """Latest generation among the items ``owner`` references (0 when none changed yet)."""
+        recorded = self._owner_keys.get(owner)
+        if recorded is None:
+            return 0
+        return max((self._key_generation.get(key, 0) for key in recorded[1]), default=0)
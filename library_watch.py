@@ -0,0 +1,371 @@
+"""Change notifications for the YAML library directories (Monsters/, Spells/, players/, Items/).
+
+:class:`LibraryWatcher` keeps a revision counter per watched directory plus the paths
+that changed at each revision, so a cache can remember the revision it was built at
+and answer later calls without globbing or stat-ing anything. On Linux the counters
+are driven by inotify (through ctypes, no extra dependency); elsewhere, or when a
+directory cannot be watched, a daemon thread re-scans the directory every
+``poll_interval`` seconds instead.
+
+``INITTRACKER_LIBRARY_WATCH`` picks the backend (``auto``, ``inotify``, ``poll`` or
+``off``) and ``INITTRACKER_LIBRARY_POLL_S`` the polling interval.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+_EVENT = struct.Struct("iIII")
+HISTORY_LIMIT = 256
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Snapshot of one directory tree for the polling backend: path -> (mtime_ns, size).
+_Snapshot = Dict[Path, Tuple[int, int]]
+
+
+def _relevant(name: str) -> bool:
+    # Atomic writers in the tracker stage through "<name>.tmp"; the rename that follows is what matters.
+    return bool(name) and not name.startswith(".") and not name.endswith(".tmp")
+
+
+def _scan(root: Path, recursive: bool) -> Optional[_Snapshot]:
+    """Stat every entry under ``root``; None when the directory itself is missing."""
+    snapshot: _Snapshot = {}
+    pending = [root]
+    first = True
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            if first:
+                return None
+            continue
+        first = False
+        for entry in entries:
+            if not _relevant(entry.name):
+                continue
+            try:
+                is_dir = entry.is_dir()
+                stat = entry.stat()
+            except OSError:
+                continue
+            path = Path(entry.path)
+            if is_dir:
+                if recursive:
+                    pending.append(path)
+                continue
+            snapshot[path] = (int(stat.st_mtime_ns), int(stat.st_size))
+    return snapshot
+
+
+class _Inotify:
+    """Minimal ctypes binding: one non-blocking inotify descriptor."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+
+    def add_watch(self, path: Path) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(str(path)), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        return wd
+
+    def remove_watch(self, wd: int) -> None:
+        self._rm_watch(self.fd, wd)
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+        events: List[Tuple[int, int, str]] = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset : offset + length].split(b"\0", 1)[0].decode("utf-8", "surrogateescape")
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _Watch:
+    def __init__(self, root: Path, recursive: bool) -> None:
+        self.root = root
+        self.recursive = recursive
+        self.revision = 0
+        # (revision, changed paths or None when the change set is unknown)
+        self.history: Deque[Tuple[int, Optional[FrozenSet[Path]]]] = deque(maxlen=HISTORY_LIMIT)
+        self.snapshot: Optional[_Snapshot] = None
+        self.polled = True
+        self.wds: Set[int] = set()
+
+
+class LibraryWatcher:
+    """Per-directory revision counters fed by inotify or a polling thread."""
+
+    def __init__(self, backend: Optional[str] = None, poll_interval: Optional[float] = None) -> None:
+        requested = str(backend or os.getenv("INITTRACKER_LIBRARY_WATCH") or "auto").strip().lower()
+        if poll_interval is None:
+            try:
+                poll_interval = float(os.getenv("INITTRACKER_LIBRARY_POLL_S") or DEFAULT_POLL_INTERVAL)
+            except ValueError:
+                poll_interval = DEFAULT_POLL_INTERVAL
+        self.poll_interval = max(0.05, float(poll_interval))
+        self.enabled = requested != "off"
+        self._lock = threading.Lock()
+        self._watches: Dict[Path, _Watch] = {}
+        self._by_wd: Dict[int, Tuple[_Watch, Path]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify: Optional[_Inotify] = None
+        if self.enabled and requested in ("auto", "inotify") and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+            except Exception:
+                self._inotify = None
+        self.backend = "off" if not self.enabled else ("inotify" if self._inotify is not None else "poll")
+
+    # ------------------------------------------------------------------ public API
+    def watch(self, directory: Path, *, recursive: bool = False) -> None:
+        """Start tracking ``directory`` (it may not exist yet; it is picked up once it does)."""
+        if not self.enabled:
+            return
+        root = Path(directory)
+        with self._lock:
+            if root in self._watches:
+                return
+            watch = _Watch(root, recursive)
+            self._watches[root] = watch
+            self._attach(watch)
+
+    def start(self) -> None:
+        if not self.enabled or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="library-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._thread = None
+        if self._inotify is not None:
+            try:
+                self._inotify.close()
+            except OSError:
+                pass
+            self._inotify = None
+
+    def revision(self, directory: Path) -> Optional[int]:
+        """Current revision of a watched directory; None when it is not watched (callers re-scan)."""
+        if self._stop.is_set():
+            return None
+        watch = self._watches.get(Path(directory))
+        return None if watch is None else watch.revision
+
+    def changed_since(self, directory: Path, revision: Optional[int]) -> Optional[FrozenSet[Path]]:
+        """Paths that changed after ``revision``; None when that is no longer known."""
+        if revision is None:
+            return None
+        with self._lock:
+            watch = self._watches.get(Path(directory))
+            if watch is None or self._stop.is_set():
+                return None
+            if revision == watch.revision:
+                return frozenset()
+            if revision > watch.revision or not watch.history or watch.history[0][0] > revision + 1:
+                return None
+            changed: Set[Path] = set()
+            for rev, paths in watch.history:
+                if rev <= revision:
+                    continue
+                if paths is None:
+                    return None
+                changed.update(paths)
+            return frozenset(changed)
+
+    def note_changed(self, path: Path) -> None:
+        """Record a write the app made itself, without waiting for the notification."""
+        path = Path(path)
+        with self._lock:
+            for root, watch in self._watches.items():
+                if path.parent == root or (watch.recursive and root in path.parents):
+                    self._bump(watch, [path])
+
+    def poll_once(self) -> None:
+        """Re-scan every directory on the polling backend (the watch thread calls this)."""
+        with self._lock:
+            polled = [watch for watch in self._watches.values() if watch.polled]
+        for watch in polled:
+            snapshot = _scan(watch.root, watch.recursive)
+            with self._lock:
+                previous = watch.snapshot
+                if snapshot is not None and self._inotify is not None:
+                    # The directory exists again (or for the first time): hand it back to inotify.
+                    self._attach(watch)
+                    if not watch.polled:
+                        self._bump(watch, None)
+                        continue
+                if previous is None and snapshot is None:
+                    continue
+                if previous is None or snapshot is None:
+                    self._bump(watch, None)
+                else:
+                    changed = [path for path in previous.keys() | snapshot.keys() if previous.get(path) != snapshot.get(path)]
+                    if changed:
+                        self._bump(watch, changed)
+                watch.snapshot = snapshot
+
+    # ------------------------------------------------------------------ internals
+    def _bump(self, watch: _Watch, paths: Optional[Iterable[Path]]) -> None:
+        watch.revision += 1
+        watch.history.append((watch.revision, None if paths is None else frozenset(paths)))
+
+    def _attach(self, watch: _Watch) -> None:
+        """Put ``watch`` on inotify when possible, otherwise on the polling list. Lock held."""
+        if self._inotify is None:
+            if watch.snapshot is None:
+                watch.snapshot = _scan(watch.root, watch.recursive)
+            watch.polled = True
+            return
+        directories = [watch.root]
+        if watch.recursive:
+            for current, subdirs, _files in os.walk(watch.root):
+                subdirs[:] = [name for name in subdirs if _relevant(name)]
+                directories.extend(Path(current) / name for name in subdirs)
+        try:
+            for directory in directories:
+                self._add_wd(watch, directory)
+        except OSError:
+            # Missing directory or out of inotify watches: poll this one instead.
+            self._drop_wds(watch)
+            watch.snapshot = _scan(watch.root, watch.recursive)
+            watch.polled = True
+            return
+        watch.polled = False
+        watch.snapshot = None
+
+    def _add_wd(self, watch: _Watch, directory: Path) -> None:
+        assert self._inotify is not None
+        wd = self._inotify.add_watch(directory)
+        watch.wds.add(wd)
+        self._by_wd[wd] = (watch, directory)
+
+    def _drop_wds(self, watch: _Watch) -> None:
+        for wd in list(watch.wds):
+            self._by_wd.pop(wd, None)
+            if self._inotify is not None:
+                try:
+                    self._inotify.remove_watch(wd)
+                except Exception:
+                    pass
+        watch.wds.clear()
+
+    def _handle_events(self, events: List[Tuple[int, int, str]]) -> None:
+        changed: Dict[Path, Optional[Set[Path]]] = {}
+        with self._lock:
+            for wd, mask, name in events:
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped: every directory may have changed.
+                    for root in self._watches:
+                        changed[root] = None
+                    continue
+                target = self._by_wd.get(wd)
+                if target is None:
+                    continue
+                watch, directory = target
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    self._by_wd.pop(wd, None)
+                    watch.wds.discard(wd)
+                    if directory == watch.root:
+                        self._drop_wds(watch)
+                        watch.polled = True
+                        watch.snapshot = None
+                        changed[watch.root] = None
+                    continue
+                if not _relevant(name):
+                    continue
+                path = directory / name
+                if mask & IN_ISDIR:
+                    if watch.recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                        try:
+                            self._add_wd(watch, path)
+                        except OSError:
+                            pass
+                    # A moved or created subtree changes an unknown set of files.
+                    if watch.recursive:
+                        changed[watch.root] = None
+                    continue
+                if watch.root in changed and changed[watch.root] is None:
+                    continue
+                changed.setdefault(watch.root, set()).add(path)  # type: ignore[union-attr]
+            for root, paths in changed.items():
+                watch = self._watches.get(root)
+                if watch is not None:
+                    self._bump(watch, paths)
+
+    def _run(self) -> None:
+        next_poll = 0.0
+        while not self._stop.is_set():
+            inotify = self._inotify
+            if inotify is None:
+                self.poll_once()
+                self._stop.wait(self.poll_interval)
+                continue
+            try:
+                readable, _, _ = select.select([inotify.fd], [], [], self.poll_interval)
+            except (OSError, ValueError):
+                if self._stop.is_set():
+                    return
+                readable = []
+            if readable:
+                self._handle_events(inotify.read_events())
+            now = time.monotonic()
+            if now >= next_poll:
+                # Directories that are missing or could not get an inotify watch.
+                self.poll_once()
+                next_poll = now + self.poll_interval
+
@@ -0,0 +1,258 @@
+"""Compiled, memory-mapped monster catalog (``logs/monster_catalog.bin``).
+
+Layout (little-endian)::
+
+    header  MAGIC, format version, row count, heap offset
+    rows    one fixed-width ROW per monster file, sorted by library-relative path
+    heap    UTF-8 strings and JSON-encoded raw_data blobs, referenced as (offset, length)
+
+Summary columns are unpacked straight out of the mapping with ``struct``; a monster's
+``raw_data`` blob is only decoded when :meth:`MonsterCatalog.detail` asks for it. The
+file is rewritten whole (temp file + ``os.replace``) but unchanged rows are copied
+across without re-reading their YAML.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"ITMCAT\x00\x01"
+FORMAT_VERSION = 1
+
+ABILITIES = ("str", "dex", "con", "int", "wis", "cha")
+INT_COLUMNS = (
+    ("hp", "ac", "speed", "swim_speed", "fly_speed", "burrow_speed", "climb_speed", "dex", "init_mod", "turn_schedule_every_n")
+    + tuple(f"score_{ability}" for ability in ABILITIES)
+    + tuple(f"save_{ability}" for ability in ABILITIES)
+)
+STRING_COLUMNS = ("filename", "name", "mtype", "cr_label", "turn_schedule_mode", "turn_schedule_counts", "detail")
+
+_HEADER = struct.Struct("<8sIIQ")
+# mtime_ns, size, cr, INT_COLUMNS, then (offset, length) per STRING_COLUMNS entry.
+_ROW = struct.Struct("<qqd" + "i" * len(INT_COLUMNS) + "II" * len(STRING_COLUMNS))
+_INT_NONE = -(2**31)
+_INT_BASE = 3
+_STR_BASE = _INT_BASE + len(INT_COLUMNS)
+
+
+def scan_library(root: Path) -> List[Tuple[str, Path, int, int]]:
+    """(relative key, path, mtime_ns, size) for every .yml/.yaml under ``root``, sorted like the index."""
+    found: List[Tuple[str, Path, int, int]] = []
+    pending = [(root, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            pending.append((Path(entry.path), f"{prefix}{entry.name}/"))
+                            continue
+                        if not entry.is_file() or os.path.splitext(entry.name)[1].lower() not in (".yml", ".yaml"):
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    found.append((f"{prefix}{entry.name}", Path(entry.path), int(stat.st_mtime_ns), int(stat.st_size)))
+        except OSError:
+            continue
+    found.sort(key=lambda row: row[0].lower())
+    return found
+
+
+def encode_detail(raw_data: Dict[str, Any]) -> bytes:
+    """JSON bytes for a raw_data blob, or b"" when it holds values JSON can't carry."""
+    try:
+        return json.dumps(raw_data, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+    except (TypeError, ValueError):
+        return b""
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = int(value) if isinstance(value, int) else int(float(str(value).strip()))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return number if _INT_NONE < number < 2**31 else None
+
+
+def _pack_row(
+    mtime_ns: int,
+    size: int,
+    summary: Dict[str, Any],
+    strings: Dict[str, Tuple[int, int]],
+) -> bytes:
+    abilities = summary.get("abilities") if isinstance(summary.get("abilities"), dict) else {}
+    saves = summary.get("saving_throws") if isinstance(summary.get("saving_throws"), dict) else {}
+    ints: List[int] = []
+    for column in INT_COLUMNS:
+        if column.startswith("score_"):
+            value = abilities.get(column[6:])
+        elif column.startswith("save_"):
+            value = saves.get(column[5:])
+        else:
+            value = summary.get(column)
+        number = _int_or_none(value)
+        ints.append(_INT_NONE if number is None else number)
+    cr = summary.get("cr")
+    try:
+        cr_value = float(cr) if cr is not None else math.nan
+    except (TypeError, ValueError):
+        cr_value = math.nan
+    refs: List[int] = []
+    for column in STRING_COLUMNS:
+        refs.extend(strings.get(column, (0, 0)))
+    return _ROW.pack(int(mtime_ns), int(size), cr_value, *ints, *refs)
+
+
+def write_catalog(path: Path, entries: Iterable[Tuple[str, int, int, Dict[str, Any], bytes]]) -> None:
+    """Write ``(filename, mtime_ns, size, summary, detail_bytes)`` rows to ``path`` atomically."""
+    rows: List[bytes] = []
+    heap = bytearray()
+    interned: Dict[bytes, Tuple[int, int]] = {}
+
+    def put(data: bytes) -> Tuple[int, int]:
+        if not data:
+            return (0, 0)
+        ref = interned.get(data)
+        if ref is None:
+            ref = (len(heap), len(data))
+            heap.extend(data)
+            # Only short strings (types, labels) repeat often enough to be worth sharing.
+            if len(data) <= 64:
+                interned[data] = ref
+        return ref
+
+    for filename, mtime_ns, size, summary, detail in sorted(entries, key=lambda row: row[0].lower()):
+        strings: Dict[str, Tuple[int, int]] = {"filename": put(filename.encode("utf-8")), "detail": put(detail or b"")}
+        for column in ("name", "mtype", "cr_label", "turn_schedule_mode", "turn_schedule_counts"):
+            value = summary.get(column)
+            if value is not None:
+                strings[column] = put(str(value).encode("utf-8"))
+        rows.append(_pack_row(mtime_ns, size, summary, strings))
+
+    heap_offset = _HEADER.size + _ROW.size * len(rows)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(rows), heap_offset))
+        for row in rows:
+            handle.write(row)
+        handle.write(heap)
+    os.replace(tmp_path, path)
+
+
+class MonsterCatalog:
+    """Read-only view over a catalog file; rows are addressed by index or filename."""
+
+    def __init__(self, path: Path, handle: Any, mapping: mmap.mmap, count: int, heap_offset: int) -> None:
+        self.path = path
+        self.count = count
+        self._handle = handle
+        self._mm = mapping
+        self._heap_offset = heap_offset
+        self._by_filename: Dict[str, int] = {}
+        for index in range(count):
+            self._by_filename[self._string(index, "filename")] = index
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["MonsterCatalog"]:
+        """Map ``path``; None when it is missing, truncated or from another format version."""
+        try:
+            handle = open(path, "rb")
+        except OSError:
+            return None
+        try:
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            handle.close()
+            return None
+        try:
+            magic, version, count, heap_offset = _HEADER.unpack_from(mapping, 0)
+            if magic != MAGIC or version != FORMAT_VERSION or heap_offset != _HEADER.size + _ROW.size * count:
+                raise ValueError("catalog header mismatch")
+            if heap_offset > len(mapping):
+                raise ValueError("catalog truncated")
+            return cls(path, handle, mapping, count, heap_offset)
+        except Exception:
+            mapping.close()
+            handle.close()
+            return None
+
+    def close(self) -> None:
+        try:
+            self._mm.close()
+        finally:
+            self._handle.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _row(self, index: int) -> Tuple[Any, ...]:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return _ROW.unpack_from(self._mm, _HEADER.size + _ROW.size * index)
+
+    def _bytes(self, row: Tuple[Any, ...], column: str) -> bytes:
+        slot = _STR_BASE + 2 * STRING_COLUMNS.index(column)
+        offset, length = row[slot], row[slot + 1]
+        if not length:
+            return b""
+        start = self._heap_offset + offset
+        return self._mm[start : start + length]
+
+    def _string(self, index: int, column: str) -> str:
+        return self._bytes(self._row(index), column).decode("utf-8")
+
+    def find(self, filename: str) -> Optional[int]:
+        return self._by_filename.get(filename)
+
+    def filenames(self) -> List[str]:
+        return list(self._by_filename)
+
+    def stat(self, index: int) -> Tuple[int, int]:
+        row = self._row(index)
+        return (row[0], row[1])
+
+    def summary(self, index: int) -> Dict[str, Any]:
+        """The summary dict the tracker builds MonsterSpecs from, read from the row columns."""
+        row = self._row(index)
+        ints = {
+            column: (None if value == _INT_NONE else value)
+            for column, value in zip(INT_COLUMNS, row[_INT_BASE:_STR_BASE])
+        }
+        scores = {ability: ints[f"score_{ability}"] for ability in ABILITIES if ints[f"score_{ability}"] is not None}
+        summary: Dict[str, Any] = {
+            column: ints[column]
+            for column in INT_COLUMNS
+            if not column.startswith(("score_", "save_"))
+        }
+        summary["cr"] = None if math.isnan(row[2]) else row[2]
+        summary["abilities"] = scores
+        summary["ability_mods"] = {ability: (score - 10) // 2 for ability, score in scores.items()}
+        summary["saving_throws"] = {
+            ability: ints[f"save_{ability}"] for ability in ABILITIES if ints[f"save_{ability}"] is not None
+        }
+        for column in ("name", "mtype", "cr_label", "turn_schedule_mode", "turn_schedule_counts"):
+            value = self._bytes(row, column)
+            summary[column] = value.decode("utf-8") if value else None
+        return summary
+
+    def detail_bytes(self, index: int) -> bytes:
+        return self._bytes(self._row(index), "detail")
+
+    def detail(self, index: int) -> Optional[Dict[str, Any]]:
+        """Decode one monster's raw_data; None when the row carries no blob."""
+        blob = self.detail_bytes(index)
+        if not blob:
+            return None
+        data = json.loads(blob.decode("utf-8"))
+        return data if isinstance(data, dict) else None
@@ -0,0 +1,129 @@
+"""Coalesced UI refresh scheduling for the Tk thread.
+
+Handlers that mutate combat state tend to refresh every view they might have touched
+(initiative table, map token groups, movement overlay, AoE "included" list, LAN state
+broadcast), and batch operations such as applying AoE damage or draining a tick's worth of
+LAN actions repeat that for every target/action. Inside :meth:`RefreshScheduler.batch`
+those refreshes only mark their region dirty; when the outermost batch ends a single
+``after_idle`` pass runs each dirty region once, after the state has settled.
+
+Outside a batch :meth:`RefreshScheduler.defer` returns ``False`` and callers refresh
+synchronously, exactly as before. :meth:`RefreshScheduler.stats` reports, per region, how
+many refreshes were requested inside batches, how many actually ran and how many were
+coalesced away.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+REGIONS = ("table", "map_tokens", "move_overlay", "aoe_includes", "lan_broadcast")
+
+
+class RefreshScheduler:
+    """Collect dirty UI regions during a batch and refresh each once on idle."""
+
+    def __init__(self, schedule: Callable[[Callable[[], None]], Any]) -> None:
+        # ``schedule`` is the Tk ``after_idle`` of the owning window.
+        self._schedule = schedule
+        self._depth = 0
+        self._flushing = False
+        self._scheduled = False
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._order: Dict[str, int] = {region: idx for idx, region in enumerate(REGIONS)}
+        self._requested: Dict[str, int] = {}
+        self._performed: Dict[str, int] = {}
+
+    @property
+    def batching(self) -> bool:
+        return self._depth > 0 and not self._flushing
+
+    @contextmanager
+    def batch(self) -> Iterator["RefreshScheduler"]:
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0 and self._pending and not self._scheduled:
+                self._scheduled = True
+                try:
+                    self._schedule(self.flush)
+                except Exception:
+                    # No event loop to defer to (window torn down): refresh right away.
+                    self.flush()
+
+    def defer(self, region: str, callback: Callable[..., Any], **flags: bool) -> bool:
+        """Mark ``region`` dirty if a batch is open; return ``False`` to refresh now.
+
+        Boolean ``flags`` are OR-merged across requests and passed to ``callback`` as
+        keyword arguments; the most recent ``callback`` for a region wins.
+        """
+        if not self.batching:
+            return False
+        self._requested[region] = self._requested.get(region, 0) + 1
+        entry = self._pending.get(region)
+        if entry is None:
+            self._pending[region] = {"callback": callback, "flags": dict(flags)}
+        else:
+            entry["callback"] = callback
+            merged = entry["flags"]
+            for key, value in flags.items():
+                merged[key] = bool(merged.get(key)) or bool(value)
+        return True
+
+    def flush(self) -> None:
+        """Run every dirty region once (table first, LAN broadcast last).
+
+        A failing refresh does not stop the others; the first error is re-raised once
+        they have all run, so Tk reports it like any other callback exception.
+        """
+        self._scheduled = False
+        if self._flushing:
+            return
+        pending, self._pending = self._pending, {}
+        error: Optional[BaseException] = None
+        self._flushing = True
+        try:
+            for region in sorted(pending, key=lambda name: self._order.get(name, len(self._order))):
+                entry = pending[region]
+                self._performed[region] = self._performed.get(region, 0) + 1
+                try:
+                    entry["callback"](**entry["flags"])
+                except Exception as exc:
+                    if error is None:
+                        error = exc
+        finally:
+            self._flushing = False
+        if error is not None:
+            raise error
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        out: Dict[str, Dict[str, int]] = {}
+        regions = sorted(set(self._requested) | set(self._performed), key=lambda name: self._order.get(name, len(self._order)))
+        for region in regions:
+            requested = self._requested.get(region, 0)
+            performed = self._performed.get(region, 0)
+            waiting = 1 if region in self._pending else 0
+            out[region] = {
+                "requested": requested,
+                "performed": performed,
+                "coalesced": max(0, requested - performed - waiting),
+            }
+        return out
+
+    def coalesced_total(self) -> int:
+        return sum(entry["coalesced"] for entry in self.stats().values())
+
+    def summary(self) -> str:
+        stats = self.stats()
+        parts = [f"{region} {entry['performed']}/{entry['requested']}" for region, entry in stats.items()]
+        total = sum(entry["coalesced"] for entry in stats.values())
+        return f"UI refreshes run/requested: {', '.join(parts) or 'none'}; {total} redundant refresh(es) skipped"
+
+
+def scheduler_for(owner: Any) -> Optional[RefreshScheduler]:
+    """The scheduler installed on ``owner`` (an app), without touching Tk ``__getattr__``."""
+    scheduler = getattr(owner, "__dict__", {}).get("_refresh_scheduler")
+    return scheduler if isinstance(scheduler, RefreshScheduler) else None
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark AoE token inclusion: 200 tokens x 20 AoEs on a 60x60 map.
+
+Compares the old per-token loop from _lan_compute_included_units_for_aoe with the
+shared aoe_geometry module on its pure-Python and NumPy backends.
+
+    python scripts/bench_aoe_geometry.py [--tokens 200] [--aoes 20] [--rounds 50]
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import aoe_geometry  # noqa: E402
+
+
+def make_aoes(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    aoes: List[Dict[str, Any]] = []
+    for idx in range(count):
+        cx, cy = rng.uniform(0, 60), rng.uniform(0, 60)
+        kind = ("sphere", "line", "cone", "cube", "square")[idx % 5]
+        aoe: Dict[str, Any] = {"kind": kind, "cx": cx, "cy": cy}
+        if kind == "sphere":
+            aoe["radius_sq"] = rng.uniform(2, 8)
+        elif kind == "line":
+            aoe.update(length_sq=rng.uniform(6, 24), width_sq=1.0, angle_deg=rng.uniform(0, 360))
+        elif kind == "cone":
+            aoe.update(length_sq=rng.uniform(3, 12), spread_deg=53.0, angle_deg=rng.uniform(0, 360))
+        else:
+            aoe.update(side_sq=rng.uniform(2, 8), angle_deg=rng.uniform(0, 90) if kind == "cube" else None)
+        aoes.append(aoe)
+    return aoes
+
+
+def legacy_included(aoe: Dict[str, Any], positions: Dict[int, Tuple[int, int]]) -> List[int]:
+    """The per-token loops _lan_compute_included_units_for_aoe used before aoe_geometry."""
+    kind = str(aoe.get("kind") or "").strip().lower()
+    cx = float(aoe.get("cx") or 0.0)
+    cy = float(aoe.get("cy") or 0.0)
+    included: List[int] = []
+    token_half = 0.5
+    if kind in ("circle", "sphere", "cylinder"):
+        r2 = float(aoe.get("radius_sq") or 0.0) ** 2
+        for cid, pos in positions.items():
+            if (float(pos[0]) - cx) ** 2 + (float(pos[1]) - cy) ** 2 <= r2:
+                included.append(cid)
+    elif kind in ("line", "wall"):
+        length_sq = float(aoe.get("length_sq") or 0.0)
+        width_sq = float(aoe.get("width_sq") or 0.0)
+        angle_rad = math.radians(float(aoe.get("angle_deg") or 0.0))
+        cos_a, sin_a = math.cos(-angle_rad), math.sin(-angle_rad)
+        for cid, pos in positions.items():
+            dx, dy = float(pos[0]) - cx, float(pos[1]) - cy
+            rx = dx * cos_a - dy * sin_a
+            ry = dx * sin_a + dy * cos_a
+            if abs(rx) <= (length_sq / 2.0) + token_half and abs(ry) <= (width_sq / 2.0):
+                included.append(cid)
+    elif kind == "cone":
+        length_sq = float(aoe.get("length_sq") or 0.0)
+        heading_rad = math.radians(float(aoe.get("angle_deg") or 0.0))
+        half_spread = math.radians(float(aoe.get("spread_deg") or 90.0) / 2.0)
+        for cid, pos in positions.items():
+            dx, dy = float(pos[0]) - cx, float(pos[1]) - cy
+            if math.hypot(dx, dy) > length_sq + token_half:
+                continue
+            angle = math.atan2(dy, dx) - heading_rad
+            while angle <= -math.pi:
+                angle += math.pi * 2
+            while angle > math.pi:
+                angle -= math.pi * 2
+            if abs(angle) <= half_spread:
+                included.append(cid)
+    else:
+        half = float(aoe.get("side_sq") or 0.0) / 2.0
+        angle = aoe.get("angle_deg") if kind in ("square", "cube") else None
+        if angle is None:
+            for cid, pos in positions.items():
+                if cx - half <= float(pos[0]) <= cx + half and cy - half <= float(pos[1]) <= cy + half:
+                    included.append(cid)
+        else:
+            angle_rad = math.radians(float(angle))
+            cos_a, sin_a = math.cos(-angle_rad), math.sin(-angle_rad)
+            for cid, pos in positions.items():
+                dx, dy = float(pos[0]) - cx, float(pos[1]) - cy
+                if abs(dx * cos_a - dy * sin_a) <= half and abs(dx * sin_a + dy * cos_a) <= half:
+                    included.append(cid)
+    return included
+
+
+def timed(label: str, fn: Callable[[], Any], rounds: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_call_ms = (time.perf_counter() - started) * 1000.0 / rounds
+    print(f"{label:<24} {per_call_ms:8.3f} ms/pass")
+    return per_call_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--aoes", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    positions = {cid: (rng.randrange(60), rng.randrange(60)) for cid in range(1, args.tokens + 1)}
+    footprints = {cid: [(pos[0] + dc, pos[1] + dr) for dc in range(2) for dr in range(2)] for cid, pos in positions.items() if cid % 10 == 0}
+    aoes = make_aoes(rng, args.aoes)
+    print(f"{args.tokens} tokens ({len(footprints)} Large), {args.aoes} AoEs, numpy={'yes' if aoe_geometry.HAVE_NUMPY else 'no'}")
+
+    legacy = timed("legacy per-token loop", lambda: [legacy_included(aoe, positions) for aoe in aoes], args.rounds)
+    backends = ["python"] + (["numpy"] if aoe_geometry.HAVE_NUMPY else [])
+    for backend in backends:
+        # Same work as the legacy loop (centre squares only), then with Large footprints.
+        elapsed = timed(
+            f"aoe_geometry[{backend}]",
+            lambda: [aoe_geometry.included_ids(aoe, positions, backend=backend) for aoe in aoes],
+            args.rounds,
+        )
+        print(f"{'':<24} {legacy / elapsed:8.1f}x vs legacy")
+        timed(
+            "  + Large footprints",
+            lambda: [aoe_geometry.included_ids(aoe, positions, footprints, backend=backend) for aoe in aoes],
+            args.rounds,
+        )
+
+
+if __name__ == "__main__":
+    main()
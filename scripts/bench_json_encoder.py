@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the LAN JSON encoders on a realistic static_data payload.
+
+Builds static_data from the repo's Spells/, players/ and Monsters/ YAML, then
+times the old recursive-sanitize _json_dumps against the stdlib and orjson
+encoder backends.
+
+    python scripts/bench_json_encoder.py [--rounds 20]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import dnd_initative_tracker as tracker_mod  # noqa: E402
+
+
+def load_yaml_dir(path: Path) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for file_path in sorted(path.glob("*.yaml")):
+        try:
+            data = yaml.safe_load(file_path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        if isinstance(data, dict):
+            out.append(data)
+    return out
+
+
+def static_data_payload() -> Dict[str, Any]:
+    spells = load_yaml_dir(ROOT / "Spells")
+    players = load_yaml_dir(ROOT / "players")
+    monsters = [
+        {"name": path.stem.replace("_", " ").title(), "slug": path.stem, "filename": path.name}
+        for path in sorted((ROOT / "Monsters").glob("*.yaml"))
+    ]
+    profiles = {str(p.get("name") or idx): p for idx, p in enumerate(players)}
+    return {
+        "spell_presets": spells,
+        "player_spells": {name: {"known": [s.get("name") for s in spells[:40]]} for name in profiles},
+        "player_profiles": profiles,
+        "resource_pools": {name: [{"id": "ki", "current": 4, "max": 4}] for name in profiles},
+        "consumables_library": [],
+        "monster_choices": monsters,
+        "conditions": ["blinded", "charmed", "prone"],
+        "dice_types": ["d4", "d6", "d8", "d10", "d12", "d20", "d100"],
+        "token_colours": ["#6aa9ff", "#ff6a6a"],
+    }
+
+
+def legacy_json_dumps(payload: Any) -> str:
+    """The pre-encoder-layer LanController._json_dumps, kept for comparison."""
+
+    def sanitize(value: Any) -> Any:
+        if isinstance(value, float):
+            return value if math.isfinite(value) else 0.0
+        if isinstance(value, dict):
+            return {key: sanitize(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple, set)):
+            return [sanitize(item) for item in value]
+        return value
+
+    def default(value: Any) -> Any:
+        if isinstance(value, Path):
+            return str(value)
+        if isinstance(value, (set, tuple)):
+            return list(value)
+        return str(value)
+
+    return json.dumps(sanitize(payload), allow_nan=False, default=default)
+
+
+def timed(label: str, fn: Callable[[Any], str], payload: Any, rounds: int) -> float:
+    fn(payload)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn(payload)
+    per_call_ms = (time.perf_counter() - started) * 1000.0 / rounds
+    print(f"{label:<22} {per_call_ms:8.2f} ms/encode")
+    return per_call_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = static_data_payload()
+    size_kib = len(legacy_json_dumps(payload)) / 1024
+    print(f"static_data: {len(payload['spell_presets'])} spells, {len(payload['monster_choices'])} monsters, "
+          f"{size_kib:.0f} KiB")
+    legacy = timed("legacy sanitize+dumps", legacy_json_dumps, payload, args.rounds)
+    for name, factory in tracker_mod.JSON_ENCODERS.items():
+        try:
+            encoder = factory()
+        except Exception as exc:
+            print(f"{name:<22} unavailable ({exc})")
+            continue
+        elapsed = timed(f"{name} encoder", encoder.dumps, payload, args.rounds)
+        print(f"{'':<22} {legacy / elapsed:8.1f}x vs legacy")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark the LAN state broadcast: 20 simulated clients, 40-combatant snapshot.
+
+Compares the old per-client serialize + sequential send loop with the
+serialize-once fan-out used by LanController._broadcast_state_async.
+
+    python scripts/bench_lan_broadcast.py [--clients 20] [--units 40] [--rounds 50] [--latency-ms 2]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import dnd_initative_tracker as tracker_mod  # noqa: E402
+
+
+class SimulatedSocket:
+    def __init__(self, latency_s: float) -> None:
+        self.latency_s = latency_s
+        self.bytes_sent = 0
+
+    async def send_text(self, text: str) -> None:
+        await asyncio.sleep(self.latency_s)
+        self.bytes_sent += len(text)
+
+
+def fake_unit(cid: int) -> Dict[str, Any]:
+    action = {"name": "Scimitar", "type": "action", "description": "Melee weapon attack. " * 4, "uses": None}
+    row: Dict[str, Any] = {
+        "cid": cid,
+        "name": f"Goblin {cid}",
+        "role": "enemy",
+        "hp": 7,
+        "max_hp": 7,
+        "pos": {"col": cid % 20, "row": cid // 20},
+        "actions": [dict(action) for _ in range(4)],
+        "bonus_actions": [dict(action, type="bonus_action")],
+        "reactions": [dict(action, type="reaction")],
+        "marks": "",
+        "effects": [],
+        "beguiling_magic_window_s": 0.0,
+    }
+    for idx in range(48):
+        row[f"field_{idx}"] = float(idx) if idx % 3 else None
+    return row
+
+
+def make_controller(clients: int, units: int, latency_s: float) -> tracker_mod.LanController:
+    state = {"units": [fake_unit(cid) for cid in range(1, units + 1)], "round_num": 3, "active_cid": 1}
+    pcs = [{"cid": cid, "name": f"PC {cid}", "claimed_by": None} for cid in range(1, 6)]
+    lan = object.__new__(tracker_mod.LanController)
+    lan._clients_lock = threading.Lock()
+    lan._clients = {ws_id: SimulatedSocket(latency_s) for ws_id in range(1, clients + 1)}
+    lan._clients_meta = {}
+    lan._client_hosts = {}
+    lan._view_only_clients = set()
+    lan._send_timeout_s = 2.0
+    lan._outbox_max_frames = 256
+    lan._drop_claim = lambda ws_id: None
+    lan._log_lan_exception = lambda *args, **kwargs: None
+    lan._dynamic_snapshot_payload = lambda: state
+    lan._pcs_payload = lambda: pcs
+    lan._build_you_payload = lambda ws_id: {"claimed_cid": ws_id % 5 or None, "claimed_name": None, "claim_rev": 1}
+    return lan
+
+
+async def legacy_broadcast(lan: tracker_mod.LanController) -> None:
+    state_data = lan._dynamic_snapshot_payload()
+    pcs_data = lan._pcs_payload()
+    for ws_id, ws in list(lan._clients.items()):
+        payload = lan._json_dumps({"type": "state", "state": state_data, "pcs": pcs_data, "you": lan._build_you_payload(ws_id)})
+        await ws.send_text(payload)
+
+
+async def fan_out_broadcast(lan: tracker_mod.LanController) -> None:
+    await lan._broadcast_state_async({})
+    await lan._wait_outboxes_idle()
+
+
+async def timed(label: str, fn, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await fn()
+    per_call_ms = (time.perf_counter() - started) * 1000.0 / rounds
+    print(f"{label:<28} {per_call_ms:8.2f} ms/broadcast")
+    return per_call_ms
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    lan = make_controller(args.clients, args.units, args.latency_ms / 1000.0)
+    sample = lan._json_dumps({"type": "state", "state": lan._dynamic_snapshot_payload(), "pcs": lan._pcs_payload()})
+    print(f"{args.clients} clients, {args.units} combatants, {len(sample) / 1024:.1f} KiB/state, "
+          f"{args.latency_ms:.1f} ms simulated send latency")
+    legacy = await timed("per-client + sequential", lambda: legacy_broadcast(lan), args.rounds)
+    fanout = await timed("serialize-once + fan-out", lambda: fan_out_broadcast(lan), args.rounds)
+    print(f"speedup: {legacy / fanout:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--units", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
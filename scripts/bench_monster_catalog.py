@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark: JSON monster index vs the memory-mapped monster catalog.
+
+Each measured run is a fresh interpreter that loads the repo's Monsters/ library
+from an already-built cache, the way the tracker does at launch:
+
+* json    - logs/monster_index.json (v5 summary rows): rglob + stat, json.load,
+            build MonsterSpecs, write the index back out
+* catalog - logs/monster_catalog.bin: scandir + stat, mmap, build MonsterSpecs
+
+    python scripts/bench_monster_catalog.py [--runs 5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def make_app(tracker_mod: Any, monsters_dir: Path) -> Any:
+    app = object.__new__(tracker_mod.InitiativeTracker)
+    app._log = lambda *args, **kwargs: None
+    app._monsters_dir_path = lambda: monsters_dir
+    app._monster_specs = []
+    app._monsters_by_name = {}
+    app._wild_shape_beast_cache = None
+    app._wild_shape_available_cache = {}
+    app._wild_shape_available_cache_source = None
+    return app
+
+
+def build_json_index(tracker_mod: Any, monsters_dir: Path, index_path: Path) -> None:
+    entries: Dict[str, Any] = {}
+    for fp in sorted(p for p in monsters_dir.rglob("*") if p.is_file() and p.suffix.lower() in {".yml", ".yaml"}):
+        parsed = tracker_mod._parse_monster_yaml_text(fp.read_text(encoding="utf-8"))
+        if parsed is None:
+            continue
+        summary = make_app(tracker_mod, monsters_dir)._monster_summary_from_yaml(parsed[0])
+        if summary is None:
+            continue
+        meta = tracker_mod._file_stat_metadata(fp)
+        entries[fp.relative_to(monsters_dir).as_posix()] = {"mtime_ns": meta["mtime_ns"], "size": meta["size"], "summary": summary}
+    tracker_mod._write_index_file(index_path, {"version": 5, "entries": entries})
+
+
+def json_index_start(tracker_mod: Any, app: Any, monsters_dir: Path, index_path: Path) -> int:
+    """The warm-cache path of _load_monsters_index before the catalog replaced it."""
+    files = sorted(
+        [fp for fp in monsters_dir.rglob("*") if fp.is_file() and fp.suffix.lower() in {".yml", ".yaml"}],
+        key=lambda fp: fp.relative_to(monsters_dir).as_posix().lower(),
+    )
+    index_data = tracker_mod._read_index_file(index_path)
+    cached = index_data.get("entries") if isinstance(index_data.get("entries"), dict) else {}
+    new_entries: Dict[str, Any] = {}
+    specs = []
+    by_name: Dict[str, Any] = {}
+    for fp in files:
+        rel_key = fp.relative_to(monsters_dir).as_posix()
+        entry = cached.get(rel_key)
+        meta = tracker_mod._file_stat_metadata(fp)
+        if isinstance(entry, dict) and tracker_mod._metadata_matches(entry, meta):
+            spec = app._monster_spec_from_summary(rel_key, entry["summary"])
+            specs.append(spec)
+            by_name.setdefault(spec.name, spec)
+            new_entries[rel_key] = entry
+    specs.sort(key=lambda spec: (spec.name.lower(), str(spec.filename).lower()))
+    app._monster_specs = specs
+    app._monsters_by_name = by_name
+    tracker_mod._write_index_file(index_path, {"version": 5, "entries": new_entries})
+    return len(app._monster_specs)
+
+
+def child(mode: str, monsters_dir: Path, logs_dir: Path) -> None:
+    import dnd_initative_tracker as tracker_mod
+
+    app = make_app(tracker_mod, monsters_dir)
+    with mock.patch.object(tracker_mod, "_ensure_logs_dir", return_value=logs_dir):
+        started = time.perf_counter()
+        if mode == "json":
+            count = json_index_start(tracker_mod, app, monsters_dir, logs_dir / "monster_index.json")
+        else:
+            app._load_monsters_index()
+            count = len(app._monster_specs)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+    print(json.dumps({"ms": elapsed_ms, "count": count}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--monsters", type=Path, default=ROOT / "Monsters")
+    parser.add_argument("--child", choices=("json", "catalog"))
+    parser.add_argument("--logs", type=Path)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.monsters, args.logs)
+        return
+
+    import dnd_initative_tracker as tracker_mod
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logs_dir = Path(tmp)
+        build_json_index(tracker_mod, args.monsters, logs_dir / "monster_index.json")
+        with mock.patch.object(tracker_mod, "_ensure_logs_dir", return_value=logs_dir):
+            make_app(tracker_mod, args.monsters)._load_monsters_index()
+        sizes = {name: (logs_dir / name).stat().st_size / 1e6 for name in ("monster_index.json", "monster_catalog.bin")}
+        print(f"monsters dir: {args.monsters}")
+        print(f"monster_index.json {sizes['monster_index.json']:.2f} MB, monster_catalog.bin {sizes['monster_catalog.bin']:.2f} MB")
+        for mode in ("json", "catalog"):
+            samples = []
+            count = 0
+            for _ in range(args.runs):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, "--monsters", str(args.monsters), "--logs", str(logs_dir)],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+                result = json.loads(out.stdout.strip().splitlines()[-1])
+                samples.append(result["ms"])
+                count = result["count"]
+            print(f"{mode:<8} {count} specs  median {statistics.median(samples):7.1f} ms  min {min(samples):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,7 @@ class AbsorbElementsReactionTests(unittest.TestCase):
         self.app._action_name_key = lambda v: str(v or "").strip().lower()
         self.app._lan_aura_effects_for_target = lambda target: {}
         self.app._apply_damage_to_target_with_temp_hp = (
-            lambda target, dmg: setattr(target, "hp", max(0, int(target.hp) - int(dmg))) or {"hp_after": int(target.hp)}
+            lambda target, dmg, source_cid=None: setattr(target, "hp", max(0, int(target.hp) - int(dmg))) or {"hp_after": int(target.hp)}
         )
         self.app._remove_combatants_with_lan_cleanup = lambda cids: None
         self.app._retarget_current_after_removal = lambda *args, **kwargs: None
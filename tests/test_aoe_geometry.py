@@ -0,0 +1,104 @@
+import math
+import random
+import unittest
+
+import aoe_geometry
+
+
+def _shapes():
+    return [
+        {"kind": "sphere", "cx": 5.0, "cy": 5.0, "radius_sq": 3.0},
+        {"kind": "line", "cx": 4.0, "cy": 6.0, "length_sq": 8.0, "width_sq": 1.0, "angle_deg": 30.0},
+        {"kind": "wall", "cx": 3.0, "cy": 3.0, "length_sq": 6.0, "width_sq": 1.0, "orient": "horizontal"},
+        {"kind": "cone", "cx": 2.0, "cy": 2.0, "length_sq": 6.0, "spread_deg": 53.0, "angle_deg": 45.0},
+        {"kind": "cone", "cx": 6.0, "cy": 6.0, "length_sq": 4.0, "orient": "vertical"},
+        {"kind": "cube", "cx": 7.0, "cy": 3.0, "side_sq": 3.0, "angle_deg": 20.0},
+        {"kind": "square", "cx": 1.5, "cy": 8.5, "side_sq": 2.0},
+    ]
+
+
+def _legacy_contains(effect, col, row):
+    """The per-cell test _map_effect_contains_cell used before aoe_geometry."""
+    kind = effect["kind"]
+    cx, cy = effect["cx"], effect["cy"]
+    px, py = float(col), float(row)
+    if kind in ("circle", "sphere", "cylinder"):
+        return ((px - cx) ** 2 + (py - cy) ** 2) <= effect["radius_sq"] ** 2
+    if kind in ("line", "wall"):
+        angle = effect.get("angle_deg")
+        if angle is None:
+            angle = 0.0 if effect.get("orient") == "horizontal" else 90.0
+        rad = math.radians(angle)
+        dx, dy = px - cx, py - cy
+        rx = dx * math.cos(-rad) - dy * math.sin(-rad)
+        ry = dx * math.sin(-rad) + dy * math.cos(-rad)
+        return abs(rx) <= effect["length_sq"] / 2.0 and abs(ry) <= effect["width_sq"] / 2.0
+    if kind == "cone":
+        dx, dy = px - cx, py - cy
+        if math.hypot(dx, dy) > effect["length_sq"]:
+            return False
+        if "spread_deg" in effect:
+            spread, heading = effect["spread_deg"], effect["angle_deg"]
+        else:
+            spread, heading = 90.0, (0.0 if effect.get("orient") == "horizontal" else -90.0)
+        delta = math.atan2(dy, dx) - math.radians(heading)
+        delta = (delta + math.pi) % (2 * math.pi) - math.pi
+        return abs(delta) <= math.radians(spread / 2.0) + 1e-9
+    half = effect["side_sq"] / 2.0
+    angle = effect.get("angle_deg")
+    if angle is None:
+        return cx - half <= px <= cx + half and cy - half <= py <= cy + half
+    rad = math.radians(angle)
+    dx, dy = px - cx, py - cy
+    return abs(dx * math.cos(-rad) - dy * math.sin(-rad)) <= half and abs(dx * math.sin(-rad) + dy * math.cos(-rad)) <= half
+
+
+class AoeGeometryTests(unittest.TestCase):
+    def test_contains_point_matches_previous_formulas(self):
+        for shape in _shapes():
+            for col in range(-2, 14):
+                for row in range(-2, 14):
+                    self.assertEqual(aoe_geometry.contains_point(shape, col, row), _legacy_contains(shape, col, row), (shape, col, row))
+
+    def test_covered_cells_agree_with_contains_point(self):
+        for shape in _shapes():
+            expected = [
+                (col, row)
+                for row in range(-10, 20)
+                for col in range(-10, 20)
+                if aoe_geometry.contains_point(shape, col, row)
+            ]
+            self.assertEqual(aoe_geometry.covered_cells(shape, backend="python"), expected, shape)
+
+    def test_token_padding_extends_lines_and_cones_only(self):
+        line = {"kind": "line", "cx": 0.0, "cy": 0.0, "length_sq": 4.0, "width_sq": 1.0, "angle_deg": 0.0}
+        sphere = {"kind": "sphere", "cx": 0.0, "cy": 0.0, "radius_sq": 2.0}
+        positions = {"a": (2.5, 0.0), "b": (2.4, 0.0), "c": (0.0, 2.2)}
+
+        self.assertEqual(aoe_geometry.included_ids(line, positions), ["a", "b"])
+        self.assertEqual(aoe_geometry.included_ids(line, positions, pad=0.0), [])
+        self.assertEqual(aoe_geometry.included_ids(sphere, positions), [])
+
+    def test_large_footprint_counts_when_any_square_is_inside(self):
+        sphere = {"kind": "sphere", "cx": 0.0, "cy": 0.0, "radius_sq": 1.0}
+        positions = {1: (2, 0), 2: (2, 0), 3: (0, 0)}
+        footprints = {2: [(1, 0), (2, 0), (1, 1), (2, 1)]}
+
+        self.assertEqual(aoe_geometry.included_ids(sphere, positions, footprints), [2, 3])
+
+    @unittest.skipUnless(aoe_geometry.HAVE_NUMPY, "numpy not installed")
+    def test_numpy_backend_matches_python(self):
+        rng = random.Random(3)
+        positions = {cid: (rng.randrange(20), rng.randrange(20)) for cid in range(200)}
+        footprints = {cid: [(pos[0] + 1, pos[1]), pos] for cid, pos in positions.items() if cid % 7 == 0}
+        for shape in _shapes():
+            self.assertEqual(
+                aoe_geometry.included_ids(shape, positions, footprints, backend="numpy"),
+                aoe_geometry.included_ids(shape, positions, footprints, backend="python"),
+                shape,
+            )
+            self.assertEqual(aoe_geometry.covered_cells(shape, backend="numpy"), aoe_geometry.covered_cells(shape, backend="python"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import battle_log
+import dnd_initative_tracker as tracker_mod
+
+
+class BattleLogTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "battle.log"
+
+    def _log(self, **kwargs):
+        log = battle_log.BattleLog(self.path, **kwargs)
+        self.addCleanup(log.close)
+        return log
+
+    def test_appends_are_batched_and_indexed(self):
+        self.path.write_text("[old]\tkept\n", encoding="utf-8")
+        log = self._log(flush_interval=60.0)
+        for n in range(5):
+            log.append(f"[t{n}]", f"line {n}")
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "[old]\tkept\n")
+        self.assertEqual(log.recent(2), ["[t3]\tline 3", "[t4]\tline 4"])
+
+        self.assertTrue(log.flush())
+        self.assertEqual(len(self.path.read_text(encoding="utf-8").splitlines()), 6)
+        self.assertEqual(log.line_count(), 6)
+        self.assertEqual(log.page(1, 2), ["[t0]\tline 0", "[t1]\tline 1"])
+        self.assertEqual(log.page(5, 10), ["[t4]\tline 4"])
+
+    def test_tail_cursor_and_rewrite(self):
+        log = self._log(flush_interval=0.0)
+        cursor = log.last_seq
+        log.append("[a]", "first")
+        log.append("[b]", "second")
+        entries, cursor, complete = log.entries_since(cursor)
+        self.assertTrue(complete)
+        self.assertEqual([entry.content for entry in entries], ["first", "second"])
+
+        log.rewrite(["[c]\tloaded"])
+        self.assertEqual(log.entries_since(cursor)[2], False)
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "[c]\tloaded\n")
+        entries, fresh, complete = log.entries_since(log.last_seq)
+        self.assertEqual((entries, complete), ([], True))
+
+    def test_ring_overflow_requests_snapshot(self):
+        log = self._log(ring_size=2, flush_interval=0.0)
+        cursor = log.last_seq
+        for n in range(4):
+            log.append("", f"line {n}")
+        self.assertFalse(log.entries_since(cursor)[2])
+        self.assertIsNone(log.recent(3))
+        log.flush()
+        self.assertEqual(log.page(1, 3), ["line 1", "line 2", "line 3"])
+
+    def test_rotation_starts_a_fresh_file(self):
+        log = self._log(max_bytes=60, backups=2, flush_interval=0.0)
+        for n in range(3):
+            log.append("[stamp]", f"entry number {n}")
+            log.flush()
+        rotated = self.path.with_name("battle.log.1")
+        self.assertTrue(rotated.exists())
+        self.assertFalse(self.path.exists())
+        self.assertEqual(log.recent(3)[-1], "[stamp]\tentry number 2")
+        log.append("[stamp]", "after rotation")
+        log.flush()
+        self.assertEqual(log.line_count(), 1)
+        self.assertEqual(log.page(0, 0), ["[stamp]\tafter rotation"])
+        self.assertEqual(
+            log.history(),
+            [f"[stamp]\tentry number {n}" for n in range(3)] + ["[stamp]\tafter rotation"],
+        )
+
+        log.rewrite(["[c]\tloaded"])
+        self.assertFalse(rotated.exists())
+        self.assertEqual(log.history(), ["[c]\tloaded"])
+
+
+class TrackerBattleLogTests(unittest.TestCase):
+    def test_lan_lines_come_from_the_ring_buffer(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "battle.log"
+            path.write_text("".join(f"[s]\tline {n}\n" for n in range(10)), encoding="utf-8")
+            app = object.__new__(tracker_mod.InitiativeTracker)
+            app._history_file_path = lambda: path
+            self.assertEqual(app._lan_battle_log_lines(limit=2), ["[s]\tline 8", "[s]\tline 9"])
+            self.assertEqual(len(app._lan_battle_log_lines(limit=0)), 10)
+            page = app._lan_battle_log_page(before=5, limit=2)
+            self.assertEqual(page, {"lines": ["[s]\tline 3", "[s]\tline 4"], "start": 3, "total": 10})
+            app._battle_log().close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import beast_forms
+import dnd_initative_tracker as tracker_mod
+
+
+def _form(form_id, cr, size="Medium", **speed):
+    return {
+        "id": form_id,
+        "name": form_id.replace("-", " ").title(),
+        "challenge_rating": cr,
+        "size": size,
+        "speed": {"walk": speed.get("walk", 30), "swim": speed.get("swim", 0), "fly": speed.get("fly", 0), "climb": 0},
+    }
+
+
+class BeastFormTableTests(unittest.TestCase):
+    def setUp(self):
+        self.forms = [
+            _form("cat", 0.0, size="Tiny"),
+            _form("eagle", 0.0, fly=60),
+            _form("wolf", 0.25),
+            _form("reef-shark", 0.5, walk=0, swim=40),
+            _form("brown-bear", 1.0),
+            _form("giant-scorpion", 3.0),
+        ]
+        self.table = beast_forms.BeastFormTable(self.forms, "abc")
+
+    def test_indexes(self):
+        self.assertIs(self.table.by_id["wolf"], self.forms[2])
+        self.assertEqual([f["id"] for f in self.table.by_band[0.25]], ["cat", "eagle", "wolf"])
+        self.assertEqual(self.table.by_movement["fly"], {"eagle"})
+        self.assertEqual(self.table.by_movement["swim"], {"reef-shark"})
+        self.assertIsNone(beast_forms.cr_band(3.0))
+
+    def test_rule_results_are_memoized_per_tier(self):
+        rules = beast_forms.wild_shape_rules(4)
+        results = self.table.wild_shape_forms(rules)
+        self.assertIs(self.table.wild_shape_forms(beast_forms.wild_shape_rules(5)), results)
+        allowed = {form["id"] for form, ok in results if ok}
+        self.assertEqual(allowed, {"wolf", "reef-shark"})
+        self.assertNotIn("giant-scorpion", {form["id"] for form, _ok in results})
+
+    def test_persisted_table_requires_matching_fingerprint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "beast_forms.json"
+            self.table.save(path)
+            loaded = beast_forms.BeastFormTable.load(path, "abc")
+            self.assertEqual([f["id"] for f in loaded.forms], [f["id"] for f in self.forms])
+            self.assertIsNone(beast_forms.BeastFormTable.load(path, "other"))
+
+
+class TrackerBeastFormPersistenceTests(unittest.TestCase):
+    def _spec(self, detail_loader):
+        return tracker_mod.MonsterSpec(
+            filename="wolf.yaml",
+            name="Wolf",
+            mtype="Beast",
+            cr=0.25,
+            hp=11,
+            speed=40,
+            swim_speed=0,
+            fly_speed=0,
+            burrow_speed=0,
+            climb_speed=0,
+            dex=15,
+            init_mod=2,
+            saving_throws={},
+            ability_mods={},
+            raw_data={},
+            detail_loader=detail_loader,
+        )
+
+    def _app(self, specs):
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._wild_shape_beast_cache = None
+        app._monster_specs = specs
+        app._monster_catalog_fingerprint = "fp-1"
+        return app
+
+    def test_second_load_reads_persisted_table_without_monster_details(self):
+        raw = {"name": "Wolf", "type": "Beast", "challenge_rating": "1/4", "size": "Medium", "speed": "40 ft."}
+        goblin = self._spec(lambda spec: {"name": "Goblin", "type": "Humanoid"})
+        goblin.mtype = "Humanoid"
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            tracker_mod, "_ensure_logs_dir", return_value=Path(tmp)
+        ):
+            first = self._app([self._spec(lambda spec: dict(raw)), goblin])._load_beast_forms()
+            self.assertEqual([form["id"] for form in first], ["wolf"])
+
+            untouched = self._spec(mock.Mock(side_effect=AssertionError("decoded monster details")))
+            app = self._app([untouched])
+            self.assertEqual(app._load_beast_forms(), first)
+            known = app._wild_shape_available_forms(
+                {"leveling": {"classes": [{"name": "Druid", "level": 2}]}, "prepared_wild_shapes": ["wolf"]}
+            )
+            self.assertEqual([form["id"] for form in known], ["wolf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+import combat_events
+import dnd_initative_tracker as tracker_mod
+
+
+class CombatEventStoreTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.store = combat_events.CombatEventStore(Path(self._tmp.name) / "events.sqlite3", flush_interval=0.0)
+        self.addCleanup(self.store.close)
+
+    def test_queries_filter_by_round_combatant_and_type(self):
+        self.store.record("move", round_num=1, cid=1, data={"cost_ft": 10})
+        self.store.record("damage", round_num=1, target_cid=2, data={"amount": 7})
+        self.store.record("attack", round_num=2, cid=2, target_cid=1, data={"hit": True})
+        self.store.flush()
+
+        self.assertEqual([e["type"] for e in self.store.query(round_num=1)], ["move", "damage"])
+        self.assertEqual([e["type"] for e in self.store.query(cid=2)], ["damage", "attack"])
+        self.assertEqual(self.store.query(kind="attack")[0]["data"], {"hit": True})
+
+    def test_pages_by_id_cursor_and_session(self):
+        for n in range(5):
+            self.store.record("log", data={"text": f"line {n}"})
+        self.store.flush()
+        first = self.store.query(limit=2)
+        rest = self.store.query(after=first[-1]["id"], limit=10)
+        self.assertEqual([e["data"]["text"] for e in first + rest], [f"line {n}" for n in range(5)])
+
+        old_session = self.store.session
+        self.store.begin_session()
+        self.store.record("turn_start", cid=1)
+        self.store.flush()
+        self.assertEqual(len(self.store.query()), 1)
+        self.assertEqual(len(self.store.query(session=old_session)), 5)
+        self.assertEqual(len(self.store.query(session="*")), 6)
+
+    def test_unknown_event_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.store.record("teleport")
+
+
+class TrackerCombatEventTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.store = combat_events.CombatEventStore(Path(self._tmp.name) / "events.sqlite3", flush_interval=0.0)
+        self.addCleanup(self.store.close)
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app.round_num = 3
+        app.turn_num = 2
+        app._next_stack_id = 1
+        app._combat_event_service = self.store
+        self.app = app
+
+    def test_condition_changes_are_recorded(self):
+        target = types.SimpleNamespace(cid=4, condition_stacks=[])
+        self.app._ensure_condition_stack(target, "prone", None)
+        self.app._ensure_condition_stack(target, "prone", 2)
+        self.app._remove_condition_type(target, "prone")
+        self.app._remove_condition_type(target, "prone")
+
+        events = self.app._combat_events_page(kind="condition")["events"]
+        self.assertEqual([e["data"]["action"] for e in events], ["apply", "remove"])
+        self.assertEqual({(e["round"], e["target_cid"]) for e in events}, {(3, 4)})
+
+    def test_lan_attack_result_is_recorded(self):
+        msg = {"_attack_result": {"type": "attack_result", "ok": True, "attacker_cid": 1, "target_cid": 2, "hit": True}}
+        tracker_mod._record_lan_action_events(self.app, msg)
+        tracker_mod._record_lan_action_events(self.app, {"_spell_target_result": {"ok": False}})
+
+        page = self.app._combat_events_page(cid=2)
+        self.assertEqual([(e["type"], e["cid"], e["data"]) for e in page["events"]], [("attack", 1, {"hit": True})])
+        self.assertIsNone(page["next_after"])
+
+    def test_damage_event_records_the_source_combatant(self):
+        self.app._refresh_monster_phase_for_combatant = lambda *args, **kwargs: None
+        target = types.SimpleNamespace(cid=2, hp=10, temp_hp=3, condition_stacks=[])
+
+        self.app._apply_damage_to_target_with_temp_hp(target, 5, source_cid=1)
+
+        events = self.app._combat_events_page(cid=1, kind="damage")["events"]
+        self.assertEqual([(e["cid"], e["target_cid"]) for e in events], [(1, 2)])
+        self.assertEqual(events[0]["data"]["hp_damage"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
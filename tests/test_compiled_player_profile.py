@@ -0,0 +1,78 @@
+import unittest
+
+import dnd_initative_tracker as tracker_mod
+
+
+def _raw_profile(pool_max=3):
+    return {
+        "name": "Aria",
+        "leveling": {"level": 5},
+        "resources": {"pools": [{"id": "ki", "max": pool_max, "current": 2}]},
+        "features": [
+            {
+                "id": "patient_defense",
+                "name": "Patient Defense",
+                "grants": {
+                    "actions": [{"name": "Dodge", "activation": "bonus_action", "consumes": {"pool": "ki"}}],
+                    "modifiers": [{"target": "ac", "value": 1}],
+                },
+            }
+        ],
+    }
+
+
+class CompiledPlayerProfileTests(unittest.TestCase):
+    def setUp(self):
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._oplog = lambda *args, **kwargs: None
+        app._load_player_yaml_cache = lambda: None
+        app._augment_resource_pools_with_temporary_conditions = lambda payload: None
+        self.profile = app._normalize_player_profile(_raw_profile(), "aria")
+        app._player_yaml_data_by_name = {"Aria": self.profile}
+        self.app = app
+
+    def test_profile_is_compiled_once_per_generation(self):
+        compiled = self.app._compiled_player_profile(self.profile)
+        self.assertIs(self.app._compiled_player_profile(self.profile), compiled)
+        self.assertEqual(compiled.resource_pools[0]["max"], 3)
+
+        pools = self.app._normalize_player_resource_pools(self.profile)
+        pools[0]["max"] = 99
+        self.assertEqual(self.app._player_resource_pools_payload()["Aria"][0]["max"], 3)
+
+    def test_feature_grants_are_compiled_with_the_profile(self):
+        compiled = self.app._compiled_player_profile(self.profile)
+        self.assertEqual([feature["id"] for feature in compiled.active_features], ["patient_defense"])
+        self.assertEqual(
+            [action["name"] for action in compiled.feature_runtime["compiled_actions"]["bonus_actions"]], ["Dodge"]
+        )
+
+        calls = []
+        self.app._active_magic_item_features = lambda profile: calls.append(profile) or []
+        runtime = self.app._feature_runtime_from_profile(self.profile)
+        runtime["compiled_actions"]["bonus_actions"].clear()
+        self.app._all_active_features(self.profile)[0]["grants"].clear()
+
+        self.assertEqual(calls, [])
+        self.assertEqual(self.app._feature_runtime_from_profile(self.profile), compiled.feature_runtime)
+        self.assertEqual(len(compiled.feature_runtime["compiled_actions"]["bonus_actions"]), 1)
+        self.assertIn("modifiers", self.app._all_active_features(self.profile)[0]["grants"])
+
+    def test_replaced_profile_recompiles(self):
+        compiled = self.app._compiled_player_profile(self.profile)
+        updated = self.app._normalize_player_profile(_raw_profile(pool_max=5), "aria")
+        self.app._player_yaml_data_by_name = {"Aria": updated}
+
+        recompiled = self.app._compiled_player_profile(updated)
+        self.assertIsNot(recompiled, compiled)
+        self.assertEqual(recompiled.resource_pools[0]["max"], 5)
+        self.assertIsNone(self.app._compiled_player_profile(self.profile))
+
+    def test_uncached_profiles_are_not_compiled(self):
+        detached = self.app._normalize_player_profile(_raw_profile(pool_max=4), "aria")
+        self.assertIsNone(self.app._compiled_player_profile(detached))
+        self.assertEqual(self.app._normalize_player_resource_pools(detached)[0]["max"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
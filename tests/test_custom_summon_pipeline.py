@@ -1,4 +1,3 @@
-import json
 import tempfile
 import threading
 import unittest
@@ -199,11 +198,10 @@ class MonsterIndexTempResolutionTests(unittest.TestCase):
             self.assertEqual(resolved_root.name, "Root Goblin")
             self.assertEqual(resolved_temp.name, "Temp Goblin")
 
-            cache_path = tracker_mod._ensure_logs_dir() / "monster_index.json"
-            cache = json.loads(cache_path.read_text(encoding="utf-8"))
-            self.assertEqual(cache.get("version"), 4)
-            self.assertIn("goblin.yaml", cache.get("entries", {}))
-            self.assertIn("temp/goblin.yaml", cache.get("entries", {}))
+            catalog = app._monster_catalog
+            self.assertEqual(catalog.path, tracker_mod._ensure_logs_dir() / "monster_catalog.bin")
+            self.assertIn("goblin.yaml", catalog.filenames())
+            self.assertIn("temp/goblin.yaml", catalog.filenames())
 
             lan = object.__new__(tracker_mod.LanController)
             object.__setattr__(lan, "_tracker", app)
@@ -0,0 +1,138 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+import dnd_initative_tracker as tracker_mod
+import item_catalog
+import library_watch
+
+
+class ItemCatalogTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name) / "Items"
+        for dirname in ("Weapons", "Armor", "Magic_Items", "Consumables"):
+            (self.root / dirname).mkdir(parents=True)
+        self.parsed = []
+
+        def parse(text):
+            self.parsed.append(text)
+            return yaml.safe_load(text)
+
+        self.catalog = item_catalog.ItemCatalog(parse, lambda message: None)
+
+    def _write(self, relative, text):
+        path = self.root / relative
+        path.write_text(text, encoding="utf-8")
+        stat = path.stat()
+        # Keep mtime moving even on coarse filesystem clocks.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + len(self.parsed) + 1_000_000))
+        return path
+
+    def test_only_changed_files_are_reparsed(self):
+        self._write("Weapons/dagger.yaml", "id: dagger\nname: Dagger\n")
+        self._write("Magic_Items/cloak.yaml", "id: cloak\nname: Cloak of Elvenkind\ntype: wondrous\n")
+        self.assertTrue(self.catalog.refresh(self.root))
+        self.assertEqual(len(self.parsed), 2)
+        self.assertFalse(self.catalog.refresh(self.root))
+        self.assertEqual(len(self.parsed), 2)
+
+        cloak = self._write("Magic_Items/cloak.yaml", "id: cloak\nname: Cloak of Protection\ntype: wondrous\n")
+        self.assertTrue(self.catalog.refresh(self.root, [cloak]))
+        self.assertEqual(len(self.parsed), 3)
+        self.assertEqual(self.catalog.magic_items["cloak"]["name"], "Cloak of Protection")
+        self.assertIn("dagger", self.catalog.equippable["weapons"])
+        self.assertEqual(self.catalog.changed_keys(1), {"cloak", "name:cloak of elvenkind", "name:cloak of protection"})
+
+        cloak.unlink()
+        self.assertTrue(self.catalog.refresh(self.root, [cloak]))
+        self.assertNotIn("cloak", self.catalog.magic_items)
+
+    def test_name_index_skips_ambiguous_names(self):
+        self._write("Weapons/a.yaml", "id: club_a\nname: Club\n")
+        self._write("Weapons/b.yaml", "id: club_b\nname: Club\n")
+        self._write("Armor/leather.yaml", "id: leather\nname: Leather\n")
+        self.catalog.refresh(self.root)
+
+        name_to_id, duplicates = self.catalog.name_index("equippable")
+        self.assertEqual(name_to_id, {"leather": "leather"})
+        self.assertEqual(duplicates, {"club"})
+        self.assertIs(self.catalog.name_index("equippable")[0], name_to_id)
+
+    def test_owner_index_tracks_item_references(self):
+        profile = {"name": "Aria"}
+        calls = []
+
+        def keys():
+            calls.append(1)
+            return {"cloak", "name:rope"}
+
+        self.catalog.sync_owner("Aria", profile, keys)
+        self.catalog.sync_owner("Aria", profile, keys)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.catalog.owners_of({"cloak"}), {"Aria"})
+        self.assertEqual(self.catalog.owners_of({"dagger"}), set())
+
+        self.catalog.sync_owner("Aria", {"name": "Aria"}, lambda: {"dagger"})
+        self.assertEqual(self.catalog.owners_of({"cloak", "dagger"}), {"Aria"})
+        self.assertEqual(self.catalog.owners_of({"cloak"}), set())
+        self.catalog.drop_owner("Aria")
+        self.assertEqual(self.catalog.owners_of({"dagger"}), set())
+
+
+class TrackerItemOwnerTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.players_dir = root / "players"
+        self.players_dir.mkdir()
+        self.items_dir = root / "Items"
+        (self.items_dir / "Magic_Items").mkdir(parents=True)
+        self.cloak = self.items_dir / "Magic_Items" / "cloak.yaml"
+        self.cloak.write_text("id: cloak\nname: Cloak\ntype: wondrous\n", encoding="utf-8")
+        (self.players_dir / "aria.yaml").write_text(
+            "name: Aria\ninventory:\n  items:\n    - id: cloak\n      equipped: true\n", encoding="utf-8"
+        )
+        (self.players_dir / "brom.yaml").write_text("name: Brom\n", encoding="utf-8")
+
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._oplog = lambda *args, **kwargs: None
+        app._players_dir = lambda: self.players_dir
+        app._resolve_items_dir = lambda: self.items_dir
+        app._yaml_players_index_path_cache = root / "yaml_players_index.json"
+        app._player_yaml_cache_by_path = {}
+        app._player_yaml_meta_by_path = {}
+        app._player_yaml_data_by_name = {}
+        app._player_yaml_name_map = {}
+        app._player_yaml_dir_signature = None
+        app._player_yaml_last_refresh = 0.0
+        app._player_yaml_refresh_interval_s = 1.0
+        self.watcher = library_watch.LibraryWatcher(backend="poll")
+        self.watcher.watch(self.players_dir)
+        self.watcher.watch(self.items_dir, recursive=True)
+        app._library_watcher = self.watcher
+        app._library_watch_dirs = {"players": self.players_dir, "items": self.items_dir}
+        self.app = app
+
+    def test_item_edit_renormalizes_only_its_owners(self):
+        self.app._load_player_yaml_cache()
+        self.app._load_player_yaml_cache()
+        aria = self.app._player_yaml_data_by_name["Aria"]
+        brom = self.app._player_yaml_data_by_name["Brom"]
+
+        self.cloak.write_text("id: cloak\nname: Cloak of Protection\ntype: wondrous\n", encoding="utf-8")
+        self.watcher.poll_once()
+        self.app._load_player_yaml_cache()
+
+        self.assertIsNot(self.app._player_yaml_data_by_name["Aria"], aria)
+        self.assertIs(self.app._player_yaml_data_by_name["Brom"], brom)
+        self.assertEqual(self.app._magic_items_registry_payload()["cloak"]["name"], "Cloak of Protection")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import unittest
+from unittest import mock
+from pathlib import Path
+
+import dnd_initative_tracker as tracker_mod
+
+
+PAYLOAD = {
+    "units": [{"cid": 1, "hp": 7, "pos": (2, 3), "tags": {"prone"}}],
+    "ratio": 0.5,
+    "file": Path("Monsters") / "goblin.yaml",
+    3: "int key",
+}
+
+
+class StdlibJsonEncoderTests(unittest.TestCase):
+    def setUp(self):
+        self.encoder = tracker_mod.StdlibJsonEncoder()
+
+    def test_matches_stdlib_output_for_finite_payloads(self):
+        text = self.encoder.dumps(PAYLOAD)
+
+        self.assertEqual(
+            text,
+            '{"units": [{"cid": 1, "hp": 7, "pos": [2, 3], "tags": ["prone"]}], '
+            '"ratio": 0.5, "file": ' + json.dumps(str(PAYLOAD["file"])) + ', "3": "int key"}',
+        )
+
+    def test_non_finite_floats_become_zero(self):
+        text = self.encoder.dumps({"a": float("nan"), "b": [float("inf")], "c": {float("-inf")}, "name": "NaNa"})
+
+        self.assertEqual(json.loads(text), {"a": 0.0, "b": [0.0], "c": [0.0], "name": "NaNa"})
+
+    def test_sort_keys_and_indent(self):
+        text = self.encoder.dumps({"b": 1, "a": 2}, sort_keys=True, indent=True)
+
+        self.assertEqual(text, json.dumps({"a": 2, "b": 1}, indent=2))
+
+
+@unittest.skipIf(tracker_mod.orjson is None, "orjson not installed")
+class OrjsonEncoderTests(unittest.TestCase):
+    def setUp(self):
+        self.encoder = tracker_mod.OrjsonEncoder()
+
+    def test_round_trips_like_stdlib(self):
+        text = self.encoder.dumps(PAYLOAD)
+
+        self.assertEqual(json.loads(text), json.loads(tracker_mod.StdlibJsonEncoder().dumps(PAYLOAD)))
+
+    def test_non_finite_floats_match_stdlib(self):
+        payload = {"a": float("nan"), "b": [1.5, float("inf")], "c": (float("-inf"),), "d": {"e": 2.0}}
+
+        self.assertEqual(
+            json.loads(self.encoder.dumps(payload)),
+            json.loads(tracker_mod.StdlibJsonEncoder().dumps(payload)),
+        )
+        self.assertEqual(json.loads(self.encoder.dumps(payload))["b"], [1.5, 0.0])
+
+    def test_finite_payloads_with_nulls_are_not_sanitized(self):
+        with mock.patch.object(tracker_mod, "_json_sanitize", wraps=tracker_mod._json_sanitize) as sanitize:
+            text = self.encoder.dumps({"hp": None, "ratio": 0.5})
+            self.assertFalse(sanitize.called)
+            nan_text = self.encoder.dumps({"hp": None, "ratio": float("nan")})
+
+        self.assertEqual(text, '{"hp":null,"ratio":0.5}')
+        self.assertEqual(nan_text, '{"hp":null,"ratio":0.0}')
+        self.assertTrue(sanitize.called)
+
+    def test_falls_back_to_stdlib_for_wide_integers(self):
+        self.assertEqual(self.encoder.dumps({"big": 2**70}), '{"big": 1180591620717411303424}')
+
+
+class JsonSanitizeTests(unittest.TestCase):
+    def test_finite_trees_are_returned_without_copying(self):
+        self.assertIs(tracker_mod._json_sanitize(PAYLOAD), PAYLOAD)
+
+    def test_non_finite_detection(self):
+        self.assertFalse(tracker_mod._json_has_non_finite(PAYLOAD))
+        self.assertFalse(tracker_mod._json_has_non_finite({"a": [None, 1.5, "NaN", True]}))
+        self.assertTrue(tracker_mod._json_has_non_finite({"a": [{"b": (1, float("-inf"))}]}))
+        self.assertTrue(tracker_mod._json_has_non_finite({"c": {float("nan")}}))
+
+    def test_only_the_path_to_a_non_finite_float_is_copied(self):
+        shared = {"hp": 3}
+        payload = {"units": [shared], "aoe": {"r": float("nan")}}
+
+        clean = tracker_mod._json_sanitize(payload)
+
+        self.assertEqual(clean, {"units": [shared], "aoe": {"r": 0.0}})
+        self.assertIs(clean["units"], payload["units"])
+        self.assertTrue(payload["aoe"]["r"] != payload["aoe"]["r"])
+
+
+class JsonEncoderSelectionTests(unittest.TestCase):
+    def tearDown(self):
+        tracker_mod._json_encoder_instance = None
+
+    def test_env_override_selects_stdlib(self):
+        tracker_mod._json_encoder_instance = None
+        with mock.patch.dict(tracker_mod.os.environ, {"INITTRACKER_JSON_ENCODER": "stdlib"}):
+            self.assertEqual(tracker_mod._json_encoder().name, "stdlib")
+        self.assertEqual(tracker_mod.LanController._json_dumps({"x": float("nan")}), '{"x": 0.0}')
+
+
+if __name__ == "__main__":
+    unittest.main()
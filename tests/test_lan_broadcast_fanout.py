@@ -0,0 +1,105 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+
+import dnd_initative_tracker as tracker_mod
+
+
+class FakeWebSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent = []
+
+    async def send_text(self, text):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+
+def _make_lan(clients, view_only=()):
+    lan = object.__new__(tracker_mod.LanController)
+    lan._clients_lock = threading.Lock()
+    lan._clients = dict(clients)
+    lan._clients_meta = {ws_id: {} for ws_id in clients}
+    lan._client_hosts = {ws_id: "10.0.0.%d" % ws_id for ws_id in clients}
+    lan._view_only_clients = set(view_only)
+    lan._send_timeout_s = 0.2
+    lan._outbox_max_frames = 256
+    lan.dropped = []
+    lan._drop_claim = lambda ws_id: lan.dropped.append(ws_id)
+    lan._log_lan_exception = lambda *args, **kwargs: None
+    lan._dynamic_snapshot_payload = lambda: {"units": [{"cid": 1, "hp": 7.5}], "round_num": 2}
+    lan._view_only_state_payload = lambda state: dict(state, grid={"cols": 4})
+    lan._pcs_payload = lambda: [{"cid": 1, "name": "Ayla"}]
+    lan._build_you_payload = lambda ws_id: {"claimed_cid": ws_id, "claim_rev": 0}
+    return lan
+
+
+async def _broadcast_and_flush(coro, lan):
+    await coro
+    await lan._wait_outboxes_idle()
+
+
+class LanBroadcastFanOutTests(unittest.TestCase):
+    def test_spliced_state_matches_full_serialization(self):
+        for name in ("stdlib", "orjson"):
+            with self.subTest(encoder=name):
+                try:
+                    tracker_mod._set_json_encoder(name)
+                except Exception:
+                    self.skipTest(f"{name} encoder unavailable")
+                try:
+                    self._assert_splice_matches()
+                finally:
+                    tracker_mod._json_encoder_instance = None
+
+    def _assert_splice_matches(self):
+        state = {"units": [{"cid": 1, "hp": float("nan"), "tags": {"a"}}], "round_num": 1}
+        pcs = [{"cid": 1, "name": "Ayla"}]
+        you = {"claimed_cid": 1, "claimed_name": "Ayla", "claim_rev": 3}
+
+        spliced = tracker_mod.LanController._state_message_text(
+            tracker_mod.LanController._json_dumps(state),
+            tracker_mod.LanController._json_dumps(pcs),
+            you,
+        )
+
+        expected = tracker_mod.LanController._json_dumps({"type": "state", "state": state, "pcs": pcs, "you": you})
+        self.assertEqual(spliced, expected)
+
+    def test_state_broadcast_personalizes_you_and_view_only_state(self):
+        player, viewer = FakeWebSocket(), FakeWebSocket()
+        lan = _make_lan({1: player, 2: viewer}, view_only={2})
+
+        asyncio.run(_broadcast_and_flush(lan._broadcast_state_async({}), lan))
+
+        player_msg = json.loads(player.sent[0])
+        viewer_msg = json.loads(viewer.sent[0])
+        self.assertEqual(player_msg["you"], {"claimed_cid": 1, "claim_rev": 0})
+        self.assertNotIn("grid", player_msg["state"])
+        self.assertEqual(viewer_msg["you"], {"claimed_cid": 2, "claim_rev": 0})
+        self.assertEqual(viewer_msg["state"]["grid"], {"cols": 4})
+        self.assertEqual(player_msg["pcs"], [{"cid": 1, "name": "Ayla"}])
+
+    def test_slow_client_times_out_without_blocking_others(self):
+        fast = [FakeWebSocket(0.05) for _ in range(5)]
+        slow = FakeWebSocket(5.0)
+        clients = {idx + 1: ws for idx, ws in enumerate(fast)}
+        clients[99] = slow
+        lan = _make_lan(clients)
+
+        started = time.monotonic()
+        asyncio.run(_broadcast_and_flush(lan._broadcast_payload_async({"type": "toast", "text": "Ahoy"}), lan))
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 1.0)
+        self.assertTrue(all([json.loads(text) for text in ws.sent] == [{"type": "toast", "text": "Ahoy"}] for ws in fast))
+        self.assertEqual(slow.sent, [])
+        self.assertEqual(lan.dropped, [99])
+        self.assertNotIn(99, lan._clients)
+
+
+if __name__ == "__main__":
+    unittest.main()
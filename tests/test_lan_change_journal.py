@@ -0,0 +1,303 @@
+import queue
+import threading
+import unittest
+
+import dnd_initative_tracker as tracker_mod
+
+
+def _make_lan(app):
+    lan = object.__new__(tracker_mod.LanController)
+    lan._actions = queue.Queue()
+    lan._clients_lock = threading.Lock()
+    lan._clients = {1: object()}
+    lan._polling = False
+    lan._active_poll_interval_ms = 120
+    lan._idle_poll_interval_ms = 350
+    lan._cached_pcs = []
+    lan._battle_log_subscribers = set()
+    lan._log_lan_exception = lambda *args, **kwargs: None
+    lan._move_debug_log = lambda *args, **kwargs: None
+    lan._broadcast_grid_update = lambda *_args, **_kwargs: None
+    lan._apply_terrain_patch_to_map = lambda *_args, **_kwargs: None
+    lan._grid_last_sent = (8, 8)
+    lan._grid_version = 1
+    lan._last_static_json = None
+    lan._last_static_check_ts = tracker_mod.time.monotonic()
+    lan._static_check_interval_s = 60.0
+    lan._journal_enabled = True
+    lan._journal_reconcile_interval_s = 60.0
+    lan._journal_idle_reconcile_interval_s = 120.0
+    lan._last_full_snapshot_ts = tracker_mod.time.monotonic()
+    lan._tracker = app
+    lan.payloads = []
+    lan._broadcast_payload = lambda payload: lan.payloads.append(payload)
+    return lan
+
+
+def _snapshot(units, aoes=None, rough=None):
+    return {
+        "grid": {"cols": 8, "rows": 8, "feet_per_square": 5.0},
+        "units": units,
+        "obstacles": [],
+        "rough_terrain": rough or [],
+        "aoes": aoes or [],
+        "active_cid": 1,
+        "round_num": 1,
+        "turn_order": [1, 2],
+    }
+
+
+class JournalAppStub:
+    def __init__(self):
+        self.journal = tracker_mod.LanChangeJournal()
+        self.snapshot_calls = 0
+        self.delta_calls = []
+        self.delta = None
+
+    def _lan_change_journal(self):
+        return self.journal
+
+    def _lan_snapshot(self, include_static=False, hydrate_static=True):
+        self.snapshot_calls += 1
+        return _snapshot([{"cid": 1, "hp": 5, "pos": {"col": 0, "row": 0}}])
+
+    def _lan_snapshot_delta(self, dirty, prev):
+        self.delta_calls.append(dirty)
+        return self.delta
+
+    def _lan_claimable(self):
+        return []
+
+    def _lan_apply_action(self, _msg):
+        return None
+
+    def after(self, _ms, _fn):
+        return None
+
+
+class LanChangeJournalTests(unittest.TestCase):
+    def test_drain_returns_marks_and_resets(self):
+        journal = tracker_mod.LanChangeJournal()
+        self.assertTrue(journal.is_clean())
+        journal.mark(cids=[3, "4"], cells=[(1, 2)], aids=[7])
+        journal.mark(all_units=True)
+
+        dirty = journal.drain()
+
+        self.assertEqual(dirty["cids"], {3, 4})
+        self.assertEqual(dirty["cells"], {(1, 2)})
+        self.assertEqual(dirty["aids"], {7})
+        self.assertTrue(dirty["all_units"])
+        self.assertFalse(dirty["full"])
+        self.assertTrue(journal.is_clean())
+        self.assertTrue(tracker_mod.LanChangeJournal.is_empty(journal.drain()))
+
+    def test_unparseable_marks_widen_to_coarser_flags(self):
+        journal = tracker_mod.LanChangeJournal()
+        journal.mark(cids=["x"], cells=[None], aids=[object()])
+
+        dirty = journal.drain()
+
+        self.assertTrue(dirty["full"])
+        self.assertTrue(dirty["terrain"])
+        self.assertTrue(dirty["all_aoes"])
+
+    def test_clean_tick_skips_snapshot_rebuild(self):
+        app = JournalAppStub()
+        lan = _make_lan(app)
+        lan._last_snapshot = _snapshot([{"cid": 1, "hp": 5}])
+        lan._cached_snapshot = lan._last_snapshot
+
+        lan._tick()
+
+        self.assertEqual(app.snapshot_calls, 0)
+        self.assertEqual(app.delta_calls, [])
+        self.assertEqual(lan.payloads, [])
+
+    def test_dirty_unit_broadcasts_only_its_patch(self):
+        app = JournalAppStub()
+        lan = _make_lan(app)
+        prev = _snapshot(
+            [
+                {"cid": 1, "hp": 5, "pos": {"col": 0, "row": 0}},
+                {"cid": 2, "hp": 9, "pos": {"col": 3, "row": 3}},
+            ]
+        )
+        lan._last_snapshot = prev
+        lan._cached_snapshot = prev
+        app.delta = {
+            "header": {"active_cid": 1, "round_num": 1, "turn_order": [1, 2]},
+            "units": {1: {"cid": 1, "hp": 2, "pos": {"col": 1, "row": 0}}},
+            "aoes": {},
+            "rough": {},
+            "obstacles": {},
+        }
+        app.journal.mark(cids=[1])
+
+        lan._tick()
+
+        self.assertEqual(app.snapshot_calls, 0)
+        self.assertEqual(
+            lan.payloads,
+            [{"type": "unit_update", "updates": [{"cid": 1, "pos": {"col": 1, "row": 0}, "hp": 2}]}],
+        )
+        self.assertEqual([u["hp"] for u in lan._cached_snapshot["units"]], [2, 9])
+        self.assertIs(lan._last_snapshot, lan._cached_snapshot)
+        self.assertIs(lan._cached_snapshot["units"][1], prev["units"][1])
+
+    def test_dirty_cells_and_aoes_produce_patches(self):
+        app = JournalAppStub()
+        lan = _make_lan(app)
+        prev = _snapshot(
+            [{"cid": 1, "hp": 5}],
+            aoes=[{"aid": 4, "kind": "circle", "cx": 1.0}],
+            rough=[{"col": 2, "row": 2, "color": "#8d6e63", "movement_type": "ground", "is_swim": False, "is_rough": True}],
+        )
+        lan._last_snapshot = prev
+        lan._cached_snapshot = prev
+        app.delta = {
+            "header": {},
+            "units": {},
+            "aoes": {4: None, 5: {"aid": 5, "kind": "line"}},
+            "rough": {(2, 2): None},
+            "obstacles": {(2, 2): True},
+        }
+        app.journal.mark(cells=[(2, 2)], aids=[4, 5])
+
+        lan._tick()
+
+        types = [payload["type"] for payload in lan.payloads]
+        self.assertEqual(types, ["terrain_patch", "aoe_patch"])
+        self.assertEqual(lan.payloads[0]["rough_removals"], [{"col": 2, "row": 2}])
+        self.assertEqual(lan.payloads[0]["obstacle_updates"], [{"col": 2, "row": 2}])
+        self.assertEqual(lan.payloads[1], {"type": "aoe_patch", "updates": [{"aid": 5, "kind": "line"}], "removals": [4]})
+        self.assertEqual(lan._cached_snapshot["rough_terrain"], [])
+        self.assertEqual(lan._cached_snapshot["obstacles"], [{"col": 2, "row": 2}])
+        self.assertEqual([a["aid"] for a in lan._cached_snapshot["aoes"]], [5])
+
+    def test_delta_refusal_falls_back_to_full_snapshot(self):
+        app = JournalAppStub()
+        lan = _make_lan(app)
+        lan._last_snapshot = _snapshot([{"cid": 1, "hp": 9, "pos": {"col": 0, "row": 0}}])
+        lan._cached_snapshot = lan._last_snapshot
+        app.delta = None
+        app.journal.mark(cids=[1])
+
+        lan._tick()
+
+        self.assertEqual(len(app.delta_calls), 1)
+        self.assertEqual(app.snapshot_calls, 1)
+        self.assertEqual(lan.payloads, [{"type": "unit_update", "updates": [{"cid": 1, "hp": 5}]}])
+
+    def test_unjournaled_action_and_due_reconcile_with_changes_force_full_diff(self):
+        app = JournalAppStub()
+        lan = _make_lan(app)
+        lan._last_snapshot = _snapshot([{"cid": 1, "hp": 5, "pos": {"col": 0, "row": 0}}])
+        lan._cached_snapshot = lan._last_snapshot
+
+        lan._actions.put({"type": "use_action"})
+        lan._tick()
+        self.assertEqual(app.snapshot_calls, 1)
+        self.assertEqual(app.delta_calls, [])
+
+        lan._last_full_snapshot_ts = tracker_mod.time.monotonic() - 90.0
+        lan._tick()
+        self.assertEqual(app.snapshot_calls, 1)
+        self.assertEqual(app.delta_calls, [])
+
+        app.journal.mark(cids=[1])
+        lan._tick()
+        self.assertEqual(app.snapshot_calls, 2)
+
+    def test_idle_ticks_still_reconcile_at_the_idle_interval(self):
+        app = JournalAppStub()
+        lan = _make_lan(app)
+        lan._last_snapshot = _snapshot([{"cid": 1, "hp": 5, "pos": {"col": 0, "row": 0}}])
+        lan._cached_snapshot = lan._last_snapshot
+
+        lan._tick()
+        self.assertEqual(app.snapshot_calls, 0)
+
+        lan._last_full_snapshot_ts = tracker_mod.time.monotonic() - 150.0
+        lan._tick()
+        self.assertEqual(app.snapshot_calls, 1)
+        self.assertEqual(app.delta_calls, [])
+
+    def test_tracker_delta_rebuilds_only_dirty_entities(self):
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._lan_grid_cols = 8
+        app._lan_grid_rows = 8
+        app._lan_obstacles = {(5, 5)}
+        app._lan_rough_terrain = {}
+        app._lan_aoes = {}
+        app._lan_positions = {1: (0, 0), 2: (3, 3)}
+        app._map_window = None
+        app.combatants = {1: type("C", (), {"cid": 1})(), 2: type("C", (), {"cid": 2})()}
+        app.current_cid = 1
+        app.round_num = 2
+        app._current_turn_kind = "normal"
+        app._lan_auras_enabled = True
+        app._display_order = lambda: list(app.combatants.values())
+        app._peek_next_turn_cid = lambda _cid: 2
+        app._lan_reaction_debug_enabled = lambda: False
+        app._lan_active_aura_contexts = lambda **_kwargs: []
+        built = []
+        app._lan_unit_payload = lambda c, pos, _auras: built.append(c.cid) or {"cid": c.cid, "pos": {"col": pos[0], "row": pos[1]}}
+        prev = {
+            "grid": None,
+            "units": [{"cid": 1}, {"cid": 2}],
+            "obstacles": [{"col": 5, "row": 5}],
+            "rough_terrain": [],
+            "aoes": [],
+        }
+
+        delta = app._lan_snapshot_delta(
+            {"cids": {1}, "cells": {(5, 5)}, "aids": set(), "all_units": False, "terrain": False, "all_aoes": False},
+            prev,
+        )
+
+        self.assertEqual(built, [1])
+        self.assertEqual(delta["units"], {1: {"cid": 1, "pos": {"col": 0, "row": 0}}})
+        self.assertEqual(delta["obstacles"], {(5, 5): True})
+        self.assertEqual(delta["rough"], {(5, 5): None})
+        self.assertEqual(delta["header"]["turn_order"], [1, 2])
+        self.assertEqual(delta["header"]["round_num"], 2)
+
+        app.combatants[3] = type("C", (), {"cid": 3})()
+        self.assertIsNone(app._lan_snapshot_delta({"cids": {3}}, prev))
+
+    def test_map_window_marks_flow_into_tracker_journal(self):
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        mw = object.__new__(tracker_mod.base.BattleMapWindow)
+        mw.app = app
+
+        mw._mark_lan_dirty(cells=[(1, 1)], aids=[3])
+        app._lan_mark_dirty(cids=[2])
+
+        dirty = app._lan_change_journal().drain()
+        self.assertEqual(dirty["cells"], {(1, 1)})
+        self.assertEqual(dirty["aids"], {3})
+        self.assertEqual(dirty["cids"], {2})
+
+    def test_aoe_pin_and_color_edits_are_journaled(self):
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        mw = object.__new__(tracker_mod.base.BattleMapWindow)
+        mw.app = app
+        mw.__dict__.update(
+            aoes={4: {"kind": "circle", "color": "#ff0000", "shape": 1, "label": 2, "duration_turns": 3}},
+            _selected_aoe=4,
+            pin_var=type("Var", (), {"get": lambda self: True})(),
+            canvas=type("Canvas", (), {"itemconfigure": lambda self, *args, **kwargs: None})(),
+            _refresh_aoe_list=lambda **kwargs: None,
+        )
+
+        mw._toggle_pin_selected()
+        self.assertEqual(app._lan_change_journal().drain()["aids"], {4})
+        self.assertEqual(mw.aoes[4]["remaining_turns"], 3)
+
+        mw._apply_aoe_color(4)
+        self.assertEqual(app._lan_change_journal().drain()["aids"], {4})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import unittest
+
+import dnd_initative_tracker as tracker_mod
+
+
+class BlockedWebSocket:
+    def __init__(self):
+        self.sent = []
+        self.closed = None
+        self.release = asyncio.Event()
+
+    async def send_text(self, text):
+        await self.release.wait()
+        self.sent.append(text)
+
+    async def close(self, code=1000, reason=""):
+        self.closed = (code, reason)
+
+
+class LanClientOutboxTests(unittest.TestCase):
+    def test_state_replaces_pending_state_and_unit_updates(self):
+        outbox = tracker_mod.LanClientOutbox()
+        outbox.put("state", "s1")
+        outbox.put("unit_update", "u1", {"type": "unit_update", "updates": [{"cid": 1, "hp": 3}]})
+        outbox.put("toast", "t1")
+        outbox.put("state", "s2")
+
+        self.assertEqual([frame["text"] for frame in outbox._frames], ["t1", "s2"])
+        self.assertEqual(outbox.coalesced, 2)
+
+    def test_unit_updates_merge_per_cid_without_touching_shared_payload(self):
+        outbox = tracker_mod.LanClientOutbox()
+        first = {"type": "unit_update", "updates": [{"cid": 1, "hp": 3}, {"cid": 2, "hp": 9}]}
+        outbox.put("unit_update", "encoded", first)
+        outbox.put("unit_update", "encoded2", {"type": "unit_update", "updates": [{"cid": 1, "pos": {"col": 2, "row": 2}}]})
+
+        self.assertEqual(len(outbox), 1)
+        frame = outbox._frames[0]
+        self.assertIsNone(frame["text"])
+        self.assertEqual(
+            frame["payload"]["updates"],
+            [{"cid": 1, "hp": 3, "pos": {"col": 2, "row": 2}}, {"cid": 2, "hp": 9}],
+        )
+        self.assertEqual(first["updates"][0], {"cid": 1, "hp": 3})
+
+    def test_unit_update_does_not_merge_past_a_later_frame(self):
+        outbox = tracker_mod.LanClientOutbox()
+        outbox.put("unit_update", "u1", {"type": "unit_update", "updates": [{"cid": 1, "hp": 3}]})
+        outbox.put("units_snapshot", "snap")
+        outbox.put("unit_update", "u2", {"type": "unit_update", "updates": [{"cid": 1, "hp": 1}]})
+
+        self.assertEqual([frame["text"] for frame in outbox._frames], ["u1", "snap", "u2"])
+        self.assertEqual(outbox.coalesced, 0)
+
+    def test_terrain_patches_merge_per_cell_in_order(self):
+        outbox = tracker_mod.LanClientOutbox()
+        outbox.put("terrain_patch", "a", {"type": "terrain_patch", "obstacle_updates": [{"col": 1, "row": 1}]})
+        outbox.put(
+            "terrain_patch",
+            "b",
+            {
+                "type": "terrain_patch",
+                "obstacle_removals": [{"col": 1, "row": 1}],
+                "rough_updates": [{"col": 4, "row": 4, "color": "#8d6e63"}],
+            },
+        )
+
+        self.assertEqual(
+            outbox._frames[0]["payload"],
+            {
+                "type": "terrain_patch",
+                "rough_updates": [{"col": 4, "row": 4, "color": "#8d6e63"}],
+                "obstacle_removals": [{"col": 1, "row": 1}],
+            },
+        )
+
+    def test_put_reports_overflow(self):
+        outbox = tracker_mod.LanClientOutbox(max_frames=2)
+        self.assertTrue(outbox.put("toast", "1"))
+        self.assertTrue(outbox.put("toast", "2"))
+        self.assertFalse(outbox.put("toast", "3"))
+
+
+class LanOutboxControllerTests(unittest.TestCase):
+    def _make_lan(self, ws):
+        lan = object.__new__(tracker_mod.LanController)
+        lan._clients_lock = threading.Lock()
+        lan._clients = {7: ws}
+        lan._clients_meta = {7: {}}
+        lan._client_hosts = {7: "10.0.0.7"}
+        lan._send_timeout_s = 5.0
+        lan._outbox_max_frames = 2
+        lan.logs = []
+        lan.resyncs = []
+        lan._append_lan_log = lambda message, level="error": lan.logs.append(message)
+        lan._log_lan_exception = lambda *args, **kwargs: None
+        lan._drop_claim = lambda ws_id: None
+
+        async def _resync(ws_id):
+            lan.resyncs.append(ws_id)
+
+        lan._send_full_state_async = _resync
+        return lan
+
+    def test_direct_state_send_supersedes_queued_deltas_in_order(self):
+        async def scenario():
+            ws = BlockedWebSocket()
+            lan = self._make_lan(ws)
+            lan._outbox_max_frames = 8
+            await lan._broadcast_payload_async({"type": "toast", "text": "first"})
+            await asyncio.sleep(0)
+            await lan._broadcast_payload_async({"type": "unit_update", "updates": [{"cid": 1, "hp": 3}]})
+            await lan._send_async(7, {"type": "state", "state": {"units": []}})
+            await lan._send_async(7, {"type": "toast", "text": "after"})
+
+            outbox = lan._outboxes[7]
+            self.assertEqual([frame["kind"] for frame in outbox._frames], ["state", "toast"])
+            ws.release.set()
+            await lan._wait_outboxes_idle()
+            kinds = [tracker_mod.json.loads(text)["type"] for text in ws.sent]
+            self.assertEqual(kinds, ["toast", "state", "toast"])
+
+        asyncio.run(scenario())
+
+    def test_backlog_overflow_resyncs_then_drops(self):
+        async def scenario():
+            ws = BlockedWebSocket()
+            lan = self._make_lan(ws)
+            for idx in range(4):
+                await lan._broadcast_payload_async({"type": "toast", "text": str(idx)})
+                await asyncio.sleep(0)
+            outbox = lan._outboxes[7]
+            self.assertTrue(outbox.resync_pending)
+            self.assertEqual([frame["kind"] for frame in outbox._frames], ["resync"])
+
+            ws.release.set()
+            await lan._wait_outboxes_idle()
+            self.assertEqual(lan.resyncs, [7])
+            self.assertEqual(len(ws.sent), 1)
+            self.assertFalse(outbox.resync_pending)
+
+            ws.release.clear()
+            for idx in range(3):
+                await lan._broadcast_payload_async({"type": "toast", "text": str(idx)})
+                await asyncio.sleep(0)
+            outbox.resync_pending = True
+            await lan._broadcast_payload_async({"type": "toast", "text": "again"})
+            await asyncio.sleep(0)
+            self.assertNotIn(7, lan._clients)
+            self.assertEqual(ws.closed[0], 1013)
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,275 @@
+import heapq
+import math
+import random
+import time
+import unittest
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+
+
+def _c(cid, movement_mode="normal", speed=30, swim_speed=0):
+    return tracker_mod.base.Combatant(
+        cid=cid,
+        name=f"Unit {cid}",
+        hp=10,
+        speed=speed,
+        swim_speed=swim_speed,
+        fly_speed=30,
+        burrow_speed=30,
+        climb_speed=0,
+        movement_mode=movement_mode,
+        move_remaining=speed,
+        initiative=10,
+    )
+
+
+def _app(aoes=None):
+    app = object.__new__(tracker_mod.InitiativeTracker)
+    app._lan_aoes = dict(aoes or {})
+    return app
+
+
+def reference_shortest_cost(app, origin, dest, obstacles, rough_terrain, cols, rows, max_ft, creature=None):
+    """The per-edge Dijkstra _lan_shortest_cost used before the compiled grid."""
+    if origin == dest:
+        return 0
+    mode = app._normalize_movement_mode(getattr(creature, "movement_mode", "normal"))
+    water_multiplier = app._water_movement_multiplier(creature, mode)
+    pq = [(0, origin[0], origin[1], 0)]
+    best = {(origin[0], origin[1], 0): 0}
+    while pq:
+        cost, c, r, parity = heapq.heappop(pq)
+        if cost != best.get((c, r, parity), 10**9):
+            continue
+        if cost > max_ft:
+            continue
+        if (c, r) == dest:
+            return cost
+        for dc in (-1, 0, 1):
+            for dr in (-1, 0, 1):
+                if dc == 0 and dr == 0:
+                    continue
+                nc, nr = c + dc, r + dr
+                if not (0 <= nc < cols and 0 <= nr < rows) or (nc, nr) in obstacles:
+                    continue
+                if dc != 0 and dr != 0:
+                    step = 5 if parity == 0 else 10
+                    npar = 1 - parity
+                else:
+                    step = 5
+                    npar = parity
+                target_cell = rough_terrain.get((nc, nr))
+                current_cell = rough_terrain.get((c, r))
+                target_is_rough = bool(target_cell.get("is_rough", False)) if isinstance(target_cell, dict) else False
+                current_type = app._normalize_movement_type(
+                    current_cell.get("movement_type") if isinstance(current_cell, dict) else None,
+                    is_swim=bool(current_cell.get("is_swim", False)) if isinstance(current_cell, dict) else False,
+                )
+                target_type = app._normalize_movement_type(
+                    target_cell.get("movement_type") if isinstance(target_cell, dict) else None,
+                    is_swim=bool(target_cell.get("is_swim", False)) if isinstance(target_cell, dict) else False,
+                )
+                if mode == "swim" and target_type != "water":
+                    continue
+                if mode == "burrow" and target_type == "water":
+                    continue
+                if mode != "fly":
+                    if current_type == "water" or target_type == "water":
+                        step = int(math.ceil(step * water_multiplier))
+                    if target_is_rough:
+                        step *= 2
+                step = int(math.ceil(step * app._movement_cost_multiplier_for_step(c, r, nc, nr, combatant=creature)))
+                ncost = cost + step
+                key = (nc, nr, npar)
+                if ncost < best.get(key, 10**9) and ncost <= max_ft:
+                    best[key] = ncost
+                    heapq.heappush(pq, (ncost, nc, nr, npar))
+    return None
+
+
+def _random_map(rng, cols, rows):
+    obstacles = {(rng.randrange(cols), rng.randrange(rows)) for _ in range(cols * rows // 6)}
+    rough = {}
+    for _ in range(cols * rows // 5):
+        cell = (rng.randrange(cols), rng.randrange(rows))
+        if cell in obstacles:
+            continue
+        if rng.random() < 0.5:
+            rough[cell] = {"movement_type": "water", "is_swim": True, "is_rough": rng.random() < 0.3}
+        else:
+            rough[cell] = {"movement_type": "ground", "is_swim": False, "is_rough": True}
+    aoes = {
+        1: {
+            "map_effect": True,
+            "kind": "circle",
+            "cx": cols / 2.0,
+            "cy": rows / 2.0,
+            "radius_sq": 2.5,
+            "environment": {"difficult_terrain": True},
+        },
+        2: {
+            "map_effect": True,
+            "kind": "line",
+            "cx": 3.0,
+            "cy": 2.0,
+            "length_sq": 6.0,
+            "width_sq": 1.0,
+            "angle_deg": 30.0,
+            "environment": {"movement_cost_multiplier": 3},
+        },
+    }
+    return obstacles, rough, aoes
+
+
+class LanMovementGridTests(unittest.TestCase):
+    def test_matches_reference_dijkstra_on_random_maps(self):
+        rng = random.Random(7)
+        creatures = [
+            None,
+            _c(1),
+            _c(2, "swim", swim_speed=20),
+            _c(3, "fly"),
+            _c(4, "burrow"),
+            _c(5, speed=30, swim_speed=60),
+        ]
+        for _trial in range(12):
+            cols, rows = rng.randrange(6, 14), rng.randrange(6, 14)
+            obstacles, rough, aoes = _random_map(rng, cols, rows)
+            app = _app(aoes)
+            for _pair in range(6):
+                origin = (rng.randrange(cols), rng.randrange(rows))
+                dest = (rng.randrange(cols), rng.randrange(rows))
+                creature = rng.choice(creatures)
+                max_ft = rng.choice((15, 30, 60, 120))
+                expected = reference_shortest_cost(app, origin, dest, obstacles, rough, cols, rows, max_ft, creature)
+                got = app._lan_shortest_cost(origin, dest, obstacles, rough, cols, rows, max_ft, creature)
+                self.assertEqual(got, expected, (cols, rows, origin, dest, getattr(creature, "movement_mode", None), max_ft))
+
+    def test_grid_reused_until_terrain_or_effects_change(self):
+        app = _app()
+        rough = {(2, 0): {"movement_type": "ground", "is_rough": True}}
+        obstacles = {(1, 1)}
+        self.assertEqual(app._lan_shortest_cost((0, 0), (3, 0), obstacles, rough, 6, 6, 60), 20)
+        grid = app._lan_movement_grid(6, 6, obstacles, rough)
+        self.assertIs(app._lan_movement_grid(6, 6, set(obstacles), dict(rough)), grid)
+
+        rough[(2, 0)]["is_rough"] = False
+        self.assertEqual(app._lan_shortest_cost((0, 0), (3, 0), obstacles, rough, 6, 6, 60), 15)
+
+        app._lan_aoes[9] = {
+            "map_effect": True,
+            "kind": "square",
+            "cx": 3.0,
+            "cy": 0.0,
+            "side_sq": 1.0,
+            "environment": {"movement_cost_multiplier": 4},
+        }
+        self.assertEqual(app._lan_shortest_cost((0, 0), (3, 0), obstacles, rough, 6, 6, 60), 30)
+        app._lan_aoes[9]["cx"] = 5.0
+        app._lan_touch_aoes()
+        self.assertEqual(app._lan_shortest_cost((0, 0), (3, 0), obstacles, rough, 6, 6, 60), 15)
+
+    def test_out_of_range_and_off_map_origin(self):
+        app = _app()
+        self.assertIsNone(app._lan_shortest_cost((0, 0), (9, 0), set(), {}, 10, 10, 30))
+        self.assertIsNone(app._lan_shortest_cost((0, 0), (2, 0), {(2, 0)}, {}, 10, 10, 30))
+        self.assertEqual(app._lan_shortest_cost((10, 3), (8, 3), set(), {}, 10, 10, 30), 10)
+
+    def test_long_drag_on_open_100x100_map_is_fast(self):
+        app = _app()
+        rough = {(c, 50): {"movement_type": "ground", "is_rough": True} for c in range(100)}
+        app._lan_shortest_cost((0, 0), (99, 99), set(), rough, 100, 100, 1000)
+        started = time.perf_counter()
+        cost = app._lan_shortest_cost((0, 0), (99, 99), set(), rough, 100, 100, 1000)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(cost, 750)
+        self.assertLess(elapsed, 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class LanReachabilityFieldTests(unittest.TestCase):
+    def _app(self):
+        app = _app()
+        app.combatants = {1: _c(1)}
+        app._lan_grid_cols = 8
+        app._lan_grid_rows = 8
+        app._lan_obstacles = {(2, 1)}
+        app._lan_rough_terrain = {}
+        app._lan_positions = {1: (1, 1)}
+        app._map_window = None
+        return app
+
+    def test_field_is_shared_by_move_validation_and_reused(self):
+        app = self._app()
+        field = app._lan_reachability_field(1)
+
+        self.assertEqual(field[(1, 1)], 0)
+        self.assertEqual(field[(0, 0)], 5)
+        self.assertNotIn((2, 1), field)
+        self.assertEqual(max(field.values()), 30)
+        self.assertIs(app._lan_reachability_field(1), field)
+        cols, rows, obstacles, rough, _positions = app._lan_live_map_data()
+        cost = app._lan_shortest_cost((1, 1), (3, 1), obstacles, rough, cols, rows, 30, app.combatants[1])
+        self.assertEqual(cost, field[(3, 1)])
+        self.assertEqual(len(app._lan_reach_fields), 1)
+
+    def test_point_to_point_cost_does_not_flood_a_field(self):
+        app = self._app()
+        cols, rows, obstacles, rough, _positions = app._lan_live_map_data()
+        with mock.patch.object(tracker_mod.LanMovementGrid, "reachability_field") as flood:
+            cost = app._lan_shortest_cost((1, 1), (3, 1), obstacles, rough, cols, rows, 30, app.combatants[1])
+
+        flood.assert_not_called()
+        self.assertEqual(cost, app._lan_reachability_field(1)[(3, 1)])
+
+    def test_terrain_change_invalidates_field(self):
+        app = self._app()
+        before = app._lan_reachability_field(1)
+        app._lan_rough_terrain = {(0, 0): {"movement_type": "ground", "is_rough": True}}
+        after = app._lan_reachability_field(1)
+
+        self.assertIsNot(after, before)
+        self.assertEqual(after[(0, 0)], 10)
+
+    def test_reachability_request_replies_to_requesting_client(self):
+        app = self._app()
+        sent = []
+        app._oplog = lambda *args, **kwargs: None
+        app._pc_name_for = lambda cid: "Goblin"
+        app.in_combat = True
+        app.current_cid = 2
+        app._lan = type("LanStub", (), {"send_reachability": lambda _self, ws_id, payload: sent.append((ws_id, payload))})()
+
+        app._lan_apply_action({"type": "reachability_request", "_ws_id": 4, "_claimed_cid": 1})
+
+        self.assertEqual(len(sent), 1)
+        ws_id, payload = sent[0]
+        self.assertEqual(ws_id, 4)
+        self.assertEqual(payload["type"], "reachable")
+        self.assertEqual(payload["origin"], {"col": 1, "row": 1})
+        self.assertIn([0, 0, 5], payload["cells"])
+
+    def test_admin_reachability_request_without_cid_is_rejected(self):
+        app = self._app()
+        toasts = []
+        app._oplog = lambda *args, **kwargs: None
+        app.in_combat = True
+        app.current_cid = 1
+        app._is_admin_token_valid = lambda token: token == "secret"
+        app._lan = type(
+            "LanStub",
+            (),
+            {
+                "toast": lambda _self, ws_id, text: toasts.append((ws_id, text)),
+                "send_reachability": lambda _self, *_args: self.fail("no reply expected"),
+            },
+        )()
+
+        app._lan_apply_action({"type": "reachability_request", "_ws_id": 4, "admin_token": "secret"})
+
+        self.assertEqual(toasts, [(4, "Pick a character first, matey.")])
@@ -0,0 +1,190 @@
+import importlib.util
+import queue
+import threading
+import types
+import unittest
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+
+
+HAS_TEST_CLIENT = bool(importlib.util.find_spec("fastapi") and importlib.util.find_spec("httpx"))
+
+
+def _make_lan(static_payload):
+    lan = object.__new__(tracker_mod.LanController)
+    lan._static_data_payload = lambda: static_payload
+    return lan
+
+
+class _RevisionAppStub:
+    def __init__(self):
+        self._monster_specs = []
+        self._spell_presets_revision = 1
+        self._player_yaml_revision = 1
+        self._item_catalog_revision = 1
+
+    def _library_revision(self, kind):
+        return {"spells": self._spell_presets_revision, "players": self._player_yaml_revision, "items": 1}[kind]
+
+
+class LanStaticManifestTests(unittest.TestCase):
+    def test_unchanged_section_objects_are_not_reencoded(self):
+        spells = [{"name": "Fire Bolt"}]
+        payload = {"spell_presets": spells, "dice_types": ["d4"]}
+        lan = _make_lan(payload)
+
+        with mock.patch.object(tracker_mod, "_json_dumps_fast", wraps=tracker_mod._json_dumps_fast) as dumps:
+            first = lan._static_section_table()
+            second = lan._static_section_table()
+
+        self.assertEqual(dumps.call_count, 2)
+        self.assertEqual(first, second)
+        self.assertEqual(lan._static_section_entry("spell_presets")[1], tracker_mod._json_dumps_fast(spells, sort_keys=True))
+
+    def test_full_static_response_reuses_the_built_snapshot(self):
+        payload = {"spell_presets": [{"name": "Fire Bolt"}], "dice_types": ["d4"]}
+        lan = _make_lan(payload)
+        table = lan._static_section_table()
+        lan._static_data_payload = mock.Mock(side_effect=AssertionError("rebuilt off the Tk thread"))
+
+        body = tracker_mod.json.loads(lan._static_data_response_text())
+
+        self.assertEqual(body["data"], payload)
+        self.assertEqual(body["sections"], lan._static_manifest(table))
+        self.assertEqual(lan._static_section_entry("dice_types"), table["dice_types"])
+        self.assertIsNone(lan._static_section_entry("nope"))
+
+    def test_replaced_section_changes_only_its_hash(self):
+        payload = {"spell_presets": [{"name": "Fire Bolt"}], "monster_choices": [{"slug": "goblin"}]}
+        lan = _make_lan(payload)
+        before = lan._static_manifest(lan._static_section_table())
+
+        payload["monster_choices"] = [{"slug": "goblin"}, {"slug": "orc"}]
+        after = lan._static_manifest(lan._static_section_table())
+
+        self.assertEqual(before["spell_presets"], after["spell_presets"])
+        self.assertNotEqual(before["monster_choices"], after["monster_choices"])
+        message = lan._static_manifest_message(after, before)
+        self.assertEqual(message["type"], "static_manifest")
+        self.assertEqual(message["changed"], ["monster_choices"])
+
+    def test_equal_content_in_new_object_keeps_hash(self):
+        payload = {"resource_pools": {"Ayla": [{"id": "ki", "current": 2}]}}
+        lan = _make_lan(payload)
+        before = lan._static_manifest(lan._static_section_table())
+
+        payload["resource_pools"] = {"Ayla": [{"current": 2, "id": "ki"}]}
+
+        self.assertEqual(lan._static_manifest(lan._static_section_table()), before)
+
+    def test_in_place_edit_rehashes_when_its_revision_moves(self):
+        spells = [{"name": "Fire Bolt", "color": "#ff0000"}]
+        lan = _make_lan({"spell_presets": spells, "dice_types": ["d4"]})
+        lan._tracker = _RevisionAppStub()
+        before = lan._static_manifest(lan._static_section_table())
+
+        spells[0]["color"] = "#00ff00"
+        self.assertEqual(lan._static_manifest(lan._static_section_table()), before)
+
+        lan._tracker._spell_presets_revision = 2
+        after = lan._static_manifest(lan._static_section_table())
+        self.assertNotEqual(after["spell_presets"], before["spell_presets"])
+        self.assertEqual(after["dice_types"], before["dice_types"])
+
+    def test_idle_static_check_skips_payload_until_sources_move(self):
+        lan = _make_lan({})
+        lan._tracker = _RevisionAppStub()
+        lan._cached_snapshot = {}
+        self.assertFalse(lan._static_sources_unchanged())
+        self.assertTrue(lan._static_sources_unchanged())
+
+        lan._tracker._player_yaml_revision = 2
+        self.assertFalse(lan._static_sources_unchanged())
+        lan._cached_snapshot = {}
+        self.assertFalse(lan._static_sources_unchanged())
+        self.assertTrue(lan._static_sources_unchanged())
+
+    def test_tick_broadcasts_manifest_only_when_a_section_changes(self):
+        payload = {"spell_presets": [], "monster_choices": []}
+        lan = _make_lan(payload)
+        lan._actions = queue.Queue()
+        lan._clients_lock = threading.Lock()
+        lan._clients = {1: object()}
+        lan._polling = False
+        lan._active_poll_interval_ms = 120
+        lan._idle_poll_interval_ms = 350
+        lan._idle_cache_refresh_interval_s = 60.0
+        lan._last_idle_cache_refresh = tracker_mod.time.monotonic()
+        lan._cached_snapshot = {}
+        lan._cached_pcs = []
+        lan._battle_log_subscribers = set()
+        lan._log_lan_exception = lambda *args, **kwargs: None
+        lan._last_static_check_ts = 0.0
+        lan._static_check_interval_s = 0.0
+        lan._last_snapshot = {}
+        lan.payloads = []
+        lan._broadcast_payload = lambda message: lan.payloads.append(message)
+        lan._drain_change_journal = lambda _types: tracker_mod.LanChangeJournal().drain()
+        lan._broadcast_journal_changes = lambda *_args: True
+        lan._tracker = types.SimpleNamespace(after=lambda *_args: None)
+
+        lan._tick()
+        lan._tick()
+        self.assertEqual(lan.payloads, [])
+
+        payload["monster_choices"] = [{"slug": "orc"}]
+        lan._tick()
+
+        self.assertEqual(len(lan.payloads), 1)
+        self.assertEqual(lan.payloads[0]["changed"], ["monster_choices"])
+        self.assertEqual(set(lan.payloads[0]["sections"]), {"spell_presets", "monster_choices"})
+
+
+@unittest.skipUnless(HAS_TEST_CLIENT, "fastapi/httpx not installed")
+class LanStaticSectionRouteTests(unittest.TestCase):
+    def test_section_route_serves_etag_and_304(self):
+        from fastapi.testclient import TestClient
+
+        class _AppStub:
+            combatants = {}
+
+            def _oplog(self, *_args, **_kwargs):
+                return None
+
+            def after(self, *_args, **_kwargs):
+                return None
+
+        lan = object.__new__(tracker_mod.LanController)
+        lan._tracker = _AppStub()
+        lan.cfg = types.SimpleNamespace(host="127.0.0.1", port=0, vapid_public_key=None, allowlist=[], denylist=[], admin_password=None)
+        lan._server_thread = None
+        lan._fastapi_app = None
+        lan._polling = False
+        lan._cached_snapshot = {}
+        lan._cached_pcs = []
+        lan._clients_lock = threading.RLock()
+        lan._actions = None
+        lan._best_lan_url = lambda: "http://127.0.0.1:0"
+        lan._tick = lambda: None
+        lan._append_lan_log = lambda *_args, **_kwargs: None
+        lan._init_admin_auth = lambda: None
+        lan._is_host_allowed = lambda _host: True
+        lan._static_data_payload = lambda: {"dice_types": ["d4", "d6"]}
+        with mock.patch("threading.Thread.start", return_value=None):
+            lan.start(quiet=True)
+        client = TestClient(lan._fastapi_app)
+
+        first = client.get("/api/lan/static/dice_types")
+        etag = first.headers.get("etag")
+        cached = client.get("/api/lan/static/dice_types", headers={"If-None-Match": etag})
+        missing = client.get("/api/lan/static/nope")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json(), ["d4", "d6"])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(missing.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
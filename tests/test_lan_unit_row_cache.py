@@ -0,0 +1,118 @@
+import unittest
+
+import dnd_initative_tracker as tracker_mod
+
+
+def _c(cid, name, hp):
+    return tracker_mod.base.Combatant(
+        cid=cid,
+        name=name,
+        hp=hp,
+        speed=30,
+        swim_speed=0,
+        fly_speed=0,
+        burrow_speed=0,
+        climb_speed=0,
+        movement_mode="normal",
+        move_remaining=30,
+        initiative=10,
+    )
+
+
+class CombatantRevisionTests(unittest.TestCase):
+    def test_setattr_bumps_revision_unless_the_same_object_is_reassigned(self):
+        c = _c(1, "Goblin", 7)
+        stacks = c.condition_stacks
+        rev = tracker_mod.base.combatant_revision(c)
+
+        c.condition_stacks = stacks
+        self.assertEqual(tracker_mod.base.combatant_revision(c), rev)
+
+        fresh = []
+        c.condition_stacks = fresh
+        self.assertIs(c.condition_stacks, fresh)
+        rev += 1
+        self.assertEqual(tracker_mod.base.combatant_revision(c), rev)
+
+        c.hp = 3
+        c.is_hidden = True
+        self.assertEqual(tracker_mod.base.combatant_revision(c), rev + 2)
+
+        c.bump_revision()
+        self.assertEqual(tracker_mod.base.combatant_revision(c), rev + 3)
+        self.assertEqual(tracker_mod.base.combatant_revision(object()), 0)
+
+
+class LanUnitRowCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.app = object.__new__(tracker_mod.InitiativeTracker)
+        self.app._name_role_memory = {}
+        self.built = []
+
+        def _payload(c, pos, _auras):
+            self.built.append(c.cid)
+            return {"cid": c.cid, "hp": c.hp, "pos": {"col": pos[0], "row": pos[1]}, "beguiling_magic_window_s": 0.0}
+
+        self.app._lan_unit_payload = _payload
+
+    def test_idle_combatant_reuses_previous_row(self):
+        c = _c(1, "Goblin", 7)
+
+        first = self.app._lan_cached_unit_payload(c, (2, 3), [])
+        second = self.app._lan_cached_unit_payload(c, (2, 3), [])
+
+        self.assertIs(first, second)
+        self.assertEqual(self.built, [1])
+
+    def test_mutation_position_and_conditions_rebuild_row(self):
+        c = _c(1, "Goblin", 7)
+        first = self.app._lan_cached_unit_payload(c, (2, 3), [])
+
+        c.hp = 4
+        second = self.app._lan_cached_unit_payload(c, (2, 3), [])
+        third = self.app._lan_cached_unit_payload(c, (2, 4), [])
+        c.condition_stacks.append(tracker_mod.base.ConditionStack(sid=1, ctype="prone", remaining_turns=None))
+        fourth = self.app._lan_cached_unit_payload(c, (2, 4), [])
+
+        self.assertEqual(self.built, [1, 1, 1, 1])
+        self.assertEqual(first["hp"], 7)
+        self.assertEqual(second["hp"], 4)
+        self.assertEqual(third["pos"], {"col": 2, "row": 4})
+        self.assertIsNot(third, fourth)
+
+    def test_cached_row_is_copied_not_mutated_for_clock_fields(self):
+        c = _c(1, "Bard", 20)
+        first = self.app._lan_cached_unit_payload(c, (0, 0), [])
+        c.__dict__["_beguiling_magic_window_until"] = tracker_mod.time.monotonic() + 10.0
+
+        second = self.app._lan_cached_unit_payload(c, (0, 0), [])
+
+        self.assertEqual(self.built, [1])
+        self.assertEqual(first["beguiling_magic_window_s"], 0.0)
+        self.assertGreater(second["beguiling_magic_window_s"], 0.0)
+
+    def test_all_units_dirty_bypasses_cached_rows(self):
+        c = _c(1, "Goblin", 7)
+        c.actions.append({"name": "Scimitar"})
+        first = self.app._lan_cached_unit_payload(c, (0, 0), [])
+        c.actions[0]["name"] = "Shortbow"
+
+        self.app._lan_mark_dirty(all_units=True)
+        second = self.app._lan_cached_unit_payload(c, (0, 0), [])
+
+        self.assertEqual(self.built, [1, 1])
+        self.assertIsNot(first, second)
+
+    def test_force_and_prune_drop_cached_rows(self):
+        c = _c(1, "Goblin", 7)
+        self.app._lan_cached_unit_payload(c, (0, 0), [])
+        self.app._lan_cached_unit_payload(c, (0, 0), [], force=True)
+        self.assertEqual(self.built, [1, 1])
+
+        self.app._lan_prune_unit_rows([])
+        self.app._lan_cached_unit_payload(c, (0, 0), [])
+        self.assertEqual(self.built, [1, 1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
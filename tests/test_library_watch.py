@@ -0,0 +1,147 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+import library_watch
+
+
+def _wait_for_revision(watcher, directory, above, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        revision = watcher.revision(directory)
+        if revision is not None and revision > above:
+            return revision
+        time.sleep(0.02)
+    return watcher.revision(directory)
+
+
+class LibraryWatcherPollingTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name) / "Spells"
+        self.root.mkdir()
+        (self.root / "fireball.yaml").write_text("name: Fireball\n", encoding="utf-8")
+        self.watcher = library_watch.LibraryWatcher(backend="poll")
+        self.addCleanup(self.watcher.stop)
+        self.watcher.watch(self.root)
+
+    def test_poll_reports_changed_paths_per_revision(self):
+        self.assertEqual(self.watcher.backend, "poll")
+        start = self.watcher.revision(self.root)
+        self.watcher.poll_once()
+        self.assertEqual(self.watcher.revision(self.root), start)
+
+        (self.root / "shield.yaml").write_text("name: Shield\n", encoding="utf-8")
+        (self.root / "fireball.yaml").write_text("name: Fireball\nlevel: 3\n", encoding="utf-8")
+        (self.root / "draft.yaml.tmp").write_text("x", encoding="utf-8")
+        self.watcher.poll_once()
+        middle = self.watcher.revision(self.root)
+        self.assertEqual(middle, start + 1)
+        self.assertEqual(
+            self.watcher.changed_since(self.root, start),
+            frozenset({self.root / "shield.yaml", self.root / "fireball.yaml"}),
+        )
+
+        (self.root / "shield.yaml").unlink()
+        self.watcher.poll_once()
+        self.assertEqual(self.watcher.changed_since(self.root, middle), frozenset({self.root / "shield.yaml"}))
+        self.assertEqual(self.watcher.changed_since(self.root, self.watcher.revision(self.root)), frozenset())
+
+    def test_trimmed_history_and_app_writes(self):
+        start = self.watcher.revision(self.root)
+        for idx in range(library_watch.HISTORY_LIMIT + 1):
+            self.watcher.note_changed(self.root / f"spell-{idx}.yaml")
+        self.assertEqual(self.watcher.revision(self.root), start + library_watch.HISTORY_LIMIT + 1)
+        self.assertIsNone(self.watcher.changed_since(self.root, start))
+        self.assertIsNone(self.watcher.revision(self.root / "elsewhere"))
+
+    def test_off_backend_leaves_callers_to_rescan(self):
+        watcher = library_watch.LibraryWatcher(backend="off")
+        watcher.watch(self.root)
+        self.assertIsNone(watcher.revision(self.root))
+
+
+def _inotify_available():
+    watcher = library_watch.LibraryWatcher(backend="inotify")
+    watcher.stop()
+    return watcher.backend == "inotify"
+
+
+@unittest.skipUnless(_inotify_available(), "inotify unavailable")
+class LibraryWatcherInotifyTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name) / "Monsters"
+        self.watcher = library_watch.LibraryWatcher(backend="inotify", poll_interval=0.05)
+        self.addCleanup(self.watcher.stop)
+
+    def test_missing_directory_is_picked_up_then_watched_recursively(self):
+        self.watcher.watch(self.root, recursive=True)
+        self.watcher.start()
+        self.root.mkdir()
+        created = _wait_for_revision(self.watcher, self.root, 0)
+        self.assertGreater(created, 0)
+
+        (self.root / "Undead").mkdir()
+        after_subdir = _wait_for_revision(self.watcher, self.root, created)
+        (self.root / "Undead" / "ghoul.yaml").write_text("name: Ghoul\n", encoding="utf-8")
+        after_file = _wait_for_revision(self.watcher, self.root, after_subdir)
+
+        self.assertGreater(after_file, after_subdir)
+        self.assertEqual(self.watcher.changed_since(self.root, after_subdir), frozenset({self.root / "Undead" / "ghoul.yaml"}))
+
+
+class PlayerCacheWatcherTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.players_dir = root / "players"
+        self.players_dir.mkdir()
+        for name in ("Aria", "Brom"):
+            (self.players_dir / f"{name.lower()}.yaml").write_text(f"name: {name}\n", encoding="utf-8")
+
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._oplog = lambda *args, **kwargs: None
+        app._players_dir = lambda: self.players_dir
+        app._yaml_players_index_path_cache = root / "yaml_players_index.json"
+        app._player_yaml_cache_by_path = {}
+        app._player_yaml_meta_by_path = {}
+        app._player_yaml_data_by_name = {}
+        app._player_yaml_name_map = {}
+        app._player_yaml_dir_signature = None
+        app._player_yaml_last_refresh = 0.0
+        app._player_yaml_refresh_interval_s = 1.0
+        self.watcher = library_watch.LibraryWatcher(backend="poll")
+        self.watcher.watch(self.players_dir)
+        app._library_watcher = self.watcher
+        app._library_watch_dirs = {"players": self.players_dir}
+        self.app = app
+
+    def test_unchanged_revision_skips_the_filesystem(self):
+        self.app._load_player_yaml_cache(force_refresh=True)
+        self.assertEqual(sorted(self.app._player_yaml_data_by_name), ["Aria", "Brom"])
+
+        with mock.patch.object(tracker_mod, "_directory_signature", side_effect=AssertionError("rescanned")):
+            with mock.patch.object(Path, "glob", side_effect=AssertionError("globbed")):
+                self.app._load_player_yaml_cache()
+
+    def test_only_changed_profiles_are_restatted(self):
+        self.app._load_player_yaml_cache(force_refresh=True)
+        (self.players_dir / "brom.yaml").write_text("name: Brom\nlevel: 5\n", encoding="utf-8")
+        self.watcher.poll_once()
+
+        with mock.patch.object(tracker_mod, "_file_stat_metadata", wraps=tracker_mod._file_stat_metadata) as stat:
+            self.app._load_player_yaml_cache()
+
+        self.assertEqual([call.args[0].name for call in stat.call_args_list], ["brom.yaml"])
+        self.assertEqual(self.app._player_yaml_cache_by_path[self.players_dir / "brom.yaml"]["level"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+import helper_script
+
+
+class _FakeText:
+    """Just enough of tk.Text for LogView: whole lines, a fixed-height viewport."""
+
+    def __init__(self, visible=3):
+        self.lines = []
+        self.tags = {}
+        self.inserts = 0
+        self.idle = []
+        self.visible = visible
+        self.top = 1
+
+    def configure(self, **_kwargs):
+        pass
+
+    def yview(self):
+        return (0.0, 1.0) if self.top + self.visible > len(self.lines) else (0.0, 0.5)
+
+    def insert(self, _index, *chunks):
+        self.inserts += 1
+        text = "".join(chunks[0::2])
+        self.lines.extend(text.split("\n")[:-1])
+
+    def delete(self, start, end):
+        if end == "end":
+            self.lines = []
+            return
+        del self.lines[: int(end.split(".")[0]) - 1]
+
+    def see(self, _index):
+        self.top = max(1, len(self.lines) - self.visible + 1)
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def winfo_height(self):
+        return 100
+
+    def index(self, spec):
+        return f"{self.top}.0" if spec == "@0,0" else f"{min(len(self.lines), self.top + self.visible - 1)}.0"
+
+    def tag_names(self, index):
+        return tuple(tag for (line, tag) in self.tags if line == int(index.split(".")[0]))
+
+    def get(self, start, _end):
+        return self.lines[int(start.split(".")[0]) - 1]
+
+    def tag_add(self, tag, start, _end):
+        self.tags[(int(start.split(".")[0].split("+")[0]), tag)] = start
+
+
+class LogViewTests(unittest.TestCase):
+    def setUp(self):
+        self.text = _FakeText()
+        self.scanned = []
+
+        def highlight(content):
+            self.scanned.append(content)
+            return [(0, 4, "nm_pc")] if content.startswith("Aria") else []
+
+        self.view = helper_script.LogView(self.text, highlight, max_lines=10)
+
+    def _run_idle(self):
+        callbacks, self.text.idle = self.text.idle, []
+        for callback in callbacks:
+            callback()
+
+    def test_history_is_inserted_in_one_call_and_only_visible_lines_are_highlighted(self):
+        self.view.replace([("[t]", f"Aria hits {n}") for n in range(8)])
+        self.assertEqual(self.text.inserts, 1)
+        self._run_idle()
+        self.assertEqual(self.scanned, ["Aria hits 5", "Aria hits 6", "Aria hits 7"])
+        self.assertIn("nm_pc", self.text.tag_names("8.0"))
+
+        self.view.schedule_highlight()
+        self._run_idle()
+        self.assertEqual(len(self.scanned), 3)
+
+    def test_scrollback_is_trimmed_in_chunks(self):
+        for n in range(10 + helper_script.LogView.TRIM_SLACK):
+            self.view.append("[t]", f"line {n}")
+        self.assertEqual(len(self.text.lines), 10 + helper_script.LogView.TRIM_SLACK)
+        self.view.append("[t]", "one more")
+        self.assertEqual(len(self.text.lines), 10)
+        self.assertEqual(self.text.lines[-1], "[t]\tone more")
+
+    def test_history_lines_are_split_like_the_log_file(self):
+        self.assertEqual(helper_script._split_history_line("[s]\tAria: moved"), ("[s]", "Aria: moved"))
+        self.assertEqual(helper_script._split_history_line("[old] Aria hits"), ("old", "Aria hits"))
+        self.assertIsNone(helper_script._split_history_line("Goblin - next up"))
+        self.assertIsNone(helper_script._split_history_line("   "))
+
+
+if __name__ == "__main__":
+    unittest.main()
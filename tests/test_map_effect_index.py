@@ -0,0 +1,122 @@
+import unittest
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+
+
+def _app(aoes):
+    app = object.__new__(tracker_mod.InitiativeTracker)
+    app._lan_aoes = aoes
+    app._lan_positions = {}
+    return app
+
+
+def _c(cid, name):
+    return tracker_mod.base.Combatant(
+        cid=cid,
+        name=name,
+        hp=10,
+        speed=30,
+        swim_speed=0,
+        fly_speed=0,
+        burrow_speed=0,
+        climb_speed=0,
+        movement_mode="normal",
+        move_remaining=30,
+        initiative=10,
+    )
+
+
+def _effects():
+    return {
+        1: {"map_effect": True, "kind": "sphere", "cx": 4.0, "cy": 4.0, "radius_sq": 2.0, "environment": {"silence": True}},
+        2: {
+            "map_effect": True,
+            "kind": "line",
+            "cx": 2.0,
+            "cy": 6.0,
+            "length_sq": 6.0,
+            "width_sq": 1.0,
+            "angle_deg": 45.0,
+            "environment": {"difficult_terrain": True},
+        },
+        3: {
+            "map_effect": True,
+            "kind": "cone",
+            "cx": 8.0,
+            "cy": 2.0,
+            "length_sq": 4.0,
+            "spread_deg": 60.0,
+            "angle_deg": 180.0,
+            "environment": {"obscured": True},
+        },
+        4: {"map_effect": True, "kind": "cube", "cx": 1.0, "cy": 1.0, "side_sq": 3.0, "angle_deg": 30.0, "environment": {"magical_darkness": True}},
+        5: {"kind": "sphere", "cx": 4.0, "cy": 4.0, "radius_sq": 9.0, "environment": {"silence": True}},
+    }
+
+
+class MapEffectIndexTests(unittest.TestCase):
+    def test_index_matches_per_cell_containment(self):
+        app = _app(_effects())
+        for col in range(-2, 14):
+            for row in range(-2, 12):
+                expected = sorted(
+                    aid
+                    for aid, aoe in app._lan_aoes.items()
+                    if aoe.get("map_effect") and app._map_effect_contains_cell(aoe, col, row)
+                )
+                got = [entry["aid"] for entry in app._collect_environmental_effects_for_cell(col, row)]
+                self.assertEqual(got, expected, (col, row))
+
+    def test_only_changed_effects_are_rasterized_again(self):
+        app = _app(_effects())
+        app._map_effect_index()
+        with mock.patch.object(app, "_map_effect_cells", wraps=app._map_effect_cells) as rasterize:
+            app._lan_aoes[1]["cx"] = 6.0
+            app._lan_aoes[3]["environment"] = {"obscured": False}
+            del app._lan_aoes[4]
+            app._lan_touch_aoes()
+            index = app._map_effect_index()
+
+        self.assertEqual(rasterize.call_count, 2)
+        self.assertEqual([entry["aid"] for entry in index.records_at(6, 4)], [1])
+        self.assertEqual(index.records_at(3, 4), [])
+        self.assertEqual(index.cells_for(4), frozenset())
+        self.assertFalse(app._cell_visibility_state(1, 1)["magical_darkness"])
+        self.assertFalse(app._cell_visibility_state(7, 2)["obscured"])
+        self.assertTrue(app._cell_has_silence(6, 4))
+
+    def test_lookups_skip_the_aoe_walk_until_aoes_change(self):
+        app = _app(_effects())
+        app._map_effect_index()
+        with mock.patch.object(app, "_map_effect_signature", wraps=app._map_effect_signature) as signature:
+            for col in range(10):
+                app._cell_has_silence(col, 4)
+            self.assertEqual(signature.call_count, 0)
+
+            app._lan_mark_dirty(aids=[1])
+            app._cell_has_silence(4, 4)
+            self.assertEqual(signature.call_count, 4)
+
+            app._lan_aoes = dict(app._lan_aoes)
+            app._cell_has_silence(4, 4)
+            self.assertEqual(signature.call_count, 8)
+
+    def test_modifiers_require_full_footprint_for_entirely_inside_rules(self):
+        app = _app({1: {"map_effect": True, "kind": "cube", "cx": 4.0, "cy": 4.0, "side_sq": 2.0, "environment": {"silence": True}}})
+        small = _c(1, "Imp")
+        large = _c(2, "Ogre")
+        large.size = "large"
+        app._lan_positions = {1: (4, 4), 2: (5, 5)}
+
+        inside = app._collect_environmental_modifiers_for_combatant(small)
+        straddling = app._collect_environmental_modifiers_for_combatant(large)
+
+        self.assertEqual(inside["damage_immunities"], {"thunder"})
+        self.assertIn("deafened", inside["derived_conditions"])
+        self.assertEqual(straddling["damage_immunities"], set())
+        self.assertEqual(straddling["cast_rules"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
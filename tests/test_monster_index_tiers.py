@@ -0,0 +1,171 @@
+import copy
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+import monster_catalog
+import yaml_batch
+
+
+def _write_monster(directory: Path, slug: str, name: str, ac: int = 13) -> None:
+    (directory / f"{slug}.yaml").write_text(
+        f"name: {name}\n"
+        "type: beast\n"
+        "challenge_rating: 1/4\n"
+        f"ac: {ac}\n"
+        "hp: 11\n"
+        "speed: {walk: 40, swim: 10}\n"
+        "abilities: {Str: 12, Dex: 15, Con: 12, Int: 2, Wis: 12, Cha: 6}\n"
+        "actions:\n"
+        "  - name: Bite\n"
+        "    desc: Melee Weapon Attack.\n",
+        encoding="utf-8",
+    )
+
+
+class MonsterIndexTierTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.monsters_dir = root / "Monsters"
+        self.monsters_dir.mkdir()
+        self.logs_dir = root / "logs"
+        self.logs_dir.mkdir()
+        for idx in range(4):
+            _write_monster(self.monsters_dir, f"wolf-{idx}", f"Wolf {idx}", ac=13 + idx)
+        patcher = mock.patch.object(tracker_mod, "_ensure_logs_dir", return_value=self.logs_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def _app(self):
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._log = lambda *args, **kwargs: None
+        app._monsters_dir_path = lambda: self.monsters_dir
+        app._monster_specs = []
+        app._monsters_by_name = {}
+        app._wild_shape_beast_cache = None
+        app._wild_shape_available_cache = {}
+        app._wild_shape_available_cache_source = None
+        self.addCleanup(lambda: app.__dict__.get("_monster_catalog") and app._monster_catalog.close())
+        return app
+
+    def test_catalog_keeps_summary_columns_and_detail_blobs(self):
+        self._app()._load_monsters_index()
+
+        catalog = monster_catalog.MonsterCatalog.open(self.logs_dir / "monster_catalog.bin")
+        self.addCleanup(catalog.close)
+        row = catalog.find("wolf-1.yaml")
+        summary = catalog.summary(row)
+        self.assertEqual(summary["name"], "Wolf 1")
+        self.assertEqual(summary["cr"], 0.25)
+        self.assertEqual(summary["cr_label"], "1/4")
+        self.assertEqual(summary["ac"], 14)
+        self.assertEqual(summary["abilities"]["dex"], 15)
+        self.assertEqual(summary["ability_mods"]["dex"], 2)
+        self.assertEqual(summary["speed"], 40)
+        self.assertIsNone(summary["init_mod"])
+        self.assertEqual(catalog.detail(row)["actions"][0]["name"], "Bite")
+
+    def test_warm_start_reads_details_lazily_through_lru(self):
+        self._app()._load_monsters_index()
+        app = self._app()
+        with mock.patch.dict("os.environ", {"INITTRACKER_MONSTER_DETAIL_CACHE": "2"}):
+            with mock.patch.object(yaml_batch, "safe_load", wraps=yaml_batch.safe_load) as parse, mock.patch.object(
+                monster_catalog, "write_catalog", wraps=monster_catalog.write_catalog
+            ) as write:
+                app._load_monsters_index()
+                catalog = app._monster_catalog
+                with mock.patch.object(catalog, "detail", wraps=catalog.detail) as decode:
+                    self.assertEqual(app._monster_cr_display(app._monsters_by_name["Wolf 0"]), "1/4")
+                    self.assertEqual(decode.call_count, 0)
+
+                    wolf = app._load_monster_details("Wolf 0")
+                    self.assertEqual(wolf.raw_data["actions"][0]["name"], "Bite")
+                    self.assertEqual(wolf.raw_data["abilities"]["str"], 12)
+                    self.assertEqual(decode.call_count, 1)
+
+                    app._monsters_by_name["Wolf 1"].raw_data
+                    app._monsters_by_name["Wolf 2"].raw_data
+                    self.assertEqual(len(app._monster_detail_lru()), 2)
+                    self.assertNotIn("wolf-0.yaml", app._monster_detail_lru())
+                    self.assertEqual(wolf.raw_data["name"], "Wolf 0")
+                    self.assertEqual(decode.call_count, 4)
+            self.assertEqual(parse.call_count, 0)
+            self.assertEqual(write.call_count, 0)
+
+    def test_only_changed_files_are_parsed_again(self):
+        self._app()._load_monsters_index()
+        _write_monster(self.monsters_dir, "wolf-2", "Dire Wolf 2", ac=17)
+        (self.monsters_dir / "wolf-3.yaml").unlink()
+        app = self._app()
+        with mock.patch.object(yaml_batch, "safe_load", wraps=yaml_batch.safe_load) as parse:
+            app._load_monsters_index()
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(sorted(app._monsters_by_name), ["Dire Wolf 2", "Wolf 0", "Wolf 1"])
+        self.assertEqual(app._monster_catalog.filenames(), ["wolf-0.yaml", "wolf-1.yaml", "wolf-2.yaml"])
+        app._monster_detail_lru().clear()
+        self.assertEqual(app._monsters_by_name["Wolf 0"].raw_data["ac"], 13)
+        self.assertEqual(app._monsters_by_name["Dire Wolf 2"].raw_data["ac"], 17)
+
+    def test_corrupt_catalog_is_rebuilt(self):
+        (self.logs_dir / "monster_catalog.bin").write_bytes(b"not a catalog")
+        app = self._app()
+        app._load_monsters_index()
+
+        self.assertEqual(len(app._monster_specs), 4)
+        self.assertEqual(len(app._monster_catalog), 4)
+
+    def test_assigned_raw_data_is_pinned_on_the_spec(self):
+        self._app()._load_monsters_index()
+        app = self._app()
+        app._load_monsters_index()
+        spec = app._monsters_by_name["Wolf 3"]
+        spec.raw_data = {"name": "Wolf 3", "ac": 99}
+        app._monster_detail_lru().clear()
+        self.assertEqual(spec.raw_data["ac"], 99)
+
+    def test_repr_eq_and_asdict_do_not_load_details(self):
+        self._app()._load_monsters_index()
+        app = self._app()
+        app._load_monsters_index()
+        spec = app._monsters_by_name["Wolf 3"]
+        app._monster_detail_lru().clear()
+
+        loader = spec.detail_loader
+        spec.detail_loader = mock.Mock(side_effect=AssertionError("detail load"))
+        text = repr(spec)
+        self.assertEqual(spec, copy.copy(spec))
+        fields = tracker_mod.asdict(spec)
+        spec.detail_loader = loader
+
+        self.assertNotIn("raw_data", text)
+        self.assertNotIn("raw_data", fields)
+        self.assertEqual(fields["name"], "Wolf 3")
+        self.assertEqual(spec.raw_data["name"], "Wolf 3")
+
+    def test_monster_choices_payload_uses_summary_columns(self):
+        self._app()._load_monsters_index()
+        app = self._app()
+        app._load_monsters_index()
+        lan = object.__new__(tracker_mod.LanController)
+        object.__setattr__(lan, "_tracker", app)
+        lan._clients_lock = threading.Lock()
+
+        with mock.patch.object(app, "_monster_spec_details", side_effect=AssertionError("detail load")):
+            for spec in app._monster_specs:
+                spec.detail_loader = app._monster_spec_details
+            choices = lan._monster_choices_payload()
+
+        template = {entry["slug"]: entry["template"] for entry in choices}["wolf-2"]
+        self.assertEqual(template["ac"], 15)
+        self.assertEqual(template["abilities"]["dex"], 15)
+        self.assertEqual(template["speeds"]["swim"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,8 @@ class MountHarness:
     _lan_try_move = tracker_mod.InitiativeTracker._lan_try_move
     _lan_live_map_data = tracker_mod.InitiativeTracker._lan_live_map_data
     _lan_apply_action = tracker_mod.InitiativeTracker._lan_apply_action
+    _lan_change_journal = tracker_mod.InitiativeTracker._lan_change_journal
+    _lan_mark_dirty = tracker_mod.InitiativeTracker._lan_mark_dirty
 
     def __init__(self):
         self.combatants = {}
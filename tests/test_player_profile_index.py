@@ -0,0 +1,77 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+import library_watch
+
+
+class PlayerProfileIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.johnny = Path("/tmp/johnny_morris.yaml")
+        self.aria = Path("/tmp/aria.yaml")
+        self.index = tracker_mod.PlayerProfileIndex(
+            {"johnny_morris": self.johnny, "aria": self.aria, "aria vale": self.aria},
+            tracker_mod._CHARACTER_SLUGIFY,
+        )
+
+    def test_resolves_exact_slug_and_suffixed_names(self):
+        self.assertIs(self.index.resolve("ARIA"), self.aria)
+        self.assertIs(self.index.resolve("Johnny Morris"), self.johnny)
+        self.assertIs(self.index.resolve("Aria Vale 2"), self.aria)
+        self.assertIs(self.index.resolve("Johnny Morris (Wolf)"), self.johnny)
+        self.assertIsNone(self.index.resolve(""))
+
+    def test_misses_are_remembered(self):
+        self.assertIsNone(self.index.resolve("Goblin 3"))
+        self.assertTrue(self.index.is_known_miss("goblin 3"))
+        self.assertFalse(self.index.is_known_miss("Aria"))
+        slugify = mock.Mock(side_effect=AssertionError("re-slugified"))
+        self.index._slugify = slugify
+        self.assertIsNone(self.index.resolve("Goblin 3"))
+
+
+class TrackerPlayerProfileLookupTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.players_dir = root / "players"
+        self.players_dir.mkdir()
+        (self.players_dir / "aria.yaml").write_text("name: Aria\n", encoding="utf-8")
+
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._oplog = lambda *args, **kwargs: None
+        app._players_dir = lambda: self.players_dir
+        app._yaml_players_index_path_cache = root / "yaml_players_index.json"
+        app._player_yaml_cache_by_path = {}
+        app._player_yaml_meta_by_path = {}
+        app._player_yaml_data_by_name = {}
+        app._player_yaml_name_map = {}
+        app._player_yaml_dir_signature = None
+        app._player_yaml_last_refresh = 0.0
+        app._player_yaml_refresh_interval_s = 1.0
+        self.watcher = library_watch.LibraryWatcher(backend="poll")
+        self.watcher.watch(self.players_dir)
+        app._library_watcher = self.watcher
+        app._library_watch_dirs = {"players": self.players_dir}
+        self.app = app
+
+    def test_monster_misses_skip_the_cache_reload(self):
+        self.assertEqual(self.app._profile_for_player_name("Aria 2")["name"], "Aria")
+        self.assertIsNone(self.app._profile_for_player_name("Goblin"))
+
+        with mock.patch.object(self.app, "_load_player_yaml_cache", side_effect=AssertionError("reloaded")):
+            for _ in range(10):
+                self.assertIsNone(self.app._profile_for_player_name("Goblin"))
+
+    def test_new_profile_clears_cached_misses(self):
+        self.assertIsNone(self.app._profile_for_player_name("Brom"))
+        (self.players_dir / "brom.yaml").write_text("name: Brom\n", encoding="utf-8")
+        self.watcher.poll_once()
+        self.assertEqual(self.app._profile_for_player_name("Brom")["name"], "Brom")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import types
+import unittest
+
+import dnd_initative_tracker as tracker_mod
+import helper_script
+import refresh_scheduler
+
+
+class RefreshSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.idle = []
+        self.calls = []
+        self.scheduler = refresh_scheduler.RefreshScheduler(self.idle.append)
+
+    def _run_idle(self):
+        callbacks, self.idle[:] = list(self.idle), []
+        for callback in callbacks:
+            callback()
+
+    def test_refreshes_outside_a_batch_run_immediately(self):
+        self.assertFalse(self.scheduler.defer("table", self.calls.append))
+        self.assertEqual(self.idle, [])
+        self.assertEqual(self.scheduler.stats(), {})
+
+    def test_each_region_runs_once_in_a_fixed_order_with_merged_flags(self):
+        def table(**flags):
+            self.calls.append(("table", flags))
+
+        with self.scheduler.batch():
+            self.assertTrue(self.scheduler.defer("lan_broadcast", lambda: self.calls.append(("lan", {}))))
+            self.scheduler.defer("table", table, scroll_to_top=False, scroll_to_current=True)
+            with self.scheduler.batch():
+                self.scheduler.defer("table", table, scroll_to_top=False, scroll_to_current=False)
+            self.assertEqual(self.idle, [])
+        with self.scheduler.batch():
+            self.scheduler.defer("lan_broadcast", lambda: self.calls.append(("lan", {})))
+        self.assertEqual(len(self.idle), 1)
+
+        self._run_idle()
+        self.assertEqual(
+            self.calls, [("table", {"scroll_to_top": False, "scroll_to_current": True}), ("lan", {})]
+        )
+        self.assertEqual(self.scheduler.coalesced_total(), 2)
+        self.assertIn("2 redundant", self.scheduler.summary())
+
+    def test_refresh_errors_propagate_after_every_region_ran(self):
+        def broken():
+            raise RuntimeError("table exploded")
+
+        with self.scheduler.batch():
+            self.scheduler.defer("table", broken)
+            self.scheduler.defer("lan_broadcast", lambda: self.calls.append("lan"))
+        with self.assertRaisesRegex(RuntimeError, "table exploded"):
+            self._run_idle()
+        self.assertEqual(self.calls, ["lan"])
+        self.assertFalse(self.scheduler._flushing)
+        self.assertFalse(self.scheduler.defer("table", broken))
+
+    def test_map_window_overlays_defer_to_the_app_scheduler(self):
+        app = types.SimpleNamespace(_refresh_scheduler=self.scheduler)
+        mw = object.__new__(helper_script.BattleMapWindow)
+        mw.__dict__["app"] = app
+        mw.__dict__["_selected_aoe"] = None
+        mw.__dict__["_set_included_text"] = self.calls.append
+        mw.__dict__["_update_aoe_damage_button"] = lambda _included: None
+
+        with helper_script._refresh_batch(app):
+            for _ in range(3):
+                mw._update_included_for_selected()
+        self.assertEqual(self.calls, [])
+        self._run_idle()
+        self.assertEqual(self.calls, [""])
+        self.assertEqual(self.scheduler.stats()["aoe_includes"]["coalesced"], 2)
+
+
+class TrackerRefreshTests(unittest.TestCase):
+    def test_lan_broadcast_is_deferred_inside_a_batch(self):
+        idle = []
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._refresh_scheduler = refresh_scheduler.RefreshScheduler(idle.append)
+        snapshots = []
+        app._lan_snapshot = lambda: snapshots.append(True) or {}
+        app._lan = types.SimpleNamespace(_broadcast_state=lambda _snap: None)
+
+        with helper_script._refresh_batch(app):
+            app._lan_force_state_broadcast()
+            app._lan_force_state_broadcast()
+        self.assertEqual(snapshots, [])
+        idle[0]()
+        self.assertEqual(snapshots, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,7 +20,7 @@ class ShieldReactionTests(unittest.TestCase):
         self.app._action_name_key = lambda v: str(v or "").strip().lower()
         self.app._lan_aura_effects_for_target = lambda target: {}
         self.app._adjust_damage_entries_for_target = lambda target, entries: {"entries": list(entries), "notes": []}
-        self.app._apply_damage_to_target_with_temp_hp = lambda target, dmg: {"hp_after": max(0, int(target.hp) - int(dmg))}
+        self.app._apply_damage_to_target_with_temp_hp = lambda target, dmg, source_cid=None: {"hp_after": max(0, int(target.hp) - int(dmg))}
         self.app._remove_combatants_with_lan_cleanup = lambda cids: None
         self.app._retarget_current_after_removal = lambda *args, **kwargs: None
         self.app._unit_has_sentinel_feat = lambda unit: False
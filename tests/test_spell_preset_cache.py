@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+
+REPO_SPELLS = Path(__file__).resolve().parents[1] / "Spells"
+SPELL_FILES = ("abjure-foes.yaml", "absorb-elements.yaml", "acid-splash.yaml")
+
+
+class SpellPresetCompileCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.spells_dir = root / "Spells"
+        self.spells_dir.mkdir()
+        for name in SPELL_FILES:
+            shutil.copy(REPO_SPELLS / name, self.spells_dir / name)
+        self.index_path = root / "spell_index.json"
+        patcher = mock.patch.object(tracker_mod, "_ensure_logs_dir", return_value=root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.app = self._app()
+
+    def _app(self):
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._oplog = lambda *args, **kwargs: None
+        app._spell_presets_cache = None
+        app._spell_index_entries = {}
+        app._spell_index_loaded = False
+        app._spell_dir_notice = None
+        app._spell_dir_signature = None
+        app._spell_yaml_lock = tracker_mod.threading.Lock()
+        app._resolve_spells_dir = lambda: self.spells_dir
+        app._spell_index_path = lambda: self.index_path
+        return app
+
+    def _compile_counter(self, app):
+        return mock.patch.object(app, "_compile_spell_preset", wraps=app._compile_spell_preset)
+
+    def test_color_edit_recompiles_only_that_spell(self):
+        before = self.app._spell_presets_payload()
+        untouched = [preset for preset in before if preset["slug"] != "acid-splash"]
+
+        with self._compile_counter(self.app) as compile_spell:
+            self.app._save_spell_color("acid-splash", "#123456")
+            after = self.app._spell_presets_payload()
+
+        self.assertEqual(compile_spell.call_count, 1)
+        self.assertEqual([preset["slug"] for preset in after], [preset["slug"] for preset in before])
+        self.assertEqual(next(preset for preset in after if preset["slug"] == "acid-splash")["color"], "#123456")
+        for preset in untouched:
+            self.assertTrue(any(candidate is preset for candidate in after))
+        stored = json.loads(self.index_path.read_text(encoding="utf-8"))["entries"]["acid-splash.yaml"]
+        self.assertEqual(stored["preset"]["color"], "#123456")
+        self.assertEqual(stored["hash"], tracker_mod._hash_text((self.spells_dir / "acid-splash.yaml").read_text(encoding="utf-8")))
+
+    def test_touched_file_with_unchanged_content_keeps_its_preset(self):
+        self.app._spell_presets_payload()
+        target = self.spells_dir / SPELL_FILES[1]
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        app = self._app()
+        with self._compile_counter(app) as compile_spell:
+            presets = app._spell_presets_payload()
+        self.assertEqual(compile_spell.call_count, 0)
+        self.assertEqual(len(presets), len(SPELL_FILES))
+        stored = json.loads(self.index_path.read_text(encoding="utf-8"))["entries"][target.name]
+        self.assertEqual(stored["mtime_ns"], target.stat().st_mtime_ns)
+
+    def test_edited_file_is_the_only_one_recompiled_on_reload(self):
+        self.app._spell_presets_payload()
+        target = self.spells_dir / SPELL_FILES[0]
+        target.write_text(target.read_text(encoding="utf-8").replace("#E8D38A", "#abcdef"), encoding="utf-8")
+
+        app = self._app()
+        with self._compile_counter(app) as compile_spell:
+            presets = app._spell_presets_payload()
+        self.assertEqual([call.args[0].name for call in compile_spell.call_args_list], [SPELL_FILES[0]])
+        self.assertEqual(presets[0]["color"], "#abcdef")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+import library_watch
+import yaml_batch
+
+REPO_SPELLS = Path(__file__).resolve().parents[1] / "Spells"
+SPELL_FILES = ("acid-splash.yaml", "cure-wounds.yaml", "fireball.yaml")
+
+
+class SpellPresetIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.presets = [
+            {"slug": "cure-wounds", "id": "cure_wounds", "name": "Cure Wounds"},
+            {"slug": "fire-bolt", "id": "fire_bolt", "name": "Fire Bolt"},
+            {"slug": "dup", "id": "cure_wounds", "name": "Duplicate"},
+        ]
+        entries = {"cure-wounds.yaml": {"preset": self.presets[0]}, "fire-bolt.yaml": {"preset": self.presets[1]}}
+        self.index = tracker_mod.SpellPresetIndex(self.presets, entries)
+
+    def test_find_prefers_slug_then_first_id(self):
+        self.assertIs(self.index.find("fire-bolt", "cure_wounds"), self.presets[1])
+        self.assertIs(self.index.find("missing", "cure_wounds"), self.presets[0])
+        self.assertIsNone(self.index.find("", ""))
+
+    def test_resolve_accepts_names_and_hyphenated_aliases(self):
+        self.assertIs(self.index.resolve("Fire Bolt"), self.presets[1])
+        self.assertIs(self.index.resolve("FIRE_BOLT"), self.presets[1])
+        self.assertIs(self.index.resolve("cure wounds"), self.presets[0])
+        self.assertIsNone(self.index.resolve("wish"))
+
+    def test_display_names_cover_ids_and_files(self):
+        self.assertEqual(self.index.display_name("fire-bolt.yaml"), "Fire Bolt")
+        self.assertEqual(self.index.display_name("CURE-WOUNDS"), "Cure Wounds")
+        self.assertEqual(self.index.display_name("cure_wounds"), "Cure Wounds")
+
+
+class TrackerSpellIndexTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.spells_dir = root / "Spells"
+        self.spells_dir.mkdir()
+        for name in SPELL_FILES:
+            shutil.copy(REPO_SPELLS / name, self.spells_dir / name)
+        patcher = mock.patch.object(tracker_mod, "_ensure_logs_dir", return_value=root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._oplog = lambda *args, **kwargs: None
+        app._spell_presets_cache = None
+        app._spell_index_entries = {}
+        app._spell_index_loaded = False
+        app._spell_dir_notice = None
+        app._spell_dir_signature = None
+        app._spell_yaml_lock = tracker_mod.threading.Lock()
+        app._resolve_spells_dir = lambda: self.spells_dir
+        app._spell_index_path = lambda: root / "spell_index.json"
+        watcher = library_watch.LibraryWatcher(backend="poll")
+        watcher.watch(self.spells_dir)
+        app._library_watcher = watcher
+        app._library_watch_dirs = {"spells": self.spells_dir}
+        self.app = app
+
+    def test_index_is_built_once_per_preset_generation(self):
+        with mock.patch.object(tracker_mod, "SpellPresetIndex", wraps=tracker_mod.SpellPresetIndex) as build:
+            fireball = self.app._find_spell_preset("fireball", None)
+            for _ in range(20):
+                self.assertIs(self.app._find_spell_preset(None, "fireball"), fireball)
+                self.assertEqual(self.app._spell_preset_name_lookup()["fireball.yaml"], fireball["name"])
+            self.assertEqual(build.call_count, 1)
+
+            self.app._save_spell_color("fireball", "#112233")
+            self.assertEqual(self.app._find_spell_preset("fireball", None)["color"], "#112233")
+            self.assertEqual(build.call_count, 2)
+
+    def test_spell_color_accepts_a_spell_name(self):
+        result = self.app._save_spell_color("Cure Wounds", "#445566")
+        self.assertEqual(result["slug"], "cure-wounds")
+        self.assertIn("#445566", (self.spells_dir / "cure-wounds.yaml").read_text(encoding="utf-8"))
+
+    def test_library_records_reuse_parsed_files(self):
+        first = self.app._spell_library_records()
+        self.assertEqual(first["ids"], ["acid-splash", "cure-wounds", "fireball"])
+        self.assertEqual(first["spells"][2]["parsed"]["name"], "Fireball")
+
+        (self.spells_dir / "fireball.yaml").write_text("name: Fireball\nlevel: 3\n", encoding="utf-8")
+        self.app._library_watcher.poll_once()
+        with mock.patch.object(yaml_batch, "safe_load", wraps=yaml_batch.safe_load) as parse:
+            second = self.app._spell_library_records()
+            again = self.app._spell_library_records()
+            raw_only = self.app._spell_library_records(include_parsed=False)
+        self.assertEqual(parse.call_count, 1)
+        self.assertIs(again, second)
+        self.assertEqual(second["spells"][2]["parsed"]["level"], 3)
+        self.assertIs(second["spells"][0], first["spells"][0])
+        self.assertNotIn("parsed", raw_only["spells"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+import dnd_initative_tracker as tracker_mod
+
+
+class _FakeTree:
+    def __init__(self):
+        self.rows = []
+        self.items = {}
+        self.calls = []
+
+    def get_children(self):
+        return tuple(self.rows)
+
+    def insert(self, _parent, index, iid, values, tags):
+        self.calls.append(("insert", iid))
+        self.rows.insert(index, iid)
+        self.items[iid] = (values, tags)
+
+    def item(self, iid, values, tags):
+        self.calls.append(("item", iid))
+        self.items[iid] = (values, tags)
+
+    def move(self, iid, _parent, index):
+        self.calls.append(("move", iid))
+        self.rows.remove(iid)
+        self.rows.insert(index, iid)
+
+    def delete(self, *iids):
+        self.calls.append(("delete",) + iids)
+        for iid in iids:
+            self.rows.remove(iid)
+            self.items.pop(iid, None)
+
+
+def _rows(*specs):
+    return [(iid, (iid, hp), ("odd" if i % 2 else "even",)) for i, (iid, hp) in enumerate(specs)]
+
+
+class TableSyncTests(unittest.TestCase):
+    def setUp(self):
+        self.app = object.__new__(tracker_mod.InitiativeTracker)
+        self.app.tree = _FakeTree()
+
+    def test_only_changed_rows_are_touched(self):
+        self.app._sync_table_rows(_rows(("1", 10), ("2", 8), ("3", 5)))
+        self.app.tree.calls.clear()
+
+        self.app._sync_table_rows(_rows(("1", 10), ("2", 3), ("3", 5)))
+        self.assertEqual(self.app.tree.calls, [("item", "2")])
+
+    def test_reorder_moves_rows_and_drops_removed_ones(self):
+        self.app._sync_table_rows(_rows(("1", 10), ("2", 8), ("3", 5)))
+        self.app.tree.calls.clear()
+
+        self.app._sync_table_rows(_rows(("3", 5), ("1", 10), ("4", 7)))
+        self.assertEqual(self.app.tree.rows, ["3", "1", "4"])
+        self.assertNotIn(("insert", "1"), self.app.tree.calls)
+        self.assertEqual(self.app.tree.calls[0], ("delete", "2"))
+
+    def test_batched_rebuilds_coalesce_into_one_idle_refresh(self):
+        idle = []
+        turn_ui = []
+        self.app._refresh_scheduler = tracker_mod.refresh_scheduler.RefreshScheduler(idle.append)
+        self.app._lan_mark_dirty = lambda **_kwargs: None
+        self.app._display_order = lambda: []
+        self.app._update_turn_ui = lambda: turn_ui.append(True)
+        self.app._sync_move_mode_selector = lambda: None
+        self.app.current_cid = None
+        with tracker_mod.base._refresh_batch(self.app):
+            self.app._rebuild_table()
+            self.app._rebuild_table(scroll_to_current=True)
+        self.assertEqual(len(idle), 1)
+        self.assertEqual(turn_ui, [])
+
+        idle[0]()
+        idle[0]()
+        self.assertEqual(turn_ui, [True])
+        self.assertEqual(
+            self.app._refresh_scheduler.stats()["table"], {"requested": 2, "performed": 1, "coalesced": 1}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import dnd_initative_tracker as tracker_mod
+import yaml_batch
+
+
+def _write_monster(directory: Path, slug: str, name: str) -> Path:
+    path = directory / f"{slug}.yaml"
+    path.write_text(f"name: {name}\ntype: beast\nchallenge_rating: 1/4\nac: 13\nhp: 11\nspeed: 40\n", encoding="utf-8")
+    return path
+
+
+class _Widget:
+    def __init__(self):
+        self.options = {}
+
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+
+
+class _Var:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class YamlBatchParserTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        self.paths = [_write_monster(self.root, f"m{idx:02d}", f"Monster {idx}") for idx in range(10)]
+        broken = self.root / "broken.yaml"
+        broken.write_text("name: [unclosed\n", encoding="utf-8")
+        self.paths.append(broken)
+
+    def test_serial_batches_report_parse_errors_per_file(self):
+        parser = yaml_batch.YamlBatchParser(self.paths, workers=0, chunk_size=4)
+        batches = list(parser.batches())
+
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 3])
+        self.assertFalse(parser.used_pool)
+        results = {Path(path).name: (data, error) for batch in batches for path, _text, data, error in batch}
+        self.assertEqual(results["m03.yaml"][0]["name"], "Monster 3")
+        self.assertIsNone(results["broken.yaml"][0])
+        self.assertIn("parse failed", results["broken.yaml"][1])
+
+    def test_process_pool_matches_serial_parse(self):
+        serial = yaml_batch.YamlBatchParser(self.paths, workers=0).parse_all()
+        parser = yaml_batch.YamlBatchParser(self.paths, workers=2, min_pool_files=1, chunk_size=3)
+        pooled = parser.parse_all()
+
+        self.assertTrue(parser.used_pool)
+        self.assertEqual(sorted(pooled, key=lambda row: row[0]), sorted(serial, key=lambda row: row[0]))
+
+    def test_cancel_stops_before_remaining_batches(self):
+        cancel = threading.Event()
+        parser = yaml_batch.YamlBatchParser(self.paths, cancel=cancel, workers=0, chunk_size=2)
+        seen = []
+        for batch in parser.batches():
+            seen.extend(batch)
+            cancel.set()
+
+        self.assertEqual(len(seen), 2)
+
+
+class MonsterIndexProgressTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.monsters_dir = root / "Monsters"
+        self.monsters_dir.mkdir()
+        logs_dir = root / "logs"
+        logs_dir.mkdir()
+        for idx in range(5):
+            _write_monster(self.monsters_dir, f"wolf-{idx}", f"Wolf {idx}")
+        patcher = mock.patch.object(tracker_mod, "_ensure_logs_dir", return_value=logs_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _app(self):
+        app = object.__new__(tracker_mod.InitiativeTracker)
+        app._log = lambda *args, **kwargs: None
+        app._monsters_dir_path = lambda: self.monsters_dir
+        app._monster_specs = []
+        app._monsters_by_name = {}
+        app._wild_shape_beast_cache = None
+        app._wild_shape_available_cache = {}
+        app._wild_shape_available_cache_source = None
+        self.addCleanup(lambda: app.__dict__.get("_monster_catalog") and app._monster_catalog.close())
+        return app
+
+    def test_specs_are_published_per_batch_with_progress(self):
+        app = self._app()
+        published = []
+
+        def on_progress(parsed, total):
+            published.append((parsed, total, [spec.name for spec in app._monster_specs]))
+
+        with mock.patch.object(yaml_batch, "CHUNK_SIZE", 2):
+            app._load_monsters_index(on_progress=on_progress)
+
+        self.assertEqual([(parsed, total) for parsed, total, _names in published], [(2, 5), (4, 5), (5, 5)])
+        self.assertEqual(published[0][2], ["Wolf 0", "Wolf 1"])
+        self.assertEqual(sorted(app._monsters_by_name), [f"Wolf {idx}" for idx in range(5)])
+
+    def test_cancelled_load_keeps_parsed_prefix_and_resumes_later(self):
+        app = self._app()
+        app._index_cancel_event().set()
+        app._load_monsters_index()
+        self.assertEqual(app._monster_specs, [])
+
+        resumed = self._app()
+        resumed._load_monsters_index()
+        self.assertEqual(len(resumed._monster_specs), 5)
+
+    def test_loading_tick_refills_dropdown_and_progress_label(self):
+        app = self._app()
+        app._monster_combo = _Widget()
+        app._monster_progress_label = _Widget()
+        app._monster_combo_specs = app._monster_specs
+        app.name_var = _Var()
+        app._on_monster_selected = lambda: None
+
+        app._load_monsters_index(on_progress=app._note_monster_index_progress)
+        app._monster_index_progress = (3, 5)
+        app._index_loading_tick()
+        self.assertEqual(app._monster_combo.options["values"], [f"Wolf {idx}" for idx in range(5)])
+        self.assertEqual(app.name_var.get(), "Wolf 0")
+        self.assertEqual(app._monster_progress_label.options["text"], "Parsing monsters 3/5…")
+
+        app._monster_index_progress = (5, 5)
+        app._monster_combo.options.clear()
+        app._index_loading_tick()
+        self.assertNotIn("values", app._monster_combo.options)
+        self.assertEqual(app._monster_progress_label.options["text"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()